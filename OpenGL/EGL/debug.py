@@ -1,5 +1,6 @@
 """Debug utilities for EGL operations"""
 from OpenGL.EGL import *
+from OpenGL.constant import getName
 import itertools
 
 
@@ -60,10 +61,10 @@ def debug_config(display, config):
             attr_value = {}
             for subattr in BITMASK_FIELDS[attr]:
                 if value.value & subattr:
-                    attr_value[subattr.name] = True
+                    attr_value[getName(subattr, "EGL_")] = True
         else:
             attr_value = value.value
-        result[attr.name] = attr_value
+        result[getName(attr, "EGL_")] = attr_value
     return result
 
 
@@ -154,7 +155,7 @@ BITMASK_FIELDS = dict(
 
 def bit_renderer(bit):
     def render(value):
-        if bit.name in value:
+        if getName(bit, "EGL_") in value:
             return " Y"
         else:
             return " ."
@@ -208,7 +209,7 @@ def format_debug_configs(debug_configs, formats=CONFIG_FORMAT):
             if isinstance(row, EGLConfig):
                 raise TypeError(row, "Call debug_config(display,config)")
             try:
-                value = row[key.name]
+                value = row[getName(key, "EGL_")]
             except KeyError:
                 formatted = "_"
             else:
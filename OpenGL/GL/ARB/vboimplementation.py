@@ -3,9 +3,11 @@ from OpenGL.GL.ARB import vertex_buffer_object
 from OpenGL.GL.ARB import uniform_buffer_object
 from OpenGL.GL.ARB import texture_buffer_object
 from OpenGL.GL.ARB import enhanced_layouts
+from OpenGL.GL.ARB import map_buffer_range, sync, buffer_storage, copy_buffer
 
 class Implementation( vbo.Implementation ):
     """OpenGL ARB extension-based implementation of VBO interfaces"""
+    OPTIONAL_SOURCES = ( map_buffer_range, sync, buffer_storage, copy_buffer )
     def __init__( self ):
         for name in self.EXPORTED_NAMES:
             source = name
@@ -1,49 +1,102 @@
-"""OpenGL.GL, the core GL library and extensions to it"""
+"""OpenGL.GL, the core GL library and extensions to it
+
+If OpenGL.LAZY_IMPORTS is set (the default, on Python 3.7+) the VERSION
+modules are not imported along with the package.  Instead the index in
+OpenGL.GL._symbols (generated by OpenGL.GL._symbolindex) maps each name
+to the module which provides it, and the module's __getattr__ imports
+that module on first access to one of its names.  __all__ lists every
+name, so "from OpenGL.GL import *" still binds (and so imports)
+everything, while "from OpenGL.GL import glClear" or GL.glClear only
+import the modules actually used.
+"""
 # early import of our modules to prevent import loops...
 from OpenGL import error as _error
-from OpenGL.GL.VERSION.GL_1_1 import *
-from OpenGL.GL.pointers import *
-from OpenGL.GL.images import *
-
-from OpenGL.GL.exceptional import *
-
-from OpenGL.GL.glget import *
-
-from OpenGL.GL.VERSION.GL_1_2 import *
-from OpenGL.GL.VERSION.GL_1_3 import *
-from OpenGL.GL.VERSION.GL_1_4 import *
-from OpenGL.GL.VERSION.GL_1_5 import *
-from OpenGL.GL.VERSION.GL_2_0 import *
-from OpenGL.GL.VERSION.GL_2_1 import *
-from OpenGL.GL.VERSION.GL_3_0 import *
-from OpenGL.GL.VERSION.GL_3_1 import *
-from OpenGL.GL.VERSION.GL_3_2 import *
-from OpenGL.GL.VERSION.GL_3_3 import *
-from OpenGL.GL.VERSION.GL_4_0 import *
-from OpenGL.GL.VERSION.GL_4_1 import *
-from OpenGL.GL.VERSION.GL_4_2 import *
-from OpenGL.GL.VERSION.GL_4_3 import *
-from OpenGL.GL.VERSION.GL_4_4 import *
-from OpenGL.GL.VERSION.GL_4_5 import *
-from OpenGL.GL.VERSION.GL_4_6 import *
+from OpenGL import _configflags
+import sys as _sys
+_LAZY = _configflags.LAZY_IMPORTS and _sys.version_info[:2] >= (3,7)
+if _LAZY:
+    try:
+        from OpenGL.GL import _symbols
+    except ImportError:
+        _LAZY = False
+
+if _LAZY:
+    import importlib as _importlib
+    def __getattr__( name ):
+        """Import the module providing name, bind and return its value"""
+        try:
+            index, kind = _symbols.SYMBOLS[name]
+        except KeyError:
+            target = _symbols.ALIASES.get( name )
+            if target is None:
+                raise AttributeError( """module %r has no attribute %r"""%( __name__, name ))
+            value = globals()[target] if target in globals() else __getattr__( target )
+        else:
+            if index is None:
+                value = _importlib.import_module( '%s.%s'%( __name__, name ))
+            else:
+                value = getattr( _importlib.import_module( _symbols.MODULES[index] ), name )
+        globals()[name] = value
+        return value
+    def __dir__():
+        return sorted( set( globals() ) | set( __all__ ))
+
+    def _vboImplementation():
+        """Load the GL VBO implementations when the first VBO needs one"""
+        from OpenGL.GL import vboimplementation
+        from OpenGL.GL.ARB import vboimplementation as _arb
+        return vboimplementation.Implementation()
+    from OpenGL.arrays import vbo as _vbo
+    _vbo.Implementation.IMPLEMENTATION_CLASSES.append( _vboImplementation )
+else:
+    from OpenGL.GL.VERSION.GL_1_1 import *
+    from OpenGL.GL.pointers import *
+    from OpenGL.GL.images import *
+
+    from OpenGL.GL.exceptional import *
+
+    from OpenGL.GL.glget import *
+
+    from OpenGL.GL.VERSION.GL_1_2 import *
+    from OpenGL.GL.VERSION.GL_1_3 import *
+    from OpenGL.GL.VERSION.GL_1_4 import *
+    from OpenGL.GL.VERSION.GL_1_5 import *
+    from OpenGL.GL.VERSION.GL_2_0 import *
+    from OpenGL.GL.VERSION.GL_2_1 import *
+    from OpenGL.GL.VERSION.GL_3_0 import *
+    from OpenGL.GL.VERSION.GL_3_1 import *
+    from OpenGL.GL.VERSION.GL_3_2 import *
+    from OpenGL.GL.VERSION.GL_3_3 import *
+    from OpenGL.GL.VERSION.GL_4_0 import *
+    from OpenGL.GL.VERSION.GL_4_1 import *
+    from OpenGL.GL.VERSION.GL_4_2 import *
+    from OpenGL.GL.VERSION.GL_4_3 import *
+    from OpenGL.GL.VERSION.GL_4_4 import *
+    from OpenGL.GL.VERSION.GL_4_5 import *
+    from OpenGL.GL.VERSION.GL_4_6 import *
 
 from OpenGL.error import *
 GLerror = GLError
 
-# Now the aliases...
-glRotate = glRotated
-glTranslate = glTranslated
-glLight = glLightfv
-glTexCoord = glTexCoord2d
-glScale = glScaled
-#glColor = glColor3f
-glNormal = glNormal3d
-
-glGetBoolean = glGetBooleanv
-glGetDouble = glGetDoublev
-glGetFloat = glGetFloatv
-glGetInteger = glGetIntegerv 
-glGetPolygonStippleub = glGetPolygonStipple
-
-from OpenGL.GL import vboimplementation as _core_implementation
-from OpenGL.GL.ARB import vboimplementation as _arb_implementation
+if _LAZY:
+    __all__ = sorted(
+        set( _symbols.SYMBOLS ) | set( _symbols.ALIASES ) | set( _error.__all__ ) | set(['GLerror'])
+    )
+else:
+    # Now the aliases...
+    glRotate = glRotated
+    glTranslate = glTranslated
+    glLight = glLightfv
+    glTexCoord = glTexCoord2d
+    glScale = glScaled
+    #glColor = glColor3f
+    glNormal = glNormal3d
+
+    glGetBoolean = glGetBooleanv
+    glGetDouble = glGetDoublev
+    glGetFloat = glGetFloatv
+    glGetInteger = glGetIntegerv
+    glGetPolygonStippleub = glGetPolygonStipple
+
+    from OpenGL.GL import vboimplementation as _core_implementation
+    from OpenGL.GL.ARB import vboimplementation as _arb_implementation
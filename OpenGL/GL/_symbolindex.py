@@ -0,0 +1,146 @@
+"""Generator for OpenGL.GL._symbols, the index used by lazy OpenGL.GL
+
+Run from the top of the repository whenever the modules star-imported
+by OpenGL/GL/__init__.py (or their exports) change:
+
+    python -m OpenGL.GL._symbolindex
+
+The index is produced by importing OpenGL.GL eagerly (the generator
+re-runs itself with PYOPENGL_LAZY_IMPORTS=0 and with
+PYOPENGL_COMPACT_CONSTANTS=0, so constants can be classified, if
+necessary), then for each public name in the package finding the last
+of SOURCES which star-exports that very object, i.e. the module whose
+binding wins in the eager package.  Names which are bound in OpenGL/GL/__init__.py
+itself are recorded as aliases of the name with the same value.
+Generation fails if any name can not be accounted for.
+"""
+import os, sys, types, pprint
+
+# The modules star-imported by OpenGL/GL/__init__.py, in order
+SOURCES = (
+    'OpenGL.GL.VERSION.GL_1_1',
+    'OpenGL.GL.pointers',
+    'OpenGL.GL.images',
+    'OpenGL.GL.exceptional',
+    'OpenGL.GL.glget',
+    'OpenGL.GL.VERSION.GL_1_2',
+    'OpenGL.GL.VERSION.GL_1_3',
+    'OpenGL.GL.VERSION.GL_1_4',
+    'OpenGL.GL.VERSION.GL_1_5',
+    'OpenGL.GL.VERSION.GL_2_0',
+    'OpenGL.GL.VERSION.GL_2_1',
+    'OpenGL.GL.VERSION.GL_3_0',
+    'OpenGL.GL.VERSION.GL_3_1',
+    'OpenGL.GL.VERSION.GL_3_2',
+    'OpenGL.GL.VERSION.GL_3_3',
+    'OpenGL.GL.VERSION.GL_4_0',
+    'OpenGL.GL.VERSION.GL_4_1',
+    'OpenGL.GL.VERSION.GL_4_2',
+    'OpenGL.GL.VERSION.GL_4_3',
+    'OpenGL.GL.VERSION.GL_4_4',
+    'OpenGL.GL.VERSION.GL_4_5',
+    'OpenGL.GL.VERSION.GL_4_6',
+)
+# Bound directly (not lazily) by OpenGL.GL in both modes
+EAGER_SOURCE = 'OpenGL.error'
+EAGER_NAMES = ('GLerror',)
+
+FUNCTION = 'function'
+CONSTANT = 'constant'
+VALUE = 'value'
+SUBMODULE = 'submodule'
+
+def exports( module ):
+    """Names bound by "from module import *" """
+    names = getattr( module, '__all__', None )
+    if names is None:
+        names = [name for name in vars( module ) if not name.startswith( '_' )]
+    return names
+
+def kind( value ):
+    """Classify value for the index"""
+    from OpenGL.constant import Constant
+    if isinstance( value, Constant ):
+        return CONSTANT
+    if callable( value ) and not isinstance( value, type ):
+        return FUNCTION
+    return VALUE
+
+def build():
+    """Build (symbols, aliases) from the eagerly imported OpenGL.GL"""
+    import importlib
+    import OpenGL.GL as package
+    if getattr( package, '_LAZY', False ):
+        raise RuntimeError( """OpenGL.GL was imported lazily, set PYOPENGL_LAZY_IMPORTS=0""" )
+    from OpenGL import constant
+    if constant.COMPACT:
+        raise RuntimeError( """Constants are plain ints, set PYOPENGL_COMPACT_CONSTANTS=0""" )
+    eager = importlib.import_module( EAGER_SOURCE )
+    skip = set( exports( eager ) ) | set( EAGER_NAMES )
+    modules = [importlib.import_module( name ) for name in SOURCES]
+    owners = {}
+    for index, module in enumerate( modules ):
+        for name in exports( module ):
+            owners[name] = index
+    symbols = {}
+    aliases = {}
+    missing = []
+    namespace = vars( package )
+    for name, value in sorted( namespace.items() ):
+        if name.startswith( '_' ) or name in skip:
+            continue
+        index = owners.get( name )
+        if index is not None and getattr( modules[index], name ) is value:
+            symbols[name] = (index, kind( value ))
+        elif (
+            isinstance( value, types.ModuleType ) and
+            value.__name__ == '%s.%s'%( package.__name__, name )
+        ):
+            symbols[name] = (None, SUBMODULE)
+        else:
+            missing.append( name )
+    for name in missing:
+        value = namespace[name]
+        for target, (index, _) in sorted( symbols.items() ):
+            if index is not None and getattr( modules[index], target ) is value:
+                aliases[name] = target
+                break
+        else:
+            raise RuntimeError( """Unable to find source of OpenGL.GL.%s"""%( name, ))
+    return symbols, aliases
+
+TEMPLATE = '''"""Symbol index for lazy OpenGL.GL (generated by OpenGL.GL._symbolindex, do not edit)"""
+# modules star-imported by OpenGL.GL, in order
+MODULES = %(modules)s
+# name: (index into MODULES or None for OpenGL.GL submodules, kind)
+SYMBOLS = %(symbols)s
+# name: name of the symbol bound to the same object
+ALIASES = %(aliases)s
+'''
+
+def generate( filename=None ):
+    """Write the symbol index module, returns the filename"""
+    if filename is None:
+        filename = os.path.join( os.path.dirname( __file__ ), '_symbols.py' )
+    symbols, aliases = build()
+    with open( filename, 'w' ) as handle:
+        handle.write( TEMPLATE%{
+            'modules': pprint.pformat( SOURCES ),
+            'symbols': pprint.pformat( symbols ),
+            'aliases': pprint.pformat( aliases ),
+        })
+    return filename
+
+if __name__ == "__main__":
+    import OpenGL.GL
+    from OpenGL import constant
+    if getattr( OpenGL.GL, '_LAZY', False ) or constant.COMPACT:
+        import subprocess
+        environ = dict(
+            os.environ, PYOPENGL_LAZY_IMPORTS='0', PYOPENGL_COMPACT_CONSTANTS='0',
+        )
+        sys.exit( subprocess.call(
+            [sys.executable, '-m', 'OpenGL.GL._symbolindex'] + sys.argv[1:],
+            env=environ,
+        ))
+    print( generate( *sys.argv[1:2] ) )
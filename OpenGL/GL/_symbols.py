@@ -0,0 +1,3312 @@
+"""Symbol index for lazy OpenGL.GL (generated by OpenGL.GL._symbolindex, do not edit)"""
+# modules star-imported by OpenGL.GL, in order
+MODULES = ('OpenGL.GL.VERSION.GL_1_1',
+ 'OpenGL.GL.pointers',
+ 'OpenGL.GL.images',
+ 'OpenGL.GL.exceptional',
+ 'OpenGL.GL.glget',
+ 'OpenGL.GL.VERSION.GL_1_2',
+ 'OpenGL.GL.VERSION.GL_1_3',
+ 'OpenGL.GL.VERSION.GL_1_4',
+ 'OpenGL.GL.VERSION.GL_1_5',
+ 'OpenGL.GL.VERSION.GL_2_0',
+ 'OpenGL.GL.VERSION.GL_2_1',
+ 'OpenGL.GL.VERSION.GL_3_0',
+ 'OpenGL.GL.VERSION.GL_3_1',
+ 'OpenGL.GL.VERSION.GL_3_2',
+ 'OpenGL.GL.VERSION.GL_3_3',
+ 'OpenGL.GL.VERSION.GL_4_0',
+ 'OpenGL.GL.VERSION.GL_4_1',
+ 'OpenGL.GL.VERSION.GL_4_2',
+ 'OpenGL.GL.VERSION.GL_4_3',
+ 'OpenGL.GL.VERSION.GL_4_4',
+ 'OpenGL.GL.VERSION.GL_4_5',
+ 'OpenGL.GL.VERSION.GL_4_6')
+# name: (index into MODULES or None for OpenGL.GL submodules, kind)
+SYMBOLS = {'ARB': (None, 'submodule'),
+ 'ARRAY_TYPE_TO_CONSTANT': (21, 'value'),
+ 'ArrayDatatype': (9, 'value'),
+ 'Constant': (21, 'value'),
+ 'GLDEBUGPROC': (21, 'value'),
+ 'GLDEBUGPROCAMD': (21, 'value'),
+ 'GLDEBUGPROCARB': (21, 'value'),
+ 'GLDEBUGPROCKHR': (21, 'value'),
+ 'GL_2D': (0, 'constant'),
+ 'GL_2_BYTES': (0, 'constant'),
+ 'GL_3D': (0, 'constant'),
+ 'GL_3D_COLOR': (0, 'constant'),
+ 'GL_3D_COLOR_TEXTURE': (0, 'constant'),
+ 'GL_3_BYTES': (0, 'constant'),
+ 'GL_4D_COLOR_TEXTURE': (0, 'constant'),
+ 'GL_4_BYTES': (0, 'constant'),
+ 'GL_ACCUM': (0, 'constant'),
+ 'GL_ACCUM_ALPHA_BITS': (0, 'constant'),
+ 'GL_ACCUM_BLUE_BITS': (0, 'constant'),
+ 'GL_ACCUM_BUFFER_BIT': (0, 'constant'),
+ 'GL_ACCUM_CLEAR_VALUE': (0, 'constant'),
+ 'GL_ACCUM_GREEN_BITS': (0, 'constant'),
+ 'GL_ACCUM_RED_BITS': (0, 'constant'),
+ 'GL_ACTIVE_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_ACTIVE_ATTRIBUTES': (9, 'constant'),
+ 'GL_ACTIVE_ATTRIBUTE_MAX_LENGTH': (9, 'constant'),
+ 'GL_ACTIVE_PROGRAM': (16, 'constant'),
+ 'GL_ACTIVE_RESOURCES': (18, 'constant'),
+ 'GL_ACTIVE_SUBROUTINES': (15, 'constant'),
+ 'GL_ACTIVE_SUBROUTINE_MAX_LENGTH': (15, 'constant'),
+ 'GL_ACTIVE_SUBROUTINE_UNIFORMS': (15, 'constant'),
+ 'GL_ACTIVE_SUBROUTINE_UNIFORM_LOCATIONS': (15, 'constant'),
+ 'GL_ACTIVE_SUBROUTINE_UNIFORM_MAX_LENGTH': (15, 'constant'),
+ 'GL_ACTIVE_TEXTURE': (6, 'constant'),
+ 'GL_ACTIVE_UNIFORMS': (9, 'constant'),
+ 'GL_ACTIVE_UNIFORM_BLOCKS': (12, 'constant'),
+ 'GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH': (12, 'constant'),
+ 'GL_ACTIVE_UNIFORM_MAX_LENGTH': (9, 'constant'),
+ 'GL_ACTIVE_VARIABLES': (18, 'constant'),
+ 'GL_ADD': (0, 'constant'),
+ 'GL_ADD_SIGNED': (6, 'constant'),
+ 'GL_ALIASED_LINE_WIDTH_RANGE': (5, 'constant'),
+ 'GL_ALIASED_POINT_SIZE_RANGE': (5, 'constant'),
+ 'GL_ALL_ATTRIB_BITS': (0, 'constant'),
+ 'GL_ALL_BARRIER_BITS': (17, 'constant'),
+ 'GL_ALL_SHADER_BITS': (16, 'constant'),
+ 'GL_ALPHA': (0, 'constant'),
+ 'GL_ALPHA12': (0, 'constant'),
+ 'GL_ALPHA16': (0, 'constant'),
+ 'GL_ALPHA4': (0, 'constant'),
+ 'GL_ALPHA8': (0, 'constant'),
+ 'GL_ALPHA_BIAS': (0, 'constant'),
+ 'GL_ALPHA_BITS': (0, 'constant'),
+ 'GL_ALPHA_INTEGER': (11, 'constant'),
+ 'GL_ALPHA_SCALE': (0, 'constant'),
+ 'GL_ALPHA_TEST': (0, 'constant'),
+ 'GL_ALPHA_TEST_FUNC': (0, 'constant'),
+ 'GL_ALPHA_TEST_REF': (0, 'constant'),
+ 'GL_ALREADY_SIGNALED': (13, 'constant'),
+ 'GL_ALWAYS': (0, 'constant'),
+ 'GL_AMBIENT': (0, 'constant'),
+ 'GL_AMBIENT_AND_DIFFUSE': (0, 'constant'),
+ 'GL_AND': (0, 'constant'),
+ 'GL_AND_INVERTED': (0, 'constant'),
+ 'GL_AND_REVERSE': (0, 'constant'),
+ 'GL_ANY_SAMPLES_PASSED': (14, 'constant'),
+ 'GL_ANY_SAMPLES_PASSED_CONSERVATIVE': (18, 'constant'),
+ 'GL_ARRAY_BUFFER': (8, 'constant'),
+ 'GL_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_ARRAY_SIZE': (18, 'constant'),
+ 'GL_ARRAY_STRIDE': (18, 'constant'),
+ 'GL_ATOMIC_COUNTER_BARRIER_BIT': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER': (18, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_ACTIVE_ATOMIC_COUNTER_INDICES': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_BINDING': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_DATA_SIZE': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_INDEX': (18, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_COMPUTE_SHADER': (18, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_FRAGMENT_SHADER': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_GEOMETRY_SHADER': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_CONTROL_SHADER': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TESS_EVALUATION_SHADER': (17,
+                                                                   'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_VERTEX_SHADER': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_SIZE': (17, 'constant'),
+ 'GL_ATOMIC_COUNTER_BUFFER_START': (17, 'constant'),
+ 'GL_ATTACHED_SHADERS': (9, 'constant'),
+ 'GL_ATTRIB_STACK_DEPTH': (0, 'constant'),
+ 'GL_AUTO_GENERATE_MIPMAP': (18, 'constant'),
+ 'GL_AUTO_NORMAL': (0, 'constant'),
+ 'GL_AUX0': (0, 'constant'),
+ 'GL_AUX1': (0, 'constant'),
+ 'GL_AUX2': (0, 'constant'),
+ 'GL_AUX3': (0, 'constant'),
+ 'GL_AUX_BUFFERS': (0, 'constant'),
+ 'GL_BACK': (20, 'constant'),
+ 'GL_BACK_LEFT': (0, 'constant'),
+ 'GL_BACK_RIGHT': (0, 'constant'),
+ 'GL_BGR': (5, 'constant'),
+ 'GL_BGRA': (5, 'constant'),
+ 'GL_BGRA_INTEGER': (11, 'constant'),
+ 'GL_BGR_INTEGER': (11, 'constant'),
+ 'GL_BITMAP': (0, 'constant'),
+ 'GL_BITMAP_TOKEN': (0, 'constant'),
+ 'GL_BLEND': (0, 'constant'),
+ 'GL_BLEND_COLOR': (7, 'constant'),
+ 'GL_BLEND_DST': (0, 'constant'),
+ 'GL_BLEND_DST_ALPHA': (7, 'constant'),
+ 'GL_BLEND_DST_RGB': (7, 'constant'),
+ 'GL_BLEND_EQUATION': (7, 'constant'),
+ 'GL_BLEND_EQUATION_ALPHA': (9, 'constant'),
+ 'GL_BLEND_EQUATION_RGB': (9, 'constant'),
+ 'GL_BLEND_SRC': (0, 'constant'),
+ 'GL_BLEND_SRC_ALPHA': (7, 'constant'),
+ 'GL_BLEND_SRC_RGB': (7, 'constant'),
+ 'GL_BLOCK_INDEX': (18, 'constant'),
+ 'GL_BLUE': (0, 'constant'),
+ 'GL_BLUE_BIAS': (0, 'constant'),
+ 'GL_BLUE_BITS': (0, 'constant'),
+ 'GL_BLUE_INTEGER': (11, 'constant'),
+ 'GL_BLUE_SCALE': (0, 'constant'),
+ 'GL_BOOL': (9, 'constant'),
+ 'GL_BOOL_VEC2': (9, 'constant'),
+ 'GL_BOOL_VEC3': (9, 'constant'),
+ 'GL_BOOL_VEC4': (9, 'constant'),
+ 'GL_BUFFER': (18, 'constant'),
+ 'GL_BUFFER_ACCESS': (8, 'constant'),
+ 'GL_BUFFER_ACCESS_FLAGS': (11, 'constant'),
+ 'GL_BUFFER_BINDING': (18, 'constant'),
+ 'GL_BUFFER_DATA_SIZE': (18, 'constant'),
+ 'GL_BUFFER_IMMUTABLE_STORAGE': (19, 'constant'),
+ 'GL_BUFFER_KHR': (18, 'constant'),
+ 'GL_BUFFER_MAPPED': (8, 'constant'),
+ 'GL_BUFFER_MAP_LENGTH': (11, 'constant'),
+ 'GL_BUFFER_MAP_OFFSET': (11, 'constant'),
+ 'GL_BUFFER_MAP_POINTER': (8, 'constant'),
+ 'GL_BUFFER_SIZE': (8, 'constant'),
+ 'GL_BUFFER_STORAGE_FLAGS': (19, 'constant'),
+ 'GL_BUFFER_UPDATE_BARRIER_BIT': (17, 'constant'),
+ 'GL_BUFFER_USAGE': (8, 'constant'),
+ 'GL_BUFFER_VARIABLE': (18, 'constant'),
+ 'GL_BYTE': (21, 'constant'),
+ 'GL_C3F_V3F': (0, 'constant'),
+ 'GL_C4F_N3F_V3F': (0, 'constant'),
+ 'GL_C4UB_V2F': (0, 'constant'),
+ 'GL_C4UB_V3F': (0, 'constant'),
+ 'GL_CAVEAT_SUPPORT': (18, 'constant'),
+ 'GL_CCW': (0, 'constant'),
+ 'GL_CHAR': (21, 'value'),
+ 'GL_CLAMP': (0, 'constant'),
+ 'GL_CLAMP_FRAGMENT_COLOR': (11, 'constant'),
+ 'GL_CLAMP_READ_COLOR': (11, 'constant'),
+ 'GL_CLAMP_TO_BORDER': (6, 'constant'),
+ 'GL_CLAMP_TO_EDGE': (5, 'constant'),
+ 'GL_CLAMP_VERTEX_COLOR': (11, 'constant'),
+ 'GL_CLEAR': (0, 'constant'),
+ 'GL_CLEAR_BUFFER': (18, 'constant'),
+ 'GL_CLEAR_TEXTURE': (19, 'constant'),
+ 'GL_CLIENT_ACTIVE_TEXTURE': (6, 'constant'),
+ 'GL_CLIENT_ALL_ATTRIB_BITS': (0, 'constant'),
+ 'GL_CLIENT_ATTRIB_STACK_DEPTH': (0, 'constant'),
+ 'GL_CLIENT_MAPPED_BUFFER_BARRIER_BIT': (19, 'constant'),
+ 'GL_CLIENT_PIXEL_STORE_BIT': (0, 'constant'),
+ 'GL_CLIENT_STORAGE_BIT': (19, 'constant'),
+ 'GL_CLIENT_VERTEX_ARRAY_BIT': (0, 'constant'),
+ 'GL_CLIPPING_INPUT_PRIMITIVES': (21, 'constant'),
+ 'GL_CLIPPING_OUTPUT_PRIMITIVES': (21, 'constant'),
+ 'GL_CLIP_DEPTH_MODE': (20, 'constant'),
+ 'GL_CLIP_DISTANCE0': (11, 'constant'),
+ 'GL_CLIP_DISTANCE1': (11, 'constant'),
+ 'GL_CLIP_DISTANCE2': (11, 'constant'),
+ 'GL_CLIP_DISTANCE3': (11, 'constant'),
+ 'GL_CLIP_DISTANCE4': (11, 'constant'),
+ 'GL_CLIP_DISTANCE5': (11, 'constant'),
+ 'GL_CLIP_DISTANCE6': (11, 'constant'),
+ 'GL_CLIP_DISTANCE7': (11, 'constant'),
+ 'GL_CLIP_ORIGIN': (20, 'constant'),
+ 'GL_CLIP_PLANE0': (0, 'constant'),
+ 'GL_CLIP_PLANE1': (0, 'constant'),
+ 'GL_CLIP_PLANE2': (0, 'constant'),
+ 'GL_CLIP_PLANE3': (0, 'constant'),
+ 'GL_CLIP_PLANE4': (0, 'constant'),
+ 'GL_CLIP_PLANE5': (0, 'constant'),
+ 'GL_COEFF': (0, 'constant'),
+ 'GL_COLOR': (0, 'constant'),
+ 'GL_COLOR_ARRAY': (0, 'constant'),
+ 'GL_COLOR_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_COLOR_ARRAY_POINTER': (0, 'constant'),
+ 'GL_COLOR_ARRAY_SIZE': (0, 'constant'),
+ 'GL_COLOR_ARRAY_STRIDE': (0, 'constant'),
+ 'GL_COLOR_ARRAY_TYPE': (0, 'constant'),
+ 'GL_COLOR_ATTACHMENT0': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT1': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT10': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT11': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT12': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT13': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT14': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT15': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT16': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT17': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT18': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT19': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT2': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT20': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT21': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT22': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT23': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT24': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT25': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT26': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT27': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT28': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT29': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT3': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT30': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT31': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT4': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT5': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT6': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT7': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT8': (11, 'constant'),
+ 'GL_COLOR_ATTACHMENT9': (11, 'constant'),
+ 'GL_COLOR_BUFFER_BIT': (0, 'constant'),
+ 'GL_COLOR_CLEAR_VALUE': (0, 'constant'),
+ 'GL_COLOR_COMPONENTS': (18, 'constant'),
+ 'GL_COLOR_ENCODING': (18, 'constant'),
+ 'GL_COLOR_INDEX': (0, 'constant'),
+ 'GL_COLOR_INDEXES': (0, 'constant'),
+ 'GL_COLOR_LOGIC_OP': (0, 'constant'),
+ 'GL_COLOR_MATERIAL': (0, 'constant'),
+ 'GL_COLOR_MATERIAL_FACE': (0, 'constant'),
+ 'GL_COLOR_MATERIAL_PARAMETER': (0, 'constant'),
+ 'GL_COLOR_MATRIX': (5, 'constant'),
+ 'GL_COLOR_MATRIX_STACK_DEPTH': (5, 'constant'),
+ 'GL_COLOR_RENDERABLE': (18, 'constant'),
+ 'GL_COLOR_SUM': (7, 'constant'),
+ 'GL_COLOR_TABLE': (5, 'constant'),
+ 'GL_COLOR_TABLE_ALPHA_SIZE': (5, 'constant'),
+ 'GL_COLOR_TABLE_BIAS': (5, 'constant'),
+ 'GL_COLOR_TABLE_BLUE_SIZE': (5, 'constant'),
+ 'GL_COLOR_TABLE_FORMAT': (5, 'constant'),
+ 'GL_COLOR_TABLE_GREEN_SIZE': (5, 'constant'),
+ 'GL_COLOR_TABLE_INTENSITY_SIZE': (5, 'constant'),
+ 'GL_COLOR_TABLE_LUMINANCE_SIZE': (5, 'constant'),
+ 'GL_COLOR_TABLE_RED_SIZE': (5, 'constant'),
+ 'GL_COLOR_TABLE_SCALE': (5, 'constant'),
+ 'GL_COLOR_TABLE_WIDTH': (5, 'constant'),
+ 'GL_COLOR_WRITEMASK': (0, 'constant'),
+ 'GL_COMBINE': (6, 'constant'),
+ 'GL_COMBINE_ALPHA': (6, 'constant'),
+ 'GL_COMBINE_RGB': (6, 'constant'),
+ 'GL_COMMAND_BARRIER_BIT': (17, 'constant'),
+ 'GL_COMPARE_REF_TO_TEXTURE': (11, 'constant'),
+ 'GL_COMPARE_R_TO_TEXTURE': (7, 'constant'),
+ 'GL_COMPATIBLE_SUBROUTINES': (18, 'constant'),
+ 'GL_COMPILE': (0, 'constant'),
+ 'GL_COMPILE_AND_EXECUTE': (0, 'constant'),
+ 'GL_COMPILE_STATUS': (9, 'constant'),
+ 'GL_COMPRESSED_ALPHA': (6, 'constant'),
+ 'GL_COMPRESSED_INTENSITY': (6, 'constant'),
+ 'GL_COMPRESSED_LUMINANCE': (6, 'constant'),
+ 'GL_COMPRESSED_LUMINANCE_ALPHA': (6, 'constant'),
+ 'GL_COMPRESSED_R11_EAC': (18, 'constant'),
+ 'GL_COMPRESSED_RED': (11, 'constant'),
+ 'GL_COMPRESSED_RED_RGTC1': (11, 'constant'),
+ 'GL_COMPRESSED_RG': (11, 'constant'),
+ 'GL_COMPRESSED_RG11_EAC': (18, 'constant'),
+ 'GL_COMPRESSED_RGB': (6, 'constant'),
+ 'GL_COMPRESSED_RGB8_ETC2': (18, 'constant'),
+ 'GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2': (18, 'constant'),
+ 'GL_COMPRESSED_RGBA': (6, 'constant'),
+ 'GL_COMPRESSED_RGBA8_ETC2_EAC': (18, 'constant'),
+ 'GL_COMPRESSED_RGBA_BPTC_UNORM': (17, 'constant'),
+ 'GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT': (17, 'constant'),
+ 'GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT': (17, 'constant'),
+ 'GL_COMPRESSED_RG_RGTC2': (11, 'constant'),
+ 'GL_COMPRESSED_SIGNED_R11_EAC': (18, 'constant'),
+ 'GL_COMPRESSED_SIGNED_RED_RGTC1': (11, 'constant'),
+ 'GL_COMPRESSED_SIGNED_RG11_EAC': (18, 'constant'),
+ 'GL_COMPRESSED_SIGNED_RG_RGTC2': (11, 'constant'),
+ 'GL_COMPRESSED_SLUMINANCE': (10, 'constant'),
+ 'GL_COMPRESSED_SLUMINANCE_ALPHA': (10, 'constant'),
+ 'GL_COMPRESSED_SRGB': (10, 'constant'),
+ 'GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC': (18, 'constant'),
+ 'GL_COMPRESSED_SRGB8_ETC2': (18, 'constant'),
+ 'GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2': (18, 'constant'),
+ 'GL_COMPRESSED_SRGB_ALPHA': (10, 'constant'),
+ 'GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM': (17, 'constant'),
+ 'GL_COMPRESSED_TEXTURE_FORMATS': (6, 'constant'),
+ 'GL_COMPUTE_SHADER': (18, 'constant'),
+ 'GL_COMPUTE_SHADER_BIT': (18, 'constant'),
+ 'GL_COMPUTE_SHADER_INVOCATIONS': (21, 'constant'),
+ 'GL_COMPUTE_SUBROUTINE': (18, 'constant'),
+ 'GL_COMPUTE_SUBROUTINE_UNIFORM': (18, 'constant'),
+ 'GL_COMPUTE_TEXTURE': (18, 'constant'),
+ 'GL_COMPUTE_WORK_GROUP_SIZE': (18, 'constant'),
+ 'GL_CONDITION_SATISFIED': (13, 'constant'),
+ 'GL_CONSTANT': (6, 'constant'),
+ 'GL_CONSTANT_ALPHA': (7, 'constant'),
+ 'GL_CONSTANT_ATTENUATION': (0, 'constant'),
+ 'GL_CONSTANT_BORDER': (5, 'constant'),
+ 'GL_CONSTANT_COLOR': (7, 'constant'),
+ 'GL_CONTEXT_COMPATIBILITY_PROFILE_BIT': (13, 'constant'),
+ 'GL_CONTEXT_CORE_PROFILE_BIT': (13, 'constant'),
+ 'GL_CONTEXT_FLAGS': (11, 'constant'),
+ 'GL_CONTEXT_FLAG_DEBUG_BIT': (18, 'constant'),
+ 'GL_CONTEXT_FLAG_DEBUG_BIT_KHR': (18, 'constant'),
+ 'GL_CONTEXT_FLAG_FORWARD_COMPATIBLE_BIT': (11, 'constant'),
+ 'GL_CONTEXT_FLAG_NO_ERROR_BIT': (21, 'constant'),
+ 'GL_CONTEXT_FLAG_ROBUST_ACCESS_BIT': (20, 'constant'),
+ 'GL_CONTEXT_LOST': (20, 'constant'),
+ 'GL_CONTEXT_PROFILE_MASK': (13, 'constant'),
+ 'GL_CONTEXT_RELEASE_BEHAVIOR': (21, 'constant'),
+ 'GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH': (21, 'constant'),
+ 'GL_CONVOLUTION_1D': (5, 'constant'),
+ 'GL_CONVOLUTION_2D': (5, 'constant'),
+ 'GL_CONVOLUTION_BORDER_COLOR': (5, 'constant'),
+ 'GL_CONVOLUTION_BORDER_MODE': (5, 'constant'),
+ 'GL_CONVOLUTION_FILTER_BIAS': (5, 'constant'),
+ 'GL_CONVOLUTION_FILTER_SCALE': (5, 'constant'),
+ 'GL_CONVOLUTION_FORMAT': (5, 'constant'),
+ 'GL_CONVOLUTION_HEIGHT': (5, 'constant'),
+ 'GL_CONVOLUTION_WIDTH': (5, 'constant'),
+ 'GL_COORD_REPLACE': (9, 'constant'),
+ 'GL_COPY': (0, 'constant'),
+ 'GL_COPY_INVERTED': (0, 'constant'),
+ 'GL_COPY_PIXEL_TOKEN': (0, 'constant'),
+ 'GL_COPY_READ_BUFFER': (12, 'constant'),
+ 'GL_COPY_READ_BUFFER_BINDING': (17, 'constant'),
+ 'GL_COPY_WRITE_BUFFER': (12, 'constant'),
+ 'GL_COPY_WRITE_BUFFER_BINDING': (17, 'constant'),
+ 'GL_CULL_FACE': (0, 'constant'),
+ 'GL_CULL_FACE_MODE': (0, 'constant'),
+ 'GL_CURRENT_BIT': (0, 'constant'),
+ 'GL_CURRENT_COLOR': (0, 'constant'),
+ 'GL_CURRENT_FOG_COORD': (8, 'constant'),
+ 'GL_CURRENT_FOG_COORDINATE': (7, 'constant'),
+ 'GL_CURRENT_INDEX': (0, 'constant'),
+ 'GL_CURRENT_NORMAL': (0, 'constant'),
+ 'GL_CURRENT_PROGRAM': (9, 'constant'),
+ 'GL_CURRENT_QUERY': (8, 'constant'),
+ 'GL_CURRENT_RASTER_COLOR': (0, 'constant'),
+ 'GL_CURRENT_RASTER_DISTANCE': (0, 'constant'),
+ 'GL_CURRENT_RASTER_INDEX': (0, 'constant'),
+ 'GL_CURRENT_RASTER_POSITION': (0, 'constant'),
+ 'GL_CURRENT_RASTER_POSITION_VALID': (0, 'constant'),
+ 'GL_CURRENT_RASTER_SECONDARY_COLOR': (10, 'constant'),
+ 'GL_CURRENT_RASTER_TEXTURE_COORDS': (0, 'constant'),
+ 'GL_CURRENT_SECONDARY_COLOR': (7, 'constant'),
+ 'GL_CURRENT_TEXTURE_COORDS': (0, 'constant'),
+ 'GL_CURRENT_VERTEX_ATTRIB': (9, 'constant'),
+ 'GL_CW': (0, 'constant'),
+ 'GL_DEBUG_CALLBACK_FUNCTION': (18, 'constant'),
+ 'GL_DEBUG_CALLBACK_FUNCTION_KHR': (18, 'constant'),
+ 'GL_DEBUG_CALLBACK_USER_PARAM': (18, 'constant'),
+ 'GL_DEBUG_CALLBACK_USER_PARAM_KHR': (18, 'constant'),
+ 'GL_DEBUG_GROUP_STACK_DEPTH': (18, 'constant'),
+ 'GL_DEBUG_GROUP_STACK_DEPTH_KHR': (18, 'constant'),
+ 'GL_DEBUG_LOGGED_MESSAGES': (18, 'constant'),
+ 'GL_DEBUG_LOGGED_MESSAGES_KHR': (18, 'constant'),
+ 'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH': (18, 'constant'),
+ 'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH_KHR': (18, 'constant'),
+ 'GL_DEBUG_OUTPUT': (18, 'constant'),
+ 'GL_DEBUG_OUTPUT_KHR': (18, 'constant'),
+ 'GL_DEBUG_OUTPUT_SYNCHRONOUS': (18, 'constant'),
+ 'GL_DEBUG_OUTPUT_SYNCHRONOUS_KHR': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_HIGH': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_HIGH_KHR': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_LOW': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_LOW_KHR': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_MEDIUM': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_MEDIUM_KHR': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_NOTIFICATION': (18, 'constant'),
+ 'GL_DEBUG_SEVERITY_NOTIFICATION_KHR': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_API': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_API_KHR': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_APPLICATION': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_APPLICATION_KHR': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_OTHER': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_OTHER_KHR': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_SHADER_COMPILER': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_SHADER_COMPILER_KHR': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_THIRD_PARTY': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_THIRD_PARTY_KHR': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_WINDOW_SYSTEM': (18, 'constant'),
+ 'GL_DEBUG_SOURCE_WINDOW_SYSTEM_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_ERROR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_ERROR_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_MARKER': (18, 'constant'),
+ 'GL_DEBUG_TYPE_MARKER_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_OTHER': (18, 'constant'),
+ 'GL_DEBUG_TYPE_OTHER_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_PERFORMANCE': (18, 'constant'),
+ 'GL_DEBUG_TYPE_PERFORMANCE_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_POP_GROUP': (18, 'constant'),
+ 'GL_DEBUG_TYPE_POP_GROUP_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_PORTABILITY': (18, 'constant'),
+ 'GL_DEBUG_TYPE_PORTABILITY_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_PUSH_GROUP': (18, 'constant'),
+ 'GL_DEBUG_TYPE_PUSH_GROUP_KHR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR': (18, 'constant'),
+ 'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR_KHR': (18, 'constant'),
+ 'GL_DECAL': (0, 'constant'),
+ 'GL_DECR': (0, 'constant'),
+ 'GL_DECR_WRAP': (7, 'constant'),
+ 'GL_DELETE_STATUS': (9, 'constant'),
+ 'GL_DEPTH': (0, 'constant'),
+ 'GL_DEPTH24_STENCIL8': (11, 'constant'),
+ 'GL_DEPTH32F_STENCIL8': (11, 'constant'),
+ 'GL_DEPTH_ATTACHMENT': (11, 'constant'),
+ 'GL_DEPTH_BIAS': (0, 'constant'),
+ 'GL_DEPTH_BITS': (0, 'constant'),
+ 'GL_DEPTH_BUFFER': (0, 'constant'),
+ 'GL_DEPTH_BUFFER_BIT': (0, 'constant'),
+ 'GL_DEPTH_CLAMP': (13, 'constant'),
+ 'GL_DEPTH_CLEAR_VALUE': (0, 'constant'),
+ 'GL_DEPTH_COMPONENT': (0, 'constant'),
+ 'GL_DEPTH_COMPONENT16': (7, 'constant'),
+ 'GL_DEPTH_COMPONENT24': (7, 'constant'),
+ 'GL_DEPTH_COMPONENT32': (7, 'constant'),
+ 'GL_DEPTH_COMPONENT32F': (11, 'constant'),
+ 'GL_DEPTH_COMPONENTS': (18, 'constant'),
+ 'GL_DEPTH_FUNC': (0, 'constant'),
+ 'GL_DEPTH_RANGE': (16, 'constant'),
+ 'GL_DEPTH_RENDERABLE': (18, 'constant'),
+ 'GL_DEPTH_SCALE': (0, 'constant'),
+ 'GL_DEPTH_STENCIL': (11, 'constant'),
+ 'GL_DEPTH_STENCIL_ATTACHMENT': (11, 'constant'),
+ 'GL_DEPTH_STENCIL_TEXTURE_MODE': (18, 'constant'),
+ 'GL_DEPTH_TEST': (0, 'constant'),
+ 'GL_DEPTH_TEXTURE_MODE': (7, 'constant'),
+ 'GL_DEPTH_WRITEMASK': (0, 'constant'),
+ 'GL_DIFFUSE': (0, 'constant'),
+ 'GL_DISPATCH_INDIRECT_BUFFER': (18, 'constant'),
+ 'GL_DISPATCH_INDIRECT_BUFFER_BINDING': (18, 'constant'),
+ 'GL_DISPLAY_LIST': (18, 'constant'),
+ 'GL_DITHER': (0, 'constant'),
+ 'GL_DOMAIN': (0, 'constant'),
+ 'GL_DONT_CARE': (0, 'constant'),
+ 'GL_DOT3_RGB': (6, 'constant'),
+ 'GL_DOT3_RGBA': (6, 'constant'),
+ 'GL_DOUBLE': (21, 'constant'),
+ 'GL_DOUBLEBUFFER': (0, 'constant'),
+ 'GL_DOUBLE_MAT2': (16, 'constant'),
+ 'GL_DOUBLE_MAT2x3': (16, 'constant'),
+ 'GL_DOUBLE_MAT2x4': (16, 'constant'),
+ 'GL_DOUBLE_MAT3': (16, 'constant'),
+ 'GL_DOUBLE_MAT3x2': (16, 'constant'),
+ 'GL_DOUBLE_MAT3x4': (16, 'constant'),
+ 'GL_DOUBLE_MAT4': (16, 'constant'),
+ 'GL_DOUBLE_MAT4x2': (16, 'constant'),
+ 'GL_DOUBLE_MAT4x3': (16, 'constant'),
+ 'GL_DOUBLE_VEC2': (16, 'constant'),
+ 'GL_DOUBLE_VEC3': (16, 'constant'),
+ 'GL_DOUBLE_VEC4': (16, 'constant'),
+ 'GL_DRAW_BUFFER': (0, 'constant'),
+ 'GL_DRAW_BUFFER0': (9, 'constant'),
+ 'GL_DRAW_BUFFER1': (9, 'constant'),
+ 'GL_DRAW_BUFFER10': (9, 'constant'),
+ 'GL_DRAW_BUFFER11': (9, 'constant'),
+ 'GL_DRAW_BUFFER12': (9, 'constant'),
+ 'GL_DRAW_BUFFER13': (9, 'constant'),
+ 'GL_DRAW_BUFFER14': (9, 'constant'),
+ 'GL_DRAW_BUFFER15': (9, 'constant'),
+ 'GL_DRAW_BUFFER2': (9, 'constant'),
+ 'GL_DRAW_BUFFER3': (9, 'constant'),
+ 'GL_DRAW_BUFFER4': (9, 'constant'),
+ 'GL_DRAW_BUFFER5': (9, 'constant'),
+ 'GL_DRAW_BUFFER6': (9, 'constant'),
+ 'GL_DRAW_BUFFER7': (9, 'constant'),
+ 'GL_DRAW_BUFFER8': (9, 'constant'),
+ 'GL_DRAW_BUFFER9': (9, 'constant'),
+ 'GL_DRAW_FRAMEBUFFER': (11, 'constant'),
+ 'GL_DRAW_FRAMEBUFFER_BINDING': (11, 'constant'),
+ 'GL_DRAW_INDIRECT_BUFFER': (15, 'constant'),
+ 'GL_DRAW_INDIRECT_BUFFER_BINDING': (15, 'constant'),
+ 'GL_DRAW_PIXEL_TOKEN': (0, 'constant'),
+ 'GL_DST_ALPHA': (0, 'constant'),
+ 'GL_DST_COLOR': (0, 'constant'),
+ 'GL_DYNAMIC_COPY': (8, 'constant'),
+ 'GL_DYNAMIC_DRAW': (8, 'constant'),
+ 'GL_DYNAMIC_READ': (8, 'constant'),
+ 'GL_DYNAMIC_STORAGE_BIT': (19, 'constant'),
+ 'GL_EDGE_FLAG': (0, 'constant'),
+ 'GL_EDGE_FLAG_ARRAY': (0, 'constant'),
+ 'GL_EDGE_FLAG_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_EDGE_FLAG_ARRAY_POINTER': (0, 'constant'),
+ 'GL_EDGE_FLAG_ARRAY_STRIDE': (0, 'constant'),
+ 'GL_ELEMENT_ARRAY_BARRIER_BIT': (17, 'constant'),
+ 'GL_ELEMENT_ARRAY_BUFFER': (8, 'constant'),
+ 'GL_ELEMENT_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_EMISSION': (0, 'constant'),
+ 'GL_ENABLE_BIT': (0, 'constant'),
+ 'GL_EQUAL': (0, 'constant'),
+ 'GL_EQUIV': (0, 'constant'),
+ 'GL_EVAL_BIT': (0, 'constant'),
+ 'GL_EXP': (0, 'constant'),
+ 'GL_EXP2': (0, 'constant'),
+ 'GL_EXTENSIONS': (0, 'constant'),
+ 'GL_EYE_LINEAR': (0, 'constant'),
+ 'GL_EYE_PLANE': (0, 'constant'),
+ 'GL_FALSE': (21, 'constant'),
+ 'GL_FASTEST': (0, 'constant'),
+ 'GL_FEEDBACK': (0, 'constant'),
+ 'GL_FEEDBACK_BUFFER_POINTER': (0, 'constant'),
+ 'GL_FEEDBACK_BUFFER_SIZE': (0, 'constant'),
+ 'GL_FEEDBACK_BUFFER_TYPE': (0, 'constant'),
+ 'GL_FILL': (0, 'constant'),
+ 'GL_FILTER': (18, 'constant'),
+ 'GL_FIRST_VERTEX_CONVENTION': (16, 'constant'),
+ 'GL_FIXED': (21, 'constant'),
+ 'GL_FIXED_ONLY': (11, 'constant'),
+ 'GL_FLAT': (0, 'constant'),
+ 'GL_FLOAT': (21, 'constant'),
+ 'GL_FLOAT_32_UNSIGNED_INT_24_8_REV': (11, 'constant'),
+ 'GL_FLOAT_MAT2': (9, 'constant'),
+ 'GL_FLOAT_MAT2x3': (10, 'constant'),
+ 'GL_FLOAT_MAT2x4': (10, 'constant'),
+ 'GL_FLOAT_MAT3': (9, 'constant'),
+ 'GL_FLOAT_MAT3x2': (10, 'constant'),
+ 'GL_FLOAT_MAT3x4': (10, 'constant'),
+ 'GL_FLOAT_MAT4': (9, 'constant'),
+ 'GL_FLOAT_MAT4x2': (10, 'constant'),
+ 'GL_FLOAT_MAT4x3': (10, 'constant'),
+ 'GL_FLOAT_VEC2': (9, 'constant'),
+ 'GL_FLOAT_VEC3': (9, 'constant'),
+ 'GL_FLOAT_VEC4': (9, 'constant'),
+ 'GL_FOG': (0, 'constant'),
+ 'GL_FOG_BIT': (0, 'constant'),
+ 'GL_FOG_COLOR': (0, 'constant'),
+ 'GL_FOG_COORD': (8, 'constant'),
+ 'GL_FOG_COORDINATE': (7, 'constant'),
+ 'GL_FOG_COORDINATE_ARRAY': (7, 'constant'),
+ 'GL_FOG_COORDINATE_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_FOG_COORDINATE_ARRAY_POINTER': (7, 'constant'),
+ 'GL_FOG_COORDINATE_ARRAY_STRIDE': (7, 'constant'),
+ 'GL_FOG_COORDINATE_ARRAY_TYPE': (7, 'constant'),
+ 'GL_FOG_COORDINATE_SOURCE': (7, 'constant'),
+ 'GL_FOG_COORD_ARRAY': (8, 'constant'),
+ 'GL_FOG_COORD_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_FOG_COORD_ARRAY_POINTER': (8, 'constant'),
+ 'GL_FOG_COORD_ARRAY_STRIDE': (8, 'constant'),
+ 'GL_FOG_COORD_ARRAY_TYPE': (8, 'constant'),
+ 'GL_FOG_COORD_SRC': (8, 'constant'),
+ 'GL_FOG_DENSITY': (0, 'constant'),
+ 'GL_FOG_END': (0, 'constant'),
+ 'GL_FOG_HINT': (0, 'constant'),
+ 'GL_FOG_INDEX': (0, 'constant'),
+ 'GL_FOG_MODE': (0, 'constant'),
+ 'GL_FOG_START': (0, 'constant'),
+ 'GL_FRACTIONAL_EVEN': (15, 'constant'),
+ 'GL_FRACTIONAL_ODD': (15, 'constant'),
+ 'GL_FRAGMENT_DEPTH': (7, 'constant'),
+ 'GL_FRAGMENT_INTERPOLATION_OFFSET_BITS': (15, 'constant'),
+ 'GL_FRAGMENT_SHADER': (9, 'constant'),
+ 'GL_FRAGMENT_SHADER_BIT': (16, 'constant'),
+ 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT': (9, 'constant'),
+ 'GL_FRAGMENT_SHADER_INVOCATIONS': (21, 'constant'),
+ 'GL_FRAGMENT_SUBROUTINE': (18, 'constant'),
+ 'GL_FRAGMENT_SUBROUTINE_UNIFORM': (18, 'constant'),
+ 'GL_FRAGMENT_TEXTURE': (18, 'constant'),
+ 'GL_FRAMEBUFFER': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_LAYERED': (13, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER': (11, 'constant'),
+ 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL': (11, 'constant'),
+ 'GL_FRAMEBUFFER_BARRIER_BIT': (17, 'constant'),
+ 'GL_FRAMEBUFFER_BINDING': (11, 'constant'),
+ 'GL_FRAMEBUFFER_BLEND': (18, 'constant'),
+ 'GL_FRAMEBUFFER_COMPLETE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_DEFAULT': (11, 'constant'),
+ 'GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS': (18, 'constant'),
+ 'GL_FRAMEBUFFER_DEFAULT_HEIGHT': (18, 'constant'),
+ 'GL_FRAMEBUFFER_DEFAULT_LAYERS': (18, 'constant'),
+ 'GL_FRAMEBUFFER_DEFAULT_SAMPLES': (18, 'constant'),
+ 'GL_FRAMEBUFFER_DEFAULT_WIDTH': (18, 'constant'),
+ 'GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT': (11, 'constant'),
+ 'GL_FRAMEBUFFER_INCOMPLETE_DRAW_BUFFER': (11, 'constant'),
+ 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS': (13, 'constant'),
+ 'GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT': (11, 'constant'),
+ 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE': (11, 'constant'),
+ 'GL_FRAMEBUFFER_INCOMPLETE_READ_BUFFER': (11, 'constant'),
+ 'GL_FRAMEBUFFER_RENDERABLE': (18, 'constant'),
+ 'GL_FRAMEBUFFER_RENDERABLE_LAYERED': (18, 'constant'),
+ 'GL_FRAMEBUFFER_SRGB': (11, 'constant'),
+ 'GL_FRAMEBUFFER_UNDEFINED': (11, 'constant'),
+ 'GL_FRAMEBUFFER_UNSUPPORTED': (11, 'constant'),
+ 'GL_FRONT': (0, 'constant'),
+ 'GL_FRONT_AND_BACK': (0, 'constant'),
+ 'GL_FRONT_FACE': (0, 'constant'),
+ 'GL_FRONT_LEFT': (0, 'constant'),
+ 'GL_FRONT_RIGHT': (0, 'constant'),
+ 'GL_FULL_SUPPORT': (18, 'constant'),
+ 'GL_FUNC_ADD': (7, 'constant'),
+ 'GL_FUNC_REVERSE_SUBTRACT': (7, 'constant'),
+ 'GL_FUNC_SUBTRACT': (7, 'constant'),
+ 'GL_GENERATE_MIPMAP': (7, 'constant'),
+ 'GL_GENERATE_MIPMAP_HINT': (7, 'constant'),
+ 'GL_GEOMETRY_INPUT_TYPE': (13, 'constant'),
+ 'GL_GEOMETRY_OUTPUT_TYPE': (13, 'constant'),
+ 'GL_GEOMETRY_SHADER': (13, 'constant'),
+ 'GL_GEOMETRY_SHADER_BIT': (16, 'constant'),
+ 'GL_GEOMETRY_SHADER_INVOCATIONS': (21, 'constant'),
+ 'GL_GEOMETRY_SHADER_PRIMITIVES_EMITTED': (21, 'constant'),
+ 'GL_GEOMETRY_SUBROUTINE': (18, 'constant'),
+ 'GL_GEOMETRY_SUBROUTINE_UNIFORM': (18, 'constant'),
+ 'GL_GEOMETRY_TEXTURE': (18, 'constant'),
+ 'GL_GEOMETRY_VERTICES_OUT': (13, 'constant'),
+ 'GL_GEQUAL': (0, 'constant'),
+ 'GL_GET_TEXTURE_IMAGE_FORMAT': (18, 'constant'),
+ 'GL_GET_TEXTURE_IMAGE_TYPE': (18, 'constant'),
+ 'GL_GREATER': (0, 'constant'),
+ 'GL_GREEN': (0, 'constant'),
+ 'GL_GREEN_BIAS': (0, 'constant'),
+ 'GL_GREEN_BITS': (0, 'constant'),
+ 'GL_GREEN_INTEGER': (11, 'constant'),
+ 'GL_GREEN_SCALE': (0, 'constant'),
+ 'GL_GUILTY_CONTEXT_RESET': (20, 'constant'),
+ 'GL_HALF_FLOAT': (21, 'constant'),
+ 'GL_HALF_NV': (21, 'constant'),
+ 'GL_HIGH_FLOAT': (16, 'constant'),
+ 'GL_HIGH_INT': (16, 'constant'),
+ 'GL_HINT_BIT': (0, 'constant'),
+ 'GL_HISTOGRAM': (5, 'constant'),
+ 'GL_HISTOGRAM_ALPHA_SIZE': (5, 'constant'),
+ 'GL_HISTOGRAM_BLUE_SIZE': (5, 'constant'),
+ 'GL_HISTOGRAM_FORMAT': (5, 'constant'),
+ 'GL_HISTOGRAM_GREEN_SIZE': (5, 'constant'),
+ 'GL_HISTOGRAM_LUMINANCE_SIZE': (5, 'constant'),
+ 'GL_HISTOGRAM_RED_SIZE': (5, 'constant'),
+ 'GL_HISTOGRAM_SINK': (5, 'constant'),
+ 'GL_HISTOGRAM_WIDTH': (5, 'constant'),
+ 'GL_IMAGE_1D': (17, 'constant'),
+ 'GL_IMAGE_1D_ARRAY': (17, 'constant'),
+ 'GL_IMAGE_2D': (17, 'constant'),
+ 'GL_IMAGE_2D_ARRAY': (17, 'constant'),
+ 'GL_IMAGE_2D_MULTISAMPLE': (17, 'constant'),
+ 'GL_IMAGE_2D_MULTISAMPLE_ARRAY': (17, 'constant'),
+ 'GL_IMAGE_2D_RECT': (17, 'constant'),
+ 'GL_IMAGE_3D': (17, 'constant'),
+ 'GL_IMAGE_BINDING_ACCESS': (17, 'constant'),
+ 'GL_IMAGE_BINDING_FORMAT': (17, 'constant'),
+ 'GL_IMAGE_BINDING_LAYER': (17, 'constant'),
+ 'GL_IMAGE_BINDING_LAYERED': (17, 'constant'),
+ 'GL_IMAGE_BINDING_LEVEL': (17, 'constant'),
+ 'GL_IMAGE_BINDING_NAME': (17, 'constant'),
+ 'GL_IMAGE_BUFFER': (17, 'constant'),
+ 'GL_IMAGE_CLASS_10_10_10_2': (18, 'constant'),
+ 'GL_IMAGE_CLASS_11_11_10': (18, 'constant'),
+ 'GL_IMAGE_CLASS_1_X_16': (18, 'constant'),
+ 'GL_IMAGE_CLASS_1_X_32': (18, 'constant'),
+ 'GL_IMAGE_CLASS_1_X_8': (18, 'constant'),
+ 'GL_IMAGE_CLASS_2_X_16': (18, 'constant'),
+ 'GL_IMAGE_CLASS_2_X_32': (18, 'constant'),
+ 'GL_IMAGE_CLASS_2_X_8': (18, 'constant'),
+ 'GL_IMAGE_CLASS_4_X_16': (18, 'constant'),
+ 'GL_IMAGE_CLASS_4_X_32': (18, 'constant'),
+ 'GL_IMAGE_CLASS_4_X_8': (18, 'constant'),
+ 'GL_IMAGE_COMPATIBILITY_CLASS': (18, 'constant'),
+ 'GL_IMAGE_CUBE': (17, 'constant'),
+ 'GL_IMAGE_CUBE_MAP_ARRAY': (17, 'constant'),
+ 'GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS': (17, 'constant'),
+ 'GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE': (17, 'constant'),
+ 'GL_IMAGE_FORMAT_COMPATIBILITY_TYPE': (18, 'constant'),
+ 'GL_IMAGE_PIXEL_FORMAT': (18, 'constant'),
+ 'GL_IMAGE_PIXEL_TYPE': (18, 'constant'),
+ 'GL_IMAGE_TEXEL_SIZE': (18, 'constant'),
+ 'GL_IMPLEMENTATION_COLOR_READ_FORMAT': (16, 'constant'),
+ 'GL_IMPLEMENTATION_COLOR_READ_TYPE': (16, 'constant'),
+ 'GL_INCR': (0, 'constant'),
+ 'GL_INCR_WRAP': (7, 'constant'),
+ 'GL_INDEX': (11, 'constant'),
+ 'GL_INDEX_ARRAY': (0, 'constant'),
+ 'GL_INDEX_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_INDEX_ARRAY_POINTER': (0, 'constant'),
+ 'GL_INDEX_ARRAY_STRIDE': (0, 'constant'),
+ 'GL_INDEX_ARRAY_TYPE': (0, 'constant'),
+ 'GL_INDEX_BITS': (0, 'constant'),
+ 'GL_INDEX_CLEAR_VALUE': (0, 'constant'),
+ 'GL_INDEX_LOGIC_OP': (0, 'constant'),
+ 'GL_INDEX_MODE': (0, 'constant'),
+ 'GL_INDEX_OFFSET': (0, 'constant'),
+ 'GL_INDEX_SHIFT': (0, 'constant'),
+ 'GL_INDEX_WRITEMASK': (0, 'constant'),
+ 'GL_INFO_LOG_LENGTH': (9, 'constant'),
+ 'GL_INNOCENT_CONTEXT_RESET': (20, 'constant'),
+ 'GL_INT': (21, 'constant'),
+ 'GL_INTENSITY': (0, 'constant'),
+ 'GL_INTENSITY12': (0, 'constant'),
+ 'GL_INTENSITY16': (0, 'constant'),
+ 'GL_INTENSITY4': (0, 'constant'),
+ 'GL_INTENSITY8': (0, 'constant'),
+ 'GL_INTERLEAVED_ARRAY_POINTER': (1, 'constant'),
+ 'GL_INTERLEAVED_ATTRIBS': (11, 'constant'),
+ 'GL_INTERNALFORMAT_ALPHA_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_ALPHA_TYPE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_BLUE_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_BLUE_TYPE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_DEPTH_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_DEPTH_TYPE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_GREEN_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_GREEN_TYPE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_PREFERRED': (18, 'constant'),
+ 'GL_INTERNALFORMAT_RED_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_RED_TYPE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_SHARED_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_STENCIL_SIZE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_STENCIL_TYPE': (18, 'constant'),
+ 'GL_INTERNALFORMAT_SUPPORTED': (18, 'constant'),
+ 'GL_INTERPOLATE': (6, 'constant'),
+ 'GL_INT_2_10_10_10_REV': (14, 'constant'),
+ 'GL_INT_IMAGE_1D': (17, 'constant'),
+ 'GL_INT_IMAGE_1D_ARRAY': (17, 'constant'),
+ 'GL_INT_IMAGE_2D': (17, 'constant'),
+ 'GL_INT_IMAGE_2D_ARRAY': (17, 'constant'),
+ 'GL_INT_IMAGE_2D_MULTISAMPLE': (17, 'constant'),
+ 'GL_INT_IMAGE_2D_MULTISAMPLE_ARRAY': (17, 'constant'),
+ 'GL_INT_IMAGE_2D_RECT': (17, 'constant'),
+ 'GL_INT_IMAGE_3D': (17, 'constant'),
+ 'GL_INT_IMAGE_BUFFER': (17, 'constant'),
+ 'GL_INT_IMAGE_CUBE': (17, 'constant'),
+ 'GL_INT_IMAGE_CUBE_MAP_ARRAY': (17, 'constant'),
+ 'GL_INT_SAMPLER_1D': (11, 'constant'),
+ 'GL_INT_SAMPLER_1D_ARRAY': (11, 'constant'),
+ 'GL_INT_SAMPLER_2D': (11, 'constant'),
+ 'GL_INT_SAMPLER_2D_ARRAY': (11, 'constant'),
+ 'GL_INT_SAMPLER_2D_MULTISAMPLE': (13, 'constant'),
+ 'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY': (13, 'constant'),
+ 'GL_INT_SAMPLER_2D_RECT': (12, 'constant'),
+ 'GL_INT_SAMPLER_3D': (11, 'constant'),
+ 'GL_INT_SAMPLER_BUFFER': (12, 'constant'),
+ 'GL_INT_SAMPLER_CUBE': (11, 'constant'),
+ 'GL_INT_SAMPLER_CUBE_MAP_ARRAY': (15, 'constant'),
+ 'GL_INT_VEC2': (9, 'constant'),
+ 'GL_INT_VEC3': (9, 'constant'),
+ 'GL_INT_VEC4': (9, 'constant'),
+ 'GL_INVALID_ENUM': (0, 'constant'),
+ 'GL_INVALID_FRAMEBUFFER_OPERATION': (11, 'constant'),
+ 'GL_INVALID_INDEX': (12, 'constant'),
+ 'GL_INVALID_OPERATION': (0, 'constant'),
+ 'GL_INVALID_VALUE': (0, 'constant'),
+ 'GL_INVERT': (0, 'constant'),
+ 'GL_ISOLINES': (15, 'constant'),
+ 'GL_IS_PER_PATCH': (18, 'constant'),
+ 'GL_IS_ROW_MAJOR': (18, 'constant'),
+ 'GL_KEEP': (0, 'constant'),
+ 'GL_LAST_VERTEX_CONVENTION': (16, 'constant'),
+ 'GL_LAYER_PROVOKING_VERTEX': (16, 'constant'),
+ 'GL_LEFT': (0, 'constant'),
+ 'GL_LEQUAL': (0, 'constant'),
+ 'GL_LESS': (0, 'constant'),
+ 'GL_LIGHT0': (0, 'constant'),
+ 'GL_LIGHT1': (0, 'constant'),
+ 'GL_LIGHT2': (0, 'constant'),
+ 'GL_LIGHT3': (0, 'constant'),
+ 'GL_LIGHT4': (0, 'constant'),
+ 'GL_LIGHT5': (0, 'constant'),
+ 'GL_LIGHT6': (0, 'constant'),
+ 'GL_LIGHT7': (0, 'constant'),
+ 'GL_LIGHTING': (0, 'constant'),
+ 'GL_LIGHTING_BIT': (0, 'constant'),
+ 'GL_LIGHT_MODEL_AMBIENT': (0, 'constant'),
+ 'GL_LIGHT_MODEL_COLOR_CONTROL': (5, 'constant'),
+ 'GL_LIGHT_MODEL_LOCAL_VIEWER': (0, 'constant'),
+ 'GL_LIGHT_MODEL_TWO_SIDE': (0, 'constant'),
+ 'GL_LINE': (0, 'constant'),
+ 'GL_LINEAR': (0, 'constant'),
+ 'GL_LINEAR_ATTENUATION': (0, 'constant'),
+ 'GL_LINEAR_MIPMAP_LINEAR': (0, 'constant'),
+ 'GL_LINEAR_MIPMAP_NEAREST': (0, 'constant'),
+ 'GL_LINES': (0, 'constant'),
+ 'GL_LINES_ADJACENCY': (13, 'constant'),
+ 'GL_LINE_BIT': (0, 'constant'),
+ 'GL_LINE_LOOP': (0, 'constant'),
+ 'GL_LINE_RESET_TOKEN': (0, 'constant'),
+ 'GL_LINE_SMOOTH': (0, 'constant'),
+ 'GL_LINE_SMOOTH_HINT': (0, 'constant'),
+ 'GL_LINE_STIPPLE': (0, 'constant'),
+ 'GL_LINE_STIPPLE_PATTERN': (0, 'constant'),
+ 'GL_LINE_STIPPLE_REPEAT': (0, 'constant'),
+ 'GL_LINE_STRIP': (0, 'constant'),
+ 'GL_LINE_STRIP_ADJACENCY': (13, 'constant'),
+ 'GL_LINE_TOKEN': (0, 'constant'),
+ 'GL_LINE_WIDTH': (0, 'constant'),
+ 'GL_LINE_WIDTH_GRANULARITY': (5, 'constant'),
+ 'GL_LINE_WIDTH_RANGE': (5, 'constant'),
+ 'GL_LINK_STATUS': (9, 'constant'),
+ 'GL_LIST_BASE': (0, 'constant'),
+ 'GL_LIST_BIT': (0, 'constant'),
+ 'GL_LIST_INDEX': (0, 'constant'),
+ 'GL_LIST_MODE': (0, 'constant'),
+ 'GL_LOAD': (0, 'constant'),
+ 'GL_LOCATION': (18, 'constant'),
+ 'GL_LOCATION_COMPONENT': (19, 'constant'),
+ 'GL_LOCATION_INDEX': (18, 'constant'),
+ 'GL_LOGIC_OP': (0, 'constant'),
+ 'GL_LOGIC_OP_MODE': (0, 'constant'),
+ 'GL_LOSE_CONTEXT_ON_RESET': (20, 'constant'),
+ 'GL_LOWER_LEFT': (20, 'constant'),
+ 'GL_LOW_FLOAT': (16, 'constant'),
+ 'GL_LOW_INT': (16, 'constant'),
+ 'GL_LUMINANCE': (0, 'constant'),
+ 'GL_LUMINANCE12': (0, 'constant'),
+ 'GL_LUMINANCE12_ALPHA12': (0, 'constant'),
+ 'GL_LUMINANCE12_ALPHA4': (0, 'constant'),
+ 'GL_LUMINANCE16': (0, 'constant'),
+ 'GL_LUMINANCE16_ALPHA16': (0, 'constant'),
+ 'GL_LUMINANCE4': (0, 'constant'),
+ 'GL_LUMINANCE4_ALPHA4': (0, 'constant'),
+ 'GL_LUMINANCE6_ALPHA2': (0, 'constant'),
+ 'GL_LUMINANCE8': (0, 'constant'),
+ 'GL_LUMINANCE8_ALPHA8': (0, 'constant'),
+ 'GL_LUMINANCE_ALPHA': (0, 'constant'),
+ 'GL_MAJOR_VERSION': (11, 'constant'),
+ 'GL_MANUAL_GENERATE_MIPMAP': (18, 'constant'),
+ 'GL_MAP1_COLOR_4': (0, 'constant'),
+ 'GL_MAP1_GRID_DOMAIN': (0, 'constant'),
+ 'GL_MAP1_GRID_SEGMENTS': (0, 'constant'),
+ 'GL_MAP1_INDEX': (0, 'constant'),
+ 'GL_MAP1_NORMAL': (0, 'constant'),
+ 'GL_MAP1_TEXTURE_COORD_1': (0, 'constant'),
+ 'GL_MAP1_TEXTURE_COORD_2': (0, 'constant'),
+ 'GL_MAP1_TEXTURE_COORD_3': (0, 'constant'),
+ 'GL_MAP1_TEXTURE_COORD_4': (0, 'constant'),
+ 'GL_MAP1_VERTEX_3': (0, 'constant'),
+ 'GL_MAP1_VERTEX_4': (0, 'constant'),
+ 'GL_MAP2_COLOR_4': (0, 'constant'),
+ 'GL_MAP2_GRID_DOMAIN': (0, 'constant'),
+ 'GL_MAP2_GRID_SEGMENTS': (0, 'constant'),
+ 'GL_MAP2_INDEX': (0, 'constant'),
+ 'GL_MAP2_NORMAL': (0, 'constant'),
+ 'GL_MAP2_TEXTURE_COORD_1': (0, 'constant'),
+ 'GL_MAP2_TEXTURE_COORD_2': (0, 'constant'),
+ 'GL_MAP2_TEXTURE_COORD_3': (0, 'constant'),
+ 'GL_MAP2_TEXTURE_COORD_4': (0, 'constant'),
+ 'GL_MAP2_VERTEX_3': (0, 'constant'),
+ 'GL_MAP2_VERTEX_4': (0, 'constant'),
+ 'GL_MAP_COHERENT_BIT': (19, 'constant'),
+ 'GL_MAP_COLOR': (0, 'constant'),
+ 'GL_MAP_FLUSH_EXPLICIT_BIT': (11, 'constant'),
+ 'GL_MAP_INVALIDATE_BUFFER_BIT': (11, 'constant'),
+ 'GL_MAP_INVALIDATE_RANGE_BIT': (11, 'constant'),
+ 'GL_MAP_PERSISTENT_BIT': (19, 'constant'),
+ 'GL_MAP_READ_BIT': (19, 'constant'),
+ 'GL_MAP_STENCIL': (0, 'constant'),
+ 'GL_MAP_UNSYNCHRONIZED_BIT': (11, 'constant'),
+ 'GL_MAP_WRITE_BIT': (19, 'constant'),
+ 'GL_MATRIX_MODE': (0, 'constant'),
+ 'GL_MATRIX_STRIDE': (18, 'constant'),
+ 'GL_MAX': (7, 'constant'),
+ 'GL_MAX_3D_TEXTURE_SIZE': (5, 'constant'),
+ 'GL_MAX_ARRAY_TEXTURE_LAYERS': (11, 'constant'),
+ 'GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS': (17, 'constant'),
+ 'GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE': (17, 'constant'),
+ 'GL_MAX_ATTRIB_STACK_DEPTH': (0, 'constant'),
+ 'GL_MAX_CLIENT_ATTRIB_STACK_DEPTH': (0, 'constant'),
+ 'GL_MAX_CLIP_DISTANCES': (11, 'constant'),
+ 'GL_MAX_CLIP_PLANES': (0, 'constant'),
+ 'GL_MAX_COLOR_ATTACHMENTS': (11, 'constant'),
+ 'GL_MAX_COLOR_MATRIX_STACK_DEPTH': (5, 'constant'),
+ 'GL_MAX_COLOR_TEXTURE_SAMPLES': (13, 'constant'),
+ 'GL_MAX_COMBINED_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_MAX_COMBINED_CLIP_AND_CULL_DISTANCES': (20, 'constant'),
+ 'GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS': (18, 'constant'),
+ 'GL_MAX_COMBINED_DIMENSIONS': (18, 'constant'),
+ 'GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS': (12, 'constant'),
+ 'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS': (12, 'constant'),
+ 'GL_MAX_COMBINED_IMAGE_UNIFORMS': (17, 'constant'),
+ 'GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS': (18, 'constant'),
+ 'GL_MAX_COMBINED_SHADER_OUTPUT_RESOURCES': (18, 'constant'),
+ 'GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS': (9, 'constant'),
+ 'GL_MAX_COMBINED_UNIFORM_BLOCKS': (12, 'constant'),
+ 'GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS': (12, 'constant'),
+ 'GL_MAX_COMPUTE_ATOMIC_COUNTERS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_IMAGE_UNIFORMS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_SHARED_MEMORY_SIZE': (18, 'constant'),
+ 'GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_UNIFORM_BLOCKS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_UNIFORM_COMPONENTS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_WORK_GROUP_COUNT': (18, 'constant'),
+ 'GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS': (18, 'constant'),
+ 'GL_MAX_COMPUTE_WORK_GROUP_SIZE': (18, 'constant'),
+ 'GL_MAX_CONVOLUTION_HEIGHT': (5, 'constant'),
+ 'GL_MAX_CONVOLUTION_WIDTH': (5, 'constant'),
+ 'GL_MAX_CUBE_MAP_TEXTURE_SIZE': (6, 'constant'),
+ 'GL_MAX_CULL_DISTANCES': (20, 'constant'),
+ 'GL_MAX_DEBUG_GROUP_STACK_DEPTH': (18, 'constant'),
+ 'GL_MAX_DEBUG_GROUP_STACK_DEPTH_KHR': (18, 'constant'),
+ 'GL_MAX_DEBUG_LOGGED_MESSAGES': (18, 'constant'),
+ 'GL_MAX_DEBUG_LOGGED_MESSAGES_KHR': (18, 'constant'),
+ 'GL_MAX_DEBUG_MESSAGE_LENGTH': (18, 'constant'),
+ 'GL_MAX_DEBUG_MESSAGE_LENGTH_KHR': (18, 'constant'),
+ 'GL_MAX_DEPTH': (18, 'constant'),
+ 'GL_MAX_DEPTH_TEXTURE_SAMPLES': (13, 'constant'),
+ 'GL_MAX_DRAW_BUFFERS': (9, 'constant'),
+ 'GL_MAX_DUAL_SOURCE_DRAW_BUFFERS': (14, 'constant'),
+ 'GL_MAX_ELEMENTS_INDICES': (5, 'constant'),
+ 'GL_MAX_ELEMENTS_VERTICES': (5, 'constant'),
+ 'GL_MAX_ELEMENT_INDEX': (18, 'constant'),
+ 'GL_MAX_EVAL_ORDER': (0, 'constant'),
+ 'GL_MAX_FRAGMENT_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_MAX_FRAGMENT_IMAGE_UNIFORMS': (17, 'constant'),
+ 'GL_MAX_FRAGMENT_INPUT_COMPONENTS': (13, 'constant'),
+ 'GL_MAX_FRAGMENT_INTERPOLATION_OFFSET': (15, 'constant'),
+ 'GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_FRAGMENT_UNIFORM_BLOCKS': (12, 'constant'),
+ 'GL_MAX_FRAGMENT_UNIFORM_COMPONENTS': (9, 'constant'),
+ 'GL_MAX_FRAGMENT_UNIFORM_VECTORS': (16, 'constant'),
+ 'GL_MAX_FRAMEBUFFER_HEIGHT': (18, 'constant'),
+ 'GL_MAX_FRAMEBUFFER_LAYERS': (18, 'constant'),
+ 'GL_MAX_FRAMEBUFFER_SAMPLES': (18, 'constant'),
+ 'GL_MAX_FRAMEBUFFER_WIDTH': (18, 'constant'),
+ 'GL_MAX_GEOMETRY_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_MAX_GEOMETRY_IMAGE_UNIFORMS': (17, 'constant'),
+ 'GL_MAX_GEOMETRY_INPUT_COMPONENTS': (13, 'constant'),
+ 'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS': (13, 'constant'),
+ 'GL_MAX_GEOMETRY_OUTPUT_VERTICES': (13, 'constant'),
+ 'GL_MAX_GEOMETRY_SHADER_INVOCATIONS': (15, 'constant'),
+ 'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS': (13, 'constant'),
+ 'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS': (13, 'constant'),
+ 'GL_MAX_GEOMETRY_UNIFORM_BLOCKS': (12, 'constant'),
+ 'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS': (13, 'constant'),
+ 'GL_MAX_HEIGHT': (18, 'constant'),
+ 'GL_MAX_IMAGE_SAMPLES': (17, 'constant'),
+ 'GL_MAX_IMAGE_UNITS': (17, 'constant'),
+ 'GL_MAX_INTEGER_SAMPLES': (13, 'constant'),
+ 'GL_MAX_LABEL_LENGTH': (18, 'constant'),
+ 'GL_MAX_LABEL_LENGTH_KHR': (18, 'constant'),
+ 'GL_MAX_LAYERS': (18, 'constant'),
+ 'GL_MAX_LIGHTS': (0, 'constant'),
+ 'GL_MAX_LIST_NESTING': (0, 'constant'),
+ 'GL_MAX_MODELVIEW_STACK_DEPTH': (0, 'constant'),
+ 'GL_MAX_NAME_LENGTH': (18, 'constant'),
+ 'GL_MAX_NAME_STACK_DEPTH': (0, 'constant'),
+ 'GL_MAX_NUM_ACTIVE_VARIABLES': (18, 'constant'),
+ 'GL_MAX_NUM_COMPATIBLE_SUBROUTINES': (18, 'constant'),
+ 'GL_MAX_PATCH_VERTICES': (15, 'constant'),
+ 'GL_MAX_PIXEL_MAP_TABLE': (0, 'constant'),
+ 'GL_MAX_PROGRAM_TEXEL_OFFSET': (11, 'constant'),
+ 'GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET': (15, 'constant'),
+ 'GL_MAX_PROJECTION_STACK_DEPTH': (0, 'constant'),
+ 'GL_MAX_RECTANGLE_TEXTURE_SIZE': (12, 'constant'),
+ 'GL_MAX_RENDERBUFFER_SIZE': (11, 'constant'),
+ 'GL_MAX_SAMPLES': (11, 'constant'),
+ 'GL_MAX_SAMPLE_MASK_WORDS': (13, 'constant'),
+ 'GL_MAX_SERVER_WAIT_TIMEOUT': (13, 'constant'),
+ 'GL_MAX_SHADER_STORAGE_BLOCK_SIZE': (18, 'constant'),
+ 'GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS': (18, 'constant'),
+ 'GL_MAX_SUBROUTINES': (15, 'constant'),
+ 'GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS': (15, 'constant'),
+ 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS': (17, 'constant'),
+ 'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS': (15, 'constant'),
+ 'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS': (15, 'constant'),
+ 'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS': (17, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS': (15, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS': (15, 'constant'),
+ 'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TESS_GEN_LEVEL': (15, 'constant'),
+ 'GL_MAX_TESS_PATCH_COMPONENTS': (15, 'constant'),
+ 'GL_MAX_TEXTURE_BUFFER_SIZE': (12, 'constant'),
+ 'GL_MAX_TEXTURE_COORDS': (9, 'constant'),
+ 'GL_MAX_TEXTURE_IMAGE_UNITS': (9, 'constant'),
+ 'GL_MAX_TEXTURE_LOD_BIAS': (7, 'constant'),
+ 'GL_MAX_TEXTURE_MAX_ANISOTROPY': (21, 'constant'),
+ 'GL_MAX_TEXTURE_SIZE': (0, 'constant'),
+ 'GL_MAX_TEXTURE_STACK_DEPTH': (0, 'constant'),
+ 'GL_MAX_TEXTURE_UNITS': (6, 'constant'),
+ 'GL_MAX_TRANSFORM_FEEDBACK_BUFFERS': (15, 'constant'),
+ 'GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS': (11, 'constant'),
+ 'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS': (11, 'constant'),
+ 'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS': (11, 'constant'),
+ 'GL_MAX_UNIFORM_BLOCK_SIZE': (12, 'constant'),
+ 'GL_MAX_UNIFORM_BUFFER_BINDINGS': (12, 'constant'),
+ 'GL_MAX_UNIFORM_LOCATIONS': (18, 'constant'),
+ 'GL_MAX_VARYING_COMPONENTS': (11, 'constant'),
+ 'GL_MAX_VARYING_FLOATS': (9, 'constant'),
+ 'GL_MAX_VARYING_VECTORS': (16, 'constant'),
+ 'GL_MAX_VERTEX_ATOMIC_COUNTERS': (17, 'constant'),
+ 'GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS': (17, 'constant'),
+ 'GL_MAX_VERTEX_ATTRIBS': (9, 'constant'),
+ 'GL_MAX_VERTEX_ATTRIB_BINDINGS': (18, 'constant'),
+ 'GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET': (18, 'constant'),
+ 'GL_MAX_VERTEX_ATTRIB_STRIDE': (19, 'constant'),
+ 'GL_MAX_VERTEX_IMAGE_UNIFORMS': (17, 'constant'),
+ 'GL_MAX_VERTEX_OUTPUT_COMPONENTS': (13, 'constant'),
+ 'GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS': (18, 'constant'),
+ 'GL_MAX_VERTEX_STREAMS': (15, 'constant'),
+ 'GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS': (9, 'constant'),
+ 'GL_MAX_VERTEX_UNIFORM_BLOCKS': (12, 'constant'),
+ 'GL_MAX_VERTEX_UNIFORM_COMPONENTS': (9, 'constant'),
+ 'GL_MAX_VERTEX_UNIFORM_VECTORS': (16, 'constant'),
+ 'GL_MAX_VIEWPORTS': (16, 'constant'),
+ 'GL_MAX_VIEWPORT_DIMS': (0, 'constant'),
+ 'GL_MAX_WIDTH': (18, 'constant'),
+ 'GL_MEDIUM_FLOAT': (16, 'constant'),
+ 'GL_MEDIUM_INT': (16, 'constant'),
+ 'GL_MIN': (7, 'constant'),
+ 'GL_MINMAX': (5, 'constant'),
+ 'GL_MINMAX_FORMAT': (5, 'constant'),
+ 'GL_MINMAX_SINK': (5, 'constant'),
+ 'GL_MINOR_VERSION': (11, 'constant'),
+ 'GL_MIN_FRAGMENT_INTERPOLATION_OFFSET': (15, 'constant'),
+ 'GL_MIN_MAP_BUFFER_ALIGNMENT': (17, 'constant'),
+ 'GL_MIN_PROGRAM_TEXEL_OFFSET': (11, 'constant'),
+ 'GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET': (15, 'constant'),
+ 'GL_MIN_SAMPLE_SHADING_VALUE': (15, 'constant'),
+ 'GL_MIPMAP': (18, 'constant'),
+ 'GL_MIRRORED_REPEAT': (7, 'constant'),
+ 'GL_MIRROR_CLAMP_TO_EDGE': (19, 'constant'),
+ 'GL_MODELVIEW': (0, 'constant'),
+ 'GL_MODELVIEW0_EXT': (0, 'constant'),
+ 'GL_MODELVIEW0_MATRIX_EXT': (0, 'constant'),
+ 'GL_MODELVIEW0_STACK_DEPTH_EXT': (0, 'constant'),
+ 'GL_MODELVIEW_MATRIX': (0, 'constant'),
+ 'GL_MODELVIEW_STACK_DEPTH': (0, 'constant'),
+ 'GL_MODULATE': (0, 'constant'),
+ 'GL_MULT': (0, 'constant'),
+ 'GL_MULTISAMPLE': (6, 'constant'),
+ 'GL_MULTISAMPLE_BIT': (6, 'constant'),
+ 'GL_N3F_V3F': (0, 'constant'),
+ 'GL_NAME_LENGTH': (18, 'constant'),
+ 'GL_NAME_STACK_DEPTH': (0, 'constant'),
+ 'GL_NAND': (0, 'constant'),
+ 'GL_NEAREST': (0, 'constant'),
+ 'GL_NEAREST_MIPMAP_LINEAR': (0, 'constant'),
+ 'GL_NEAREST_MIPMAP_NEAREST': (0, 'constant'),
+ 'GL_NEGATIVE_ONE_TO_ONE': (20, 'constant'),
+ 'GL_NEVER': (0, 'constant'),
+ 'GL_NICEST': (0, 'constant'),
+ 'GL_NONE': (21, 'constant'),
+ 'GL_NOOP': (0, 'constant'),
+ 'GL_NOR': (0, 'constant'),
+ 'GL_NORMALIZE': (0, 'constant'),
+ 'GL_NORMAL_ARRAY': (0, 'constant'),
+ 'GL_NORMAL_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_NORMAL_ARRAY_POINTER': (0, 'constant'),
+ 'GL_NORMAL_ARRAY_STRIDE': (0, 'constant'),
+ 'GL_NORMAL_ARRAY_TYPE': (0, 'constant'),
+ 'GL_NORMAL_MAP': (6, 'constant'),
+ 'GL_NOTEQUAL': (0, 'constant'),
+ 'GL_NO_ERROR': (20, 'constant'),
+ 'GL_NO_RESET_NOTIFICATION': (20, 'constant'),
+ 'GL_NUM_ACTIVE_VARIABLES': (18, 'constant'),
+ 'GL_NUM_COMPATIBLE_SUBROUTINES': (18, 'constant'),
+ 'GL_NUM_COMPRESSED_TEXTURE_FORMATS': (6, 'constant'),
+ 'GL_NUM_EXTENSIONS': (11, 'constant'),
+ 'GL_NUM_PROGRAM_BINARY_FORMATS': (16, 'constant'),
+ 'GL_NUM_SAMPLE_COUNTS': (18, 'constant'),
+ 'GL_NUM_SHADER_BINARY_FORMATS': (16, 'constant'),
+ 'GL_NUM_SHADING_LANGUAGE_VERSIONS': (18, 'constant'),
+ 'GL_NUM_SPIR_V_EXTENSIONS': (21, 'constant'),
+ 'GL_OBJECT_ACTIVE_UNIFORMS': (9, 'constant'),
+ 'GL_OBJECT_ACTIVE_UNIFORM_MAX_LENGTH': (9, 'constant'),
+ 'GL_OBJECT_COMPILE_STATUS': (9, 'constant'),
+ 'GL_OBJECT_LINEAR': (0, 'constant'),
+ 'GL_OBJECT_LINK_STATUS': (9, 'constant'),
+ 'GL_OBJECT_PLANE': (0, 'constant'),
+ 'GL_OBJECT_TYPE': (13, 'constant'),
+ 'GL_OFFSET': (18, 'constant'),
+ 'GL_ONE': (0, 'constant'),
+ 'GL_ONE_MINUS_CONSTANT_ALPHA': (7, 'constant'),
+ 'GL_ONE_MINUS_CONSTANT_COLOR': (7, 'constant'),
+ 'GL_ONE_MINUS_DST_ALPHA': (0, 'constant'),
+ 'GL_ONE_MINUS_DST_COLOR': (0, 'constant'),
+ 'GL_ONE_MINUS_SRC1_ALPHA': (14, 'constant'),
+ 'GL_ONE_MINUS_SRC1_COLOR': (14, 'constant'),
+ 'GL_ONE_MINUS_SRC_ALPHA': (0, 'constant'),
+ 'GL_ONE_MINUS_SRC_COLOR': (0, 'constant'),
+ 'GL_OPERAND0_ALPHA': (6, 'constant'),
+ 'GL_OPERAND0_RGB': (6, 'constant'),
+ 'GL_OPERAND1_ALPHA': (6, 'constant'),
+ 'GL_OPERAND1_RGB': (6, 'constant'),
+ 'GL_OPERAND2_ALPHA': (6, 'constant'),
+ 'GL_OPERAND2_RGB': (6, 'constant'),
+ 'GL_OR': (0, 'constant'),
+ 'GL_ORDER': (0, 'constant'),
+ 'GL_OR_INVERTED': (0, 'constant'),
+ 'GL_OR_REVERSE': (0, 'constant'),
+ 'GL_OUT_OF_MEMORY': (0, 'constant'),
+ 'GL_PACK_ALIGNMENT': (0, 'constant'),
+ 'GL_PACK_COMPRESSED_BLOCK_DEPTH': (17, 'constant'),
+ 'GL_PACK_COMPRESSED_BLOCK_HEIGHT': (17, 'constant'),
+ 'GL_PACK_COMPRESSED_BLOCK_SIZE': (17, 'constant'),
+ 'GL_PACK_COMPRESSED_BLOCK_WIDTH': (17, 'constant'),
+ 'GL_PACK_IMAGE_HEIGHT': (5, 'constant'),
+ 'GL_PACK_LSB_FIRST': (0, 'constant'),
+ 'GL_PACK_ROW_LENGTH': (0, 'constant'),
+ 'GL_PACK_SKIP_IMAGES': (5, 'constant'),
+ 'GL_PACK_SKIP_PIXELS': (0, 'constant'),
+ 'GL_PACK_SKIP_ROWS': (0, 'constant'),
+ 'GL_PACK_SWAP_BYTES': (0, 'constant'),
+ 'GL_PARAMETER_BUFFER': (21, 'constant'),
+ 'GL_PARAMETER_BUFFER_BINDING': (21, 'constant'),
+ 'GL_PASS_THROUGH_TOKEN': (0, 'constant'),
+ 'GL_PATCHES': (15, 'constant'),
+ 'GL_PATCH_DEFAULT_INNER_LEVEL': (15, 'constant'),
+ 'GL_PATCH_DEFAULT_OUTER_LEVEL': (15, 'constant'),
+ 'GL_PATCH_VERTICES': (15, 'constant'),
+ 'GL_PERSPECTIVE_CORRECTION_HINT': (0, 'constant'),
+ 'GL_PIXEL_BUFFER_BARRIER_BIT': (17, 'constant'),
+ 'GL_PIXEL_MAP_A_TO_A': (0, 'constant'),
+ 'GL_PIXEL_MAP_A_TO_A_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_B_TO_B': (0, 'constant'),
+ 'GL_PIXEL_MAP_B_TO_B_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_G_TO_G': (0, 'constant'),
+ 'GL_PIXEL_MAP_G_TO_G_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_A': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_A_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_B': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_B_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_G': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_G_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_I': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_I_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_R': (0, 'constant'),
+ 'GL_PIXEL_MAP_I_TO_R_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_R_TO_R': (0, 'constant'),
+ 'GL_PIXEL_MAP_R_TO_R_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MAP_S_TO_S': (0, 'constant'),
+ 'GL_PIXEL_MAP_S_TO_S_SIZE': (0, 'constant'),
+ 'GL_PIXEL_MODE_BIT': (0, 'constant'),
+ 'GL_PIXEL_PACK_BUFFER': (10, 'constant'),
+ 'GL_PIXEL_PACK_BUFFER_BINDING': (10, 'constant'),
+ 'GL_PIXEL_UNPACK_BUFFER': (10, 'constant'),
+ 'GL_PIXEL_UNPACK_BUFFER_BINDING': (10, 'constant'),
+ 'GL_POINT': (0, 'constant'),
+ 'GL_POINTS': (0, 'constant'),
+ 'GL_POINT_BIT': (0, 'constant'),
+ 'GL_POINT_DISTANCE_ATTENUATION': (7, 'constant'),
+ 'GL_POINT_FADE_THRESHOLD_SIZE': (7, 'constant'),
+ 'GL_POINT_SIZE': (0, 'constant'),
+ 'GL_POINT_SIZE_GRANULARITY': (5, 'constant'),
+ 'GL_POINT_SIZE_MAX': (7, 'constant'),
+ 'GL_POINT_SIZE_MIN': (7, 'constant'),
+ 'GL_POINT_SIZE_RANGE': (5, 'constant'),
+ 'GL_POINT_SMOOTH': (0, 'constant'),
+ 'GL_POINT_SMOOTH_HINT': (0, 'constant'),
+ 'GL_POINT_SPRITE': (9, 'constant'),
+ 'GL_POINT_SPRITE_COORD_ORIGIN': (9, 'constant'),
+ 'GL_POINT_TOKEN': (0, 'constant'),
+ 'GL_POLYGON': (0, 'constant'),
+ 'GL_POLYGON_BIT': (0, 'constant'),
+ 'GL_POLYGON_MODE': (0, 'constant'),
+ 'GL_POLYGON_OFFSET_CLAMP': (21, 'constant'),
+ 'GL_POLYGON_OFFSET_FACTOR': (0, 'constant'),
+ 'GL_POLYGON_OFFSET_FILL': (0, 'constant'),
+ 'GL_POLYGON_OFFSET_LINE': (0, 'constant'),
+ 'GL_POLYGON_OFFSET_POINT': (0, 'constant'),
+ 'GL_POLYGON_OFFSET_UNITS': (0, 'constant'),
+ 'GL_POLYGON_SMOOTH': (0, 'constant'),
+ 'GL_POLYGON_SMOOTH_HINT': (0, 'constant'),
+ 'GL_POLYGON_STIPPLE': (0, 'constant'),
+ 'GL_POLYGON_STIPPLE_BIT': (0, 'constant'),
+ 'GL_POLYGON_TOKEN': (0, 'constant'),
+ 'GL_POSITION': (0, 'constant'),
+ 'GL_POST_COLOR_MATRIX_ALPHA_BIAS': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_ALPHA_SCALE': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_BLUE_BIAS': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_BLUE_SCALE': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_COLOR_TABLE': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_GREEN_BIAS': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_GREEN_SCALE': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_RED_BIAS': (5, 'constant'),
+ 'GL_POST_COLOR_MATRIX_RED_SCALE': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_ALPHA_BIAS': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_ALPHA_SCALE': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_BLUE_BIAS': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_BLUE_SCALE': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_COLOR_TABLE': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_GREEN_BIAS': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_GREEN_SCALE': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_RED_BIAS': (5, 'constant'),
+ 'GL_POST_CONVOLUTION_RED_SCALE': (5, 'constant'),
+ 'GL_PREVIOUS': (6, 'constant'),
+ 'GL_PRIMARY_COLOR': (6, 'constant'),
+ 'GL_PRIMITIVES_GENERATED': (11, 'constant'),
+ 'GL_PRIMITIVES_SUBMITTED': (21, 'constant'),
+ 'GL_PRIMITIVE_RESTART': (12, 'constant'),
+ 'GL_PRIMITIVE_RESTART_FIXED_INDEX': (18, 'constant'),
+ 'GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED': (19, 'constant'),
+ 'GL_PRIMITIVE_RESTART_INDEX': (12, 'constant'),
+ 'GL_PROGRAM': (18, 'constant'),
+ 'GL_PROGRAM_BINARY_FORMATS': (16, 'constant'),
+ 'GL_PROGRAM_BINARY_LENGTH': (16, 'constant'),
+ 'GL_PROGRAM_BINARY_RETRIEVABLE_HINT': (16, 'constant'),
+ 'GL_PROGRAM_INPUT': (18, 'constant'),
+ 'GL_PROGRAM_KHR': (18, 'constant'),
+ 'GL_PROGRAM_OUTPUT': (18, 'constant'),
+ 'GL_PROGRAM_PIPELINE': (18, 'constant'),
+ 'GL_PROGRAM_PIPELINE_BINDING': (16, 'constant'),
+ 'GL_PROGRAM_PIPELINE_KHR': (18, 'constant'),
+ 'GL_PROGRAM_POINT_SIZE': (13, 'constant'),
+ 'GL_PROGRAM_SEPARABLE': (16, 'constant'),
+ 'GL_PROJECTION': (0, 'constant'),
+ 'GL_PROJECTION_MATRIX': (0, 'constant'),
+ 'GL_PROJECTION_STACK_DEPTH': (0, 'constant'),
+ 'GL_PROVOKING_VERTEX': (16, 'constant'),
+ 'GL_PROXY_COLOR_TABLE': (5, 'constant'),
+ 'GL_PROXY_HISTOGRAM': (5, 'constant'),
+ 'GL_PROXY_POST_COLOR_MATRIX_COLOR_TABLE': (5, 'constant'),
+ 'GL_PROXY_POST_CONVOLUTION_COLOR_TABLE': (5, 'constant'),
+ 'GL_PROXY_TEXTURE_1D': (0, 'constant'),
+ 'GL_PROXY_TEXTURE_1D_ARRAY': (11, 'constant'),
+ 'GL_PROXY_TEXTURE_2D': (0, 'constant'),
+ 'GL_PROXY_TEXTURE_2D_ARRAY': (11, 'constant'),
+ 'GL_PROXY_TEXTURE_2D_MULTISAMPLE': (13, 'constant'),
+ 'GL_PROXY_TEXTURE_2D_MULTISAMPLE_ARRAY': (13, 'constant'),
+ 'GL_PROXY_TEXTURE_3D': (5, 'constant'),
+ 'GL_PROXY_TEXTURE_CUBE_MAP': (6, 'constant'),
+ 'GL_PROXY_TEXTURE_CUBE_MAP_ARRAY': (15, 'constant'),
+ 'GL_PROXY_TEXTURE_RECTANGLE': (12, 'constant'),
+ 'GL_Q': (0, 'constant'),
+ 'GL_QUADRATIC_ATTENUATION': (0, 'constant'),
+ 'GL_QUADS': (15, 'constant'),
+ 'GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION': (13, 'constant'),
+ 'GL_QUAD_STRIP': (0, 'constant'),
+ 'GL_QUERY': (18, 'constant'),
+ 'GL_QUERY_BUFFER': (19, 'constant'),
+ 'GL_QUERY_BUFFER_BARRIER_BIT': (19, 'constant'),
+ 'GL_QUERY_BUFFER_BINDING': (19, 'constant'),
+ 'GL_QUERY_BY_REGION_NO_WAIT': (11, 'constant'),
+ 'GL_QUERY_BY_REGION_NO_WAIT_INVERTED': (20, 'constant'),
+ 'GL_QUERY_BY_REGION_WAIT': (11, 'constant'),
+ 'GL_QUERY_BY_REGION_WAIT_INVERTED': (20, 'constant'),
+ 'GL_QUERY_COUNTER_BITS': (8, 'constant'),
+ 'GL_QUERY_KHR': (18, 'constant'),
+ 'GL_QUERY_NO_WAIT': (11, 'constant'),
+ 'GL_QUERY_NO_WAIT_INVERTED': (20, 'constant'),
+ 'GL_QUERY_RESULT': (8, 'constant'),
+ 'GL_QUERY_RESULT_AVAILABLE': (8, 'constant'),
+ 'GL_QUERY_RESULT_NO_WAIT': (19, 'constant'),
+ 'GL_QUERY_TARGET': (20, 'constant'),
+ 'GL_QUERY_WAIT': (11, 'constant'),
+ 'GL_QUERY_WAIT_INVERTED': (20, 'constant'),
+ 'GL_R': (0, 'constant'),
+ 'GL_R11F_G11F_B10F': (11, 'constant'),
+ 'GL_R16': (11, 'constant'),
+ 'GL_R16F': (11, 'constant'),
+ 'GL_R16I': (11, 'constant'),
+ 'GL_R16UI': (11, 'constant'),
+ 'GL_R16_SNORM': (12, 'constant'),
+ 'GL_R32F': (11, 'constant'),
+ 'GL_R32I': (11, 'constant'),
+ 'GL_R32UI': (11, 'constant'),
+ 'GL_R3_G3_B2': (0, 'constant'),
+ 'GL_R8': (11, 'constant'),
+ 'GL_R8I': (11, 'constant'),
+ 'GL_R8UI': (11, 'constant'),
+ 'GL_R8_SNORM': (12, 'constant'),
+ 'GL_RASTERIZER_DISCARD': (11, 'constant'),
+ 'GL_READ_BUFFER': (0, 'constant'),
+ 'GL_READ_FRAMEBUFFER': (11, 'constant'),
+ 'GL_READ_FRAMEBUFFER_BINDING': (11, 'constant'),
+ 'GL_READ_ONLY': (8, 'constant'),
+ 'GL_READ_PIXELS': (18, 'constant'),
+ 'GL_READ_PIXELS_FORMAT': (18, 'constant'),
+ 'GL_READ_PIXELS_TYPE': (18, 'constant'),
+ 'GL_READ_WRITE': (8, 'constant'),
+ 'GL_RED': (0, 'constant'),
+ 'GL_REDUCE': (5, 'constant'),
+ 'GL_RED_BIAS': (0, 'constant'),
+ 'GL_RED_BITS': (0, 'constant'),
+ 'GL_RED_INTEGER': (11, 'constant'),
+ 'GL_RED_SCALE': (0, 'constant'),
+ 'GL_REFERENCED_BY_COMPUTE_SHADER': (18, 'constant'),
+ 'GL_REFERENCED_BY_FRAGMENT_SHADER': (18, 'constant'),
+ 'GL_REFERENCED_BY_GEOMETRY_SHADER': (18, 'constant'),
+ 'GL_REFERENCED_BY_TESS_CONTROL_SHADER': (18, 'constant'),
+ 'GL_REFERENCED_BY_TESS_EVALUATION_SHADER': (18, 'constant'),
+ 'GL_REFERENCED_BY_VERTEX_SHADER': (18, 'constant'),
+ 'GL_REFLECTION_MAP': (6, 'constant'),
+ 'GL_RENDER': (0, 'constant'),
+ 'GL_RENDERBUFFER': (18, 'constant'),
+ 'GL_RENDERBUFFER_ALPHA_SIZE': (11, 'constant'),
+ 'GL_RENDERBUFFER_BINDING': (11, 'constant'),
+ 'GL_RENDERBUFFER_BLUE_SIZE': (11, 'constant'),
+ 'GL_RENDERBUFFER_DEPTH_SIZE': (11, 'constant'),
+ 'GL_RENDERBUFFER_GREEN_SIZE': (11, 'constant'),
+ 'GL_RENDERBUFFER_HEIGHT': (11, 'constant'),
+ 'GL_RENDERBUFFER_INTERNAL_FORMAT': (11, 'constant'),
+ 'GL_RENDERBUFFER_RED_SIZE': (11, 'constant'),
+ 'GL_RENDERBUFFER_SAMPLES': (11, 'constant'),
+ 'GL_RENDERBUFFER_STENCIL_SIZE': (11, 'constant'),
+ 'GL_RENDERBUFFER_WIDTH': (11, 'constant'),
+ 'GL_RENDERER': (0, 'constant'),
+ 'GL_RENDER_MODE': (0, 'constant'),
+ 'GL_REPEAT': (0, 'constant'),
+ 'GL_REPLACE': (0, 'constant'),
+ 'GL_REPLICATE_BORDER': (5, 'constant'),
+ 'GL_RESCALE_NORMAL': (5, 'constant'),
+ 'GL_RESET_NOTIFICATION_STRATEGY': (20, 'constant'),
+ 'GL_RETURN': (0, 'constant'),
+ 'GL_RG': (11, 'constant'),
+ 'GL_RG16': (11, 'constant'),
+ 'GL_RG16F': (11, 'constant'),
+ 'GL_RG16I': (11, 'constant'),
+ 'GL_RG16UI': (11, 'constant'),
+ 'GL_RG16_SNORM': (12, 'constant'),
+ 'GL_RG32F': (11, 'constant'),
+ 'GL_RG32I': (11, 'constant'),
+ 'GL_RG32UI': (11, 'constant'),
+ 'GL_RG8': (11, 'constant'),
+ 'GL_RG8I': (11, 'constant'),
+ 'GL_RG8UI': (11, 'constant'),
+ 'GL_RG8_SNORM': (12, 'constant'),
+ 'GL_RGB': (0, 'constant'),
+ 'GL_RGB10': (0, 'constant'),
+ 'GL_RGB10_A2': (0, 'constant'),
+ 'GL_RGB10_A2UI': (14, 'constant'),
+ 'GL_RGB12': (0, 'constant'),
+ 'GL_RGB16': (0, 'constant'),
+ 'GL_RGB16F': (11, 'constant'),
+ 'GL_RGB16I': (11, 'constant'),
+ 'GL_RGB16UI': (11, 'constant'),
+ 'GL_RGB16_SNORM': (12, 'constant'),
+ 'GL_RGB32F': (11, 'constant'),
+ 'GL_RGB32I': (16, 'constant'),
+ 'GL_RGB32UI': (11, 'constant'),
+ 'GL_RGB4': (0, 'constant'),
+ 'GL_RGB5': (0, 'constant'),
+ 'GL_RGB565': (16, 'constant'),
+ 'GL_RGB5_A1': (0, 'constant'),
+ 'GL_RGB8': (0, 'constant'),
+ 'GL_RGB8I': (11, 'constant'),
+ 'GL_RGB8UI': (11, 'constant'),
+ 'GL_RGB8_SNORM': (12, 'constant'),
+ 'GL_RGB9_E5': (11, 'constant'),
+ 'GL_RGBA': (0, 'constant'),
+ 'GL_RGBA12': (0, 'constant'),
+ 'GL_RGBA16': (0, 'constant'),
+ 'GL_RGBA16F': (11, 'constant'),
+ 'GL_RGBA16I': (11, 'constant'),
+ 'GL_RGBA16UI': (11, 'constant'),
+ 'GL_RGBA16_SNORM': (12, 'constant'),
+ 'GL_RGBA2': (0, 'constant'),
+ 'GL_RGBA32F': (11, 'constant'),
+ 'GL_RGBA32I': (11, 'constant'),
+ 'GL_RGBA32UI': (11, 'constant'),
+ 'GL_RGBA4': (0, 'constant'),
+ 'GL_RGBA8': (0, 'constant'),
+ 'GL_RGBA8I': (11, 'constant'),
+ 'GL_RGBA8UI': (11, 'constant'),
+ 'GL_RGBA8_SNORM': (12, 'constant'),
+ 'GL_RGBA_INTEGER': (11, 'constant'),
+ 'GL_RGBA_MODE': (0, 'constant'),
+ 'GL_RGB_INTEGER': (11, 'constant'),
+ 'GL_RGB_SCALE': (6, 'constant'),
+ 'GL_RG_INTEGER': (11, 'constant'),
+ 'GL_RIGHT': (0, 'constant'),
+ 'GL_S': (0, 'constant'),
+ 'GL_SAMPLER': (18, 'constant'),
+ 'GL_SAMPLER_1D': (9, 'constant'),
+ 'GL_SAMPLER_1D_ARRAY': (11, 'constant'),
+ 'GL_SAMPLER_1D_ARRAY_SHADOW': (11, 'constant'),
+ 'GL_SAMPLER_1D_SHADOW': (9, 'constant'),
+ 'GL_SAMPLER_2D': (9, 'constant'),
+ 'GL_SAMPLER_2D_ARRAY': (11, 'constant'),
+ 'GL_SAMPLER_2D_ARRAY_SHADOW': (11, 'constant'),
+ 'GL_SAMPLER_2D_MULTISAMPLE': (13, 'constant'),
+ 'GL_SAMPLER_2D_MULTISAMPLE_ARRAY': (13, 'constant'),
+ 'GL_SAMPLER_2D_RECT': (12, 'constant'),
+ 'GL_SAMPLER_2D_RECT_SHADOW': (12, 'constant'),
+ 'GL_SAMPLER_2D_SHADOW': (9, 'constant'),
+ 'GL_SAMPLER_3D': (9, 'constant'),
+ 'GL_SAMPLER_BINDING': (14, 'constant'),
+ 'GL_SAMPLER_BUFFER': (12, 'constant'),
+ 'GL_SAMPLER_CUBE': (9, 'constant'),
+ 'GL_SAMPLER_CUBE_MAP_ARRAY': (15, 'constant'),
+ 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW': (15, 'constant'),
+ 'GL_SAMPLER_CUBE_SHADOW': (11, 'constant'),
+ 'GL_SAMPLER_KHR': (18, 'constant'),
+ 'GL_SAMPLES': (18, 'constant'),
+ 'GL_SAMPLES_PASSED': (8, 'constant'),
+ 'GL_SAMPLE_ALPHA_TO_COVERAGE': (6, 'constant'),
+ 'GL_SAMPLE_ALPHA_TO_ONE': (6, 'constant'),
+ 'GL_SAMPLE_BUFFERS': (6, 'constant'),
+ 'GL_SAMPLE_COVERAGE': (6, 'constant'),
+ 'GL_SAMPLE_COVERAGE_INVERT': (6, 'constant'),
+ 'GL_SAMPLE_COVERAGE_VALUE': (6, 'constant'),
+ 'GL_SAMPLE_MASK': (13, 'constant'),
+ 'GL_SAMPLE_MASK_VALUE': (13, 'constant'),
+ 'GL_SAMPLE_POSITION': (13, 'constant'),
+ 'GL_SAMPLE_SHADING': (15, 'constant'),
+ 'GL_SCISSOR_BIT': (0, 'constant'),
+ 'GL_SCISSOR_BOX': (16, 'constant'),
+ 'GL_SCISSOR_TEST': (16, 'constant'),
+ 'GL_SECONDARY_COLOR_ARRAY': (7, 'constant'),
+ 'GL_SECONDARY_COLOR_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_SECONDARY_COLOR_ARRAY_POINTER': (7, 'constant'),
+ 'GL_SECONDARY_COLOR_ARRAY_SIZE': (7, 'constant'),
+ 'GL_SECONDARY_COLOR_ARRAY_STRIDE': (7, 'constant'),
+ 'GL_SECONDARY_COLOR_ARRAY_TYPE': (7, 'constant'),
+ 'GL_SELECT': (0, 'constant'),
+ 'GL_SELECTION_BUFFER_POINTER': (0, 'constant'),
+ 'GL_SELECTION_BUFFER_SIZE': (0, 'constant'),
+ 'GL_SEPARABLE_2D': (5, 'constant'),
+ 'GL_SEPARATE_ATTRIBS': (11, 'constant'),
+ 'GL_SEPARATE_SPECULAR_COLOR': (5, 'constant'),
+ 'GL_SET': (0, 'constant'),
+ 'GL_SHADER': (18, 'constant'),
+ 'GL_SHADER_BINARY_FORMATS': (16, 'constant'),
+ 'GL_SHADER_BINARY_FORMAT_SPIR_V': (21, 'constant'),
+ 'GL_SHADER_COMPILER': (16, 'constant'),
+ 'GL_SHADER_IMAGE_ACCESS_BARRIER_BIT': (17, 'constant'),
+ 'GL_SHADER_IMAGE_ATOMIC': (18, 'constant'),
+ 'GL_SHADER_IMAGE_LOAD': (18, 'constant'),
+ 'GL_SHADER_IMAGE_STORE': (18, 'constant'),
+ 'GL_SHADER_KHR': (18, 'constant'),
+ 'GL_SHADER_SOURCE_LENGTH': (9, 'constant'),
+ 'GL_SHADER_STORAGE_BARRIER_BIT': (18, 'constant'),
+ 'GL_SHADER_STORAGE_BLOCK': (18, 'constant'),
+ 'GL_SHADER_STORAGE_BUFFER': (18, 'constant'),
+ 'GL_SHADER_STORAGE_BUFFER_BINDING': (18, 'constant'),
+ 'GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT': (18, 'constant'),
+ 'GL_SHADER_STORAGE_BUFFER_SIZE': (18, 'constant'),
+ 'GL_SHADER_STORAGE_BUFFER_START': (18, 'constant'),
+ 'GL_SHADER_TYPE': (9, 'constant'),
+ 'GL_SHADE_MODEL': (0, 'constant'),
+ 'GL_SHADING_LANGUAGE_VERSION': (9, 'constant'),
+ 'GL_SHININESS': (0, 'constant'),
+ 'GL_SHORT': (21, 'constant'),
+ 'GL_SIGNALED': (13, 'constant'),
+ 'GL_SIGNED_NORMALIZED': (12, 'constant'),
+ 'GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST': (18, 'constant'),
+ 'GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE': (18, 'constant'),
+ 'GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_TEST': (18, 'constant'),
+ 'GL_SIMULTANEOUS_TEXTURE_AND_STENCIL_WRITE': (18, 'constant'),
+ 'GL_SINGLE_COLOR': (5, 'constant'),
+ 'GL_SLUMINANCE': (10, 'constant'),
+ 'GL_SLUMINANCE8': (10, 'constant'),
+ 'GL_SLUMINANCE8_ALPHA8': (10, 'constant'),
+ 'GL_SLUMINANCE_ALPHA': (10, 'constant'),
+ 'GL_SMOOTH': (0, 'constant'),
+ 'GL_SMOOTH_LINE_WIDTH_GRANULARITY': (5, 'constant'),
+ 'GL_SMOOTH_LINE_WIDTH_RANGE': (5, 'constant'),
+ 'GL_SMOOTH_POINT_SIZE_GRANULARITY': (5, 'constant'),
+ 'GL_SMOOTH_POINT_SIZE_RANGE': (5, 'constant'),
+ 'GL_SOURCE0_ALPHA': (6, 'constant'),
+ 'GL_SOURCE0_RGB': (6, 'constant'),
+ 'GL_SOURCE1_ALPHA': (6, 'constant'),
+ 'GL_SOURCE1_RGB': (6, 'constant'),
+ 'GL_SOURCE2_ALPHA': (6, 'constant'),
+ 'GL_SOURCE2_RGB': (6, 'constant'),
+ 'GL_SPECULAR': (0, 'constant'),
+ 'GL_SPHERE_MAP': (0, 'constant'),
+ 'GL_SPIR_V_BINARY': (21, 'constant'),
+ 'GL_SPIR_V_EXTENSIONS': (21, 'constant'),
+ 'GL_SPOT_CUTOFF': (0, 'constant'),
+ 'GL_SPOT_DIRECTION': (0, 'constant'),
+ 'GL_SPOT_EXPONENT': (0, 'constant'),
+ 'GL_SRC0_ALPHA': (8, 'constant'),
+ 'GL_SRC0_RGB': (8, 'constant'),
+ 'GL_SRC1_ALPHA': (8, 'constant'),
+ 'GL_SRC1_COLOR': (14, 'constant'),
+ 'GL_SRC1_RGB': (8, 'constant'),
+ 'GL_SRC2_ALPHA': (8, 'constant'),
+ 'GL_SRC2_RGB': (8, 'constant'),
+ 'GL_SRC_ALPHA': (0, 'constant'),
+ 'GL_SRC_ALPHA_SATURATE': (0, 'constant'),
+ 'GL_SRC_COLOR': (0, 'constant'),
+ 'GL_SRGB': (10, 'constant'),
+ 'GL_SRGB8': (10, 'constant'),
+ 'GL_SRGB8_ALPHA8': (10, 'constant'),
+ 'GL_SRGB_ALPHA': (10, 'constant'),
+ 'GL_SRGB_DECODE_ARB': (18, 'constant'),
+ 'GL_SRGB_READ': (18, 'constant'),
+ 'GL_SRGB_WRITE': (18, 'constant'),
+ 'GL_STACK_OVERFLOW': (18, 'constant'),
+ 'GL_STACK_OVERFLOW_KHR': (18, 'constant'),
+ 'GL_STACK_UNDERFLOW': (18, 'constant'),
+ 'GL_STACK_UNDERFLOW_KHR': (18, 'constant'),
+ 'GL_STATIC_COPY': (8, 'constant'),
+ 'GL_STATIC_DRAW': (8, 'constant'),
+ 'GL_STATIC_READ': (8, 'constant'),
+ 'GL_STENCIL': (0, 'constant'),
+ 'GL_STENCIL_ATTACHMENT': (11, 'constant'),
+ 'GL_STENCIL_BACK_FAIL': (9, 'constant'),
+ 'GL_STENCIL_BACK_FUNC': (9, 'constant'),
+ 'GL_STENCIL_BACK_PASS_DEPTH_FAIL': (9, 'constant'),
+ 'GL_STENCIL_BACK_PASS_DEPTH_PASS': (9, 'constant'),
+ 'GL_STENCIL_BACK_REF': (9, 'constant'),
+ 'GL_STENCIL_BACK_VALUE_MASK': (9, 'constant'),
+ 'GL_STENCIL_BACK_WRITEMASK': (9, 'constant'),
+ 'GL_STENCIL_BITS': (0, 'constant'),
+ 'GL_STENCIL_BUFFER': (0, 'constant'),
+ 'GL_STENCIL_BUFFER_BIT': (0, 'constant'),
+ 'GL_STENCIL_CLEAR_VALUE': (0, 'constant'),
+ 'GL_STENCIL_COMPONENTS': (18, 'constant'),
+ 'GL_STENCIL_FAIL': (0, 'constant'),
+ 'GL_STENCIL_FUNC': (0, 'constant'),
+ 'GL_STENCIL_INDEX': (19, 'constant'),
+ 'GL_STENCIL_INDEX1': (11, 'constant'),
+ 'GL_STENCIL_INDEX16': (11, 'constant'),
+ 'GL_STENCIL_INDEX4': (11, 'constant'),
+ 'GL_STENCIL_INDEX8': (19, 'constant'),
+ 'GL_STENCIL_PASS_DEPTH_FAIL': (0, 'constant'),
+ 'GL_STENCIL_PASS_DEPTH_PASS': (0, 'constant'),
+ 'GL_STENCIL_REF': (0, 'constant'),
+ 'GL_STENCIL_RENDERABLE': (18, 'constant'),
+ 'GL_STENCIL_TEST': (0, 'constant'),
+ 'GL_STENCIL_VALUE_MASK': (0, 'constant'),
+ 'GL_STENCIL_WRITEMASK': (0, 'constant'),
+ 'GL_STEREO': (0, 'constant'),
+ 'GL_STREAM_COPY': (8, 'constant'),
+ 'GL_STREAM_DRAW': (8, 'constant'),
+ 'GL_STREAM_READ': (8, 'constant'),
+ 'GL_SUBPIXEL_BITS': (0, 'constant'),
+ 'GL_SUBTRACT': (6, 'constant'),
+ 'GL_SYNC_CONDITION': (13, 'constant'),
+ 'GL_SYNC_FENCE': (13, 'constant'),
+ 'GL_SYNC_FLAGS': (13, 'constant'),
+ 'GL_SYNC_FLUSH_COMMANDS_BIT': (13, 'constant'),
+ 'GL_SYNC_GPU_COMMANDS_COMPLETE': (13, 'constant'),
+ 'GL_SYNC_STATUS': (13, 'constant'),
+ 'GL_T': (0, 'constant'),
+ 'GL_T2F_C3F_V3F': (0, 'constant'),
+ 'GL_T2F_C4F_N3F_V3F': (0, 'constant'),
+ 'GL_T2F_C4UB_V3F': (0, 'constant'),
+ 'GL_T2F_N3F_V3F': (0, 'constant'),
+ 'GL_T2F_V3F': (0, 'constant'),
+ 'GL_T4F_C4F_N3F_V4F': (0, 'constant'),
+ 'GL_T4F_V4F': (0, 'constant'),
+ 'GL_TABLE_TOO_LARGE': (5, 'constant'),
+ 'GL_TESS_CONTROL_OUTPUT_VERTICES': (15, 'constant'),
+ 'GL_TESS_CONTROL_SHADER': (15, 'constant'),
+ 'GL_TESS_CONTROL_SHADER_BIT': (16, 'constant'),
+ 'GL_TESS_CONTROL_SHADER_PATCHES': (21, 'constant'),
+ 'GL_TESS_CONTROL_SUBROUTINE': (18, 'constant'),
+ 'GL_TESS_CONTROL_SUBROUTINE_UNIFORM': (18, 'constant'),
+ 'GL_TESS_CONTROL_TEXTURE': (18, 'constant'),
+ 'GL_TESS_EVALUATION_SHADER': (15, 'constant'),
+ 'GL_TESS_EVALUATION_SHADER_BIT': (16, 'constant'),
+ 'GL_TESS_EVALUATION_SHADER_INVOCATIONS': (21, 'constant'),
+ 'GL_TESS_EVALUATION_SUBROUTINE': (18, 'constant'),
+ 'GL_TESS_EVALUATION_SUBROUTINE_UNIFORM': (18, 'constant'),
+ 'GL_TESS_EVALUATION_TEXTURE': (18, 'constant'),
+ 'GL_TESS_GEN_MODE': (15, 'constant'),
+ 'GL_TESS_GEN_POINT_MODE': (15, 'constant'),
+ 'GL_TESS_GEN_SPACING': (15, 'constant'),
+ 'GL_TESS_GEN_VERTEX_ORDER': (15, 'constant'),
+ 'GL_TEXTURE': (0, 'constant'),
+ 'GL_TEXTURE0': (6, 'constant'),
+ 'GL_TEXTURE1': (6, 'constant'),
+ 'GL_TEXTURE10': (6, 'constant'),
+ 'GL_TEXTURE11': (6, 'constant'),
+ 'GL_TEXTURE12': (6, 'constant'),
+ 'GL_TEXTURE13': (6, 'constant'),
+ 'GL_TEXTURE14': (6, 'constant'),
+ 'GL_TEXTURE15': (6, 'constant'),
+ 'GL_TEXTURE16': (6, 'constant'),
+ 'GL_TEXTURE17': (6, 'constant'),
+ 'GL_TEXTURE18': (6, 'constant'),
+ 'GL_TEXTURE19': (6, 'constant'),
+ 'GL_TEXTURE2': (6, 'constant'),
+ 'GL_TEXTURE20': (6, 'constant'),
+ 'GL_TEXTURE21': (6, 'constant'),
+ 'GL_TEXTURE22': (6, 'constant'),
+ 'GL_TEXTURE23': (6, 'constant'),
+ 'GL_TEXTURE24': (6, 'constant'),
+ 'GL_TEXTURE25': (6, 'constant'),
+ 'GL_TEXTURE26': (6, 'constant'),
+ 'GL_TEXTURE27': (6, 'constant'),
+ 'GL_TEXTURE28': (6, 'constant'),
+ 'GL_TEXTURE29': (6, 'constant'),
+ 'GL_TEXTURE3': (6, 'constant'),
+ 'GL_TEXTURE30': (6, 'constant'),
+ 'GL_TEXTURE31': (6, 'constant'),
+ 'GL_TEXTURE4': (6, 'constant'),
+ 'GL_TEXTURE5': (6, 'constant'),
+ 'GL_TEXTURE6': (6, 'constant'),
+ 'GL_TEXTURE7': (6, 'constant'),
+ 'GL_TEXTURE8': (6, 'constant'),
+ 'GL_TEXTURE9': (6, 'constant'),
+ 'GL_TEXTURE_1D': (18, 'constant'),
+ 'GL_TEXTURE_1D_ARRAY': (18, 'constant'),
+ 'GL_TEXTURE_2D': (18, 'constant'),
+ 'GL_TEXTURE_2D_ARRAY': (18, 'constant'),
+ 'GL_TEXTURE_2D_MULTISAMPLE': (18, 'constant'),
+ 'GL_TEXTURE_2D_MULTISAMPLE_ARRAY': (18, 'constant'),
+ 'GL_TEXTURE_3D': (18, 'constant'),
+ 'GL_TEXTURE_ALPHA_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_ALPHA_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_BASE_LEVEL': (5, 'constant'),
+ 'GL_TEXTURE_BINDING_1D': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_1D_ARRAY': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_2D': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_2D_ARRAY': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_2D_MULTISAMPLE': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_3D': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_BUFFER': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_CUBE_MAP': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY': (20, 'constant'),
+ 'GL_TEXTURE_BINDING_RECTANGLE': (20, 'constant'),
+ 'GL_TEXTURE_BIT': (0, 'constant'),
+ 'GL_TEXTURE_BLUE_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_BLUE_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_BORDER': (0, 'constant'),
+ 'GL_TEXTURE_BORDER_COLOR': (0, 'constant'),
+ 'GL_TEXTURE_BUFFER': (18, 'constant'),
+ 'GL_TEXTURE_BUFFER_BINDING': (19, 'constant'),
+ 'GL_TEXTURE_BUFFER_DATA_STORE_BINDING': (12, 'constant'),
+ 'GL_TEXTURE_BUFFER_OFFSET': (18, 'constant'),
+ 'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT': (18, 'constant'),
+ 'GL_TEXTURE_BUFFER_SIZE': (18, 'constant'),
+ 'GL_TEXTURE_COMPARE_FUNC': (7, 'constant'),
+ 'GL_TEXTURE_COMPARE_MODE': (7, 'constant'),
+ 'GL_TEXTURE_COMPONENTS': (0, 'constant'),
+ 'GL_TEXTURE_COMPRESSED': (18, 'constant'),
+ 'GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT': (18, 'constant'),
+ 'GL_TEXTURE_COMPRESSED_BLOCK_SIZE': (18, 'constant'),
+ 'GL_TEXTURE_COMPRESSED_BLOCK_WIDTH': (18, 'constant'),
+ 'GL_TEXTURE_COMPRESSED_IMAGE_SIZE': (6, 'constant'),
+ 'GL_TEXTURE_COMPRESSION_HINT': (6, 'constant'),
+ 'GL_TEXTURE_COORD_ARRAY': (0, 'constant'),
+ 'GL_TEXTURE_COORD_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_TEXTURE_COORD_ARRAY_POINTER': (0, 'constant'),
+ 'GL_TEXTURE_COORD_ARRAY_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_COORD_ARRAY_STRIDE': (0, 'constant'),
+ 'GL_TEXTURE_COORD_ARRAY_TYPE': (0, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP': (18, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_ARRAY': (18, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_NEGATIVE_X': (6, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Y': (6, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Z': (6, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_POSITIVE_X': (6, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_POSITIVE_Y': (6, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_POSITIVE_Z': (6, 'constant'),
+ 'GL_TEXTURE_CUBE_MAP_SEAMLESS': (13, 'constant'),
+ 'GL_TEXTURE_DEPTH': (5, 'constant'),
+ 'GL_TEXTURE_DEPTH_SIZE': (7, 'constant'),
+ 'GL_TEXTURE_DEPTH_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_ENV': (0, 'constant'),
+ 'GL_TEXTURE_ENV_COLOR': (0, 'constant'),
+ 'GL_TEXTURE_ENV_MODE': (0, 'constant'),
+ 'GL_TEXTURE_FETCH_BARRIER_BIT': (17, 'constant'),
+ 'GL_TEXTURE_FILTER_CONTROL': (7, 'constant'),
+ 'GL_TEXTURE_FIXED_SAMPLE_LOCATIONS': (13, 'constant'),
+ 'GL_TEXTURE_GATHER': (18, 'constant'),
+ 'GL_TEXTURE_GATHER_SHADOW': (18, 'constant'),
+ 'GL_TEXTURE_GEN_MODE': (0, 'constant'),
+ 'GL_TEXTURE_GEN_Q': (0, 'constant'),
+ 'GL_TEXTURE_GEN_R': (0, 'constant'),
+ 'GL_TEXTURE_GEN_S': (0, 'constant'),
+ 'GL_TEXTURE_GEN_T': (0, 'constant'),
+ 'GL_TEXTURE_GREEN_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_GREEN_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_HEIGHT': (0, 'constant'),
+ 'GL_TEXTURE_IMAGE_FORMAT': (18, 'constant'),
+ 'GL_TEXTURE_IMAGE_TYPE': (18, 'constant'),
+ 'GL_TEXTURE_IMMUTABLE_FORMAT': (17, 'constant'),
+ 'GL_TEXTURE_IMMUTABLE_LEVELS': (18, 'constant'),
+ 'GL_TEXTURE_INTENSITY_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_INTENSITY_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_INTERNAL_FORMAT': (0, 'constant'),
+ 'GL_TEXTURE_LOD_BIAS': (7, 'constant'),
+ 'GL_TEXTURE_LUMINANCE_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_LUMINANCE_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_MAG_FILTER': (0, 'constant'),
+ 'GL_TEXTURE_MATRIX': (0, 'constant'),
+ 'GL_TEXTURE_MAX_ANISOTROPY': (21, 'constant'),
+ 'GL_TEXTURE_MAX_LEVEL': (5, 'constant'),
+ 'GL_TEXTURE_MAX_LOD': (5, 'constant'),
+ 'GL_TEXTURE_MIN_FILTER': (0, 'constant'),
+ 'GL_TEXTURE_MIN_LOD': (5, 'constant'),
+ 'GL_TEXTURE_PRIORITY': (0, 'constant'),
+ 'GL_TEXTURE_RECTANGLE': (18, 'constant'),
+ 'GL_TEXTURE_RED_SIZE': (0, 'constant'),
+ 'GL_TEXTURE_RED_TYPE': (11, 'constant'),
+ 'GL_TEXTURE_RESIDENT': (0, 'constant'),
+ 'GL_TEXTURE_SAMPLES': (13, 'constant'),
+ 'GL_TEXTURE_SHADOW': (18, 'constant'),
+ 'GL_TEXTURE_SHARED_SIZE': (11, 'constant'),
+ 'GL_TEXTURE_STACK_DEPTH': (0, 'constant'),
+ 'GL_TEXTURE_STENCIL_SIZE': (11, 'constant'),
+ 'GL_TEXTURE_SWIZZLE_A': (14, 'constant'),
+ 'GL_TEXTURE_SWIZZLE_B': (14, 'constant'),
+ 'GL_TEXTURE_SWIZZLE_G': (14, 'constant'),
+ 'GL_TEXTURE_SWIZZLE_R': (14, 'constant'),
+ 'GL_TEXTURE_SWIZZLE_RGBA': (14, 'constant'),
+ 'GL_TEXTURE_TARGET': (20, 'constant'),
+ 'GL_TEXTURE_UPDATE_BARRIER_BIT': (17, 'constant'),
+ 'GL_TEXTURE_VIEW': (18, 'constant'),
+ 'GL_TEXTURE_VIEW_MIN_LAYER': (18, 'constant'),
+ 'GL_TEXTURE_VIEW_MIN_LEVEL': (18, 'constant'),
+ 'GL_TEXTURE_VIEW_NUM_LAYERS': (18, 'constant'),
+ 'GL_TEXTURE_VIEW_NUM_LEVELS': (18, 'constant'),
+ 'GL_TEXTURE_WIDTH': (0, 'constant'),
+ 'GL_TEXTURE_WRAP_R': (5, 'constant'),
+ 'GL_TEXTURE_WRAP_S': (0, 'constant'),
+ 'GL_TEXTURE_WRAP_T': (0, 'constant'),
+ 'GL_TIMEOUT_EXPIRED': (13, 'constant'),
+ 'GL_TIMEOUT_IGNORED': (13, 'constant'),
+ 'GL_TIMESTAMP': (14, 'constant'),
+ 'GL_TIME_ELAPSED': (14, 'constant'),
+ 'GL_TOP_LEVEL_ARRAY_SIZE': (18, 'constant'),
+ 'GL_TOP_LEVEL_ARRAY_STRIDE': (18, 'constant'),
+ 'GL_TRANSFORM_BIT': (0, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK': (15, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_ACTIVE': (17, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BARRIER_BIT': (17, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BINDING': (15, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER': (19, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_ACTIVE': (15, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_BINDING': (11, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_INDEX': (19, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_MODE': (11, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_PAUSED': (15, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_SIZE': (11, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_START': (11, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_BUFFER_STRIDE': (19, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_OVERFLOW': (21, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_PAUSED': (17, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN': (11, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_STREAM_OVERFLOW': (21, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_VARYING': (18, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_VARYINGS': (11, 'constant'),
+ 'GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH': (11, 'constant'),
+ 'GL_TRANSPOSE_COLOR_MATRIX': (6, 'constant'),
+ 'GL_TRANSPOSE_MODELVIEW_MATRIX': (6, 'constant'),
+ 'GL_TRANSPOSE_PROJECTION_MATRIX': (6, 'constant'),
+ 'GL_TRANSPOSE_TEXTURE_MATRIX': (6, 'constant'),
+ 'GL_TRIANGLES': (0, 'constant'),
+ 'GL_TRIANGLES_ADJACENCY': (13, 'constant'),
+ 'GL_TRIANGLE_FAN': (0, 'constant'),
+ 'GL_TRIANGLE_STRIP': (0, 'constant'),
+ 'GL_TRIANGLE_STRIP_ADJACENCY': (13, 'constant'),
+ 'GL_TRUE': (21, 'constant'),
+ 'GL_TYPE': (18, 'constant'),
+ 'GL_UNDEFINED_VERTEX': (16, 'constant'),
+ 'GL_UNIFORM': (18, 'constant'),
+ 'GL_UNIFORM_ARRAY_STRIDE': (12, 'constant'),
+ 'GL_UNIFORM_ATOMIC_COUNTER_BUFFER_INDEX': (17, 'constant'),
+ 'GL_UNIFORM_BARRIER_BIT': (17, 'constant'),
+ 'GL_UNIFORM_BLOCK': (18, 'constant'),
+ 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_BINDING': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_DATA_SIZE': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_INDEX': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_NAME_LENGTH': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_REFERENCED_BY_COMPUTE_SHADER': (18, 'constant'),
+ 'GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_REFERENCED_BY_GEOMETRY_SHADER': (12, 'constant'),
+ 'GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_CONTROL_SHADER': (15, 'constant'),
+ 'GL_UNIFORM_BLOCK_REFERENCED_BY_TESS_EVALUATION_SHADER': (15, 'constant'),
+ 'GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER': (12, 'constant'),
+ 'GL_UNIFORM_BUFFER': (12, 'constant'),
+ 'GL_UNIFORM_BUFFER_BINDING': (12, 'constant'),
+ 'GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT': (12, 'constant'),
+ 'GL_UNIFORM_BUFFER_SIZE': (12, 'constant'),
+ 'GL_UNIFORM_BUFFER_START': (12, 'constant'),
+ 'GL_UNIFORM_IS_ROW_MAJOR': (12, 'constant'),
+ 'GL_UNIFORM_MATRIX_STRIDE': (12, 'constant'),
+ 'GL_UNIFORM_NAME_LENGTH': (12, 'constant'),
+ 'GL_UNIFORM_OFFSET': (12, 'constant'),
+ 'GL_UNIFORM_SIZE': (12, 'constant'),
+ 'GL_UNIFORM_TYPE': (12, 'constant'),
+ 'GL_UNKNOWN_CONTEXT_RESET': (20, 'constant'),
+ 'GL_UNPACK_ALIGNMENT': (0, 'constant'),
+ 'GL_UNPACK_COMPRESSED_BLOCK_DEPTH': (17, 'constant'),
+ 'GL_UNPACK_COMPRESSED_BLOCK_HEIGHT': (17, 'constant'),
+ 'GL_UNPACK_COMPRESSED_BLOCK_SIZE': (17, 'constant'),
+ 'GL_UNPACK_COMPRESSED_BLOCK_WIDTH': (17, 'constant'),
+ 'GL_UNPACK_IMAGE_HEIGHT': (5, 'constant'),
+ 'GL_UNPACK_LSB_FIRST': (0, 'constant'),
+ 'GL_UNPACK_ROW_LENGTH': (0, 'constant'),
+ 'GL_UNPACK_SKIP_IMAGES': (5, 'constant'),
+ 'GL_UNPACK_SKIP_PIXELS': (0, 'constant'),
+ 'GL_UNPACK_SKIP_ROWS': (0, 'constant'),
+ 'GL_UNPACK_SWAP_BYTES': (0, 'constant'),
+ 'GL_UNSIGNALED': (13, 'constant'),
+ 'GL_UNSIGNED_BYTE': (21, 'constant'),
+ 'GL_UNSIGNED_BYTE_2_3_3_REV': (5, 'constant'),
+ 'GL_UNSIGNED_BYTE_3_3_2': (5, 'constant'),
+ 'GL_UNSIGNED_INT': (21, 'constant'),
+ 'GL_UNSIGNED_INT64': (21, 'constant'),
+ 'GL_UNSIGNED_INT_10F_11F_11F_REV': (19, 'constant'),
+ 'GL_UNSIGNED_INT_10_10_10_2': (5, 'constant'),
+ 'GL_UNSIGNED_INT_24_8': (11, 'constant'),
+ 'GL_UNSIGNED_INT_2_10_10_10_REV': (5, 'constant'),
+ 'GL_UNSIGNED_INT_5_9_9_9_REV': (11, 'constant'),
+ 'GL_UNSIGNED_INT_8_8_8_8': (5, 'constant'),
+ 'GL_UNSIGNED_INT_8_8_8_8_REV': (5, 'constant'),
+ 'GL_UNSIGNED_INT_ATOMIC_COUNTER': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_1D': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_1D_ARRAY': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_2D': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_2D_ARRAY': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_2D_MULTISAMPLE_ARRAY': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_2D_RECT': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_3D': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_BUFFER': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_CUBE': (17, 'constant'),
+ 'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY': (17, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_1D': (11, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_1D_ARRAY': (11, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_2D': (11, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_2D_ARRAY': (11, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE': (13, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY': (13, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_2D_RECT': (12, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_3D': (11, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_BUFFER': (12, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_CUBE': (11, 'constant'),
+ 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY': (15, 'constant'),
+ 'GL_UNSIGNED_INT_VEC2': (11, 'constant'),
+ 'GL_UNSIGNED_INT_VEC3': (11, 'constant'),
+ 'GL_UNSIGNED_INT_VEC4': (11, 'constant'),
+ 'GL_UNSIGNED_NORMALIZED': (11, 'constant'),
+ 'GL_UNSIGNED_SHORT': (21, 'constant'),
+ 'GL_UNSIGNED_SHORT_1_5_5_5_REV': (5, 'constant'),
+ 'GL_UNSIGNED_SHORT_4_4_4_4': (5, 'constant'),
+ 'GL_UNSIGNED_SHORT_4_4_4_4_REV': (5, 'constant'),
+ 'GL_UNSIGNED_SHORT_5_5_5_1': (5, 'constant'),
+ 'GL_UNSIGNED_SHORT_5_6_5': (5, 'constant'),
+ 'GL_UNSIGNED_SHORT_5_6_5_REV': (5, 'constant'),
+ 'GL_UPPER_LEFT': (20, 'constant'),
+ 'GL_V2F': (0, 'constant'),
+ 'GL_V3F': (0, 'constant'),
+ 'GL_VALIDATE_STATUS': (9, 'constant'),
+ 'GL_VENDOR': (0, 'constant'),
+ 'GL_VERSION': (0, 'constant'),
+ 'GL_VERTEX_ARRAY': (18, 'constant'),
+ 'GL_VERTEX_ARRAY_BINDING': (11, 'constant'),
+ 'GL_VERTEX_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_VERTEX_ARRAY_KHR': (18, 'constant'),
+ 'GL_VERTEX_ARRAY_POINTER': (0, 'constant'),
+ 'GL_VERTEX_ARRAY_SIZE': (0, 'constant'),
+ 'GL_VERTEX_ARRAY_STRIDE': (0, 'constant'),
+ 'GL_VERTEX_ARRAY_TYPE': (0, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT': (17, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR': (14, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_ENABLED': (9, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_INTEGER': (11, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_LONG': (18, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED': (9, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_POINTER': (9, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_SIZE': (9, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_STRIDE': (9, 'constant'),
+ 'GL_VERTEX_ATTRIB_ARRAY_TYPE': (9, 'constant'),
+ 'GL_VERTEX_ATTRIB_BINDING': (18, 'constant'),
+ 'GL_VERTEX_ATTRIB_RELATIVE_OFFSET': (18, 'constant'),
+ 'GL_VERTEX_BINDING_BUFFER': (18, 'constant'),
+ 'GL_VERTEX_BINDING_DIVISOR': (18, 'constant'),
+ 'GL_VERTEX_BINDING_OFFSET': (18, 'constant'),
+ 'GL_VERTEX_BINDING_STRIDE': (18, 'constant'),
+ 'GL_VERTEX_PROGRAM_POINT_SIZE': (9, 'constant'),
+ 'GL_VERTEX_PROGRAM_TWO_SIDE': (9, 'constant'),
+ 'GL_VERTEX_SHADER': (9, 'constant'),
+ 'GL_VERTEX_SHADER_BIT': (16, 'constant'),
+ 'GL_VERTEX_SHADER_INVOCATIONS': (21, 'constant'),
+ 'GL_VERTEX_SUBROUTINE': (18, 'constant'),
+ 'GL_VERTEX_SUBROUTINE_UNIFORM': (18, 'constant'),
+ 'GL_VERTEX_TEXTURE': (18, 'constant'),
+ 'GL_VERTICES_SUBMITTED': (21, 'constant'),
+ 'GL_VIEWPORT': (16, 'constant'),
+ 'GL_VIEWPORT_BIT': (0, 'constant'),
+ 'GL_VIEWPORT_BOUNDS_RANGE': (16, 'constant'),
+ 'GL_VIEWPORT_INDEX_PROVOKING_VERTEX': (16, 'constant'),
+ 'GL_VIEWPORT_SUBPIXEL_BITS': (16, 'constant'),
+ 'GL_VIEW_CLASS_128_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_16_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_24_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_32_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_48_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_64_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_8_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_96_BITS': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_10x10_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_10x5_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_10x6_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_10x8_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_12x10_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_12x12_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_4x4_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_5x4_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_5x5_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_6x5_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_6x6_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_8x5_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_8x6_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ASTC_8x8_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_BPTC_FLOAT': (18, 'constant'),
+ 'GL_VIEW_CLASS_BPTC_UNORM': (18, 'constant'),
+ 'GL_VIEW_CLASS_EAC_R11': (18, 'constant'),
+ 'GL_VIEW_CLASS_EAC_RG11': (18, 'constant'),
+ 'GL_VIEW_CLASS_ETC2_EAC_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_ETC2_RGB': (18, 'constant'),
+ 'GL_VIEW_CLASS_ETC2_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_RGTC1_RED': (18, 'constant'),
+ 'GL_VIEW_CLASS_RGTC2_RG': (18, 'constant'),
+ 'GL_VIEW_CLASS_S3TC_DXT1_RGB': (18, 'constant'),
+ 'GL_VIEW_CLASS_S3TC_DXT1_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_S3TC_DXT3_RGBA': (18, 'constant'),
+ 'GL_VIEW_CLASS_S3TC_DXT5_RGBA': (18, 'constant'),
+ 'GL_VIEW_COMPATIBILITY_CLASS': (18, 'constant'),
+ 'GL_VOID_P': (21, 'value'),
+ 'GL_WAIT_FAILED': (13, 'constant'),
+ 'GL_WEIGHT_ARRAY_BUFFER_BINDING': (8, 'constant'),
+ 'GL_WRITE_ONLY': (8, 'constant'),
+ 'GL_XOR': (0, 'constant'),
+ 'GL_ZERO': (0, 'constant'),
+ 'GL_ZERO_TO_ONE': (20, 'constant'),
+ 'GL_ZOOM_X': (0, 'constant'),
+ 'GL_ZOOM_Y': (0, 'constant'),
+ 'GLbitfield': (21, 'value'),
+ 'GLboolean': (21, 'value'),
+ 'GLbyte': (21, 'value'),
+ 'GLchar': (21, 'value'),
+ 'GLcharARB': (21, 'value'),
+ 'GLclampd': (21, 'value'),
+ 'GLclampf': (21, 'value'),
+ 'GLclampx': (21, 'value'),
+ 'GLdouble': (21, 'value'),
+ 'GLdouble_2': (21, 'value'),
+ 'GLdouble_3': (21, 'value'),
+ 'GLdouble_4': (21, 'value'),
+ 'GLeglImageOES': (21, 'value'),
+ 'GLenum': (21, 'value'),
+ 'GLenumArray': (9, 'value'),
+ 'GLfixed': (21, 'value'),
+ 'GLfloat': (21, 'value'),
+ 'GLfloat_2': (21, 'value'),
+ 'GLfloat_3': (21, 'value'),
+ 'GLfloat_4': (21, 'value'),
+ 'GLhalfARB': (21, 'value'),
+ 'GLhalfNV': (21, 'value'),
+ 'GLhandle': (21, 'value'),
+ 'GLhandleARB': (21, 'value'),
+ 'GLint': (21, 'value'),
+ 'GLint64': (21, 'value'),
+ 'GLint64EXT': (21, 'value'),
+ 'GLintArray': (16, 'value'),
+ 'GLintptr': (21, 'value'),
+ 'GLintptrARB': (21, 'value'),
+ 'GLshort': (21, 'value'),
+ 'GLsizei': (21, 'value'),
+ 'GLsizeiptr': (21, 'value'),
+ 'GLsizeiptrARB': (21, 'value'),
+ 'GLsync': (21, 'value'),
+ 'GLubyte': (21, 'value'),
+ 'GLubyte_3': (21, 'value'),
+ 'GLuint': (21, 'value'),
+ 'GLuint64': (21, 'value'),
+ 'GLuint64EXT': (21, 'value'),
+ 'GLulong': (21, 'value'),
+ 'GLushort': (21, 'value'),
+ 'GLvdpauSurfaceNV': (21, 'value'),
+ 'GLvoid': (21, 'value'),
+ 'GLvoidp': (21, 'value'),
+ 'KHR': (None, 'submodule'),
+ 'OpenGL': (9, 'value'),
+ 'VERSION': (None, 'submodule'),
+ 'arrays': (21, 'value'),
+ 'as_8_bit': (21, 'function'),
+ 'bytes': (21, 'value'),
+ 'c_char_p': (11, 'value'),
+ 'c_int': (21, 'value'),
+ 'constant': (21, 'value'),
+ 'constants': (5, 'value'),
+ 'contextdata': (9, 'value'),
+ 'converters': (9, 'value'),
+ 'ctypes': (21, 'value'),
+ 'ctypes_version': (21, 'value'),
+ 'error': (9, 'value'),
+ 'exceptional': (None, 'submodule'),
+ 'extensions': (21, 'value'),
+ 'glAccum': (0, 'function'),
+ 'glActiveShaderProgram': (16, 'function'),
+ 'glActiveTexture': (6, 'function'),
+ 'glAlphaFunc': (0, 'function'),
+ 'glAreTexturesResident': (3, 'function'),
+ 'glArrayElement': (0, 'function'),
+ 'glAttachShader': (9, 'function'),
+ 'glBegin': (3, 'function'),
+ 'glBeginConditionalRender': (11, 'function'),
+ 'glBeginQuery': (8, 'function'),
+ 'glBeginQueryIndexed': (15, 'function'),
+ 'glBeginTransformFeedback': (11, 'function'),
+ 'glBindAttribLocation': (9, 'function'),
+ 'glBindBuffer': (8, 'function'),
+ 'glBindBufferBase': (12, 'function'),
+ 'glBindBufferRange': (12, 'function'),
+ 'glBindBuffersBase': (19, 'function'),
+ 'glBindBuffersRange': (19, 'function'),
+ 'glBindFragDataLocation': (11, 'function'),
+ 'glBindFragDataLocationIndexed': (14, 'function'),
+ 'glBindFramebuffer': (11, 'function'),
+ 'glBindImageTexture': (17, 'function'),
+ 'glBindImageTextures': (19, 'function'),
+ 'glBindProgramPipeline': (16, 'function'),
+ 'glBindRenderbuffer': (11, 'function'),
+ 'glBindSampler': (14, 'function'),
+ 'glBindSamplers': (19, 'function'),
+ 'glBindTexture': (0, 'function'),
+ 'glBindTextureUnit': (20, 'function'),
+ 'glBindTextures': (19, 'function'),
+ 'glBindTransformFeedback': (15, 'function'),
+ 'glBindVertexArray': (11, 'function'),
+ 'glBindVertexBuffer': (18, 'function'),
+ 'glBindVertexBuffers': (19, 'function'),
+ 'glBitmap': (0, 'function'),
+ 'glBlendColor': (7, 'function'),
+ 'glBlendEquation': (7, 'function'),
+ 'glBlendEquationSeparate': (9, 'function'),
+ 'glBlendEquationSeparatei': (15, 'function'),
+ 'glBlendEquationi': (15, 'function'),
+ 'glBlendFunc': (0, 'function'),
+ 'glBlendFuncSeparate': (7, 'function'),
+ 'glBlendFuncSeparatei': (15, 'function'),
+ 'glBlendFunci': (15, 'function'),
+ 'glBlitFramebuffer': (11, 'function'),
+ 'glBlitNamedFramebuffer': (20, 'function'),
+ 'glBufferData': (8, 'function'),
+ 'glBufferStorage': (19, 'function'),
+ 'glBufferSubData': (8, 'function'),
+ 'glCallList': (0, 'function'),
+ 'glCallLists': (3, 'function'),
+ 'glCheckFramebufferStatus': (11, 'function'),
+ 'glCheckNamedFramebufferStatus': (20, 'function'),
+ 'glClampColor': (11, 'function'),
+ 'glClear': (0, 'function'),
+ 'glClearAccum': (0, 'function'),
+ 'glClearBufferData': (18, 'function'),
+ 'glClearBufferSubData': (18, 'function'),
+ 'glClearBufferfi': (11, 'function'),
+ 'glClearBufferfv': (11, 'function'),
+ 'glClearBufferiv': (11, 'function'),
+ 'glClearBufferuiv': (11, 'function'),
+ 'glClearColor': (0, 'function'),
+ 'glClearDepth': (0, 'function'),
+ 'glClearDepthf': (16, 'function'),
+ 'glClearIndex': (0, 'function'),
+ 'glClearNamedBufferData': (20, 'function'),
+ 'glClearNamedBufferSubData': (20, 'function'),
+ 'glClearNamedFramebufferfi': (20, 'function'),
+ 'glClearNamedFramebufferfv': (20, 'function'),
+ 'glClearNamedFramebufferiv': (20, 'function'),
+ 'glClearNamedFramebufferuiv': (20, 'function'),
+ 'glClearStencil': (0, 'function'),
+ 'glClearTexImage': (19, 'function'),
+ 'glClearTexSubImage': (19, 'function'),
+ 'glClientActiveTexture': (6, 'function'),
+ 'glClientWaitSync': (13, 'function'),
+ 'glClipControl': (20, 'function'),
+ 'glClipPlane': (0, 'function'),
+ 'glColor': (3, 'function'),
+ 'glColor3b': (0, 'function'),
+ 'glColor3bv': (0, 'function'),
+ 'glColor3d': (0, 'function'),
+ 'glColor3dv': (0, 'function'),
+ 'glColor3f': (0, 'function'),
+ 'glColor3fv': (0, 'function'),
+ 'glColor3i': (0, 'function'),
+ 'glColor3iv': (0, 'function'),
+ 'glColor3s': (0, 'function'),
+ 'glColor3sv': (0, 'function'),
+ 'glColor3ub': (0, 'function'),
+ 'glColor3ubv': (0, 'function'),
+ 'glColor3ui': (0, 'function'),
+ 'glColor3uiv': (0, 'function'),
+ 'glColor3us': (0, 'function'),
+ 'glColor3usv': (0, 'function'),
+ 'glColor4b': (0, 'function'),
+ 'glColor4bv': (0, 'function'),
+ 'glColor4d': (0, 'function'),
+ 'glColor4dv': (0, 'function'),
+ 'glColor4f': (0, 'function'),
+ 'glColor4fv': (0, 'function'),
+ 'glColor4i': (0, 'function'),
+ 'glColor4iv': (0, 'function'),
+ 'glColor4s': (0, 'function'),
+ 'glColor4sv': (0, 'function'),
+ 'glColor4ub': (0, 'function'),
+ 'glColor4ubv': (0, 'function'),
+ 'glColor4ui': (0, 'function'),
+ 'glColor4uiv': (0, 'function'),
+ 'glColor4us': (0, 'function'),
+ 'glColor4usv': (0, 'function'),
+ 'glColorMask': (0, 'function'),
+ 'glColorMaski': (11, 'function'),
+ 'glColorMaterial': (0, 'function'),
+ 'glColorP3ui': (14, 'function'),
+ 'glColorP3uiv': (14, 'function'),
+ 'glColorP4ui': (14, 'function'),
+ 'glColorP4uiv': (14, 'function'),
+ 'glColorPointer': (1, 'function'),
+ 'glColorPointerb': (1, 'function'),
+ 'glColorPointerd': (1, 'function'),
+ 'glColorPointerf': (1, 'function'),
+ 'glColorPointeri': (1, 'function'),
+ 'glColorPointers': (1, 'function'),
+ 'glColorPointerub': (1, 'function'),
+ 'glColorPointerui': (1, 'function'),
+ 'glColorPointerus': (1, 'function'),
+ 'glColorSubTable': (5, 'function'),
+ 'glColorTable': (5, 'function'),
+ 'glColorTableParameterfv': (5, 'function'),
+ 'glColorTableParameteriv': (5, 'function'),
+ 'glCompileShader': (9, 'function'),
+ 'glCompressedTexImage1D': (6, 'function'),
+ 'glCompressedTexImage2D': (6, 'function'),
+ 'glCompressedTexImage3D': (6, 'function'),
+ 'glCompressedTexSubImage1D': (6, 'function'),
+ 'glCompressedTexSubImage2D': (6, 'function'),
+ 'glCompressedTexSubImage3D': (6, 'function'),
+ 'glCompressedTextureSubImage1D': (20, 'function'),
+ 'glCompressedTextureSubImage2D': (20, 'function'),
+ 'glCompressedTextureSubImage3D': (20, 'function'),
+ 'glConvolutionFilter1D': (5, 'function'),
+ 'glConvolutionFilter2D': (5, 'function'),
+ 'glConvolutionParameterf': (5, 'function'),
+ 'glConvolutionParameterfv': (5, 'function'),
+ 'glConvolutionParameteri': (5, 'function'),
+ 'glConvolutionParameteriv': (5, 'function'),
+ 'glCopyBufferSubData': (12, 'function'),
+ 'glCopyColorSubTable': (5, 'function'),
+ 'glCopyColorTable': (5, 'function'),
+ 'glCopyConvolutionFilter1D': (5, 'function'),
+ 'glCopyConvolutionFilter2D': (5, 'function'),
+ 'glCopyImageSubData': (18, 'function'),
+ 'glCopyNamedBufferSubData': (20, 'function'),
+ 'glCopyPixels': (0, 'function'),
+ 'glCopyTexImage1D': (0, 'function'),
+ 'glCopyTexImage2D': (0, 'function'),
+ 'glCopyTexSubImage1D': (0, 'function'),
+ 'glCopyTexSubImage2D': (0, 'function'),
+ 'glCopyTexSubImage3D': (5, 'function'),
+ 'glCopyTextureSubImage1D': (20, 'function'),
+ 'glCopyTextureSubImage2D': (20, 'function'),
+ 'glCopyTextureSubImage3D': (20, 'function'),
+ 'glCreateBuffers': (20, 'function'),
+ 'glCreateFramebuffers': (20, 'function'),
+ 'glCreateProgram': (9, 'function'),
+ 'glCreateProgramPipelines': (20, 'function'),
+ 'glCreateQueries': (20, 'function'),
+ 'glCreateRenderbuffers': (20, 'function'),
+ 'glCreateSamplers': (20, 'function'),
+ 'glCreateShader': (9, 'function'),
+ 'glCreateShaderProgramv': (16, 'function'),
+ 'glCreateTextures': (20, 'function'),
+ 'glCreateTransformFeedbacks': (20, 'function'),
+ 'glCreateVertexArrays': (20, 'function'),
+ 'glCullFace': (0, 'function'),
+ 'glDebugMessageCallback': (18, 'function'),
+ 'glDebugMessageCallbackKHR': (18, 'function'),
+ 'glDebugMessageControl': (18, 'function'),
+ 'glDebugMessageControlKHR': (18, 'function'),
+ 'glDebugMessageInsert': (18, 'function'),
+ 'glDebugMessageInsertKHR': (18, 'function'),
+ 'glDeleteBuffers': (8, 'function'),
+ 'glDeleteFramebuffers': (11, 'function'),
+ 'glDeleteLists': (0, 'function'),
+ 'glDeleteProgram': (9, 'function'),
+ 'glDeleteProgramPipelines': (16, 'function'),
+ 'glDeleteQueries': (8, 'function'),
+ 'glDeleteRenderbuffers': (11, 'function'),
+ 'glDeleteSamplers': (14, 'function'),
+ 'glDeleteShader': (9, 'function'),
+ 'glDeleteSync': (13, 'function'),
+ 'glDeleteTextures': (3, 'function'),
+ 'glDeleteTransformFeedbacks': (15, 'function'),
+ 'glDeleteVertexArrays': (11, 'function'),
+ 'glDepthFunc': (0, 'function'),
+ 'glDepthMask': (0, 'function'),
+ 'glDepthRange': (0, 'function'),
+ 'glDepthRangeArrayv': (16, 'function'),
+ 'glDepthRangeIndexed': (16, 'function'),
+ 'glDepthRangef': (16, 'function'),
+ 'glDetachShader': (9, 'function'),
+ 'glDisable': (0, 'function'),
+ 'glDisableClientState': (0, 'function'),
+ 'glDisableVertexArrayAttrib': (20, 'function'),
+ 'glDisableVertexAttribArray': (9, 'function'),
+ 'glDisablei': (11, 'function'),
+ 'glDispatchCompute': (18, 'function'),
+ 'glDispatchComputeIndirect': (18, 'function'),
+ 'glDrawArrays': (0, 'function'),
+ 'glDrawArraysIndirect': (15, 'function'),
+ 'glDrawArraysInstanced': (12, 'function'),
+ 'glDrawArraysInstancedBaseInstance': (17, 'function'),
+ 'glDrawBuffer': (0, 'function'),
+ 'glDrawBuffers': (9, 'function'),
+ 'glDrawElements': (1, 'function'),
+ 'glDrawElementsBaseVertex': (13, 'function'),
+ 'glDrawElementsIndirect': (15, 'function'),
+ 'glDrawElementsInstanced': (12, 'function'),
+ 'glDrawElementsInstancedBaseInstance': (17, 'function'),
+ 'glDrawElementsInstancedBaseVertex': (13, 'function'),
+ 'glDrawElementsInstancedBaseVertexBaseInstance': (17, 'function'),
+ 'glDrawElementsub': (1, 'function'),
+ 'glDrawElementsui': (1, 'function'),
+ 'glDrawElementsus': (1, 'function'),
+ 'glDrawPixels': (2, 'function'),
+ 'glDrawPixelsb': (2, 'function'),
+ 'glDrawPixelsf': (2, 'function'),
+ 'glDrawPixelsi': (2, 'function'),
+ 'glDrawPixelss': (2, 'function'),
+ 'glDrawPixelsub': (2, 'function'),
+ 'glDrawPixelsui': (2, 'function'),
+ 'glDrawPixelsus': (2, 'function'),
+ 'glDrawRangeElements': (5, 'function'),
+ 'glDrawRangeElementsBaseVertex': (13, 'function'),
+ 'glDrawTransformFeedback': (15, 'function'),
+ 'glDrawTransformFeedbackInstanced': (17, 'function'),
+ 'glDrawTransformFeedbackStream': (15, 'function'),
+ 'glDrawTransformFeedbackStreamInstanced': (17, 'function'),
+ 'glEdgeFlag': (0, 'function'),
+ 'glEdgeFlagPointer': (1, 'function'),
+ 'glEdgeFlagPointerb': (1, 'function'),
+ 'glEdgeFlagv': (0, 'function'),
+ 'glEnable': (0, 'function'),
+ 'glEnableClientState': (0, 'function'),
+ 'glEnableVertexArrayAttrib': (20, 'function'),
+ 'glEnableVertexAttribArray': (9, 'function'),
+ 'glEnablei': (11, 'function'),
+ 'glEnd': (3, 'function'),
+ 'glEndConditionalRender': (11, 'function'),
+ 'glEndList': (0, 'function'),
+ 'glEndQuery': (8, 'function'),
+ 'glEndQueryIndexed': (15, 'function'),
+ 'glEndTransformFeedback': (11, 'function'),
+ 'glEvalCoord1d': (0, 'function'),
+ 'glEvalCoord1dv': (0, 'function'),
+ 'glEvalCoord1f': (0, 'function'),
+ 'glEvalCoord1fv': (0, 'function'),
+ 'glEvalCoord2d': (0, 'function'),
+ 'glEvalCoord2dv': (0, 'function'),
+ 'glEvalCoord2f': (0, 'function'),
+ 'glEvalCoord2fv': (0, 'function'),
+ 'glEvalMesh1': (0, 'function'),
+ 'glEvalMesh2': (0, 'function'),
+ 'glEvalPoint1': (0, 'function'),
+ 'glEvalPoint2': (0, 'function'),
+ 'glFeedbackBuffer': (1, 'function'),
+ 'glFenceSync': (13, 'function'),
+ 'glFinish': (0, 'function'),
+ 'glFlush': (0, 'function'),
+ 'glFlushMappedBufferRange': (11, 'function'),
+ 'glFlushMappedNamedBufferRange': (20, 'function'),
+ 'glFogCoordPointer': (7, 'function'),
+ 'glFogCoordd': (7, 'function'),
+ 'glFogCoorddv': (7, 'function'),
+ 'glFogCoordf': (7, 'function'),
+ 'glFogCoordfv': (7, 'function'),
+ 'glFogf': (0, 'function'),
+ 'glFogfv': (0, 'function'),
+ 'glFogi': (0, 'function'),
+ 'glFogiv': (0, 'function'),
+ 'glFramebufferParameteri': (18, 'function'),
+ 'glFramebufferRenderbuffer': (11, 'function'),
+ 'glFramebufferTexture': (13, 'function'),
+ 'glFramebufferTexture1D': (11, 'function'),
+ 'glFramebufferTexture2D': (11, 'function'),
+ 'glFramebufferTexture3D': (11, 'function'),
+ 'glFramebufferTextureLayer': (11, 'function'),
+ 'glFrontFace': (0, 'function'),
+ 'glFrustum': (0, 'function'),
+ 'glGenBuffers': (8, 'function'),
+ 'glGenFramebuffers': (11, 'function'),
+ 'glGenLists': (0, 'function'),
+ 'glGenProgramPipelines': (16, 'function'),
+ 'glGenQueries': (8, 'function'),
+ 'glGenRenderbuffers': (11, 'function'),
+ 'glGenSamplers': (14, 'function'),
+ 'glGenTextures': (0, 'function'),
+ 'glGenTransformFeedbacks': (15, 'function'),
+ 'glGenVertexArrays': (11, 'function'),
+ 'glGenerateMipmap': (11, 'function'),
+ 'glGenerateTextureMipmap': (20, 'function'),
+ 'glGetActiveAtomicCounterBufferiv': (17, 'function'),
+ 'glGetActiveAttrib': (9, 'function'),
+ 'glGetActiveSubroutineName': (15, 'function'),
+ 'glGetActiveSubroutineUniformName': (15, 'function'),
+ 'glGetActiveSubroutineUniformiv': (15, 'function'),
+ 'glGetActiveUniform': (9, 'function'),
+ 'glGetActiveUniformBlockName': (12, 'function'),
+ 'glGetActiveUniformBlockiv': (12, 'function'),
+ 'glGetActiveUniformName': (12, 'function'),
+ 'glGetActiveUniformsiv': (12, 'function'),
+ 'glGetAttachedShaders': (9, 'function'),
+ 'glGetAttribLocation': (9, 'function'),
+ 'glGetBooleani_v': (11, 'function'),
+ 'glGetBooleanv': (0, 'function'),
+ 'glGetBufferParameteri64v': (13, 'function'),
+ 'glGetBufferParameteriv': (8, 'function'),
+ 'glGetBufferPointerv': (8, 'function'),
+ 'glGetBufferSubData': (8, 'function'),
+ 'glGetClipPlane': (0, 'function'),
+ 'glGetColorTable': (5, 'function'),
+ 'glGetColorTableParameterfv': (5, 'function'),
+ 'glGetColorTableParameteriv': (5, 'function'),
+ 'glGetCompressedTexImage': (6, 'function'),
+ 'glGetCompressedTextureImage': (20, 'function'),
+ 'glGetCompressedTextureSubImage': (20, 'function'),
+ 'glGetConvolutionFilter': (5, 'function'),
+ 'glGetConvolutionParameterfv': (5, 'function'),
+ 'glGetConvolutionParameteriv': (5, 'function'),
+ 'glGetDebugMessageLog': (18, 'function'),
+ 'glGetDebugMessageLogKHR': (18, 'function'),
+ 'glGetDoublei_v': (16, 'function'),
+ 'glGetDoublev': (0, 'function'),
+ 'glGetError': (0, 'function'),
+ 'glGetFloatValue': (4, 'function'),
+ 'glGetFloati_v': (16, 'function'),
+ 'glGetFloatv': (4, 'function'),
+ 'glGetFragDataIndex': (14, 'function'),
+ 'glGetFragDataLocation': (11, 'function'),
+ 'glGetFramebufferAttachmentParameteriv': (11, 'function'),
+ 'glGetFramebufferParameteriv': (18, 'function'),
+ 'glGetGraphicsResetStatus': (20, 'function'),
+ 'glGetHistogram': (5, 'function'),
+ 'glGetHistogramParameterfv': (5, 'function'),
+ 'glGetHistogramParameteriv': (5, 'function'),
+ 'glGetInteger64i_v': (13, 'function'),
+ 'glGetInteger64v': (13, 'function'),
+ 'glGetIntegerValue': (4, 'function'),
+ 'glGetIntegeri_v': (12, 'function'),
+ 'glGetIntegerv': (4, 'function'),
+ 'glGetInternalformati64v': (18, 'function'),
+ 'glGetInternalformativ': (17, 'function'),
+ 'glGetLightfv': (0, 'function'),
+ 'glGetLightiv': (0, 'function'),
+ 'glGetMapdv': (0, 'function'),
+ 'glGetMapfv': (0, 'function'),
+ 'glGetMapiv': (0, 'function'),
+ 'glGetMaterialfv': (0, 'function'),
+ 'glGetMaterialiv': (0, 'function'),
+ 'glGetMinmax': (5, 'function'),
+ 'glGetMinmaxParameterfv': (5, 'function'),
+ 'glGetMinmaxParameteriv': (5, 'function'),
+ 'glGetMultisamplefv': (13, 'function'),
+ 'glGetNamedBufferParameteri64v': (20, 'function'),
+ 'glGetNamedBufferParameteriv': (20, 'function'),
+ 'glGetNamedBufferPointerv': (20, 'function'),
+ 'glGetNamedBufferSubData': (20, 'function'),
+ 'glGetNamedFramebufferAttachmentParameteriv': (20, 'function'),
+ 'glGetNamedFramebufferParameteriv': (20, 'function'),
+ 'glGetNamedRenderbufferParameteriv': (20, 'function'),
+ 'glGetObjectLabel': (18, 'function'),
+ 'glGetObjectLabelKHR': (18, 'function'),
+ 'glGetObjectPtrLabel': (18, 'function'),
+ 'glGetObjectPtrLabelKHR': (18, 'function'),
+ 'glGetPixelMapfv': (0, 'function'),
+ 'glGetPixelMapuiv': (0, 'function'),
+ 'glGetPixelMapusv': (0, 'function'),
+ 'glGetPointerv': (18, 'function'),
+ 'glGetPointervKHR': (18, 'function'),
+ 'glGetPolygonStipple': (0, 'function'),
+ 'glGetProgramBinary': (16, 'function'),
+ 'glGetProgramInfoLog': (9, 'function'),
+ 'glGetProgramInterfaceiv': (18, 'function'),
+ 'glGetProgramPipelineInfoLog': (16, 'function'),
+ 'glGetProgramPipelineiv': (16, 'function'),
+ 'glGetProgramResourceIndex': (18, 'function'),
+ 'glGetProgramResourceLocation': (18, 'function'),
+ 'glGetProgramResourceLocationIndex': (18, 'function'),
+ 'glGetProgramResourceName': (18, 'function'),
+ 'glGetProgramResourceiv': (18, 'function'),
+ 'glGetProgramStageiv': (15, 'function'),
+ 'glGetProgramiv': (9, 'function'),
+ 'glGetQueryBufferObjecti64v': (20, 'function'),
+ 'glGetQueryBufferObjectiv': (20, 'function'),
+ 'glGetQueryBufferObjectui64v': (20, 'function'),
+ 'glGetQueryBufferObjectuiv': (20, 'function'),
+ 'glGetQueryIndexediv': (15, 'function'),
+ 'glGetQueryObjecti64v': (14, 'function'),
+ 'glGetQueryObjectiv': (8, 'function'),
+ 'glGetQueryObjectui64v': (14, 'function'),
+ 'glGetQueryObjectuiv': (8, 'function'),
+ 'glGetQueryiv': (8, 'function'),
+ 'glGetRenderbufferParameteriv': (11, 'function'),
+ 'glGetSamplerParameterIiv': (14, 'function'),
+ 'glGetSamplerParameterIuiv': (14, 'function'),
+ 'glGetSamplerParameterfv': (14, 'function'),
+ 'glGetSamplerParameteriv': (14, 'function'),
+ 'glGetSeparableFilter': (5, 'function'),
+ 'glGetShaderInfoLog': (9, 'function'),
+ 'glGetShaderPrecisionFormat': (16, 'function'),
+ 'glGetShaderSource': (9, 'function'),
+ 'glGetShaderiv': (9, 'function'),
+ 'glGetString': (4, 'function'),
+ 'glGetStringi': (11, 'function'),
+ 'glGetSubroutineIndex': (15, 'function'),
+ 'glGetSubroutineUniformLocation': (15, 'function'),
+ 'glGetSynciv': (13, 'function'),
+ 'glGetTexEnvfv': (0, 'function'),
+ 'glGetTexEnviv': (0, 'function'),
+ 'glGetTexGendv': (0, 'function'),
+ 'glGetTexGenfv': (0, 'function'),
+ 'glGetTexGeniv': (0, 'function'),
+ 'glGetTexImage': (2, 'function'),
+ 'glGetTexImageb': (2, 'function'),
+ 'glGetTexImaged': (2, 'function'),
+ 'glGetTexImagef': (2, 'function'),
+ 'glGetTexImagei': (2, 'function'),
+ 'glGetTexImages': (2, 'function'),
+ 'glGetTexImageub': (2, 'function'),
+ 'glGetTexImageui': (2, 'function'),
+ 'glGetTexImageus': (2, 'function'),
+ 'glGetTexLevelParameterfv': (0, 'function'),
+ 'glGetTexLevelParameteriv': (0, 'function'),
+ 'glGetTexParameterIiv': (11, 'function'),
+ 'glGetTexParameterIuiv': (11, 'function'),
+ 'glGetTexParameterfv': (0, 'function'),
+ 'glGetTexParameteriv': (0, 'function'),
+ 'glGetTextureImage': (20, 'function'),
+ 'glGetTextureLevelParameterfv': (20, 'function'),
+ 'glGetTextureLevelParameteriv': (20, 'function'),
+ 'glGetTextureParameterIiv': (20, 'function'),
+ 'glGetTextureParameterIuiv': (20, 'function'),
+ 'glGetTextureParameterfv': (20, 'function'),
+ 'glGetTextureParameteriv': (20, 'function'),
+ 'glGetTextureSubImage': (20, 'function'),
+ 'glGetTransformFeedbackVarying': (11, 'function'),
+ 'glGetTransformFeedbacki64_v': (20, 'function'),
+ 'glGetTransformFeedbacki_v': (20, 'function'),
+ 'glGetTransformFeedbackiv': (20, 'function'),
+ 'glGetUniformBlockIndex': (12, 'function'),
+ 'glGetUniformIndices': (12, 'function'),
+ 'glGetUniformLocation': (9, 'function'),
+ 'glGetUniformSubroutineuiv': (15, 'function'),
+ 'glGetUniformdv': (15, 'function'),
+ 'glGetUniformfv': (9, 'function'),
+ 'glGetUniformiv': (9, 'function'),
+ 'glGetUniformuiv': (11, 'function'),
+ 'glGetVertexArrayIndexed64iv': (20, 'function'),
+ 'glGetVertexArrayIndexediv': (20, 'function'),
+ 'glGetVertexArrayiv': (20, 'function'),
+ 'glGetVertexAttribIiv': (11, 'function'),
+ 'glGetVertexAttribIuiv': (11, 'function'),
+ 'glGetVertexAttribLdv': (16, 'function'),
+ 'glGetVertexAttribPointerv': (9, 'function'),
+ 'glGetVertexAttribdv': (9, 'function'),
+ 'glGetVertexAttribfv': (9, 'function'),
+ 'glGetVertexAttribiv': (9, 'function'),
+ 'glGetnColorTable': (20, 'function'),
+ 'glGetnCompressedTexImage': (20, 'function'),
+ 'glGetnConvolutionFilter': (20, 'function'),
+ 'glGetnHistogram': (20, 'function'),
+ 'glGetnMapdv': (20, 'function'),
+ 'glGetnMapfv': (20, 'function'),
+ 'glGetnMapiv': (20, 'function'),
+ 'glGetnMinmax': (20, 'function'),
+ 'glGetnPixelMapfv': (20, 'function'),
+ 'glGetnPixelMapuiv': (20, 'function'),
+ 'glGetnPixelMapusv': (20, 'function'),
+ 'glGetnPolygonStipple': (20, 'function'),
+ 'glGetnSeparableFilter': (20, 'function'),
+ 'glGetnTexImage': (20, 'function'),
+ 'glGetnUniformdv': (20, 'function'),
+ 'glGetnUniformfv': (20, 'function'),
+ 'glGetnUniformiv': (20, 'function'),
+ 'glGetnUniformuiv': (20, 'function'),
+ 'glHint': (0, 'function'),
+ 'glHistogram': (5, 'function'),
+ 'glIndexMask': (0, 'function'),
+ 'glIndexPointer': (1, 'function'),
+ 'glIndexPointerb': (1, 'function'),
+ 'glIndexPointerd': (1, 'function'),
+ 'glIndexPointerf': (1, 'function'),
+ 'glIndexPointeri': (1, 'function'),
+ 'glIndexPointers': (1, 'function'),
+ 'glIndexPointerub': (1, 'function'),
+ 'glIndexd': (0, 'function'),
+ 'glIndexdv': (0, 'function'),
+ 'glIndexf': (0, 'function'),
+ 'glIndexfv': (0, 'function'),
+ 'glIndexi': (0, 'function'),
+ 'glIndexiv': (0, 'function'),
+ 'glIndexs': (0, 'function'),
+ 'glIndexsv': (0, 'function'),
+ 'glIndexub': (0, 'function'),
+ 'glIndexubv': (0, 'function'),
+ 'glInitArraysOfArraysARB': (18, 'function'),
+ 'glInitBaseInstanceARB': (17, 'function'),
+ 'glInitClearBufferObjectARB': (18, 'function'),
+ 'glInitCompressedTexturePixelStorageARB': (17, 'function'),
+ 'glInitComputeShaderARB': (18, 'function'),
+ 'glInitConservativeDepthARB': (17, 'function'),
+ 'glInitCopyImageARB': (18, 'function'),
+ 'glInitDebugKHR': (18, 'function'),
+ 'glInitEs2CompatibilityARB': (16, 'function'),
+ 'glInitEs3CompatibilityARB': (18, 'function'),
+ 'glInitExplicitUniformLocationARB': (18, 'function'),
+ 'glInitFragmentLayerViewportARB': (18, 'function'),
+ 'glInitFramebufferNoAttachmentsARB': (18, 'function'),
+ 'glInitGetProgramBinaryARB': (16, 'function'),
+ 'glInitGl10VERSION': (0, 'function'),
+ 'glInitGl11VERSION': (0, 'function'),
+ 'glInitGl12VERSION': (5, 'function'),
+ 'glInitGl13VERSION': (6, 'function'),
+ 'glInitGl14VERSION': (7, 'function'),
+ 'glInitGl15VERSION': (8, 'function'),
+ 'glInitGl20VERSION': (9, 'function'),
+ 'glInitGl21VERSION': (10, 'function'),
+ 'glInitGl30VERSION': (11, 'function'),
+ 'glInitGl31VERSION': (12, 'function'),
+ 'glInitGl32VERSION': (13, 'function'),
+ 'glInitGl33VERSION': (14, 'function'),
+ 'glInitGl40VERSION': (15, 'function'),
+ 'glInitGl41VERSION': (16, 'function'),
+ 'glInitGl42VERSION': (17, 'function'),
+ 'glInitGl43VERSION': (18, 'function'),
+ 'glInitGl44VERSION': (19, 'function'),
+ 'glInitGl45VERSION': (20, 'function'),
+ 'glInitGl46VERSION': (21, 'function'),
+ 'glInitImagingARB': (5, 'function'),
+ 'glInitInternalformatQuery2ARB': (18, 'function'),
+ 'glInitInternalformatQueryARB': (17, 'function'),
+ 'glInitInvalidateSubdataARB': (18, 'function'),
+ 'glInitMapBufferAlignmentARB': (17, 'function'),
+ 'glInitMultiDrawIndirectARB': (18, 'function'),
+ 'glInitNames': (0, 'function'),
+ 'glInitProgramInterfaceQueryARB': (18, 'function'),
+ 'glInitRobustBufferAccessBehaviorARB': (18, 'function'),
+ 'glInitSeparateShaderObjectsARB': (16, 'function'),
+ 'glInitShaderAtomicCountersARB': (17, 'function'),
+ 'glInitShaderImageLoadStoreARB': (17, 'function'),
+ 'glInitShaderImageSizeARB': (18, 'function'),
+ 'glInitShaderPrecisionARB': (16, 'function'),
+ 'glInitShaderStorageBufferObjectARB': (18, 'function'),
+ 'glInitShadingLanguage420PackARB': (17, 'function'),
+ 'glInitShadingLanguagePackingARB': (17, 'function'),
+ 'glInitStencilTexturingARB': (18, 'function'),
+ 'glInitTextureBufferRangeARB': (18, 'function'),
+ 'glInitTextureQueryLevelsARB': (18, 'function'),
+ 'glInitTextureStorageARB': (17, 'function'),
+ 'glInitTextureStorageMultisampleARB': (18, 'function'),
+ 'glInitTextureViewARB': (18, 'function'),
+ 'glInitTransformFeedbackInstancedARB': (17, 'function'),
+ 'glInitVertexAttrib64BitARB': (16, 'function'),
+ 'glInitVertexAttribBindingARB': (18, 'function'),
+ 'glInitViewportArrayARB': (16, 'function'),
+ 'glInterleavedArrays': (1, 'function'),
+ 'glInvalidateBufferData': (18, 'function'),
+ 'glInvalidateBufferSubData': (18, 'function'),
+ 'glInvalidateFramebuffer': (18, 'function'),
+ 'glInvalidateNamedFramebufferData': (20, 'function'),
+ 'glInvalidateNamedFramebufferSubData': (20, 'function'),
+ 'glInvalidateSubFramebuffer': (18, 'function'),
+ 'glInvalidateTexImage': (18, 'function'),
+ 'glInvalidateTexSubImage': (18, 'function'),
+ 'glIsBuffer': (8, 'function'),
+ 'glIsEnabled': (0, 'function'),
+ 'glIsEnabledi': (11, 'function'),
+ 'glIsFramebuffer': (11, 'function'),
+ 'glIsList': (0, 'function'),
+ 'glIsProgram': (9, 'function'),
+ 'glIsProgramPipeline': (16, 'function'),
+ 'glIsQuery': (8, 'function'),
+ 'glIsRenderbuffer': (11, 'function'),
+ 'glIsSampler': (14, 'function'),
+ 'glIsShader': (9, 'function'),
+ 'glIsSync': (13, 'function'),
+ 'glIsTexture': (0, 'function'),
+ 'glIsTransformFeedback': (15, 'function'),
+ 'glIsVertexArray': (11, 'function'),
+ 'glLightModelf': (0, 'function'),
+ 'glLightModelfv': (0, 'function'),
+ 'glLightModeli': (0, 'function'),
+ 'glLightModeliv': (0, 'function'),
+ 'glLightf': (0, 'function'),
+ 'glLightfv': (0, 'function'),
+ 'glLighti': (0, 'function'),
+ 'glLightiv': (0, 'function'),
+ 'glLineStipple': (0, 'function'),
+ 'glLineWidth': (0, 'function'),
+ 'glLinkProgram': (9, 'function'),
+ 'glListBase': (0, 'function'),
+ 'glLoadIdentity': (0, 'function'),
+ 'glLoadMatrixd': (0, 'function'),
+ 'glLoadMatrixf': (0, 'function'),
+ 'glLoadName': (0, 'function'),
+ 'glLoadTransposeMatrixd': (6, 'function'),
+ 'glLoadTransposeMatrixf': (6, 'function'),
+ 'glLogicOp': (0, 'function'),
+ 'glMap1d': (3, 'function'),
+ 'glMap1f': (3, 'function'),
+ 'glMap2d': (3, 'function'),
+ 'glMap2f': (3, 'function'),
+ 'glMapBuffer': (8, 'function'),
+ 'glMapBufferRange': (11, 'function'),
+ 'glMapGrid1d': (0, 'function'),
+ 'glMapGrid1f': (0, 'function'),
+ 'glMapGrid2d': (0, 'function'),
+ 'glMapGrid2f': (0, 'function'),
+ 'glMapNamedBuffer': (20, 'function'),
+ 'glMapNamedBufferRange': (20, 'function'),
+ 'glMaterial': (3, 'function'),
+ 'glMaterialf': (0, 'function'),
+ 'glMaterialfv': (0, 'function'),
+ 'glMateriali': (0, 'function'),
+ 'glMaterialiv': (0, 'function'),
+ 'glMatrixMode': (0, 'function'),
+ 'glMemoryBarrier': (17, 'function'),
+ 'glMemoryBarrierByRegion': (20, 'function'),
+ 'glMinSampleShading': (15, 'function'),
+ 'glMinmax': (5, 'function'),
+ 'glMultMatrixd': (0, 'function'),
+ 'glMultMatrixf': (0, 'function'),
+ 'glMultTransposeMatrixd': (6, 'function'),
+ 'glMultTransposeMatrixf': (6, 'function'),
+ 'glMultiDrawArrays': (7, 'function'),
+ 'glMultiDrawArraysIndirect': (18, 'function'),
+ 'glMultiDrawArraysIndirectCount': (21, 'function'),
+ 'glMultiDrawElements': (7, 'function'),
+ 'glMultiDrawElementsBaseVertex': (13, 'function'),
+ 'glMultiDrawElementsIndirect': (18, 'function'),
+ 'glMultiDrawElementsIndirectCount': (21, 'function'),
+ 'glMultiTexCoord1d': (6, 'function'),
+ 'glMultiTexCoord1dv': (6, 'function'),
+ 'glMultiTexCoord1f': (6, 'function'),
+ 'glMultiTexCoord1fv': (6, 'function'),
+ 'glMultiTexCoord1i': (6, 'function'),
+ 'glMultiTexCoord1iv': (6, 'function'),
+ 'glMultiTexCoord1s': (6, 'function'),
+ 'glMultiTexCoord1sv': (6, 'function'),
+ 'glMultiTexCoord2d': (6, 'function'),
+ 'glMultiTexCoord2dv': (6, 'function'),
+ 'glMultiTexCoord2f': (6, 'function'),
+ 'glMultiTexCoord2fv': (6, 'function'),
+ 'glMultiTexCoord2i': (6, 'function'),
+ 'glMultiTexCoord2iv': (6, 'function'),
+ 'glMultiTexCoord2s': (6, 'function'),
+ 'glMultiTexCoord2sv': (6, 'function'),
+ 'glMultiTexCoord3d': (6, 'function'),
+ 'glMultiTexCoord3dv': (6, 'function'),
+ 'glMultiTexCoord3f': (6, 'function'),
+ 'glMultiTexCoord3fv': (6, 'function'),
+ 'glMultiTexCoord3i': (6, 'function'),
+ 'glMultiTexCoord3iv': (6, 'function'),
+ 'glMultiTexCoord3s': (6, 'function'),
+ 'glMultiTexCoord3sv': (6, 'function'),
+ 'glMultiTexCoord4d': (6, 'function'),
+ 'glMultiTexCoord4dv': (6, 'function'),
+ 'glMultiTexCoord4f': (6, 'function'),
+ 'glMultiTexCoord4fv': (6, 'function'),
+ 'glMultiTexCoord4i': (6, 'function'),
+ 'glMultiTexCoord4iv': (6, 'function'),
+ 'glMultiTexCoord4s': (6, 'function'),
+ 'glMultiTexCoord4sv': (6, 'function'),
+ 'glMultiTexCoordP1ui': (14, 'function'),
+ 'glMultiTexCoordP1uiv': (14, 'function'),
+ 'glMultiTexCoordP2ui': (14, 'function'),
+ 'glMultiTexCoordP2uiv': (14, 'function'),
+ 'glMultiTexCoordP3ui': (14, 'function'),
+ 'glMultiTexCoordP3uiv': (14, 'function'),
+ 'glMultiTexCoordP4ui': (14, 'function'),
+ 'glMultiTexCoordP4uiv': (14, 'function'),
+ 'glNamedBufferData': (20, 'function'),
+ 'glNamedBufferStorage': (20, 'function'),
+ 'glNamedBufferSubData': (20, 'function'),
+ 'glNamedFramebufferDrawBuffer': (20, 'function'),
+ 'glNamedFramebufferDrawBuffers': (20, 'function'),
+ 'glNamedFramebufferParameteri': (20, 'function'),
+ 'glNamedFramebufferReadBuffer': (20, 'function'),
+ 'glNamedFramebufferRenderbuffer': (20, 'function'),
+ 'glNamedFramebufferTexture': (20, 'function'),
+ 'glNamedFramebufferTextureLayer': (20, 'function'),
+ 'glNamedRenderbufferStorage': (20, 'function'),
+ 'glNamedRenderbufferStorageMultisample': (20, 'function'),
+ 'glNewList': (0, 'function'),
+ 'glNormal3b': (0, 'function'),
+ 'glNormal3bv': (0, 'function'),
+ 'glNormal3d': (0, 'function'),
+ 'glNormal3dv': (0, 'function'),
+ 'glNormal3f': (0, 'function'),
+ 'glNormal3fv': (0, 'function'),
+ 'glNormal3i': (0, 'function'),
+ 'glNormal3iv': (0, 'function'),
+ 'glNormal3s': (0, 'function'),
+ 'glNormal3sv': (0, 'function'),
+ 'glNormalP3ui': (14, 'function'),
+ 'glNormalP3uiv': (14, 'function'),
+ 'glNormalPointer': (1, 'function'),
+ 'glNormalPointerb': (1, 'function'),
+ 'glNormalPointerd': (1, 'function'),
+ 'glNormalPointerf': (1, 'function'),
+ 'glNormalPointeri': (1, 'function'),
+ 'glNormalPointers': (1, 'function'),
+ 'glObjectLabel': (18, 'function'),
+ 'glObjectLabelKHR': (18, 'function'),
+ 'glObjectPtrLabel': (18, 'function'),
+ 'glObjectPtrLabelKHR': (18, 'function'),
+ 'glOrtho': (0, 'function'),
+ 'glPassThrough': (0, 'function'),
+ 'glPatchParameterfv': (15, 'function'),
+ 'glPatchParameteri': (15, 'function'),
+ 'glPauseTransformFeedback': (15, 'function'),
+ 'glPixelMapfv': (0, 'function'),
+ 'glPixelMapuiv': (0, 'function'),
+ 'glPixelMapusv': (0, 'function'),
+ 'glPixelStoref': (0, 'function'),
+ 'glPixelStorei': (0, 'function'),
+ 'glPixelTransferf': (0, 'function'),
+ 'glPixelTransferi': (0, 'function'),
+ 'glPixelZoom': (0, 'function'),
+ 'glPointParameterf': (7, 'function'),
+ 'glPointParameterfv': (7, 'function'),
+ 'glPointParameteri': (7, 'function'),
+ 'glPointParameteriv': (7, 'function'),
+ 'glPointSize': (0, 'function'),
+ 'glPolygonMode': (0, 'function'),
+ 'glPolygonOffset': (0, 'function'),
+ 'glPolygonOffsetClamp': (21, 'function'),
+ 'glPolygonStipple': (0, 'function'),
+ 'glPopAttrib': (0, 'function'),
+ 'glPopClientAttrib': (0, 'function'),
+ 'glPopDebugGroup': (18, 'function'),
+ 'glPopDebugGroupKHR': (18, 'function'),
+ 'glPopMatrix': (0, 'function'),
+ 'glPopName': (0, 'function'),
+ 'glPrimitiveRestartIndex': (12, 'function'),
+ 'glPrioritizeTextures': (0, 'function'),
+ 'glProgramBinary': (16, 'function'),
+ 'glProgramParameteri': (16, 'function'),
+ 'glProgramUniform1d': (16, 'function'),
+ 'glProgramUniform1dv': (16, 'function'),
+ 'glProgramUniform1f': (16, 'function'),
+ 'glProgramUniform1fv': (16, 'function'),
+ 'glProgramUniform1i': (16, 'function'),
+ 'glProgramUniform1iv': (16, 'function'),
+ 'glProgramUniform1ui': (16, 'function'),
+ 'glProgramUniform1uiv': (16, 'function'),
+ 'glProgramUniform2d': (16, 'function'),
+ 'glProgramUniform2dv': (16, 'function'),
+ 'glProgramUniform2f': (16, 'function'),
+ 'glProgramUniform2fv': (16, 'function'),
+ 'glProgramUniform2i': (16, 'function'),
+ 'glProgramUniform2iv': (16, 'function'),
+ 'glProgramUniform2ui': (16, 'function'),
+ 'glProgramUniform2uiv': (16, 'function'),
+ 'glProgramUniform3d': (16, 'function'),
+ 'glProgramUniform3dv': (16, 'function'),
+ 'glProgramUniform3f': (16, 'function'),
+ 'glProgramUniform3fv': (16, 'function'),
+ 'glProgramUniform3i': (16, 'function'),
+ 'glProgramUniform3iv': (16, 'function'),
+ 'glProgramUniform3ui': (16, 'function'),
+ 'glProgramUniform3uiv': (16, 'function'),
+ 'glProgramUniform4d': (16, 'function'),
+ 'glProgramUniform4dv': (16, 'function'),
+ 'glProgramUniform4f': (16, 'function'),
+ 'glProgramUniform4fv': (16, 'function'),
+ 'glProgramUniform4i': (16, 'function'),
+ 'glProgramUniform4iv': (16, 'function'),
+ 'glProgramUniform4ui': (16, 'function'),
+ 'glProgramUniform4uiv': (16, 'function'),
+ 'glProgramUniformMatrix2dv': (16, 'function'),
+ 'glProgramUniformMatrix2fv': (16, 'function'),
+ 'glProgramUniformMatrix2x3dv': (16, 'function'),
+ 'glProgramUniformMatrix2x3fv': (16, 'function'),
+ 'glProgramUniformMatrix2x4dv': (16, 'function'),
+ 'glProgramUniformMatrix2x4fv': (16, 'function'),
+ 'glProgramUniformMatrix3dv': (16, 'function'),
+ 'glProgramUniformMatrix3fv': (16, 'function'),
+ 'glProgramUniformMatrix3x2dv': (16, 'function'),
+ 'glProgramUniformMatrix3x2fv': (16, 'function'),
+ 'glProgramUniformMatrix3x4dv': (16, 'function'),
+ 'glProgramUniformMatrix3x4fv': (16, 'function'),
+ 'glProgramUniformMatrix4dv': (16, 'function'),
+ 'glProgramUniformMatrix4fv': (16, 'function'),
+ 'glProgramUniformMatrix4x2dv': (16, 'function'),
+ 'glProgramUniformMatrix4x2fv': (16, 'function'),
+ 'glProgramUniformMatrix4x3dv': (16, 'function'),
+ 'glProgramUniformMatrix4x3fv': (16, 'function'),
+ 'glProvokingVertex': (13, 'function'),
+ 'glPushAttrib': (0, 'function'),
+ 'glPushClientAttrib': (0, 'function'),
+ 'glPushDebugGroup': (18, 'function'),
+ 'glPushDebugGroupKHR': (18, 'function'),
+ 'glPushMatrix': (0, 'function'),
+ 'glPushName': (0, 'function'),
+ 'glQueryCounter': (14, 'function'),
+ 'glRasterPos': (3, 'function'),
+ 'glRasterPos2d': (0, 'function'),
+ 'glRasterPos2dv': (0, 'function'),
+ 'glRasterPos2f': (0, 'function'),
+ 'glRasterPos2fv': (0, 'function'),
+ 'glRasterPos2i': (0, 'function'),
+ 'glRasterPos2iv': (0, 'function'),
+ 'glRasterPos2s': (0, 'function'),
+ 'glRasterPos2sv': (0, 'function'),
+ 'glRasterPos3d': (0, 'function'),
+ 'glRasterPos3dv': (0, 'function'),
+ 'glRasterPos3f': (0, 'function'),
+ 'glRasterPos3fv': (0, 'function'),
+ 'glRasterPos3i': (0, 'function'),
+ 'glRasterPos3iv': (0, 'function'),
+ 'glRasterPos3s': (0, 'function'),
+ 'glRasterPos3sv': (0, 'function'),
+ 'glRasterPos4d': (0, 'function'),
+ 'glRasterPos4dv': (0, 'function'),
+ 'glRasterPos4f': (0, 'function'),
+ 'glRasterPos4fv': (0, 'function'),
+ 'glRasterPos4i': (0, 'function'),
+ 'glRasterPos4iv': (0, 'function'),
+ 'glRasterPos4s': (0, 'function'),
+ 'glRasterPos4sv': (0, 'function'),
+ 'glReadBuffer': (0, 'function'),
+ 'glReadPixels': (2, 'function'),
+ 'glReadPixelsb': (2, 'function'),
+ 'glReadPixelsd': (2, 'function'),
+ 'glReadPixelsf': (2, 'function'),
+ 'glReadPixelsi': (2, 'function'),
+ 'glReadPixelss': (2, 'function'),
+ 'glReadPixelsub': (2, 'function'),
+ 'glReadPixelsui': (2, 'function'),
+ 'glReadPixelsus': (2, 'function'),
+ 'glReadnPixels': (20, 'function'),
+ 'glRectd': (0, 'function'),
+ 'glRectdv': (0, 'function'),
+ 'glRectf': (0, 'function'),
+ 'glRectfv': (0, 'function'),
+ 'glRecti': (0, 'function'),
+ 'glRectiv': (0, 'function'),
+ 'glRects': (0, 'function'),
+ 'glRectsv': (0, 'function'),
+ 'glReleaseShaderCompiler': (16, 'function'),
+ 'glRenderMode': (1, 'function'),
+ 'glRenderbufferStorage': (11, 'function'),
+ 'glRenderbufferStorageMultisample': (11, 'function'),
+ 'glResetHistogram': (5, 'function'),
+ 'glResetMinmax': (5, 'function'),
+ 'glResumeTransformFeedback': (15, 'function'),
+ 'glRotated': (0, 'function'),
+ 'glRotatef': (0, 'function'),
+ 'glSampleCoverage': (6, 'function'),
+ 'glSampleMaski': (13, 'function'),
+ 'glSamplerParameterIiv': (14, 'function'),
+ 'glSamplerParameterIuiv': (14, 'function'),
+ 'glSamplerParameterf': (14, 'function'),
+ 'glSamplerParameterfv': (14, 'function'),
+ 'glSamplerParameteri': (14, 'function'),
+ 'glSamplerParameteriv': (14, 'function'),
+ 'glScaled': (0, 'function'),
+ 'glScalef': (0, 'function'),
+ 'glScissor': (0, 'function'),
+ 'glScissorArrayv': (16, 'function'),
+ 'glScissorIndexed': (16, 'function'),
+ 'glScissorIndexedv': (16, 'function'),
+ 'glSecondaryColor3b': (7, 'function'),
+ 'glSecondaryColor3bv': (7, 'function'),
+ 'glSecondaryColor3d': (7, 'function'),
+ 'glSecondaryColor3dv': (7, 'function'),
+ 'glSecondaryColor3f': (7, 'function'),
+ 'glSecondaryColor3fv': (7, 'function'),
+ 'glSecondaryColor3i': (7, 'function'),
+ 'glSecondaryColor3iv': (7, 'function'),
+ 'glSecondaryColor3s': (7, 'function'),
+ 'glSecondaryColor3sv': (7, 'function'),
+ 'glSecondaryColor3ub': (7, 'function'),
+ 'glSecondaryColor3ubv': (7, 'function'),
+ 'glSecondaryColor3ui': (7, 'function'),
+ 'glSecondaryColor3uiv': (7, 'function'),
+ 'glSecondaryColor3us': (7, 'function'),
+ 'glSecondaryColor3usv': (7, 'function'),
+ 'glSecondaryColorP3ui': (14, 'function'),
+ 'glSecondaryColorP3uiv': (14, 'function'),
+ 'glSecondaryColorPointer': (7, 'function'),
+ 'glSelectBuffer': (1, 'function'),
+ 'glSeparableFilter2D': (5, 'function'),
+ 'glShadeModel': (0, 'function'),
+ 'glShaderBinary': (16, 'function'),
+ 'glShaderSource': (9, 'function'),
+ 'glShaderStorageBlockBinding': (18, 'function'),
+ 'glSpecializeShader': (21, 'function'),
+ 'glStencilFunc': (0, 'function'),
+ 'glStencilFuncSeparate': (9, 'function'),
+ 'glStencilMask': (0, 'function'),
+ 'glStencilMaskSeparate': (9, 'function'),
+ 'glStencilOp': (0, 'function'),
+ 'glStencilOpSeparate': (9, 'function'),
+ 'glTexBuffer': (12, 'function'),
+ 'glTexBufferRange': (18, 'function'),
+ 'glTexCoord1d': (0, 'function'),
+ 'glTexCoord1dv': (0, 'function'),
+ 'glTexCoord1f': (0, 'function'),
+ 'glTexCoord1fv': (0, 'function'),
+ 'glTexCoord1i': (0, 'function'),
+ 'glTexCoord1iv': (0, 'function'),
+ 'glTexCoord1s': (0, 'function'),
+ 'glTexCoord1sv': (0, 'function'),
+ 'glTexCoord2d': (0, 'function'),
+ 'glTexCoord2dv': (0, 'function'),
+ 'glTexCoord2f': (0, 'function'),
+ 'glTexCoord2fv': (0, 'function'),
+ 'glTexCoord2i': (0, 'function'),
+ 'glTexCoord2iv': (0, 'function'),
+ 'glTexCoord2s': (0, 'function'),
+ 'glTexCoord2sv': (0, 'function'),
+ 'glTexCoord3d': (0, 'function'),
+ 'glTexCoord3dv': (0, 'function'),
+ 'glTexCoord3f': (0, 'function'),
+ 'glTexCoord3fv': (0, 'function'),
+ 'glTexCoord3i': (0, 'function'),
+ 'glTexCoord3iv': (0, 'function'),
+ 'glTexCoord3s': (0, 'function'),
+ 'glTexCoord3sv': (0, 'function'),
+ 'glTexCoord4d': (0, 'function'),
+ 'glTexCoord4dv': (0, 'function'),
+ 'glTexCoord4f': (0, 'function'),
+ 'glTexCoord4fv': (0, 'function'),
+ 'glTexCoord4i': (0, 'function'),
+ 'glTexCoord4iv': (0, 'function'),
+ 'glTexCoord4s': (0, 'function'),
+ 'glTexCoord4sv': (0, 'function'),
+ 'glTexCoordP1ui': (14, 'function'),
+ 'glTexCoordP1uiv': (14, 'function'),
+ 'glTexCoordP2ui': (14, 'function'),
+ 'glTexCoordP2uiv': (14, 'function'),
+ 'glTexCoordP3ui': (14, 'function'),
+ 'glTexCoordP3uiv': (14, 'function'),
+ 'glTexCoordP4ui': (14, 'function'),
+ 'glTexCoordP4uiv': (14, 'function'),
+ 'glTexCoordPointer': (1, 'function'),
+ 'glTexCoordPointerb': (1, 'function'),
+ 'glTexCoordPointerd': (1, 'function'),
+ 'glTexCoordPointerf': (1, 'function'),
+ 'glTexCoordPointeri': (1, 'function'),
+ 'glTexCoordPointers': (1, 'function'),
+ 'glTexEnvf': (0, 'function'),
+ 'glTexEnvfv': (0, 'function'),
+ 'glTexEnvi': (0, 'function'),
+ 'glTexEnviv': (0, 'function'),
+ 'glTexGend': (0, 'function'),
+ 'glTexGendv': (0, 'function'),
+ 'glTexGenf': (0, 'function'),
+ 'glTexGenfv': (0, 'function'),
+ 'glTexGeni': (0, 'function'),
+ 'glTexGeniv': (0, 'function'),
+ 'glTexImage1D': (2, 'function'),
+ 'glTexImage1Db': (2, 'function'),
+ 'glTexImage1Df': (2, 'function'),
+ 'glTexImage1Di': (2, 'function'),
+ 'glTexImage1Ds': (2, 'function'),
+ 'glTexImage1Dub': (2, 'function'),
+ 'glTexImage1Dui': (2, 'function'),
+ 'glTexImage1Dus': (2, 'function'),
+ 'glTexImage2D': (2, 'function'),
+ 'glTexImage2DMultisample': (13, 'function'),
+ 'glTexImage2Db': (2, 'function'),
+ 'glTexImage2Df': (2, 'function'),
+ 'glTexImage2Di': (2, 'function'),
+ 'glTexImage2Ds': (2, 'function'),
+ 'glTexImage2Dub': (2, 'function'),
+ 'glTexImage2Dui': (2, 'function'),
+ 'glTexImage2Dus': (2, 'function'),
+ 'glTexImage3D': (5, 'function'),
+ 'glTexImage3DMultisample': (13, 'function'),
+ 'glTexImage3Db': (5, 'function'),
+ 'glTexImage3Df': (5, 'function'),
+ 'glTexImage3Di': (5, 'function'),
+ 'glTexImage3Ds': (5, 'function'),
+ 'glTexImage3Dub': (5, 'function'),
+ 'glTexImage3Dui': (5, 'function'),
+ 'glTexImage3Dus': (5, 'function'),
+ 'glTexParameter': (3, 'function'),
+ 'glTexParameterIiv': (11, 'function'),
+ 'glTexParameterIuiv': (11, 'function'),
+ 'glTexParameterf': (0, 'function'),
+ 'glTexParameterfv': (0, 'function'),
+ 'glTexParameteri': (0, 'function'),
+ 'glTexParameteriv': (0, 'function'),
+ 'glTexStorage1D': (17, 'function'),
+ 'glTexStorage2D': (17, 'function'),
+ 'glTexStorage2DMultisample': (18, 'function'),
+ 'glTexStorage3D': (17, 'function'),
+ 'glTexStorage3DMultisample': (18, 'function'),
+ 'glTexSubImage1D': (2, 'function'),
+ 'glTexSubImage1Db': (2, 'function'),
+ 'glTexSubImage1Df': (2, 'function'),
+ 'glTexSubImage1Di': (2, 'function'),
+ 'glTexSubImage1Ds': (2, 'function'),
+ 'glTexSubImage1Dub': (2, 'function'),
+ 'glTexSubImage1Dui': (2, 'function'),
+ 'glTexSubImage1Dus': (2, 'function'),
+ 'glTexSubImage2D': (2, 'function'),
+ 'glTexSubImage2Db': (2, 'function'),
+ 'glTexSubImage2Df': (2, 'function'),
+ 'glTexSubImage2Di': (2, 'function'),
+ 'glTexSubImage2Ds': (2, 'function'),
+ 'glTexSubImage2Dub': (2, 'function'),
+ 'glTexSubImage2Dui': (2, 'function'),
+ 'glTexSubImage2Dus': (2, 'function'),
+ 'glTexSubImage3D': (5, 'function'),
+ 'glTexSubImage3Db': (5, 'function'),
+ 'glTexSubImage3Df': (5, 'function'),
+ 'glTexSubImage3Di': (5, 'function'),
+ 'glTexSubImage3Ds': (5, 'function'),
+ 'glTexSubImage3Dub': (5, 'function'),
+ 'glTexSubImage3Dui': (5, 'function'),
+ 'glTexSubImage3Dus': (5, 'function'),
+ 'glTextureBarrier': (20, 'function'),
+ 'glTextureBuffer': (20, 'function'),
+ 'glTextureBufferRange': (20, 'function'),
+ 'glTextureParameterIiv': (20, 'function'),
+ 'glTextureParameterIuiv': (20, 'function'),
+ 'glTextureParameterf': (20, 'function'),
+ 'glTextureParameterfv': (20, 'function'),
+ 'glTextureParameteri': (20, 'function'),
+ 'glTextureParameteriv': (20, 'function'),
+ 'glTextureStorage1D': (20, 'function'),
+ 'glTextureStorage2D': (20, 'function'),
+ 'glTextureStorage2DMultisample': (20, 'function'),
+ 'glTextureStorage3D': (20, 'function'),
+ 'glTextureStorage3DMultisample': (20, 'function'),
+ 'glTextureSubImage1D': (20, 'function'),
+ 'glTextureSubImage2D': (20, 'function'),
+ 'glTextureSubImage3D': (20, 'function'),
+ 'glTextureView': (18, 'function'),
+ 'glTransformFeedbackBufferBase': (20, 'function'),
+ 'glTransformFeedbackBufferRange': (20, 'function'),
+ 'glTransformFeedbackVaryings': (11, 'function'),
+ 'glTranslated': (0, 'function'),
+ 'glTranslatef': (0, 'function'),
+ 'glUniform1d': (15, 'function'),
+ 'glUniform1dv': (15, 'function'),
+ 'glUniform1f': (9, 'function'),
+ 'glUniform1fv': (9, 'function'),
+ 'glUniform1i': (9, 'function'),
+ 'glUniform1iv': (9, 'function'),
+ 'glUniform1ui': (11, 'function'),
+ 'glUniform1uiv': (11, 'function'),
+ 'glUniform2d': (15, 'function'),
+ 'glUniform2dv': (15, 'function'),
+ 'glUniform2f': (9, 'function'),
+ 'glUniform2fv': (9, 'function'),
+ 'glUniform2i': (9, 'function'),
+ 'glUniform2iv': (9, 'function'),
+ 'glUniform2ui': (11, 'function'),
+ 'glUniform2uiv': (11, 'function'),
+ 'glUniform3d': (15, 'function'),
+ 'glUniform3dv': (15, 'function'),
+ 'glUniform3f': (9, 'function'),
+ 'glUniform3fv': (9, 'function'),
+ 'glUniform3i': (9, 'function'),
+ 'glUniform3iv': (9, 'function'),
+ 'glUniform3ui': (11, 'function'),
+ 'glUniform3uiv': (11, 'function'),
+ 'glUniform4d': (15, 'function'),
+ 'glUniform4dv': (15, 'function'),
+ 'glUniform4f': (9, 'function'),
+ 'glUniform4fv': (9, 'function'),
+ 'glUniform4i': (9, 'function'),
+ 'glUniform4iv': (9, 'function'),
+ 'glUniform4ui': (11, 'function'),
+ 'glUniform4uiv': (11, 'function'),
+ 'glUniformBlockBinding': (12, 'function'),
+ 'glUniformMatrix2dv': (15, 'function'),
+ 'glUniformMatrix2fv': (9, 'function'),
+ 'glUniformMatrix2x3dv': (15, 'function'),
+ 'glUniformMatrix2x3fv': (10, 'function'),
+ 'glUniformMatrix2x4dv': (15, 'function'),
+ 'glUniformMatrix2x4fv': (10, 'function'),
+ 'glUniformMatrix3dv': (15, 'function'),
+ 'glUniformMatrix3fv': (9, 'function'),
+ 'glUniformMatrix3x2dv': (15, 'function'),
+ 'glUniformMatrix3x2fv': (10, 'function'),
+ 'glUniformMatrix3x4dv': (15, 'function'),
+ 'glUniformMatrix3x4fv': (10, 'function'),
+ 'glUniformMatrix4dv': (15, 'function'),
+ 'glUniformMatrix4fv': (9, 'function'),
+ 'glUniformMatrix4x2dv': (15, 'function'),
+ 'glUniformMatrix4x2fv': (10, 'function'),
+ 'glUniformMatrix4x3dv': (15, 'function'),
+ 'glUniformMatrix4x3fv': (10, 'function'),
+ 'glUniformSubroutinesuiv': (15, 'function'),
+ 'glUnmapBuffer': (8, 'function'),
+ 'glUnmapNamedBuffer': (20, 'function'),
+ 'glUseProgram': (9, 'function'),
+ 'glUseProgramStages': (16, 'function'),
+ 'glValidateProgram': (9, 'function'),
+ 'glValidateProgramPipeline': (16, 'function'),
+ 'glVertex': (3, 'function'),
+ 'glVertex2d': (0, 'function'),
+ 'glVertex2dv': (0, 'function'),
+ 'glVertex2f': (0, 'function'),
+ 'glVertex2fv': (0, 'function'),
+ 'glVertex2i': (0, 'function'),
+ 'glVertex2iv': (0, 'function'),
+ 'glVertex2s': (0, 'function'),
+ 'glVertex2sv': (0, 'function'),
+ 'glVertex3d': (0, 'function'),
+ 'glVertex3dv': (0, 'function'),
+ 'glVertex3f': (0, 'function'),
+ 'glVertex3fv': (0, 'function'),
+ 'glVertex3i': (0, 'function'),
+ 'glVertex3iv': (0, 'function'),
+ 'glVertex3s': (0, 'function'),
+ 'glVertex3sv': (0, 'function'),
+ 'glVertex4d': (0, 'function'),
+ 'glVertex4dv': (0, 'function'),
+ 'glVertex4f': (0, 'function'),
+ 'glVertex4fv': (0, 'function'),
+ 'glVertex4i': (0, 'function'),
+ 'glVertex4iv': (0, 'function'),
+ 'glVertex4s': (0, 'function'),
+ 'glVertex4sv': (0, 'function'),
+ 'glVertexArrayAttribBinding': (20, 'function'),
+ 'glVertexArrayAttribFormat': (20, 'function'),
+ 'glVertexArrayAttribIFormat': (20, 'function'),
+ 'glVertexArrayAttribLFormat': (20, 'function'),
+ 'glVertexArrayBindingDivisor': (20, 'function'),
+ 'glVertexArrayElementBuffer': (20, 'function'),
+ 'glVertexArrayVertexBuffer': (20, 'function'),
+ 'glVertexArrayVertexBuffers': (20, 'function'),
+ 'glVertexAttrib1d': (9, 'function'),
+ 'glVertexAttrib1dv': (9, 'function'),
+ 'glVertexAttrib1f': (9, 'function'),
+ 'glVertexAttrib1fv': (9, 'function'),
+ 'glVertexAttrib1s': (9, 'function'),
+ 'glVertexAttrib1sv': (9, 'function'),
+ 'glVertexAttrib2d': (9, 'function'),
+ 'glVertexAttrib2dv': (9, 'function'),
+ 'glVertexAttrib2f': (9, 'function'),
+ 'glVertexAttrib2fv': (9, 'function'),
+ 'glVertexAttrib2s': (9, 'function'),
+ 'glVertexAttrib2sv': (9, 'function'),
+ 'glVertexAttrib3d': (9, 'function'),
+ 'glVertexAttrib3dv': (9, 'function'),
+ 'glVertexAttrib3f': (9, 'function'),
+ 'glVertexAttrib3fv': (9, 'function'),
+ 'glVertexAttrib3s': (9, 'function'),
+ 'glVertexAttrib3sv': (9, 'function'),
+ 'glVertexAttrib4Nbv': (9, 'function'),
+ 'glVertexAttrib4Niv': (9, 'function'),
+ 'glVertexAttrib4Nsv': (9, 'function'),
+ 'glVertexAttrib4Nub': (9, 'function'),
+ 'glVertexAttrib4Nubv': (9, 'function'),
+ 'glVertexAttrib4Nuiv': (9, 'function'),
+ 'glVertexAttrib4Nusv': (9, 'function'),
+ 'glVertexAttrib4bv': (9, 'function'),
+ 'glVertexAttrib4d': (9, 'function'),
+ 'glVertexAttrib4dv': (9, 'function'),
+ 'glVertexAttrib4f': (9, 'function'),
+ 'glVertexAttrib4fv': (9, 'function'),
+ 'glVertexAttrib4iv': (9, 'function'),
+ 'glVertexAttrib4s': (9, 'function'),
+ 'glVertexAttrib4sv': (9, 'function'),
+ 'glVertexAttrib4ubv': (9, 'function'),
+ 'glVertexAttrib4uiv': (9, 'function'),
+ 'glVertexAttrib4usv': (9, 'function'),
+ 'glVertexAttribBinding': (18, 'function'),
+ 'glVertexAttribDivisor': (14, 'function'),
+ 'glVertexAttribFormat': (18, 'function'),
+ 'glVertexAttribI1i': (11, 'function'),
+ 'glVertexAttribI1iv': (11, 'function'),
+ 'glVertexAttribI1ui': (11, 'function'),
+ 'glVertexAttribI1uiv': (11, 'function'),
+ 'glVertexAttribI2i': (11, 'function'),
+ 'glVertexAttribI2iv': (11, 'function'),
+ 'glVertexAttribI2ui': (11, 'function'),
+ 'glVertexAttribI2uiv': (11, 'function'),
+ 'glVertexAttribI3i': (11, 'function'),
+ 'glVertexAttribI3iv': (11, 'function'),
+ 'glVertexAttribI3ui': (11, 'function'),
+ 'glVertexAttribI3uiv': (11, 'function'),
+ 'glVertexAttribI4bv': (11, 'function'),
+ 'glVertexAttribI4i': (11, 'function'),
+ 'glVertexAttribI4iv': (11, 'function'),
+ 'glVertexAttribI4sv': (11, 'function'),
+ 'glVertexAttribI4ubv': (11, 'function'),
+ 'glVertexAttribI4ui': (11, 'function'),
+ 'glVertexAttribI4uiv': (11, 'function'),
+ 'glVertexAttribI4usv': (11, 'function'),
+ 'glVertexAttribIFormat': (18, 'function'),
+ 'glVertexAttribIPointer': (11, 'function'),
+ 'glVertexAttribL1d': (16, 'function'),
+ 'glVertexAttribL1dv': (16, 'function'),
+ 'glVertexAttribL2d': (16, 'function'),
+ 'glVertexAttribL2dv': (16, 'function'),
+ 'glVertexAttribL3d': (16, 'function'),
+ 'glVertexAttribL3dv': (16, 'function'),
+ 'glVertexAttribL4d': (16, 'function'),
+ 'glVertexAttribL4dv': (16, 'function'),
+ 'glVertexAttribLFormat': (18, 'function'),
+ 'glVertexAttribLPointer': (16, 'function'),
+ 'glVertexAttribP1ui': (14, 'function'),
+ 'glVertexAttribP1uiv': (14, 'function'),
+ 'glVertexAttribP2ui': (14, 'function'),
+ 'glVertexAttribP2uiv': (14, 'function'),
+ 'glVertexAttribP3ui': (14, 'function'),
+ 'glVertexAttribP3uiv': (14, 'function'),
+ 'glVertexAttribP4ui': (14, 'function'),
+ 'glVertexAttribP4uiv': (14, 'function'),
+ 'glVertexAttribPointer': (9, 'function'),
+ 'glVertexBindingDivisor': (18, 'function'),
+ 'glVertexP2ui': (14, 'function'),
+ 'glVertexP2uiv': (14, 'function'),
+ 'glVertexP3ui': (14, 'function'),
+ 'glVertexP3uiv': (14, 'function'),
+ 'glVertexP4ui': (14, 'function'),
+ 'glVertexP4uiv': (14, 'function'),
+ 'glVertexPointer': (1, 'function'),
+ 'glVertexPointerb': (1, 'function'),
+ 'glVertexPointerd': (1, 'function'),
+ 'glVertexPointerf': (1, 'function'),
+ 'glVertexPointeri': (1, 'function'),
+ 'glVertexPointers': (1, 'function'),
+ 'glViewport': (0, 'function'),
+ 'glViewportArrayv': (16, 'function'),
+ 'glViewportIndexedf': (16, 'function'),
+ 'glViewportIndexedfv': (16, 'function'),
+ 'glWaitSync': (13, 'function'),
+ 'glWindowPos2d': (7, 'function'),
+ 'glWindowPos2dv': (7, 'function'),
+ 'glWindowPos2f': (7, 'function'),
+ 'glWindowPos2fv': (7, 'function'),
+ 'glWindowPos2i': (7, 'function'),
+ 'glWindowPos2iv': (7, 'function'),
+ 'glWindowPos2s': (7, 'function'),
+ 'glWindowPos2sv': (7, 'function'),
+ 'glWindowPos3d': (7, 'function'),
+ 'glWindowPos3dv': (7, 'function'),
+ 'glWindowPos3f': (7, 'function'),
+ 'glWindowPos3fv': (7, 'function'),
+ 'glWindowPos3i': (7, 'function'),
+ 'glWindowPos3iv': (7, 'function'),
+ 'glWindowPos3s': (7, 'function'),
+ 'glWindowPos3sv': (7, 'function'),
+ 'glget': (6, 'value'),
+ 'images': (6, 'value'),
+ 'imaging': (5, 'value'),
+ 'int32_t': (21, 'value'),
+ 'int64_t': (21, 'value'),
+ 'integer_types': (8, 'value'),
+ 'long': (21, 'value'),
+ 'platform': (21, 'value'),
+ 'pointers': (None, 'submodule'),
+ 'size_t': (21, 'value'),
+ 'sizeof': (21, 'function'),
+ 'unicode': (21, 'value'),
+ 'vboimplementation': (None, 'submodule'),
+ 'void': (21, 'value'),
+ 'wrapper': (21, 'value')}
+# name: name of the symbol bound to the same object
+ALIASES = {'glGetBoolean': 'glGetBooleanv',
+ 'glGetDouble': 'glGetDoublev',
+ 'glGetFloat': 'glGetFloatv',
+ 'glGetInteger': 'glGetIntegerv',
+ 'glGetPolygonStippleub': 'glGetPolygonStipple',
+ 'glLight': 'glLightfv',
+ 'glNormal': 'glNormal3d',
+ 'glRotate': 'glRotated',
+ 'glScale': 'glScaled',
+ 'glTexCoord': 'glTexCoord2d',
+ 'glTranslate': 'glTranslated'}
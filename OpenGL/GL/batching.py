@@ -0,0 +1,484 @@
+"""Batched recording of immediate-mode (glBegin/glEnd) geometry
+
+Immediate-mode code issues one ctypes call per vertex attribute, which
+makes drawing thousands of vertices per frame expensive from Python.
+This module provides drop-in replacements for glBegin, glEnd and the
+common glVertex/glColor/glNormal/glTexCoord entry points which record
+the values between glBegin and glEnd into Python-side buffers and then
+issue a single glDrawArrays over those buffers when glEnd is called.
+
+Usage:
+
+    from OpenGL.GL import *
+    from OpenGL.GL.batching import *  # opt in to batching
+
+    glBegin( GL_LINES )
+    for drop in raindrops:
+        glColor3f( *drop.colour )
+        glVertex3f( *drop.top )
+        glVertex3f( *drop.bottom )
+    glEnd()  # one glDrawArrays here
+
+    ...
+    stats = getRecorder().frame()  # per-frame statistics, resets counters
+
+Semantics:
+
+    The current colour, normal and texture coordinate are carried over
+    into (and out of) a batch just as they would be with real immediate
+    mode, so a vertex recorded before any glColor call in a batch gets
+    the colour which was current at glBegin, and after glEnd the GL's
+    current colour/normal/texcoord are those last specified.  Values set
+    through this module outside of glBegin/glEnd are tracked without a
+    round-trip, if other code changes the current values (e.g. display
+    lists, glMaterial with GL_COLOR_MATERIAL, raw entry points) call
+    getRecorder().invalidate() and the next batch which needs them will
+    query the GL once.
+
+    Each context has its own ImmediateRecorder (see getRecorder), the
+    recorder of the context current at glBegin records the batch.
+
+    The draw is wrapped in glPushClientAttrib/glPopClientAttrib so the
+    caller's vertex-array state (including the GL_ARRAY_BUFFER binding)
+    is preserved.  Only the entry points exported here are recorded, any
+    other GL call made between glBegin and glEnd (glEdgeFlag, glMaterial,
+    glEvalCoord, glArrayElement...) executes immediately, *before* the
+    batch is drawn, so code using those should not use this module.
+
+    Requires a compatibility-profile context (client-side arrays and
+    the fixed-function vertex attributes), the vertex data is passed
+    either as client-side arrays or, with getRecorder().useVBO = True,
+    streamed into a per-context buffer object which is orphaned on each
+    batch.
+"""
+import threading
+import numpy
+from OpenGL import contextdata
+from OpenGL.raw.GL.VERSION import GL_1_1 as _simple
+from OpenGL.raw.GL.VERSION import GL_1_5 as _buffers
+from OpenGL.raw.GL import _types
+
+__all__ = (
+    'getRecorder',
+    'ImmediateRecorder',
+    'BatchStatistics',
+    'glBegin',
+    'glEnd',
+    'glVertex2f', 'glVertex2d', 'glVertex2i',
+    'glVertex3f', 'glVertex3d', 'glVertex3i',
+    'glVertex4f', 'glVertex4d',
+    'glVertex2fv', 'glVertex2dv', 'glVertex3fv', 'glVertex3dv',
+    'glColor3f', 'glColor3d', 'glColor3ub',
+    'glColor4f', 'glColor4d', 'glColor4ub',
+    'glColor3fv', 'glColor4fv',
+    'glNormal3f', 'glNormal3d', 'glNormal3fv',
+    'glTexCoord1f', 'glTexCoord2f', 'glTexCoord2d',
+    'glTexCoord3f', 'glTexCoord4f', 'glTexCoord2fv',
+)
+
+_STREAM_BUFFER = 'OpenGL.GL.batching.stream'
+_RECORDER_KEY = 'OpenGL.GL.batching.recorder'
+_WIDTHS = { 'color': 4, 'normal': 3, 'texcoord': 4 }
+
+
+class BatchStatistics( object ):
+    """Counters for the work done by an ImmediateRecorder
+
+    batches -- number of glBegin/glEnd pairs drawn
+    vertices -- number of vertices recorded
+    bytes -- bytes of vertex data handed to the GL
+    recordedCalls -- attribute calls captured instead of issued to the GL
+    glCalls -- GL entry points actually called to draw the batches
+    queries -- glGet queries needed to recover unknown current state
+    """
+    def __init__( self ):
+        self.reset()
+    def reset( self ):
+        """Zero all counters"""
+        self.batches = 0
+        self.vertices = 0
+        self.bytes = 0
+        self.recordedCalls = 0
+        self.glCalls = 0
+        self.queries = 0
+    def copy( self ):
+        """Return an independent copy of the current counter values"""
+        result = BatchStatistics()
+        result.__dict__.update( self.__dict__ )
+        return result
+    def __repr__( self ):
+        return '%s( batches=%s, vertices=%s, bytes=%s, recordedCalls=%s, glCalls=%s, queries=%s )'%(
+            self.__class__.__name__,
+            self.batches, self.vertices, self.bytes, self.recordedCalls,
+            self.glCalls, self.queries,
+        )
+
+
+class _Staging( object ):
+    """Growable float32 array used to hand recorded values to the GL"""
+    def __init__( self, width ):
+        self.width = width
+        self.array = numpy.zeros( (64, width), dtype='f' )
+    def fill( self, values, count ):
+        """Copy flat values (count*width) into our array, return the view"""
+        if count > len( self.array ):
+            size = len( self.array )
+            while size < count:
+                size *= 2
+            self.array = numpy.zeros( (size, self.width), dtype='f' )
+        view = self.array[:count]
+        view.reshape( -1 )[:] = values
+        return view
+
+
+class _Attribute( object ):
+    """Recording state for a single fixed-function vertex attribute
+
+    current -- tuple of the current value, or None if unknown
+    values -- flat list of recorded values during a batch, or None if
+        the attribute has not been specified in this batch
+    """
+    def __init__( self, name, width, query, array, pointer, restore ):
+        self.name = name
+        self.width = width
+        self.query = query
+        self.array = array
+        self.pointer = pointer
+        self.restore = restore
+        self.current = None
+        self.values = None
+        self.touched = False
+        self.staging = _Staging( width )
+
+
+class ImmediateRecorder( object ):
+    """Records immediate-mode calls and draws them as one glDrawArrays
+
+    useVBO -- if True, upload recorded data into a per-context stream
+        buffer object (orphaned each batch) rather than passing
+        client-side arrays
+    """
+    def __init__( self, useVBO=False ):
+        self.useVBO = useVBO
+        self.stats = BatchStatistics()
+        self.mode = None
+        self.count = 0
+        self.vertices = []
+        self.captured = None
+        self.color = _Attribute(
+            'color', _WIDTHS['color'], _simple.GL_CURRENT_COLOR,
+            _simple.GL_COLOR_ARRAY, self._colorPointer, _simple.glColor4f,
+        )
+        self.normal = _Attribute(
+            'normal', _WIDTHS['normal'], _simple.GL_CURRENT_NORMAL,
+            _simple.GL_NORMAL_ARRAY, self._normalPointer, _simple.glNormal3f,
+        )
+        self.texcoord = _Attribute(
+            'texcoord', _WIDTHS['texcoord'], _simple.GL_CURRENT_TEXTURE_COORDS,
+            _simple.GL_TEXTURE_COORD_ARRAY, self._texCoordPointer, _simple.glTexCoord4f,
+        )
+        self.attributes = (self.color, self.normal, self.texcoord)
+        self.vertexStaging = _Staging( 4 )
+
+    @property
+    def recording( self ):
+        """Whether we are currently between glBegin and glEnd"""
+        return self.mode is not None
+
+    def frame( self ):
+        """Return statistics accumulated since the last frame() and reset them"""
+        result = self.stats.copy()
+        self.stats.reset()
+        return result
+
+    def startCapture( self ):
+        """Capture rather than draw until stopCapture() is called
+
+        While capturing, batches and colour/normal/texcoord changes made
+        outside of batches are appended to a list of operations instead
+        of being sent to the GL:
+
+            ('draw', mode, vertices, { attributeName: array })
+            ('set', attributeName, value )
+
+        where vertices is an (N,4) float32 array and each attribute array
+        is (N,width).  This is used by OpenGL.GL.geometrycache to move
+        geometry into buffer objects.
+        """
+        if self.captured is not None:
+            raise RuntimeError( """Already capturing geometry""" )
+        self.captured = []
+    def stopCapture( self ):
+        """Stop capturing, return the captured operations"""
+        captured, self.captured = self.captured, None
+        return captured or []
+
+    def invalidate( self ):
+        """Forget tracked current colour/normal/texcoord
+
+        Call after code outside this module has changed the GL's current
+        vertex attributes, the values will be queried again if needed.
+        """
+        for attribute in self.attributes:
+            attribute.current = None
+
+    def begin( self, mode ):
+        """Start recording a primitive batch of the given mode"""
+        if self.mode is not None:
+            from OpenGL import error
+            raise error.GLError(
+                err = _simple.GL_INVALID_OPERATION,
+                description = b'glBegin called while already recording a batch',
+                baseOperation = _simple.glBegin,
+            )
+        self.mode = mode
+        self.count = 0
+        del self.vertices[:]
+        for attribute in self.attributes:
+            attribute.values = None
+            attribute.touched = False
+
+    def vertex( self, x, y, z, w ):
+        """Record a vertex with the current attribute values"""
+        self.vertices.extend( (x, y, z, w) )
+        self.count += 1
+        for attribute in self.attributes:
+            if attribute.values is not None:
+                attribute.values.extend( attribute.current )
+        self.stats.recordedCalls += 1
+
+    def set( self, attribute, value ):
+        """Set current value of attribute, recording if in a batch"""
+        if self.mode is None:
+            attribute.current = value
+            if self.captured is not None:
+                self.captured.append( ('set', attribute.name, value) )
+                return True
+            return False
+        if attribute.values is None:
+            if self.count:
+                previous = self._current( attribute )
+                attribute.values = list( previous ) * self.count
+            else:
+                attribute.values = []
+        attribute.current = value
+        attribute.touched = True
+        self.stats.recordedCalls += 1
+        return True
+
+    def _current( self, attribute ):
+        """Retrieve current value of attribute, querying the GL if unknown"""
+        if attribute.current is None:
+            result = numpy.zeros( (4,), dtype='f' )
+            _simple.glGetFloatv( attribute.query, result )
+            self.stats.queries += 1
+            attribute.current = tuple( result[:attribute.width].tolist() )
+        return attribute.current
+
+    def end( self ):
+        """Finish the batch, drawing the recorded vertices"""
+        if self.mode is None:
+            from OpenGL import error
+            raise error.GLError(
+                err = _simple.GL_INVALID_OPERATION,
+                description = b'glEnd called without matching glBegin',
+                baseOperation = _simple.glEnd,
+            )
+        mode, count = self.mode, self.count
+        self.mode = None
+        if self.captured is not None:
+            return self._capture( mode, count )
+        calls = 0
+        if count:
+            active = [a for a in self.attributes if a.values is not None]
+            _simple.glPushClientAttrib( _simple.GL_CLIENT_VERTEX_ARRAY_BIT )
+            try:
+                vertices = self.vertexStaging.fill( self.vertices, count )
+                if self.useVBO:
+                    sources = self._upload( vertices, active, count )
+                else:
+                    _buffers.glBindBuffer( _buffers.GL_ARRAY_BUFFER, 0 )
+                    sources = [vertices] + [
+                        a.staging.fill( a.values, count ) for a in active
+                    ]
+                _simple.glEnableClientState( _simple.GL_VERTEX_ARRAY )
+                _simple.glVertexPointer( 4, _simple.GL_FLOAT, 0, sources[0] )
+                for attribute, source in zip( active, sources[1:] ):
+                    _simple.glEnableClientState( attribute.array )
+                    attribute.pointer( source )
+                _simple.glDrawArrays( mode, 0, count )
+            finally:
+                _simple.glPopClientAttrib()
+            calls += 6 + 2*len( active ) + (3 + len( active ) if self.useVBO else 0)
+            self.stats.bytes += 4*count*(4 + sum( a.width for a in active ))
+        # leave current values as immediate mode would have...
+        for attribute in self.attributes:
+            if attribute.touched:
+                attribute.restore( *attribute.current )
+                calls += 1
+        stats = self.stats
+        stats.batches += 1
+        stats.vertices += count
+        stats.glCalls += calls
+
+    def _capture( self, mode, count ):
+        """Append the just-finished batch to self.captured"""
+        if count:
+            vertices = numpy.array( self.vertices, dtype='f' ).reshape( (count, 4) )
+            arrays = dict([
+                (a.name, numpy.array( a.values, dtype='f' ).reshape( (count, a.width) ))
+                for a in self.attributes if a.values is not None
+            ])
+            self.captured.append( ('draw', mode, vertices, arrays) )
+        for attribute in self.attributes:
+            if attribute.touched:
+                self.captured.append( ('set', attribute.name, attribute.current) )
+        self.stats.batches += 1
+        self.stats.vertices += count
+
+    def _colorPointer( self, source ):
+        _simple.glColorPointer( 4, _simple.GL_FLOAT, 0, source )
+    def _normalPointer( self, source ):
+        _simple.glNormalPointer( _simple.GL_FLOAT, 0, source )
+    def _texCoordPointer( self, source ):
+        _simple.glTexCoordPointer( 4, _simple.GL_FLOAT, 0, source )
+
+    def _upload( self, vertices, active, count ):
+        """Stream recorded data into our per-context buffer, return offsets"""
+        buffer = contextdata.getValue( _STREAM_BUFFER )
+        if buffer is None:
+            buffer = _types.GLuint( 0 )
+            _buffers.glGenBuffers( 1, buffer )
+            buffer = int( buffer.value )
+            contextdata.setValue( _STREAM_BUFFER, buffer )
+        arrays = [vertices] + [a.staging.fill( a.values, count ) for a in active]
+        total = sum( array.nbytes for array in arrays )
+        _buffers.glBindBuffer( _buffers.GL_ARRAY_BUFFER, buffer )
+        _buffers.glBufferData( _buffers.GL_ARRAY_BUFFER, total, None, _buffers.GL_STREAM_DRAW )
+        offsets = []
+        offset = 0
+        for array in arrays:
+            _buffers.glBufferSubData( _buffers.GL_ARRAY_BUFFER, offset, array.nbytes, array )
+            offsets.append( _types.GLvoidp( offset ) )
+            offset += array.nbytes
+        return offsets
+
+
+def getRecorder( context=None ):
+    """Retrieve (creating if necessary) the ImmediateRecorder for the context"""
+    recorder = contextdata.getValue( _RECORDER_KEY, context=context )
+    if recorder is None:
+        recorder = ImmediateRecorder()
+        contextdata.setValue( _RECORDER_KEY, recorder, context=context )
+    return recorder
+
+# the recorder recording a batch on this thread, set from glBegin to
+# glEnd so per-vertex calls do not need to look up the context
+_local = threading.local()
+
+def _tracking( ):
+    """Return this thread's recording recorder or the current context's recorder"""
+    recorder = getattr( _local, 'recorder', None )
+    if recorder is None:
+        recorder = contextdata.getValue( _RECORDER_KEY )
+    return recorder
+
+
+def glBegin( mode ):
+    """Start recording a batch (replaces glBegin, see module docstring)"""
+    recorder = getRecorder()
+    recorder.begin( mode )
+    _local.recorder = recorder
+def glEnd( ):
+    """Draw the recorded batch with a single glDrawArrays"""
+    recorder = getattr( _local, 'recorder', None ) or getRecorder()
+    _local.recorder = None
+    recorder.end()
+
+
+def _vertex( baseFunction, size ):
+    """Produce recording version of a glVertex* entry point"""
+    padding = (0.0, 1.0)[size-2:]
+    def glVertex( *args ):
+        recorder = getattr( _local, 'recorder', None )
+        if recorder is None:
+            return baseFunction( *args )
+        values = args + padding
+        recorder.vertex( *values )
+    glVertex.__name__ = baseFunction.__name__
+    glVertex.__doc__ = baseFunction.__doc__
+    glVertex.baseFunction = baseFunction
+    return glVertex
+
+def _vertexv( baseFunction, size ):
+    """Produce recording version of a glVertex*v entry point"""
+    padding = (0.0, 1.0)[size-2:]
+    def glVertexv( v ):
+        recorder = getattr( _local, 'recorder', None )
+        if recorder is None:
+            return baseFunction( v )
+        recorder.vertex( *(tuple( v[:size] ) + padding) )
+    glVertexv.__name__ = baseFunction.__name__
+    glVertexv.__doc__ = baseFunction.__doc__
+    glVertexv.baseFunction = baseFunction
+    return glVertexv
+
+def _attribute( baseFunction, attribute, padding=(), scale=None, vector=False ):
+    """Produce recording version of a glColor/glNormal/glTexCoord entry point
+
+    baseFunction -- the entry point called outside of glBegin/glEnd
+    attribute -- name of the ImmediateRecorder attribute to record
+    padding -- values appended to the arguments to fill out the attribute
+    scale -- if not None, multiply (integer) arguments by this value
+    vector -- whether the entry point takes a single sequence argument
+    """
+    width = _WIDTHS[ attribute ]
+    def glAttribute( *args ):
+        recorder = _tracking()
+        if recorder is None:
+            return baseFunction( *args )
+        values = tuple( args[0] ) if vector else args
+        if scale is not None:
+            values = tuple( [v*scale for v in values] )
+        values = (values + padding)[:width]
+        if not recorder.set( getattr( recorder, attribute ), values ):
+            return baseFunction( *args )
+    glAttribute.__name__ = baseFunction.__name__
+    glAttribute.__doc__ = baseFunction.__doc__
+    glAttribute.baseFunction = baseFunction
+    return glAttribute
+
+glVertex2f = _vertex( _simple.glVertex2f, 2 )
+glVertex2d = _vertex( _simple.glVertex2d, 2 )
+glVertex2i = _vertex( _simple.glVertex2i, 2 )
+glVertex3f = _vertex( _simple.glVertex3f, 3 )
+glVertex3d = _vertex( _simple.glVertex3d, 3 )
+glVertex3i = _vertex( _simple.glVertex3i, 3 )
+glVertex4f = _vertex( _simple.glVertex4f, 4 )
+glVertex4d = _vertex( _simple.glVertex4d, 4 )
+
+from OpenGL.GL.VERSION import GL_1_0 as _wrapped
+glVertex2fv = _vertexv( _wrapped.glVertex2fv, 2 )
+glVertex2dv = _vertexv( _wrapped.glVertex2dv, 2 )
+glVertex3fv = _vertexv( _wrapped.glVertex3fv, 3 )
+glVertex3dv = _vertexv( _wrapped.glVertex3dv, 3 )
+
+glColor3f = _attribute( _simple.glColor3f, 'color', (1.0,) )
+glColor3d = _attribute( _simple.glColor3d, 'color', (1.0,) )
+glColor3ub = _attribute( _simple.glColor3ub, 'color', (1.0,), scale=1.0/255 )
+glColor4f = _attribute( _simple.glColor4f, 'color' )
+glColor4d = _attribute( _simple.glColor4d, 'color' )
+glColor4ub = _attribute( _simple.glColor4ub, 'color', scale=1.0/255 )
+glColor3fv = _attribute( _wrapped.glColor3fv, 'color', (1.0,), vector=True )
+glColor4fv = _attribute( _wrapped.glColor4fv, 'color', vector=True )
+
+glNormal3f = _attribute( _simple.glNormal3f, 'normal' )
+glNormal3d = _attribute( _simple.glNormal3d, 'normal' )
+glNormal3fv = _attribute( _wrapped.glNormal3fv, 'normal', vector=True )
+
+glTexCoord1f = _attribute( _simple.glTexCoord1f, 'texcoord', (0.0, 0.0, 1.0) )
+glTexCoord2f = _attribute( _simple.glTexCoord2f, 'texcoord', (0.0, 1.0) )
+glTexCoord2d = _attribute( _simple.glTexCoord2d, 'texcoord', (0.0, 1.0) )
+glTexCoord3f = _attribute( _simple.glTexCoord3f, 'texcoord', (1.0,) )
+glTexCoord4f = _attribute( _simple.glTexCoord4f, 'texcoord' )
+glTexCoord2fv = _attribute( _wrapped.glTexCoord2fv, 'texcoord', (0.0, 1.0), vector=True )
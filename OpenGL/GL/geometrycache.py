@@ -0,0 +1,450 @@
+"""Caching of the geometry emitted by pure drawing functions
+
+Drawing functions such as draw_cube( size ) re-issue identical geometry
+every frame.  Decorating them with cachedGeometry runs the function once
+per distinct set of arguments, stores what it drew in GL-side objects and
+replays that on later calls:
+
+    from OpenGL.GL.geometrycache import cachedGeometry
+
+    @cachedGeometry
+    def draw_cube( size ):
+        glBegin( GL_QUADS )
+        ...
+        glEnd()
+
+    @cachedGeometry( strategy=BUFFER )
+    def draw_sphere( radius=1.0, slices=16, stacks=16 ):
+        ...
+
+The decorated function must be "pure": its output must depend only on
+its (hashable) arguments.  Calls with unhashable arguments, and calls
+made while another cached function is being compiled (so that a cached
+draw_box calling a cached draw_cube is captured as a whole), are passed
+straight through to the function without caching.
+
+Strategies:
+
+    DISPLAY_LIST -- compile the function into a display list and replay
+        it with glCallList.  Captures every GL call the function makes
+        (matrix operations, GLUT shapes, state changes...), but is only
+        available on compatibility-profile contexts.  Storage size is
+        estimated from the vertex data which passed through
+        OpenGL.GL.batching, or DISPLAY_LIST_BYTES if the function does
+        not use that module.
+
+    BUFFER -- run the function under OpenGL.GL.batching's capture mode and
+        store the geometry in a single buffer object, with a vertex array
+        object per group of draws, replayed with glDrawArrays.  Only the
+        geometry and colour/normal/texcoord calls made through
+        OpenGL.GL.batching are captured, any other GL call the function
+        makes takes effect once, when the geometry is captured, so the
+        function should make no other GL calls.  Consecutive batches of
+        GL_POINTS, GL_LINES, GL_TRIANGLES or GL_QUADS sharing the same
+        attributes are merged into a single draw.  Pass locations to use
+        generic vertex attributes (e.g. on core profiles) instead of the
+        fixed-function arrays.
+
+        If nothing was captured (e.g. the function uses the plain
+        OpenGL.GL entry points) or, on GL 3.0+, a GL_PRIMITIVES_GENERATED
+        query shows that the function drew primitives without going
+        through OpenGL.GL.batching, the arguments are not cached as a
+        buffer: compatibility contexts compile a display list instead,
+        other contexts call the function directly on each call.
+
+    AUTO -- DISPLAY_LIST on compatibility contexts, otherwise BUFFER
+
+Each context has its own GeometryCache (stored via OpenGL.contextdata),
+holding least-recently-used entries up to a byte budget, see getCache().
+Replaying a BUFFER entry leaves GL_ARRAY_BUFFER and the vertex array
+binding set to 0.
+"""
+import functools, collections
+import numpy
+from OpenGL import GL, contextdata
+from OpenGL.GL import batching
+
+__all__ = (
+    'cachedGeometry',
+    'getCache',
+    'GeometryCache',
+    'AUTO',
+    'DISPLAY_LIST',
+    'BUFFER',
+)
+
+AUTO = 'auto'
+DISPLAY_LIST = 'displaylist'
+BUFFER = 'buffer'
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+DISPLAY_LIST_BYTES = 4096
+_CACHE_KEY = 'OpenGL.GL.geometrycache'
+
+_MERGEABLE = frozenset((
+    GL.GL_POINTS, GL.GL_LINES, GL.GL_TRIANGLES, GL.GL_QUADS,
+))
+
+
+class GeometryCache( object ):
+    """Least-recently-used store of cached geometry for a single context
+
+    budget -- maximum total (estimated) GPU bytes to hold, least-recently
+        used entries are deleted when it is exceeded
+
+    Counters:
+
+        hits -- calls replayed from the cache
+        misses -- calls which had to run the decorated function
+        evictions -- entries deleted to stay within the budget
+        bytes -- current total (estimated) GPU bytes held
+
+    compiling -- stack of decorated functions being compiled into this
+        context, calls nested inside them run uncached
+    """
+    def __init__( self, budget=DEFAULT_BUDGET ):
+        self.budget = budget
+        self.entries = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compiling = []
+        self._compatibility = None
+        self._primitiveQueries = None
+    def __len__( self ):
+        return len( self.entries )
+    @property
+    def compatibility( self ):
+        """Whether the context supports display lists and fixed-function arrays"""
+        if self._compatibility is None:
+            major, minor, es = _version()
+            if es:
+                self._compatibility = False
+            elif (major, minor) < (3, 2):
+                self._compatibility = True
+            else:
+                mask = GL.glGetIntegerv( GL.GL_CONTEXT_PROFILE_MASK )
+                self._compatibility = bool( mask & GL.GL_CONTEXT_COMPATIBILITY_PROFILE_BIT )
+        return self._compatibility
+    @property
+    def primitiveQueries( self ):
+        """Whether the context supports GL_PRIMITIVES_GENERATED queries"""
+        if self._primitiveQueries is None:
+            major, minor, es = _version()
+            self._primitiveQueries = not es and major >= 3
+        return self._primitiveQueries
+    def get( self, key ):
+        """Retrieve the entry for key (marking it most-recently used) or None"""
+        entry = self.entries.get( key )
+        if entry is not None:
+            self.entries.move_to_end( key )
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+    def store( self, key, entry ):
+        """Add entry for key, evicting least-recently-used entries over budget"""
+        previous = self.entries.pop( key, None )
+        if previous is not None:
+            self.bytes -= previous.bytes
+            previous.delete()
+        self.entries[ key ] = entry
+        self.bytes += entry.bytes
+        while self.bytes > self.budget and len( self.entries ) > 1:
+            _, oldest = self.entries.popitem( last=False )
+            self.bytes -= oldest.bytes
+            oldest.delete()
+            self.evictions += 1
+        return entry
+    def clear( self ):
+        """Delete all cached GL objects (requires the context to be current)"""
+        while self.entries:
+            _, entry = self.entries.popitem()
+            entry.delete()
+        self.bytes = 0
+    def stats( self ):
+        """Return a dictionary of the cache counters"""
+        return {
+            'entries': len( self.entries ),
+            'bytes': self.bytes,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+def _version( ):
+    """Return (major, minor, es) for the current context"""
+    version = GL.glGetString( GL.GL_VERSION ) or b'1.0'
+    es = version.startswith( b'OpenGL ES' )
+    if es:
+        version = version.split( b' ' )[2]
+    major, minor = [int(x) for x in version.split(b' ')[0].split(b'.')[:2]]
+    return major, minor, es
+
+def getCache( context=None ):
+    """Retrieve (creating if necessary) the GeometryCache for the context"""
+    cache = contextdata.getValue( _CACHE_KEY, context=context )
+    if cache is None:
+        cache = GeometryCache()
+        contextdata.setValue( _CACHE_KEY, cache, context=context )
+    return cache
+
+
+class _DisplayListEntry( object ):
+    """Geometry stored in a display list"""
+    def __init__( self, displayList, bytes ):
+        self.displayList = displayList
+        self.bytes = bytes
+    def replay( self ):
+        GL.glCallList( self.displayList )
+    def delete( self ):
+        GL.glDeleteLists( self.displayList, 1 )
+
+class _BufferEntry( object ):
+    """Geometry stored in a buffer object with a VAO per draw group
+
+    operations -- sequence of (vao, mode, first, count) draws and
+        (function, value) current-attribute updates
+    """
+    def __init__( self, buffer, vaos, operations, bytes ):
+        self.buffer = buffer
+        self.vaos = vaos
+        self.operations = operations
+        self.bytes = bytes
+    def replay( self ):
+        for operation in self.operations:
+            if len( operation ) == 4:
+                GL.glBindVertexArray( operation[0] )
+                GL.glDrawArrays( operation[1], operation[2], operation[3] )
+            else:
+                operation[0]( *operation[1] )
+        GL.glBindVertexArray( 0 )
+    def delete( self ):
+        if self.vaos:
+            GL.glDeleteVertexArrays( len( self.vaos ), self.vaos )
+        GL.glDeleteBuffers( 1, [self.buffer] )
+
+class _CallEntry( object ):
+    """Function whose geometry could not be captured, called directly"""
+    bytes = 0
+    def __init__( self, function, args, named ):
+        self.function = function
+        self.args = args
+        self.named = named
+    def replay( self ):
+        self.function( *self.args, **self.named )
+    def delete( self ):
+        pass
+
+
+def _compileDisplayList( function, args, named ):
+    """Run function compiled into a new display list, return the entry"""
+    recorder = batching.getRecorder()
+    before = recorder.stats.bytes
+    displayList = GL.glGenLists( 1 )
+    GL.glNewList( displayList, GL.GL_COMPILE )
+    try:
+        function( *args, **named )
+    finally:
+        GL.glEndList()
+    recorded = recorder.stats.bytes - before
+    return _DisplayListEntry( displayList, max( recorded, DISPLAY_LIST_BYTES ))
+
+def _group( captured ):
+    """Merge captured batching operations into draw groups
+
+    returns (groups, operations) where groups are [mode, vertices, arrays]
+    lists and operations are ('draw', groupIndex) or ('set', name, value)
+    """
+    groups = []
+    operations = []
+    for operation in captured:
+        if operation[0] != 'draw':
+            operations.append( operation )
+            continue
+        _, mode, vertices, arrays = operation
+        names = frozenset( arrays )
+        # current-value updates for attributes supplied as arrays do not
+        # affect the draw, so we can merge across them...
+        index = len( operations ) - 1
+        while index >= 0 and operations[index][0] == 'set' and operations[index][1] in names:
+            index -= 1
+        if index >= 0 and operations[index][0] == 'draw' and mode in _MERGEABLE:
+            group = groups[ operations[index][1] ]
+            if group[0] == mode and frozenset( group[2] ) == names:
+                group[1].append( vertices )
+                for name, array in arrays.items():
+                    group[2][name].append( array )
+                continue
+        groups.append( [mode, [vertices], dict([(k,[v]) for k,v in arrays.items()])] )
+        operations.append( ('draw', len( groups ) - 1) )
+    return groups, operations
+
+def _compileBuffer( function, args, named, locations, cache ):
+    """Run function under batching capture, store geometry in a buffer
+
+    returns (entry, executed) where executed is True if the function's
+    output has already been drawn (the capture fell back, see the module
+    docstring) and entry should not be replayed for this call
+    """
+    recorder = batching.getRecorder()
+    query = None
+    if cache.primitiveQueries:
+        query = int( GL.glGenQueries( 1 )[0] )
+        GL.glBeginQuery( GL.GL_PRIMITIVES_GENERATED, query )
+    recorder.startCapture()
+    try:
+        function( *args, **named )
+    finally:
+        captured = recorder.stopCapture()
+        bypassed = 0
+        if query is not None:
+            GL.glEndQuery( GL.GL_PRIMITIVES_GENERATED )
+            bypassed = GL.glGetQueryObjectuiv( query, GL.GL_QUERY_RESULT )
+            GL.glDeleteQueries( 1, [query] )
+    drew = any( operation[0] == 'draw' for operation in captured )
+    if drew and not bypassed:
+        return _bufferEntry( captured, locations ), False
+    # the function's other GL calls have run, draw what it sent through
+    # batching once, then fall back for later calls...
+    if captured:
+        entry = _bufferEntry( captured, locations )
+        entry.replay()
+        entry.delete()
+    if cache.compatibility:
+        return _compileDisplayList( function, args, named ), True
+    return _CallEntry( function, args, named ), True
+
+def _bufferEntry( captured, locations ):
+    """Store captured batching operations in a new _BufferEntry"""
+    groups, operations = _group( captured )
+    chunks = []
+    layouts = []
+    offset = 0
+    for mode, vertices, arrays in groups:
+        vertices = numpy.concatenate( vertices )
+        layout = [ ('vertex', 4, offset) ]
+        chunks.append( vertices.reshape( -1 ))
+        offset += vertices.nbytes
+        for name in sorted( arrays ):
+            array = numpy.concatenate( arrays[name] )
+            layout.append( (name, array.shape[1], offset) )
+            chunks.append( array.reshape( -1 ))
+            offset += array.nbytes
+        layouts.append( (mode, len( vertices ), layout) )
+    data = numpy.concatenate( chunks ) if chunks else numpy.zeros( (0,), 'f' )
+    buffer = int( GL.glGenBuffers( 1 ))
+    vaos = []
+    draws = []
+    first = 0
+    GL.glBindBuffer( GL.GL_ARRAY_BUFFER, buffer )
+    try:
+        if data.nbytes:
+            GL.glBufferData( GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_STATIC_DRAW )
+        for mode, count, layout in layouts:
+            vao = int( GL.glGenVertexArrays( 1 ))
+            GL.glBindVertexArray( vao )
+            for name, width, start in layout:
+                _setupArray( name, width, GL.GLvoidp( start ), locations )
+            GL.glBindVertexArray( 0 )
+            vaos.append( vao )
+            draws.append( (vao, mode, 0, count) )
+    finally:
+        GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+    replay = []
+    pending = collections.OrderedDict()
+    for operation in operations:
+        if operation[0] == 'draw':
+            replay.extend( pending.values() )
+            pending.clear()
+            replay.append( draws[ operation[1] ] )
+        else:
+            # only the last value set between draws matters
+            pending.pop( operation[1], None )
+            pending[ operation[1] ] = (_restoreFunction( operation[1], locations ), operation[2])
+    replay.extend( pending.values() )
+    return _BufferEntry( buffer, vaos, replay, data.nbytes )
+
+_FIXED_ARRAYS = {
+    'vertex': GL.GL_VERTEX_ARRAY,
+    'color': GL.GL_COLOR_ARRAY,
+    'normal': GL.GL_NORMAL_ARRAY,
+    'texcoord': GL.GL_TEXTURE_COORD_ARRAY,
+}
+
+def _setupArray( name, width, offset, locations ):
+    """Enable and point the named attribute at offset in the bound buffer"""
+    if locations is not None:
+        location = locations[ name ]
+        GL.glEnableVertexAttribArray( location )
+        GL.glVertexAttribPointer( location, width, GL.GL_FLOAT, GL.GL_FALSE, 0, offset )
+        return
+    GL.glEnableClientState( _FIXED_ARRAYS[ name ] )
+    if name == 'vertex':
+        GL.glVertexPointer( width, GL.GL_FLOAT, 0, offset )
+    elif name == 'color':
+        GL.glColorPointer( width, GL.GL_FLOAT, 0, offset )
+    elif name == 'normal':
+        GL.glNormalPointer( GL.GL_FLOAT, 0, offset )
+    else:
+        GL.glTexCoordPointer( width, GL.GL_FLOAT, 0, offset )
+
+def _restoreFunction( name, locations ):
+    """Produce function setting the current value of the named attribute"""
+    if locations is not None:
+        location = locations[ name ]
+        def restore( *value ):
+            GL.glVertexAttrib4f( location, *(value + (0.0, 0.0, 1.0))[:4] )
+        return restore
+    attribute = getattr( batching.getRecorder(), name )
+    def restore( *value ):
+        attribute.current = value
+        attribute.restore( *value )
+    return restore
+
+
+def cachedGeometry( function=None, strategy=AUTO, locations=None ):
+    """Decorate a pure drawing function to cache its geometry per arguments
+
+    strategy -- AUTO, DISPLAY_LIST or BUFFER, see module docstring
+    locations -- for BUFFER, optional mapping from 'vertex', 'color',
+        'normal' and 'texcoord' to generic vertex attribute locations,
+        if not provided the fixed-function arrays are used
+
+    Can be used as @cachedGeometry or @cachedGeometry( strategy=... )
+    """
+    if function is None:
+        return functools.partial( cachedGeometry, strategy=strategy, locations=locations )
+    @functools.wraps( function )
+    def cached( *args, **named ):
+        cache = getCache()
+        if cache.compiling:
+            return function( *args, **named )
+        try:
+            key = (function, args, tuple(sorted( named.items() )) if named else ())
+            hash( key )
+        except TypeError:
+            return function( *args, **named )
+        entry = cache.get( key )
+        if entry is None:
+            chosen = strategy
+            if chosen == AUTO:
+                chosen = DISPLAY_LIST if cache.compatibility else BUFFER
+            executed = False
+            cache.compiling.append( function )
+            try:
+                if chosen == DISPLAY_LIST:
+                    entry = _compileDisplayList( function, args, named )
+                else:
+                    entry, executed = _compileBuffer( function, args, named, locations, cache )
+            finally:
+                cache.compiling.pop()
+            cache.store( key, entry )
+            if executed:
+                return
+        entry.replay()
+    cached.uncached = function
+    return cached
@@ -8,16 +8,372 @@ For comparison, here's what a straightforward implementation looks like:
         result = output()
         result = platform.PLATFORM.GL.glGetDoublev( pname, byref(result) )
         return Numeric.array( result )
+
+glGetIntegerValue and glGetFloatValue are scalar versions of glGetIntegerv
+and glGetFloatv (glGetInteger and glGetFloat remain aliases of those), they
+query into a per-thread ctypes buffer sized from the glGet size table and
+return Python values (an int/float for single-value pnames, otherwise a
+tuple, or a tuple of row tuples for matrices), so no output array is
+allocated for each call.
+
+Values of the pnames in IMMUTABLE (implementation limits, the
+implementation strings, extension and format counts, etc.) can not
+change during the life of a context, glGetIntegerValue, glGetFloatValue
+and glGetString return them from a per-context cache stored in
+OpenGL.contextdata (so released by contextdata.cleanupContext), which
+is seeded from the context's extensions.Capabilities snapshot if there
+is one.  glGetIntegerv and glGetFloatv called without an output array
+return a copy of their cached result for those pnames.  Add pnames
+with registerImmutable.
 """
 from OpenGL.GL.VERSION import GL_1_1 as _simple
-import ctypes
+from OpenGL.GL.VERSION import GL_1_0 as _wrapped
+from OpenGL.raw.GL.VERSION import GL_1_0 as _raw
+from OpenGL.raw.GL import _glgets
+from OpenGL.raw.GL._types import GLint, GLfloat
+from OpenGL import platform, contextdata, extensions
+import ctypes, threading, copy
 GLenum = ctypes.c_uint
 GLsize = GLsizei = ctypes.c_int
 
 __all__ = (
     'glGetString',
+    'glGetIntegerv',
+    'glGetFloatv',
+    'glGetIntegerValue',
+    'glGetFloatValue',
 )
 
-glGetString = _simple.glGetString
-glGetString.restype = ctypes.c_char_p
-glGetString.__doc__ = """glGetString( constant ) -> Current string value"""
+# pnames whose values are fixed for the life of a context
+IMMUTABLE = set([
+    0x846E, # GL_ALIASED_LINE_WIDTH_RANGE
+    0x846D, # GL_ALIASED_POINT_SIZE_RANGE
+    0x86A3, # GL_COMPRESSED_TEXTURE_FORMATS
+    0x821E, # GL_CONTEXT_FLAGS
+    0x9126, # GL_CONTEXT_PROFILE_MASK
+    0x1F03, # GL_EXTENSIONS
+    0x825E, # GL_LAYER_PROVOKING_VERTEX
+    0x821B, # GL_MAJOR_VERSION
+    0x8073, # GL_MAX_3D_TEXTURE_SIZE
+    0x88FF, # GL_MAX_ARRAY_TEXTURE_LAYERS
+    0x92DC, # GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS
+    0x92D8, # GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE
+    0x0D35, # GL_MAX_ATTRIB_STACK_DEPTH
+    0x0D3B, # GL_MAX_CLIENT_ATTRIB_STACK_DEPTH
+    0x0D32, # GL_MAX_CLIP_DISTANCES
+    0x8CDF, # GL_MAX_COLOR_ATTACHMENTS
+    0x910E, # GL_MAX_COLOR_TEXTURE_SAMPLES
+    0x92D7, # GL_MAX_COMBINED_ATOMIC_COUNTERS
+    0x92D1, # GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS
+    0x82FA, # GL_MAX_COMBINED_CLIP_AND_CULL_DISTANCES
+    0x8266, # GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS
+    0x8A33, # GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS
+    0x8A32, # GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS
+    0x90CF, # GL_MAX_COMBINED_IMAGE_UNIFORMS
+    0x8F39, # GL_MAX_COMBINED_IMAGE_UNITS_AND_FRAGMENT_OUTPUTS
+    0x90DC, # GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS
+    0x8E1E, # GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS
+    0x8E1F, # GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS
+    0x8B4D, # GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS
+    0x8A2E, # GL_MAX_COMBINED_UNIFORM_BLOCKS
+    0x8A31, # GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS
+    0x8265, # GL_MAX_COMPUTE_ATOMIC_COUNTERS
+    0x8264, # GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS
+    0x91BD, # GL_MAX_COMPUTE_IMAGE_UNIFORMS
+    0x90DB, # GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS
+    0x8262, # GL_MAX_COMPUTE_SHARED_MEMORY_SIZE
+    0x91BC, # GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS
+    0x91BB, # GL_MAX_COMPUTE_UNIFORM_BLOCKS
+    0x8263, # GL_MAX_COMPUTE_UNIFORM_COMPONENTS
+    0x91BE, # GL_MAX_COMPUTE_WORK_GROUP_COUNT
+    0x90EB, # GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS
+    0x91BF, # GL_MAX_COMPUTE_WORK_GROUP_SIZE
+    0x851C, # GL_MAX_CUBE_MAP_TEXTURE_SIZE
+    0x82F9, # GL_MAX_CULL_DISTANCES
+    0x826C, # GL_MAX_DEBUG_GROUP_STACK_DEPTH
+    0x9144, # GL_MAX_DEBUG_LOGGED_MESSAGES
+    0x9143, # GL_MAX_DEBUG_MESSAGE_LENGTH
+    0x910F, # GL_MAX_DEPTH_TEXTURE_SAMPLES
+    0x8824, # GL_MAX_DRAW_BUFFERS
+    0x88FC, # GL_MAX_DUAL_SOURCE_DRAW_BUFFERS
+    0x80E9, # GL_MAX_ELEMENTS_INDICES
+    0x80E8, # GL_MAX_ELEMENTS_VERTICES
+    0x8D6B, # GL_MAX_ELEMENT_INDEX
+    0x0D30, # GL_MAX_EVAL_ORDER
+    0x92D6, # GL_MAX_FRAGMENT_ATOMIC_COUNTERS
+    0x92D0, # GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS
+    0x90CE, # GL_MAX_FRAGMENT_IMAGE_UNIFORMS
+    0x9125, # GL_MAX_FRAGMENT_INPUT_COMPONENTS
+    0x8E5C, # GL_MAX_FRAGMENT_INTERPOLATION_OFFSET
+    0x90DA, # GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS
+    0x8A2D, # GL_MAX_FRAGMENT_UNIFORM_BLOCKS
+    0x8B49, # GL_MAX_FRAGMENT_UNIFORM_COMPONENTS
+    0x8DFD, # GL_MAX_FRAGMENT_UNIFORM_VECTORS
+    0x9316, # GL_MAX_FRAMEBUFFER_HEIGHT
+    0x9317, # GL_MAX_FRAMEBUFFER_LAYERS
+    0x9318, # GL_MAX_FRAMEBUFFER_SAMPLES
+    0x9315, # GL_MAX_FRAMEBUFFER_WIDTH
+    0x92D5, # GL_MAX_GEOMETRY_ATOMIC_COUNTERS
+    0x92CF, # GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS
+    0x90CD, # GL_MAX_GEOMETRY_IMAGE_UNIFORMS
+    0x9123, # GL_MAX_GEOMETRY_INPUT_COMPONENTS
+    0x9124, # GL_MAX_GEOMETRY_OUTPUT_COMPONENTS
+    0x8DE0, # GL_MAX_GEOMETRY_OUTPUT_VERTICES
+    0x8E5A, # GL_MAX_GEOMETRY_SHADER_INVOCATIONS
+    0x90D7, # GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS
+    0x8C29, # GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS
+    0x8DE1, # GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS
+    0x8A2C, # GL_MAX_GEOMETRY_UNIFORM_BLOCKS
+    0x8DDF, # GL_MAX_GEOMETRY_UNIFORM_COMPONENTS
+    0x906D, # GL_MAX_IMAGE_SAMPLES
+    0x8F38, # GL_MAX_IMAGE_UNITS
+    0x9110, # GL_MAX_INTEGER_SAMPLES
+    0x82E8, # GL_MAX_LABEL_LENGTH
+    0x0D31, # GL_MAX_LIGHTS
+    0x0B31, # GL_MAX_LIST_NESTING
+    0x0D36, # GL_MAX_MODELVIEW_STACK_DEPTH
+    0x92F6, # GL_MAX_NAME_LENGTH
+    0x0D37, # GL_MAX_NAME_STACK_DEPTH
+    0x92F7, # GL_MAX_NUM_ACTIVE_VARIABLES
+    0x92F8, # GL_MAX_NUM_COMPATIBLE_SUBROUTINES
+    0x8E7D, # GL_MAX_PATCH_VERTICES
+    0x0D34, # GL_MAX_PIXEL_MAP_TABLE
+    0x8905, # GL_MAX_PROGRAM_TEXEL_OFFSET
+    0x8E5F, # GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET
+    0x0D38, # GL_MAX_PROJECTION_STACK_DEPTH
+    0x84F8, # GL_MAX_RECTANGLE_TEXTURE_SIZE
+    0x84E8, # GL_MAX_RENDERBUFFER_SIZE
+    0x8D57, # GL_MAX_SAMPLES
+    0x8E59, # GL_MAX_SAMPLE_MASK_WORDS
+    0x9111, # GL_MAX_SERVER_WAIT_TIMEOUT
+    0x90DE, # GL_MAX_SHADER_STORAGE_BLOCK_SIZE
+    0x90DD, # GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS
+    0x8DE7, # GL_MAX_SUBROUTINES
+    0x8DE8, # GL_MAX_SUBROUTINE_UNIFORM_LOCATIONS
+    0x92D3, # GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS
+    0x92CD, # GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS
+    0x90CB, # GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS
+    0x886C, # GL_MAX_TESS_CONTROL_INPUT_COMPONENTS
+    0x8E83, # GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS
+    0x90D8, # GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS
+    0x8E81, # GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS
+    0x8E85, # GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS
+    0x8E89, # GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS
+    0x8E7F, # GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS
+    0x92D4, # GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS
+    0x92CE, # GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS
+    0x90CC, # GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS
+    0x886D, # GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS
+    0x8E86, # GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS
+    0x90D9, # GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS
+    0x8E82, # GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS
+    0x8E8A, # GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS
+    0x8E80, # GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS
+    0x8E7E, # GL_MAX_TESS_GEN_LEVEL
+    0x8E84, # GL_MAX_TESS_PATCH_COMPONENTS
+    0x8C2B, # GL_MAX_TEXTURE_BUFFER_SIZE
+    0x8871, # GL_MAX_TEXTURE_COORDS
+    0x8872, # GL_MAX_TEXTURE_IMAGE_UNITS
+    0x84FD, # GL_MAX_TEXTURE_LOD_BIAS
+    0x84FF, # GL_MAX_TEXTURE_MAX_ANISOTROPY
+    0x0D33, # GL_MAX_TEXTURE_SIZE
+    0x0D39, # GL_MAX_TEXTURE_STACK_DEPTH
+    0x84E2, # GL_MAX_TEXTURE_UNITS
+    0x8E70, # GL_MAX_TRANSFORM_FEEDBACK_BUFFERS
+    0x8C8A, # GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS
+    0x8C8B, # GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS
+    0x8C80, # GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS
+    0x8A30, # GL_MAX_UNIFORM_BLOCK_SIZE
+    0x8A2F, # GL_MAX_UNIFORM_BUFFER_BINDINGS
+    0x826E, # GL_MAX_UNIFORM_LOCATIONS
+    0x8B4B, # GL_MAX_VARYING_COMPONENTS
+    0x8DFC, # GL_MAX_VARYING_VECTORS
+    0x92D2, # GL_MAX_VERTEX_ATOMIC_COUNTERS
+    0x92CC, # GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS
+    0x8869, # GL_MAX_VERTEX_ATTRIBS
+    0x82DA, # GL_MAX_VERTEX_ATTRIB_BINDINGS
+    0x82D9, # GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET
+    0x82E5, # GL_MAX_VERTEX_ATTRIB_STRIDE
+    0x90CA, # GL_MAX_VERTEX_IMAGE_UNIFORMS
+    0x9122, # GL_MAX_VERTEX_OUTPUT_COMPONENTS
+    0x90D6, # GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS
+    0x8E71, # GL_MAX_VERTEX_STREAMS
+    0x8B4C, # GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS
+    0x8A2B, # GL_MAX_VERTEX_UNIFORM_BLOCKS
+    0x8B4A, # GL_MAX_VERTEX_UNIFORM_COMPONENTS
+    0x8DFB, # GL_MAX_VERTEX_UNIFORM_VECTORS
+    0x825B, # GL_MAX_VIEWPORTS
+    0x0D3A, # GL_MAX_VIEWPORT_DIMS
+    0x821C, # GL_MINOR_VERSION
+    0x8E5B, # GL_MIN_FRAGMENT_INTERPOLATION_OFFSET
+    0x90BC, # GL_MIN_MAP_BUFFER_ALIGNMENT
+    0x8904, # GL_MIN_PROGRAM_TEXEL_OFFSET
+    0x8E5E, # GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET
+    0x86A2, # GL_NUM_COMPRESSED_TEXTURE_FORMATS
+    0x821D, # GL_NUM_EXTENSIONS
+    0x87FE, # GL_NUM_PROGRAM_BINARY_FORMATS
+    0x8DF9, # GL_NUM_SHADER_BINARY_FORMATS
+    0x82E9, # GL_NUM_SHADING_LANGUAGE_VERSIONS
+    0x9554, # GL_NUM_SPIR_V_EXTENSIONS
+    0x0B13, # GL_POINT_SIZE_GRANULARITY
+    0x0B12, # GL_POINT_SIZE_RANGE
+    0x87FF, # GL_PROGRAM_BINARY_FORMATS
+    0x1F01, # GL_RENDERER
+    0x8DF8, # GL_SHADER_BINARY_FORMATS
+    0x90DF, # GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT
+    0x8B8C, # GL_SHADING_LANGUAGE_VERSION
+    0x0B23, # GL_SMOOTH_LINE_WIDTH_GRANULARITY
+    0x0B22, # GL_SMOOTH_LINE_WIDTH_RANGE
+    0x0D50, # GL_SUBPIXEL_BITS
+    0x919F, # GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT
+    0x8A34, # GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT
+    0x1F00, # GL_VENDOR
+    0x1F02, # GL_VERSION
+    0x825D, # GL_VIEWPORT_BOUNDS_RANGE
+    0x825F, # GL_VIEWPORT_INDEX_PROVOKING_VERTEX
+    0x825C, # GL_VIEWPORT_SUBPIXEL_BITS
+])
+IMMUTABLE_KEY = 'OpenGL.GL.glget.immutable'
+
+def registerImmutable( *pnames ):
+    """Register pnames whose values never change for a given context"""
+    IMMUTABLE.update([ int( pname ) for pname in pnames ])
+
+def _immutableCache( ):
+    """Retrieve the current context's cache of IMMUTABLE values, or None
+
+    Keys are (data type, pname), the cache is seeded with the values
+    already recorded in the context's capability snapshot.
+    """
+    context = platform.PLATFORM.GetCurrentContext()
+    if not context:
+        return None
+    cache = contextdata.storedPointers.get( context, {} ).get( IMMUTABLE_KEY )
+    if cache is None:
+        cache = {}
+        capabilities = contextdata.getValue(
+            extensions.CAPABILITIES_KEY, context=context
+        )
+        if capabilities is not None:
+            for pname, value in zip( _STRINGS, capabilities.signature ):
+                cache[(ctypes.c_char_p, pname)] = value
+            for name, pname, count, desktop, es in extensions.LIMITS:
+                if name in capabilities.limits:
+                    cache[(GLint, pname)] = capabilities.limits[name]
+        contextdata.setValue( IMMUTABLE_KEY, cache, context=context, weak=False )
+    return cache
+
+def _cachedGet( dataType, query, pname, *args ):
+    """Return query( pname, *args ), cached per context if pname is IMMUTABLE"""
+    if pname in IMMUTABLE:
+        cache = _immutableCache()
+        if cache is not None:
+            key = (dataType, pname)
+            try:
+                return cache[key]
+            except KeyError:
+                value = cache[key] = query( pname, *args )
+                return value
+    return query( pname, *args )
+
+_glGetString = _simple.glGetString
+_glGetString.restype = ctypes.c_char_p
+# GL_VENDOR, GL_RENDERER, GL_VERSION, in Capabilities.signature order
+_STRINGS = (0x1F00, 0x1F01, 0x1F02)
+
+def glGetString( name ):
+    """glGetString( constant ) -> Current string value"""
+    return _cachedGet( ctypes.c_char_p, _glGetString, name )
+glGetString.wrappedOperation = _glGetString
+
+# largest fixed size in the glGet size table (4x4 matrices)
+BUFFER_SIZE = 16
+_buffers = threading.local()
+
+def _outputBuffer( dataType, count ):
+    """Retrieve this thread's output buffer of dataType for count values"""
+    if count > BUFFER_SIZE:
+        return (dataType*count)()
+    try:
+        return _buffers.__dict__[dataType]
+    except KeyError:
+        buffer = _buffers.__dict__[dataType] = (dataType*BUFFER_SIZE)()
+        return buffer
+
+# pname: (count, shape) for the fixed sizes in the glGet size table
+_shapes = {}
+
+def _shape( pname ):
+    """Retrieve (count, shape) of the values of pname"""
+    try:
+        return _shapes[pname]
+    except KeyError:
+        pass
+    size = _glgets._glget_size_mapping.get( pname, (1,) )
+    shape = tuple([ int( dimension ) for dimension in size ])
+    count = 1
+    for dimension in shape:
+        count *= dimension
+    if all( isinstance( dimension, int ) for dimension in size ):
+        # not looked up from the context (e.g. counts of format lists)
+        _shapes[pname] = (count, shape)
+    return count, shape
+
+def _scalarGet( function, dataType, pname ):
+    """Query pname with function, cached if pname is IMMUTABLE"""
+    return _cachedGet( dataType, _bufferGet, pname, function, dataType )
+
+def _bufferGet( pname, function, dataType ):
+    """Query pname with function into a thread buffer, return Python values"""
+    count, shape = _shape( pname )
+    buffer = _outputBuffer( dataType, count )
+    function( pname, buffer )
+    if count == 1:
+        return buffer[0]
+    values = buffer[:count]
+    if len( shape ) == 2:
+        rows, columns = shape
+        return tuple([
+            tuple( values[row*columns:(row+1)*columns] ) for row in range( rows )
+        ])
+    return tuple( values )
+
+def glGetIntegerValue( pname ):
+    """glGetIntegerValue( pname ) -> int or tuple of ints
+
+    Scalar version of glGetIntegerv, pnames which are not in the glGet
+    size table are assumed to have a single value.
+    """
+    return _scalarGet( _raw.glGetIntegerv, GLint, pname )
+def glGetFloatValue( pname ):
+    """glGetFloatValue( pname ) -> float or tuple of floats
+
+    Scalar version of glGetFloatv, pnames which are not in the glGet
+    size table are assumed to have a single value.
+    """
+    return _scalarGet( _raw.glGetFloatv, GLfloat, pname )
+
+def _arrayGet( function, pname, data ):
+    """Call wrapped glGet function, returning copies of cached IMMUTABLE results"""
+    if data is None and pname in IMMUTABLE:
+        return copy.copy( _cachedGet( function, function, pname ))
+    return function( pname, data )
+
+_glGetIntegerv = _wrapped.glGetIntegerv
+_glGetFloatv = _wrapped.glGetFloatv
+def glGetIntegerv( pname, data=None ):
+    """glGetIntegerv( pname[, data] ) -> data or new array of the value(s)
+
+    Results for IMMUTABLE pnames are cached per context when data is
+    not passed, each call returns a new copy.
+    """
+    return _arrayGet( _glGetIntegerv, pname, data )
+glGetIntegerv.wrappedOperation = _glGetIntegerv
+def glGetFloatv( pname, data=None ):
+    """glGetFloatv( pname[, data] ) -> data or new array of the value(s)
+
+    Results for IMMUTABLE pnames are cached per context when data is
+    not passed, each call returns a new copy.
+    """
+    return _arrayGet( _glGetFloatv, pname, data )
+glGetFloatv.wrappedOperation = _glGetFloatv
@@ -0,0 +1,179 @@
+"""On-disk cache of linked program binaries for OpenGL.GL.shaders
+
+Usage:
+
+    from OpenGL.GL import shaders
+    shaders.setProgramCache( '~/.cache/myapp/programs' )
+    ...
+    program = shaders.compileProgram(
+        shaders.deferredShader( vertex_source, GL_VERTEX_SHADER ),
+        shaders.deferredShader( fragment_source, GL_FRAGMENT_SHADER ),
+    )
+
+or set PYOPENGL_PROGRAM_CACHE to a directory before importing
+OpenGL.GL.shaders.  deferredShader only creates the shader and sets its
+source, compilation is deferred to compileProgram, which first looks
+for a binary of the program stored by glGetProgramBinary and loads it
+with glProgramBinary, only compiling and linking the sources when no
+(usable) binary is found.  Programs of shaders from compileShader
+(which compiles immediately) are cached as well, skipping the link.
+
+Entries are keyed by a hash of the shader types and sources, the
+program flags, and the GL vendor, renderer, version and shading
+language version strings (the version string normally includes the
+driver build, pass salt to ProgramCache to add anything else which
+should invalidate entries).  Binaries the driver rejects are removed
+and the program is compiled from source.  Files are written atomically
+(write to a temporary file, then rename), and when the directory
+exceeds max_bytes the least-recently used entries are removed.
+"""
+import os, hashlib, struct, tempfile, logging
+log = logging.getLogger( __name__ )
+
+__all__ = ('ProgramCache',)
+
+SUFFIX = '.glbin'
+HEADER = struct.Struct( '<4sI' )
+MAGIC = b'PGLB'
+
+class ProgramCache( object ):
+    """Directory of program binaries with size-bounded LRU eviction
+
+    directory -- directory for the cache files (created on demand)
+    max_bytes -- total size of the entries above which the least
+        recently used are removed
+    salt -- extra string included in every key
+
+    hits, misses, stores, rejected and evictions count operations
+    since creation.
+    """
+    def __init__( self, directory, max_bytes=64*1024*1024, salt='' ):
+        self.directory = os.path.abspath( os.path.expanduser( directory ))
+        self.max_bytes = max_bytes
+        self.salt = salt
+        self.hits = self.misses = self.stores = self.rejected = self.evictions = 0
+    def key( self, sources, signature, flags=() ):
+        """Calculate the key for a program
+
+        sources -- sequence of (shaderType, [source bytes,...]) for the
+            attached shaders, in attachment order
+        signature -- sequence of strings identifying the GL implementation
+        flags -- sequence of program options affecting the binary
+        """
+        digest = hashlib.sha256()
+        for item in list( signature ) + [self.salt] + [repr(flag) for flag in flags]:
+            if not isinstance( item, bytes ):
+                item = str( item ).encode( 'utf-8' )
+            digest.update( struct.pack( '<I', len(item) ) )
+            digest.update( item )
+        for shaderType, source in sources:
+            digest.update( struct.pack( '<II', int(shaderType), len(source) ))
+            for segment in source:
+                digest.update( struct.pack( '<I', len(segment) ))
+                digest.update( segment )
+        return digest.hexdigest()
+    def filename( self, key ):
+        return os.path.join( self.directory, key + SUFFIX )
+    def get( self, key ):
+        """Retrieve (format, binary) stored for key or None"""
+        filename = self.filename( key )
+        try:
+            with open( filename, 'rb' ) as handle:
+                data = handle.read()
+        except (IOError, OSError):
+            self.misses += 1
+            return None
+        if len( data ) < HEADER.size or data[:4] != MAGIC:
+            self.discard( key )
+            self.misses += 1
+            return None
+        magic, format = HEADER.unpack_from( data )
+        try:
+            # mark as recently used
+            os.utime( filename, None )
+        except OSError:
+            pass
+        self.hits += 1
+        return format, data[HEADER.size:]
+    def put( self, key, format, binary ):
+        """Atomically store format and binary for key, then trim the cache"""
+        try:
+            if not os.path.isdir( self.directory ):
+                os.makedirs( self.directory )
+            handle, temporary = tempfile.mkstemp(
+                dir=self.directory, prefix='.', suffix='.tmp',
+            )
+            try:
+                with os.fdopen( handle, 'wb' ) as output:
+                    output.write( HEADER.pack( MAGIC, format ))
+                    output.write( binary )
+                os.replace( temporary, self.filename( key ))
+            except Exception:
+                os.remove( temporary )
+                raise
+        except (IOError, OSError) as err:
+            log.warning( """Unable to store program binary in %s: %s""", self.directory, err )
+            return False
+        self.stores += 1
+        self.trim()
+        return True
+    def discard( self, key, rejected=False ):
+        """Remove the entry for key (e.g. because the driver rejected it)"""
+        if rejected:
+            self.rejected += 1
+        try:
+            os.remove( self.filename( key ))
+        except OSError:
+            pass
+    def entries( self ):
+        """Return [(mtime, size, filename)] for the entries, oldest first"""
+        result = []
+        try:
+            names = os.listdir( self.directory )
+        except OSError:
+            return result
+        for name in names:
+            if not name.endswith( SUFFIX ):
+                continue
+            filename = os.path.join( self.directory, name )
+            try:
+                stat = os.stat( filename )
+            except OSError:
+                continue
+            result.append( (stat.st_mtime, stat.st_size, filename) )
+        result.sort()
+        return result
+    def trim( self ):
+        """Remove least-recently used entries until within max_bytes"""
+        entries = self.entries()
+        total = sum( size for (_, size, _) in entries )
+        for mtime, size, filename in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove( filename )
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        return total
+    def clear( self ):
+        """Remove all entries"""
+        for mtime, size, filename in self.entries():
+            try:
+                os.remove( filename )
+            except OSError:
+                pass
+    def stats( self ):
+        """Return a dictionary of the cache counters and size"""
+        entries = self.entries()
+        return {
+            'entries': len( entries ),
+            'bytes': sum( size for (_, size, _) in entries ),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'rejected': self.rejected,
+            'evictions': self.evictions,
+        }
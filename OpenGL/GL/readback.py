@@ -0,0 +1,305 @@
+"""Asynchronous glReadPixels through rotating pixel-pack buffers
+
+glReadPixels into client memory stalls the caller until the GL has
+finished rendering everything before it and copied the pixels out.
+PixelReader instead reads into one of a ring of GL_PIXEL_PACK_BUFFER
+buffer objects, which returns as soon as the read is queued, places a
+fence after it and hands back a ReadbackFuture.  The pixels are copied
+out of (or viewed in) the buffer once the fence has signalled, normally
+a frame or two later, so continuous capture does not stall the render
+loop:
+
+    from OpenGL.GL.readback import PixelReader
+
+    reader = PixelReader( slots=3 )
+    ...
+    # each frame, after rendering
+    future = reader.read( 0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE )
+    future.add_done_callback( lambda future: encoder.write( future.result() ) )
+    reader.poll() # fetch and dispatch the reads which have completed
+    ...
+    reader.finish() # at the end of the capture, fetch the rest
+    reader.delete()
+
+Pixels come back as numpy arrays shaped as glReadPixels returns them,
+i.e. (width, height[, components]), never as bytes.  Pass out to
+read() to have them copied into an existing (C-contiguous) array
+rather than a new one, or use ReadbackFuture.mapped() to work on a
+read-only view of the mapped buffer without any copy.
+
+When a read needs a slot whose previous read has not been fetched yet,
+that read is fetched first, waiting on its fence if necessary (counted
+in PixelReader.stalls); use more slots if the GL falls that far behind.
+
+All methods must be called with the context in which the reader was
+first used current.  read() leaves GL_PIXEL_PACK_BUFFER bound to 0.
+Without GL 3.2 or ARB_sync there are no fences, futures report done()
+immediately and mapping the buffer synchronises instead.  Without
+GL 2.1 or ARB_pixel_buffer_object read() falls back to a synchronous
+glReadPixels and returns a completed future.
+"""
+import ctypes, collections, contextlib
+import numpy
+from OpenGL import GL, images, extensions, error
+from OpenGL.raw.GL.VERSION import GL_1_1
+
+__all__ = (
+    'PixelReader',
+    'ReadbackFuture',
+)
+
+_LAYOUTS = {}
+
+def _layout( format, type ):
+    """Retrieve (trailing dimensions, dtype) of format/type pixel data"""
+    key = (format, type)
+    layout = _LAYOUTS.get( key )
+    if layout is None:
+        template = images.createTargetArray( format, (0, 0), type )
+        layout = _LAYOUTS[key] = (template.shape[2:], template.dtype)
+    return layout
+
+class ReadbackFuture( object ):
+    """Result of a PixelReader.read which may not have completed yet
+
+    shape, dtype, nbytes -- layout of the pixel data
+    out -- array into which the pixels will be copied or None
+    """
+    def __init__( self, reader, shape, dtype, out=None ):
+        self.reader = reader
+        self.shape = shape
+        self.dtype = dtype
+        self.nbytes = int( numpy.prod( shape )) * dtype.itemsize
+        self.out = out
+        self.slot = None
+        self.fence = None
+        self._array = None
+        self._consumed = False
+        self._callbacks = []
+    def done( self ):
+        """Whether the pixels are available without waiting"""
+        return self.wait( 0 )
+    def wait( self, timeout=None ):
+        """Wait up to timeout seconds (None for no limit) for the read, returns done()"""
+        if self.fence is None:
+            return True
+        if timeout is None:
+            result = GL.GL_TIMEOUT_EXPIRED
+            while result == GL.GL_TIMEOUT_EXPIRED:
+                result = GL.glClientWaitSync(
+                    self.fence, GL.GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000,
+                )
+        else:
+            result = GL.glClientWaitSync(
+                self.fence, GL.GL_SYNC_FLUSH_COMMANDS_BIT, int( timeout * 1e9 ),
+            )
+        if result == GL.GL_WAIT_FAILED:
+            raise error.Error( """Wait on pixel readback fence failed""" )
+        if result == GL.GL_TIMEOUT_EXPIRED:
+            return False
+        GL.glDeleteSync( self.fence )
+        self.fence = None
+        return True
+    def result( self, timeout=None ):
+        """Retrieve the pixels as a numpy array (out, if one was passed to read)
+
+        Waits up to timeout seconds (None for no limit) for the read,
+        raises TimeoutError if it has not completed by then.
+        """
+        if self._array is None:
+            if self._consumed:
+                raise RuntimeError( """Pixels were consumed through mapped() or the reader was deleted""" )
+            if not self.wait( timeout ):
+                raise TimeoutError( """Pixel readback did not complete in %ss"""%( timeout, ))
+            self._fetch()
+        return self._array
+    def add_done_callback( self, callback ):
+        """Call callback( future ) once the pixels have been fetched
+
+        Callbacks run in the thread (and context) fetching the pixels,
+        i.e. from PixelReader.poll(), finish(), read() or result().  If
+        the pixels have already been fetched callback is called now.
+        """
+        if self._array is not None:
+            callback( self )
+        else:
+            self._callbacks.append( callback )
+    @contextlib.contextmanager
+    def mapped( self ):
+        """Context manager providing a read-only view of the mapped buffer
+
+        Waits for the read, no copy is made, the view is only valid
+        inside the with statement, after which the slot is released and
+        result() is no longer available.
+        """
+        if self._array is not None:
+            yield self._array
+            return
+        if self._consumed:
+            raise RuntimeError( """Pixels were consumed through mapped() or the reader was deleted""" )
+        self.wait()
+        pointer = self._map()
+        try:
+            view = numpy.frombuffer(
+                (ctypes.c_ubyte*self.nbytes).from_address( pointer ), 'B',
+            ).view( self.dtype ).reshape( self.shape )
+            view.flags.writeable = False
+            yield view
+        finally:
+            self._consumed = True
+            self._unmap()
+    def _map( self ):
+        GL.glBindBuffer( GL.GL_PIXEL_PACK_BUFFER, self.reader.buffers[self.slot] )
+        pointer = GL.glMapBuffer( GL.GL_PIXEL_PACK_BUFFER, GL.GL_READ_ONLY )
+        if not pointer:
+            GL.glBindBuffer( GL.GL_PIXEL_PACK_BUFFER, 0 )
+            raise error.Error( """Unable to map pixel readback buffer""" )
+        return pointer
+    def _unmap( self ):
+        GL.glUnmapBuffer( GL.GL_PIXEL_PACK_BUFFER )
+        GL.glBindBuffer( GL.GL_PIXEL_PACK_BUFFER, 0 )
+        self.reader._release( self )
+    def _fetch( self ):
+        """Copy the pixels out of the buffer, release the slot, run callbacks"""
+        if not self.done():
+            self.reader.stalls += 1
+            self.wait()
+        array = self.out
+        if array is None:
+            array = numpy.empty( self.shape, self.dtype )
+        pointer = self._map()
+        try:
+            ctypes.memmove( array.ctypes.data, pointer, self.nbytes )
+        finally:
+            self._unmap()
+        self._complete( array )
+    def _complete( self, array ):
+        self._array = array
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback( self )
+
+class PixelReader( object ):
+    """Ring of pixel-pack buffers for asynchronous glReadPixels
+
+    slots -- number of buffers, i.e. of reads which may be in flight
+
+    reads and stalls count the reads made and those which had to wait
+    for an earlier read to complete to reuse its buffer.
+    """
+    def __init__( self, slots=3 ):
+        if slots < 1:
+            raise ValueError( """Need at least one slot""" )
+        self.slots = slots
+        self.buffers = []
+        self.capacities = []
+        self.futures = [None] * slots
+        self.pending = collections.deque()
+        self.slot = 0
+        self.reads = self.stalls = 0
+        self.buffered = self.fenced = None
+    def createBuffers( self ):
+        """Check the context's support and create the buffers"""
+        self.buffered = (
+            extensions.hasGLExtension( 'GL_VERSION_GL_2_1' ) or
+            extensions.hasGLExtension( 'GL_ARB_pixel_buffer_object' )
+        )
+        self.fenced = (
+            extensions.hasGLExtension( 'GL_VERSION_GL_3_2' ) or
+            extensions.hasGLExtension( 'GL_ARB_sync' )
+        )
+        if self.buffered:
+            self.buffers = [ int( GL.glGenBuffers( 1 )) for i in range( self.slots ) ]
+            self.capacities = [0] * self.slots
+        return self.buffers
+    def read( self, x, y, width, height, format=GL.GL_RGBA, type=GL.GL_UNSIGNED_BYTE, out=None ):
+        """Queue a read of the given pixels of the read buffer, return ReadbackFuture
+
+        x,y,width,height,format,type -- as for glReadPixels
+        out -- optional C-contiguous array of the same size (in bytes) as
+            the pixel data, into which the pixels are copied when fetched
+        """
+        x, y, width, height = int( x ), int( y ), int( width ), int( height )
+        components, dtype = _layout( format, type )
+        future = ReadbackFuture( self, (width, height) + components, dtype, out )
+        if out is not None and (
+            not isinstance( out, numpy.ndarray ) or
+            not out.flags.c_contiguous or
+            not out.flags.writeable or
+            out.nbytes != future.nbytes
+        ):
+            raise ValueError(
+                """out must be a writable C-contiguous array of %s bytes"""%( future.nbytes, )
+            )
+        if self.buffered is None:
+            self.createBuffers()
+        images.setupDefaultTransferMode()
+        images.rankPacking( 3 )
+        self.reads += 1
+        if not self.buffered:
+            array = out if out is not None else numpy.empty( future.shape, dtype )
+            GL_1_1.glReadPixels(
+                x, y, width, height, format, type, ctypes.c_void_p( array.ctypes.data ),
+            )
+            future._complete( array )
+            return future
+        slot = self.slot
+        if self.futures[slot] is not None:
+            self.futures[slot]._fetch()
+        GL.glBindBuffer( GL.GL_PIXEL_PACK_BUFFER, self.buffers[slot] )
+        if self.capacities[slot] < future.nbytes:
+            GL.glBufferData( GL.GL_PIXEL_PACK_BUFFER, future.nbytes, None, GL.GL_STREAM_READ )
+            self.capacities[slot] = future.nbytes
+        GL_1_1.glReadPixels( x, y, width, height, format, type, ctypes.c_void_p( 0 ))
+        GL.glBindBuffer( GL.GL_PIXEL_PACK_BUFFER, 0 )
+        if self.fenced:
+            future.fence = GL.glFenceSync( GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0 )
+        future.slot = slot
+        self.futures[slot] = future
+        self.pending.append( future )
+        self.slot = (slot + 1) % self.slots
+        return future
+    def _release( self, future ):
+        """Free the slot used by future"""
+        if future.slot is not None and self.futures[future.slot] is future:
+            self.futures[future.slot] = None
+        future.slot = None
+    def poll( self ):
+        """Fetch the reads which have completed, oldest first, return their futures
+
+        Stops at the first read which is still in flight, so pixels
+        are always delivered in the order they were read.
+        """
+        fetched = []
+        while self.pending:
+            future = self.pending[0]
+            if future.slot is not None:
+                if not future.done():
+                    break
+                future._fetch()
+                fetched.append( future )
+            self.pending.popleft()
+        return fetched
+    def finish( self ):
+        """Fetch all outstanding reads (waiting as necessary), return their futures"""
+        fetched = []
+        while self.pending:
+            future = self.pending.popleft()
+            if future.slot is not None:
+                future._fetch()
+                fetched.append( future )
+        return fetched
+    def delete( self ):
+        """Delete the buffers and fences, outstanding reads are abandoned"""
+        while self.pending:
+            future = self.pending.popleft()
+            if future.fence is not None:
+                GL.glDeleteSync( future.fence )
+                future.fence = None
+            future._consumed = True
+            self._release( future )
+        if self.buffers:
+            GL.glDeleteBuffers( len( self.buffers ), self.buffers )
+        self.buffers = []
+        self.capacities = []
+        self.buffered = self.fenced = None
@@ -7,14 +7,19 @@ shader rendering.
 
 There are also two utility methods compileProgram and compileShader
 which make it easy to create demos which are shader-using.
+
+setProgramCache (or PYOPENGL_PROGRAM_CACHE) enables an on-disk cache of
+linked program binaries used by compileProgram, see
+OpenGL.GL.programcache.
 """
-import logging
+import logging, os
 log = logging.getLogger( __name__ )
 from OpenGL import GL
 from OpenGL.GL.ARB import (
     shader_objects, fragment_shader, vertex_shader, vertex_program,
     geometry_shader4, separate_shader_objects, get_program_binary,
 )
+from OpenGL.GL.KHR import parallel_shader_compile
 from OpenGL.extensions import alternate
 from OpenGL._bytes import bytes,unicode,as_8_bit
 
@@ -27,6 +32,13 @@ __all__ = [
     'glGetShaderiv',
     'compileProgram',
     'compileShader',
+    'deferredShader',
+    'compilePrograms',
+    'asCompleted',
+    'ProgramFuture',
+    'ShaderObject',
+    'setProgramCache',
+    'getProgramCache',
     'GL_VALIDATE_STATUS',
     'GL_LINK_STATUS',
     'ShaderCompilationError', 
@@ -86,9 +98,184 @@ GL_LINK_STATUS = GL.GL_LINK_STATUS
 GL_FALSE = GL.GL_FALSE
 GL_TRUE = GL.GL_TRUE
 
+# uniform type name: (glUniform suffix, array type name, components)
+_UNIFORM_TYPES = {
+    'GL_FLOAT': ('1fv', 'GLfloatArray', 1),
+    'GL_FLOAT_VEC2': ('2fv', 'GLfloatArray', 2),
+    'GL_FLOAT_VEC3': ('3fv', 'GLfloatArray', 3),
+    'GL_FLOAT_VEC4': ('4fv', 'GLfloatArray', 4),
+    'GL_DOUBLE': ('1dv', 'GLdoubleArray', 1),
+    'GL_DOUBLE_VEC2': ('2dv', 'GLdoubleArray', 2),
+    'GL_DOUBLE_VEC3': ('3dv', 'GLdoubleArray', 3),
+    'GL_DOUBLE_VEC4': ('4dv', 'GLdoubleArray', 4),
+    'GL_INT': ('1iv', 'GLintArray', 1),
+    'GL_INT_VEC2': ('2iv', 'GLintArray', 2),
+    'GL_INT_VEC3': ('3iv', 'GLintArray', 3),
+    'GL_INT_VEC4': ('4iv', 'GLintArray', 4),
+    'GL_BOOL': ('1iv', 'GLintArray', 1),
+    'GL_BOOL_VEC2': ('2iv', 'GLintArray', 2),
+    'GL_BOOL_VEC3': ('3iv', 'GLintArray', 3),
+    'GL_BOOL_VEC4': ('4iv', 'GLintArray', 4),
+    'GL_UNSIGNED_INT': ('1uiv', 'GLuintArray', 1),
+    'GL_UNSIGNED_INT_VEC2': ('2uiv', 'GLuintArray', 2),
+    'GL_UNSIGNED_INT_VEC3': ('3uiv', 'GLuintArray', 3),
+    'GL_UNSIGNED_INT_VEC4': ('4uiv', 'GLuintArray', 4),
+    'GL_FLOAT_MAT2': ('Matrix2fv', 'GLfloatArray', 4),
+    'GL_FLOAT_MAT3': ('Matrix3fv', 'GLfloatArray', 9),
+    'GL_FLOAT_MAT4': ('Matrix4fv', 'GLfloatArray', 16),
+    'GL_FLOAT_MAT2x3': ('Matrix2x3fv', 'GLfloatArray', 6),
+    'GL_FLOAT_MAT2x4': ('Matrix2x4fv', 'GLfloatArray', 8),
+    'GL_FLOAT_MAT3x2': ('Matrix3x2fv', 'GLfloatArray', 6),
+    'GL_FLOAT_MAT3x4': ('Matrix3x4fv', 'GLfloatArray', 12),
+    'GL_FLOAT_MAT4x2': ('Matrix4x2fv', 'GLfloatArray', 8),
+    'GL_FLOAT_MAT4x3': ('Matrix4x3fv', 'GLfloatArray', 12),
+    'GL_DOUBLE_MAT2': ('Matrix2dv', 'GLdoubleArray', 4),
+    'GL_DOUBLE_MAT3': ('Matrix3dv', 'GLdoubleArray', 9),
+    'GL_DOUBLE_MAT4': ('Matrix4dv', 'GLdoubleArray', 16),
+    'GL_DOUBLE_MAT2x3': ('Matrix2x3dv', 'GLdoubleArray', 6),
+    'GL_DOUBLE_MAT2x4': ('Matrix2x4dv', 'GLdoubleArray', 8),
+    'GL_DOUBLE_MAT3x2': ('Matrix3x2dv', 'GLdoubleArray', 6),
+    'GL_DOUBLE_MAT3x4': ('Matrix3x4dv', 'GLdoubleArray', 12),
+    'GL_DOUBLE_MAT4x2': ('Matrix4x2dv', 'GLdoubleArray', 8),
+    'GL_DOUBLE_MAT4x3': ('Matrix4x3dv', 'GLdoubleArray', 12),
+}
+_uniformTypes = {}
+def _uniformType( typeConstant ):
+    """Return (suffix, arrayType, components) for a uniform's type
+
+    Samplers and images (and any other opaque type) are set as ints.
+    """
+    if not _uniformTypes:
+        from OpenGL import arrays
+        for name, (suffix, arrayType, components) in _UNIFORM_TYPES.items():
+            constant = getattr( GL, name, None )
+            if constant is not None:
+                _uniformTypes[int(constant)] = (suffix, getattr( arrays, arrayType ), components)
+    try:
+        return _uniformTypes[int(typeConstant)]
+    except KeyError:
+        from OpenGL import arrays
+        return ('1iv', arrays.GLintArray, 1)
+
+def _baseName( name ):
+    """Name of a uniform/attribute without array subscript, as str"""
+    if not isinstance( name, (bytes,unicode) ):
+        # glGetActive* return the name buffer as an array
+        name = bytes( bytearray( name )).split( b'\0', 1 )[0]
+    if not isinstance( name, unicode ):
+        name = name.decode( 'utf-8' )
+    if name.endswith( '[0]' ):
+        name = name[:-3]
+    return name
+
 class ShaderProgram( int ):
-    """Integer sub-class with context-manager operation"""
+    """Integer sub-class with context-manager operation
+
+    After linking, the program's active uniforms, attributes and uniform
+    blocks are available (queried once, on first access) as:
+
+        uniforms -- name: (location, type, size)
+        attributes -- name: (location, type, size)
+        uniform_blocks -- name: (index, binding, data size)
+
+    with array uniforms/attributes available without the "[0]".
+    Uniforms can be set with program['name'] = value, which calls the
+    glProgramUniform* (or, without GL 4.1/ARB_separate_shader_objects,
+    glUniform*, which requires the program to be in use) entry point
+    for the uniform's type and skips the call when the value set for
+    the name is unchanged.  Values set other than through item
+    assignment are not seen, call forget() after doing so.
+    """
     validated = False
+    def __getattr__( self, key ):
+        """Introspect the program on first access to the introspection results"""
+        if key in ('uniforms', 'attributes', 'uniform_blocks'):
+            self.introspect()
+            return self.__dict__[key]
+        raise AttributeError( key )
+    def introspect( self ):
+        """(Re)query the active uniforms, attributes and uniform blocks"""
+        from OpenGL.raw.GL._types import GLint
+        uniforms = {}
+        for index in range( int( glGetProgramiv( self, GL.GL_ACTIVE_UNIFORMS ))):
+            name, size, type = GL.glGetActiveUniform( self, index )
+            name = _baseName( name )
+            location = GL.glGetUniformLocation( self, name )
+            if location >= 0:
+                # uniforms in blocks have no location
+                uniforms[name] = (int(location), int(type), int(size))
+        attributes = {}
+        for index in range( int( glGetProgramiv( self, GL.GL_ACTIVE_ATTRIBUTES ))):
+            name, size, type = GL.glGetActiveAttrib( self, index )
+            name = _baseName( name )
+            attributes[name] = (int(GL.glGetAttribLocation( self, name )), int(type), int(size))
+        blocks = {}
+        if GL.glGetActiveUniformBlockName:
+            import ctypes
+            blockName = GL.glGetActiveUniformBlockName
+            blockName = getattr( blockName, 'wrappedOperation', blockName )
+            count = GLint()
+            glGetProgramiv( self, GL.GL_ACTIVE_UNIFORM_BLOCKS, count )
+            for index in range( count.value ):
+                length = GLint()
+                GL.glGetActiveUniformBlockiv( self, index, GL.GL_UNIFORM_BLOCK_NAME_LENGTH, length )
+                name = ctypes.create_string_buffer( max( length.value, 1 ))
+                blockName( self, index, len( name ), None, name )
+                name = name.value
+                binding, dataSize = GLint(), GLint()
+                GL.glGetActiveUniformBlockiv( self, index, GL.GL_UNIFORM_BLOCK_BINDING, binding )
+                GL.glGetActiveUniformBlockiv( self, index, GL.GL_UNIFORM_BLOCK_DATA_SIZE, dataSize )
+                blocks[_baseName( name )] = (index, binding.value, dataSize.value)
+        self.uniforms = uniforms
+        self.attributes = attributes
+        self.uniform_blocks = blocks
+        self._setters = {}
+        return self
+    def forget( self, *names ):
+        """Forget the values set for the named uniforms (default all)"""
+        setters = self.__dict__.get( '_setters', {} )
+        for name in (names or list( setters )):
+            setters.pop( name, None )
+    def _setter( self, name ):
+        """Produce the setter for the named uniform"""
+        try:
+            location, type, size = self.uniforms[name]
+        except KeyError:
+            raise KeyError( """No active uniform %r in program %s"""%( name, int(self) ))
+        suffix, arrayType, components = _uniformType( type )
+        separate = bool( GL.glProgramUniform1fv )
+        function = getattr( GL, ('glProgramUniform' if separate else 'glUniform') + suffix )
+        function = getattr( function, 'wrappedOperation', function )
+        matrix = suffix.startswith( 'Matrix' )
+        program = int( self )
+        import ctypes
+        last = [None]
+        def setter( value ):
+            array = arrayType.asArray( value )
+            count = arrayType.arraySize( array ) // components
+            data = ctypes.string_at(
+                arrayType.dataPointer( array ), arrayType.arrayByteCount( array ),
+            )
+            if data == last[0]:
+                return
+            if separate and matrix:
+                function( program, location, count, GL_FALSE, array )
+            elif separate:
+                function( program, location, count, array )
+            elif matrix:
+                function( location, count, GL_FALSE, array )
+            else:
+                function( location, count, array )
+            last[0] = data
+        self._setters[name] = setter
+        return setter
+    def __setitem__( self, name, value ):
+        """Set the named uniform to value (skipped if unchanged)"""
+        try:
+            setter = self._setters[name]
+        except (KeyError, AttributeError):
+            setter = self._setter( name )
+        setter( value )
     def __enter__( self ):
         """Start use of the program"""
         glUseProgram( self )
@@ -138,13 +325,18 @@ class ShaderProgram( int ):
         returns (format,binaryData) for the shader program
         """
         from OpenGL.raw.GL._types import GLint,GLenum 
-        from OpenGL.arrays import GLbyteArray
+        from OpenGL.raw.GL.ARB import get_program_binary as raw_program_binary
+        from OpenGL.arrays import GLbyteArray, ArrayDatatype
         size = GLint()
         glGetProgramiv( self, get_program_binary.GL_PROGRAM_BINARY_LENGTH, size )
         result = GLbyteArray.zeros( (size.value,))
         size2 = GLint()
         format = GLenum()
-        get_program_binary.glGetProgramBinary( self, size.value, size2, format, result )
+        # the wrapped function returns a new (unsigned) array rather than
+        # filling in the passed one, so call the raw entry point
+        raw_program_binary.glGetProgramBinary(
+            self, size.value, size2, format, ArrayDatatype.voidDataPointer( result ),
+        )
         return format.value, result 
     def load( self, format, binary, validate=True ):
         """Attempt to load binary-format for a pre-compiled shader
@@ -152,11 +344,140 @@ class ShaderProgram( int ):
         See notes in retrieve
         """
         get_program_binary.glProgramBinary( self, format, binary, len(binary))
+        for key in ('uniforms', 'attributes', 'uniform_blocks', '_setters'):
+            self.__dict__.pop( key, None )
         if validate:
             self.check_validate()
         self.check_linked()
         return self
 
+class ShaderObject( int ):
+    """Integer sub-class recording the source of a compileShader shader
+
+    source -- list of source segments (bytes)
+    shaderType -- GLenum shader type
+    compiled -- whether glCompileShader has been run
+    """
+    compiled = False
+    def __new__( cls, shader, source, shaderType ):
+        base = super( ShaderObject, cls ).__new__( cls, shader )
+        base.source = source
+        base.shaderType = shaderType
+        return base
+    def compile( self ):
+        """Compile the shader (if not yet compiled)
+
+        raises ShaderCompilationError on failure
+        """
+        if self.compiled:
+            return self
+        glCompileShader( self )
+        result = glGetShaderiv( self, GL_COMPILE_STATUS )
+        if not(result):
+            # TODO: this will be wrong if the user has
+            # disabled traditional unpacking array support.
+            raise ShaderCompilationError(
+                """Shader compile failure (%s): %s"""%(
+                    result,
+                    glGetShaderInfoLog( self ),
+                ),
+                self.source,
+                self.shaderType,
+            )
+        self.compiled = True
+        return self
+
+_programCache = None
+def setProgramCache( cache ):
+    """Set the program cache used by compileProgram/compilePrograms
+
+    cache -- OpenGL.GL.programcache.ProgramCache, a directory name
+        for a ProgramCache with default settings, or None to disable
+        caching
+
+    returns the ProgramCache (or None)
+    """
+    global _programCache
+    if isinstance( cache, (bytes,unicode)):
+        from OpenGL.GL.programcache import ProgramCache
+        cache = ProgramCache( cache )
+    _programCache = cache
+    return cache
+def getProgramCache( ):
+    """Retrieve the program cache used by compileProgram (or None)"""
+    return _programCache
+if os.environ.get( 'PYOPENGL_PROGRAM_CACHE' ):
+    setProgramCache( os.environ['PYOPENGL_PROGRAM_CACHE'] )
+
+def _binariesSupported( ):
+    """Whether the context can retrieve and load program binaries"""
+    if not (get_program_binary.glGetProgramBinary and get_program_binary.glProgramBinary):
+        return False
+    return GL.glGetIntegerValue( get_program_binary.GL_NUM_PROGRAM_BINARY_FORMATS ) > 0
+
+def _shaderSources( shaders ):
+    """Return [(shaderType, source)] for shaders or None if any lacks its source"""
+    if not all( isinstance( shader, ShaderObject ) for shader in shaders ):
+        return None
+    return [(shader.shaderType, shader.source) for shader in shaders]
+
+def _cachedProgram( cache, sources, named ):
+    """Create program for sources using cache, returns (program, key)
+
+    sources -- [(shaderType, source)] for the program's shaders, or
+        None if not known
+
+    Returns (None, key) when there is no usable binary, or (None, None)
+    when the program can not be cached (sources not known, or no binary
+    support in the context).
+    """
+    if sources is None:
+        return None, None
+    if not _binariesSupported():
+        return None, None
+    signature = [
+        GL.glGetString( constant ) or b'' for constant in (
+            GL.GL_VENDOR, GL.GL_RENDERER, GL.GL_VERSION,
+            GL.GL_SHADING_LANGUAGE_VERSION,
+        )
+    ]
+    key = cache.key(
+        sources,
+        signature,
+        flags=( bool(named.get('separable')), ),
+    )
+    stored = cache.get( key )
+    if stored is None:
+        return None, key
+    format, binary = stored
+    program = ShaderProgram( glCreateProgram() )
+    if named.get('separable'):
+        glProgramParameteri( program, separate_shader_objects.GL_PROGRAM_SEPARABLE, GL_TRUE )
+    try:
+        program.load( format, binary, validate=False )
+    except (GL.GLError, ShaderLinkError) as err:
+        log.info( """Program binary %s rejected, compiling from source: %s""", key, err )
+        cache.discard( key, rejected=True )
+        GL.glDeleteProgram( program )
+        return None, key
+    return program, key
+
+def _storeProgram( cache, key, program ):
+    """Store program's binary in cache under key"""
+    try:
+        format, binary = program.retrieve()
+    except GL.GLError as err:
+        log.info( """Unable to retrieve program binary: %s""", err )
+        return False
+    from OpenGL.arrays import ArrayDatatype
+    import ctypes
+    data = ctypes.string_at(
+        ArrayDatatype.dataPointer( binary ), ArrayDatatype.arrayByteCount( binary ),
+    )
+    if not data:
+        return False
+    return cache.put( key, format, data )
+
 def compileProgram(*shaders, **named):
     """Create a new program, attach shaders and validate
 
@@ -174,6 +495,11 @@ def compileProgram(*shaders, **named):
         function is *not* really intended for advanced usage,
         if you're finding yourself specifying this flag you 
         likely should be using your own shader management code.
+    cache (keyword only) -- ProgramCache to use instead of the one
+        set with setProgramCache, or None to bypass caching.  Only
+        programs whose shaders were all created by compileShader or
+        deferredShader are cached, linking (and, for deferredShader
+        shaders, compiling) is skipped when a binary is found.
 
     This convenience function is *not* standard OpenGL,
     but it does wind up being fairly useful for demos
@@ -198,10 +524,23 @@ def compileProgram(*shaders, **named):
         ShaderCompilationError, ShaderValidationError, ShaderLinkError,
     } when a link/validation failure occurs
     """
+    cache = named.get( 'cache', _programCache )
+    key = None
+    if cache is not None:
+        program, key = _cachedProgram( cache, _shaderSources( shaders ), named )
+        if program is not None:
+            if named.get('validate', True):
+                program.check_validate()
+            for shader in shaders:
+                glDeleteShader(shader)
+            return program
+    for shader in shaders:
+        if isinstance( shader, ShaderObject ):
+            shader.compile()
     program = glCreateProgram()
     if named.get('separable'):
         glProgramParameteri( program, separate_shader_objects.GL_PROGRAM_SEPARABLE, GL_TRUE )
-    if named.get('retrievable'):
+    if named.get('retrievable') or key is not None:
         glProgramParameteri( program, get_program_binary.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE )
     for shader in shaders:
         glAttachShader(program, shader)
@@ -210,6 +549,8 @@ def compileProgram(*shaders, **named):
     if named.get('validate', True):
         program.check_validate()
     program.check_linked()
+    if key is not None:
+        _storeProgram( cache, key, program )
     for shader in shaders:
         glDeleteShader(shader)
     return program
@@ -219,29 +560,208 @@ def compileShader( source, shaderType ):
     source -- GLSL source-code for the shader
     shaderType -- GLenum GL_VERTEX_SHADER, GL_FRAGMENT_SHADER, etc,
 
-    returns GLuint compiled shader reference
+    returns ShaderObject (GLuint) compiled shader reference
     raises RuntimeError when a compilation failure occurs
     """
+    return deferredShader( source, shaderType ).compile()
+def deferredShader( source, shaderType ):
+    """Create shader of given type with source, without compiling it
+
+    source -- GLSL source-code for the shader
+    shaderType -- GLenum GL_VERTEX_SHADER, GL_FRAGMENT_SHADER, etc,
+
+    The shader is compiled by compileProgram (or ShaderObject.compile),
+    which skips compilation when the linked program is found in the
+    program cache (see setProgramCache), compilation errors are raised
+    from there.
+
+    returns ShaderObject (GLuint) uncompiled shader reference
+    """
     if isinstance( source, (bytes,unicode)):
         source = [ source ]
     source = [ as_8_bit(s) for s in source ]
-    shader = glCreateShader(shaderType)
+    shader = ShaderObject( glCreateShader(shaderType), source, shaderType )
     glShaderSource( shader, source )
-    glCompileShader( shader )
-    result = glGetShaderiv( shader, GL_COMPILE_STATUS )
-    if not(result):
-        # TODO: this will be wrong if the user has
-        # disabled traditional unpacking array support.
-        raise ShaderCompilationError(
-            """Shader compile failure (%s): %s"""%(
-                result,
-                glGetShaderInfoLog( shader ),
-            ),
-            source,
-            shaderType,
-        )
     return shader
 
+_unchecked = {}
+def _uncheckedFunction( name ):
+    """Core entry point taking a single object, with no error checking
+
+    With ERROR_CHECKING the normal glCompileShader and glLinkProgram
+    query the compile/link status immediately, which waits for the
+    driver to finish the operation.
+    """
+    function = _unchecked.get( name )
+    if function is None:
+        from OpenGL import platform
+        from OpenGL.raw.GL._types import GLuint
+        function = _unchecked[name] = platform.PLATFORM.createBaseFunction(
+            name, dll=platform.PLATFORM.GL, resultType=None,
+            argTypes=(GLuint,), argNames=('object',),
+            extension='GL_VERSION_GL_2_0',
+        )
+    return function
+
+def _parallelCompileSupported( ):
+    """Whether the context can report completion without blocking"""
+    return bool( parallel_shader_compile.glMaxShaderCompilerThreadsKHR )
+
+class ProgramFuture( object ):
+    """Pending result of compilePrograms
+
+    program -- ShaderProgram being linked
+    shaders -- ShaderObject instances attached to the program
+    """
+    def __init__( self, program, shaders=(), named=None, cache=None, key=None ):
+        self.program = program
+        self.shaders = shaders
+        self.named = named or {}
+        self.cache = cache
+        self.key = key
+        self._finished = False
+        self._error = None
+    def done( self ):
+        """Whether the program has finished compiling and linking
+
+        Without KHR_parallel_shader_compile this is always True, as
+        the status queries made by result() wait for the driver.
+        """
+        if self._finished:
+            return True
+        if not _parallelCompileSupported():
+            return True
+        from OpenGL.raw.GL._types import GLint
+        status = GLint()
+        glGetProgramiv(
+            self.program, parallel_shader_compile.GL_COMPLETION_STATUS_KHR, status,
+        )
+        return bool( status.value )
+    def _finish( self ):
+        """Check compile/link status, validate, cache and release shaders"""
+        self._finished = True
+        try:
+            for shader in self.shaders:
+                result = glGetShaderiv( shader, GL_COMPILE_STATUS )
+                if not(result):
+                    raise ShaderCompilationError(
+                        """Shader compile failure (%s): %s"""%(
+                            result,
+                            glGetShaderInfoLog( shader ),
+                        ),
+                        shader.source,
+                        shader.shaderType,
+                    )
+                shader.compiled = True
+            self.program.check_linked()
+            if self.named.get('validate', True):
+                self.program.check_validate()
+            if self.key is not None:
+                _storeProgram( self.cache, self.key, self.program )
+        except (ShaderCompilationError, ShaderLinkError, ShaderValidationError) as err:
+            self._error = err
+        for shader in self.shaders:
+            glDeleteShader( shader )
+    def exception( self ):
+        """Wait for the program, return the compile/link/validation error or None"""
+        if not self._finished:
+            self._finish()
+        return self._error
+    def result( self ):
+        """Wait for the program and return the ShaderProgram
+
+        raises ShaderCompilationError, ShaderLinkError or
+        ShaderValidationError as compileProgram would
+        """
+        error = self.exception()
+        if error is not None:
+            raise error
+        return self.program
+
+def compilePrograms( programs, threads=0xFFFFFFFF, **named ):
+    """Submit a batch of programs for compilation, return ProgramFuture list
+
+    programs -- sequence of programs, each a sequence of
+        (source, shaderType) for its shaders, as for compileShader
+    threads -- number of compiler threads to request from the driver
+        with glMaxShaderCompilerThreadsKHR (the default, 0xFFFFFFFF,
+        lets the implementation choose), None to leave the setting alone
+    named -- as for compileProgram (separable, retrievable, validate,
+        cache)
+
+    All shaders are compiled and all programs linked before any status
+    is queried, so drivers with worker threads (KHR_parallel_shader_compile)
+    can overlap the work, use asCompleted() to handle the programs as
+    they finish, or ProgramFuture.result() to wait for a given one.
+    Programs found in the program cache are loaded from their binaries.
+
+    Usage:
+
+        futures = compilePrograms([
+            [(vertex, GL_VERTEX_SHADER), (fragment, GL_FRAGMENT_SHADER)],
+            [(vertex2, GL_VERTEX_SHADER), (fragment2, GL_FRAGMENT_SHADER)],
+        ])
+        programs = [future.result() for future in futures]
+    """
+    if threads is not None and _parallelCompileSupported():
+        parallel_shader_compile.glMaxShaderCompilerThreadsKHR( threads )
+    compile = _uncheckedFunction( 'glCompileShader' )
+    link = _uncheckedFunction( 'glLinkProgram' )
+    cache = named.get( 'cache', _programCache )
+    futures = []
+    pending = []
+    for shaders in programs:
+        sources = []
+        for source, shaderType in shaders:
+            if isinstance( source, (bytes,unicode)):
+                source = [ source ]
+            sources.append( (shaderType, [ as_8_bit(s) for s in source ]) )
+        key = None
+        if cache is not None:
+            program, key = _cachedProgram( cache, sources, named )
+            if program is not None:
+                future = ProgramFuture( program, named=named )
+                futures.append( future )
+                continue
+        objects = []
+        for shaderType, source in sources:
+            shader = ShaderObject( glCreateShader(shaderType), source, shaderType )
+            glShaderSource( shader, source )
+            compile( shader )
+            objects.append( shader )
+        future = ProgramFuture( None, objects, named, cache, key )
+        futures.append( future )
+        pending.append( future )
+    for future in pending:
+        program = ShaderProgram( glCreateProgram() )
+        if future.named.get('separable'):
+            glProgramParameteri( program, separate_shader_objects.GL_PROGRAM_SEPARABLE, GL_TRUE )
+        if future.named.get('retrievable') or future.key is not None:
+            glProgramParameteri( program, get_program_binary.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE )
+        for shader in future.shaders:
+            glAttachShader( program, shader )
+        link( program )
+        future.program = program
+    return futures
+
+def asCompleted( futures, interval=0.001 ):
+    """Yield ProgramFutures from futures as they finish compiling/linking
+
+    interval -- seconds to sleep when none of the remaining programs
+        has finished
+    """
+    import time
+    remaining = list( futures )
+    while remaining:
+        finished = [future for future in remaining if future.done()]
+        if not finished:
+            time.sleep( interval )
+            continue
+        for future in finished:
+            remaining.remove( future )
+            future.exception()
+            yield future
+
 class ShaderCompilationError(RuntimeError):
     """Raised when a shader compilation fails"""
 class ShaderValidationError(RuntimeError):
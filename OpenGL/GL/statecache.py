@@ -0,0 +1,364 @@
+"""Per-context shadowing of GL state to elide redundant state calls
+
+Render loops tend to set the same state over and over (glEnable of an
+already enabled capability, glColor3f of the current colour, glMatrixMode
+of the current mode...), each costing a ctypes call and, with error
+checking on, a glGetError round-trip.  This module provides drop-in
+replacements for common state setters which remember the last value set
+through them for the current context and skip the GL call when the value
+would not change.
+
+Usage:
+
+    from OpenGL.GL import *
+    from OpenGL.GL.statecache import *  # opt in to shadowing
+    from OpenGL.GL import statecache
+
+    # with the context current (once per context)
+    statecache.install()
+    ...
+    glMatrixMode( GL_MODELVIEW ) # only reaches the GL if mode changed
+    ...
+    print( statecache.getCache().stats() )
+
+The cache is stored with OpenGL.contextdata, so it is released with
+the context's other data by contextdata.cleanupContext.  Until install()
+has been called (or after uninstall()) the functions simply call
+through to the GL.  When switching between contexts which each have a
+cache installed, call activate() after making the other context current.
+
+Invalidation:
+
+    Only calls made through this module are seen.  When other code may
+    have changed the state (raw entry points, libraries
+    such as GLUT's text rendering, glDrawArrays with GL_COLOR_ARRAY
+    enabled, which leaves the current colour undefined) call
+    statecache.invalidate() to forget everything, or pass the functions
+    whose state changed, e.g. invalidate( 'glColor3f' ).  glPopAttrib
+    and glPopClientAttrib made through this module invalidate the whole
+    cache, glDeleteTextures and glDeleteBuffers forget the bindings, and
+    glBindVertexArray forgets the GL_ELEMENT_ARRAY_BUFFER binding.
+
+    Between glNewList and glEndList made through this module every
+    setter calls through to the GL, so that the list records the call,
+    and the cache is invalidated at glEndList if the list was also
+    executed (GL_COMPILE_AND_EXECUTE).  glCallList and glCallLists
+    invalidate the whole cache after the lists have run.  Setters which
+    are executed immediately rather than compiled into lists
+    (glBindBuffer, glBindVertexArray) are shadowed as usual.
+
+    Texture enables (GL_TEXTURE_2D, GL_TEXTURE_GEN_S, etc.) are per
+    texture unit, like texture bindings they are only shadowed once the
+    active unit is known.
+
+    Nothing is known about a context when the cache is installed, so the
+    first call to each setter always reaches the GL.
+"""
+import threading
+from OpenGL import contextdata
+from OpenGL.raw.GL.VERSION import GL_1_1 as _simple
+from OpenGL.raw.GL.VERSION import GL_1_3 as _multitexture
+from OpenGL.raw.GL.VERSION import GL_1_5 as _buffers
+from OpenGL.raw.GL.VERSION import GL_2_0 as _shaders
+from OpenGL.raw.GL.VERSION import GL_3_0 as _vertexarrays
+from OpenGL.GL import exceptional as _exceptional
+from OpenGL.GL.VERSION import GL_1_5 as _wrappedbuffers
+
+__all__ = (
+    'StateCache',
+    'install',
+    'uninstall',
+    'activate',
+    'getCache',
+    'invalidate',
+    'glEnable', 'glDisable',
+    'glColor3f', 'glColor4f',
+    'glLineWidth', 'glPointSize',
+    'glMatrixMode', 'glShadeModel',
+    'glBlendFunc', 'glDepthFunc', 'glDepthMask',
+    'glCullFace', 'glFrontFace', 'glClearColor',
+    'glActiveTexture', 'glBindTexture',
+    'glUseProgram', 'glBindBuffer', 'glBindVertexArray',
+    'glDeleteTextures', 'glDeleteBuffers',
+    'glPopAttrib', 'glPopClientAttrib',
+    'glNewList', 'glEndList', 'glCallList', 'glCallLists',
+)
+
+_CACHE_KEY = 'OpenGL.GL.statecache'
+_local = threading.local()
+_UNKNOWN = object()
+# capabilities enabled per texture unit
+_TEXTURE_CAPABILITIES = frozenset([
+    0x0DE0, # GL_TEXTURE_1D
+    0x0DE1, # GL_TEXTURE_2D
+    0x806F, # GL_TEXTURE_3D
+    0x8513, # GL_TEXTURE_CUBE_MAP
+    0x84F5, # GL_TEXTURE_RECTANGLE
+    0x0C60, # GL_TEXTURE_GEN_S
+    0x0C61, # GL_TEXTURE_GEN_T
+    0x0C62, # GL_TEXTURE_GEN_R
+    0x0C63, # GL_TEXTURE_GEN_Q
+])
+
+
+class StateCache( object ):
+    """Shadow values of GL state for a single context
+
+    values -- mapping from state key to the arguments last passed
+    elided -- mapping from function name to number of calls skipped
+    issued -- mapping from function name to number of calls made
+    compiling -- mode of the display list being compiled, or None
+    """
+    def __init__( self ):
+        self.values = {}
+        self.elided = {}
+        self.issued = {}
+        self.compiling = None
+    def invalidate( self, *names ):
+        """Forget the state set by the named functions (default all)"""
+        if not names:
+            self.values.clear()
+            return
+        states = set( _FUNCTION_STATES.get( name, name ) for name in names )
+        for key in list( self.values ):
+            state = key[0] if isinstance( key, tuple ) else key
+            if state in states:
+                del self.values[key]
+    def stats( self ):
+        """Return a dictionary of the cache counters"""
+        return {
+            'elided': sum( self.elided.values() ),
+            'issued': sum( self.issued.values() ),
+            'tracked': len( self.values ),
+            'elided_by_function': dict( self.elided ),
+        }
+    def reset( self ):
+        """Reset the elided/issued counters (not the shadowed state)"""
+        self.elided.clear()
+        self.issued.clear()
+
+
+def getCache( context=None ):
+    """Retrieve the StateCache installed for the context (or None)"""
+    return contextdata.getValue( _CACHE_KEY, context=context )
+
+def install( context=None ):
+    """Install (if necessary) and activate a StateCache for the context"""
+    cache = getCache( context )
+    if cache is None:
+        cache = StateCache()
+        contextdata.setValue( _CACHE_KEY, cache, context=context )
+    _local.cache = cache
+    return cache
+
+def uninstall( context=None ):
+    """Remove the context's StateCache, calls pass straight through again"""
+    cache = getCache( context )
+    contextdata.delValue( _CACHE_KEY, context=context )
+    if getattr( _local, 'cache', None ) is cache:
+        _local.cache = None
+
+def activate( context=None ):
+    """Use the cache installed for the (newly current) context, if any"""
+    _local.cache = cache = getCache( context )
+    return cache
+
+def invalidate( *names ):
+    """Forget the active cache's state set by the named functions (default all)"""
+    cache = getattr( _local, 'cache', None )
+    if cache is not None:
+        cache.invalidate( *names )
+
+
+def _shadow( name, baseFunction, state, keyed=0, normalise=None, compiled=True ):
+    """Produce shadowing version of baseFunction
+
+    state -- name under which the values are stored
+    keyed -- number of leading arguments which select the piece of state
+        (e.g. the capability for glEnable) rather than being its value
+    normalise -- optional function converting the value arguments so
+        that equivalent calls compare equal (e.g. glColor3f as glColor4f)
+    compiled -- whether baseFunction is compiled into display lists, if
+        so it is not shadowed while a list is being compiled
+    """
+    def shadowed( *args ):
+        cache = getattr( _local, 'cache', None )
+        if cache is None or (compiled and cache.compiling is not None):
+            return baseFunction( *args )
+        if keyed:
+            key = (state,) + args[:keyed]
+            value = args[keyed:]
+        else:
+            key = state
+            value = args
+        if normalise is not None:
+            value = normalise( value )
+        if cache.values.get( key, _UNKNOWN ) == value:
+            cache.elided[name] = cache.elided.get( name, 0 ) + 1
+            return None
+        result = baseFunction( *args )
+        cache.values[key] = value
+        cache.issued[name] = cache.issued.get( name, 0 ) + 1
+        return result
+    shadowed.__name__ = name
+    shadowed.__doc__ = """Shadowing version of %s, skipped if state is unchanged"""%( name, )
+    shadowed.baseFunction = baseFunction
+    return shadowed
+
+def _capability( name, baseFunction, enabled ):
+    """Produce shadowing glEnable/glDisable"""
+    def capability( cap ):
+        cache = getattr( _local, 'cache', None )
+        if cache is None or cache.compiling is not None:
+            return baseFunction( cap )
+        if cap in _TEXTURE_CAPABILITIES:
+            unit = cache.values.get( 'activeTexture', _UNKNOWN )
+            if unit is _UNKNOWN:
+                return baseFunction( cap )
+            key = ('enabled', cap, unit)
+        else:
+            key = ('enabled', cap)
+        if cache.values.get( key, _UNKNOWN ) is enabled:
+            cache.elided[name] = cache.elided.get( name, 0 ) + 1
+            return None
+        result = baseFunction( cap )
+        cache.values[key] = enabled
+        cache.issued[name] = cache.issued.get( name, 0 ) + 1
+        return result
+    capability.__name__ = name
+    capability.__doc__ = """Shadowing version of %s, skipped if state is unchanged"""%( name, )
+    capability.baseFunction = baseFunction
+    return capability
+
+def _invalidating( name, baseFunction, *states ):
+    """Produce version of baseFunction which forgets the given states (all if none)"""
+    def invalidating( *args ):
+        result = baseFunction( *args )
+        cache = getattr( _local, 'cache', None )
+        if cache is not None:
+            cache.invalidate( *states )
+        return result
+    invalidating.__name__ = name
+    invalidating.__doc__ = """%s which also updates the shadowed state"""%( name, )
+    invalidating.baseFunction = baseFunction
+    return invalidating
+
+def _color3( value ):
+    return tuple( value ) + (1.0,)
+
+glEnable = _capability( 'glEnable', _simple.glEnable, True )
+glDisable = _capability( 'glDisable', _simple.glDisable, False )
+glColor3f = _shadow( 'glColor3f', _simple.glColor3f, 'color', normalise=_color3 )
+glColor4f = _shadow( 'glColor4f', _simple.glColor4f, 'color' )
+glLineWidth = _shadow( 'glLineWidth', _simple.glLineWidth, 'lineWidth' )
+glPointSize = _shadow( 'glPointSize', _simple.glPointSize, 'pointSize' )
+glMatrixMode = _shadow( 'glMatrixMode', _simple.glMatrixMode, 'matrixMode' )
+glShadeModel = _shadow( 'glShadeModel', _simple.glShadeModel, 'shadeModel' )
+glBlendFunc = _shadow( 'glBlendFunc', _simple.glBlendFunc, 'blendFunc' )
+glDepthFunc = _shadow( 'glDepthFunc', _simple.glDepthFunc, 'depthFunc' )
+glDepthMask = _shadow( 'glDepthMask', _simple.glDepthMask, 'depthMask' )
+glCullFace = _shadow( 'glCullFace', _simple.glCullFace, 'cullFace' )
+glFrontFace = _shadow( 'glFrontFace', _simple.glFrontFace, 'frontFace' )
+glClearColor = _shadow( 'glClearColor', _simple.glClearColor, 'clearColor' )
+glActiveTexture = _shadow( 'glActiveTexture', _multitexture.glActiveTexture, 'activeTexture' )
+glUseProgram = _shadow( 'glUseProgram', _shaders.glUseProgram, 'program' )
+glBindBuffer = _shadow(
+    'glBindBuffer', _buffers.glBindBuffer, 'buffer', keyed=1, compiled=False
+)
+
+def glBindTexture( target, texture ):
+    """Shadowing version of glBindTexture, skipped if binding is unchanged
+
+    Bindings are per texture unit, so this is only shadowed once the
+    active unit is known (i.e. glActiveTexture was called through this
+    module since the last invalidation).
+    """
+    cache = getattr( _local, 'cache', None )
+    if cache is None or cache.compiling is not None:
+        return _simple.glBindTexture( target, texture )
+    unit = cache.values.get( 'activeTexture', _UNKNOWN )
+    if unit is _UNKNOWN:
+        return _simple.glBindTexture( target, texture )
+    key = ('texture', unit, target)
+    if cache.values.get( key, _UNKNOWN ) == texture:
+        cache.elided['glBindTexture'] = cache.elided.get( 'glBindTexture', 0 ) + 1
+        return None
+    result = _simple.glBindTexture( target, texture )
+    cache.values[key] = texture
+    cache.issued['glBindTexture'] = cache.issued.get( 'glBindTexture', 0 ) + 1
+    return result
+glBindTexture.baseFunction = _simple.glBindTexture
+
+_bindVertexArray = _shadow(
+    'glBindVertexArray', _vertexarrays.glBindVertexArray, 'vertexArray',
+    compiled=False,
+)
+def glBindVertexArray( array ):
+    """Shadowing version of glBindVertexArray, skipped if binding is unchanged
+
+    The GL_ELEMENT_ARRAY_BUFFER binding is part of the vertex array
+    object, so it is forgotten whenever the binding changes.
+    """
+    cache = getattr( _local, 'cache', None )
+    if cache is not None and cache.values.get( 'vertexArray', _UNKNOWN ) != (array,):
+        cache.values.pop( ('buffer', _buffers.GL_ELEMENT_ARRAY_BUFFER), None )
+    return _bindVertexArray( array )
+glBindVertexArray.baseFunction = _vertexarrays.glBindVertexArray
+
+glDeleteTextures = _invalidating( 'glDeleteTextures', _exceptional.glDeleteTextures, 'texture' )
+glDeleteBuffers = _invalidating( 'glDeleteBuffers', _wrappedbuffers.glDeleteBuffers, 'buffer' )
+glPopAttrib = _invalidating( 'glPopAttrib', _simple.glPopAttrib )
+glPopClientAttrib = _invalidating( 'glPopClientAttrib', _simple.glPopClientAttrib )
+glCallList = _invalidating( 'glCallList', _simple.glCallList )
+glCallLists = _invalidating( 'glCallLists', _exceptional.glCallLists )
+
+def glNewList( list, mode ):
+    """glNewList which stops shadowing until glEndList
+
+    The setters call through to the GL while the list is compiled so
+    that the list records them.
+    """
+    result = _simple.glNewList( list, mode )
+    cache = getattr( _local, 'cache', None )
+    if cache is not None:
+        cache.compiling = mode
+    return result
+glNewList.baseFunction = _simple.glNewList
+
+def glEndList( ):
+    """glEndList which resumes shadowing
+
+    If the list was executed as it was compiled (GL_COMPILE_AND_EXECUTE)
+    the shadowed state is no longer known and is forgotten.
+    """
+    result = _simple.glEndList()
+    cache = getattr( _local, 'cache', None )
+    if cache is not None:
+        if cache.compiling == _simple.GL_COMPILE_AND_EXECUTE:
+            cache.invalidate()
+        cache.compiling = None
+    return result
+glEndList.baseFunction = _simple.glEndList
+
+# function name to the name of the state it sets, for invalidate( name )
+_FUNCTION_STATES = {
+    'glEnable': 'enabled',
+    'glDisable': 'enabled',
+    'glColor3f': 'color',
+    'glColor4f': 'color',
+    'glLineWidth': 'lineWidth',
+    'glPointSize': 'pointSize',
+    'glMatrixMode': 'matrixMode',
+    'glShadeModel': 'shadeModel',
+    'glBlendFunc': 'blendFunc',
+    'glDepthFunc': 'depthFunc',
+    'glDepthMask': 'depthMask',
+    'glCullFace': 'cullFace',
+    'glFrontFace': 'frontFace',
+    'glClearColor': 'clearColor',
+    'glActiveTexture': 'activeTexture',
+    'glBindTexture': 'texture',
+    'glUseProgram': 'program',
+    'glBindBuffer': 'buffer',
+    'glBindVertexArray': 'vertexArray',
+}
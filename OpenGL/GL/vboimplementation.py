@@ -1,8 +1,13 @@
 from OpenGL.arrays import vbo
-from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1
+from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1, GL_3_2, GL_4_4
+from OpenGL.GL.ARB import map_buffer_range, sync, buffer_storage, copy_buffer
 
 class Implementation( vbo.Implementation ):
     """OpenGL-based implementation of VBO interfaces"""
+    OPTIONAL_SOURCES = (
+        GL_3_0, GL_3_1, GL_3_2, GL_4_4,
+        map_buffer_range, sync, buffer_storage, copy_buffer,
+    )
     def __init__( self ):
         for name in self.EXPORTED_NAMES:
             found = False
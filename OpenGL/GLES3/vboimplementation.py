@@ -4,6 +4,7 @@ from OpenGL.GLES3.OES import mapbuffer
 
 class Implementation( vbo.Implementation ):
     """OpenGL-based implementation of VBO interfaces"""
+    OPTIONAL_SOURCES = ( GLES3_3_0, )
     def __init__( self ):
         for name in self.EXPORTED_NAMES:
             for source in [ GLES3_3_0, mapbuffer ]:
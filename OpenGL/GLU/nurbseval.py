@@ -0,0 +1,415 @@
+"""NumPy evaluation of NURBS curves and surfaces
+
+gluNurbsCurve and gluNurbsSurface hand evaluation to GLU, which emits
+the geometry through immediate mode (or per-vertex callbacks in
+GLU_NURBS_TESSELLATOR mode), neither of which is available on core
+profiles or fast from Python.  This module evaluates the B-spline basis
+with the Cox-de Boor recursion for a whole array of parameters at once,
+so that curve points are one matrix product with the control points and
+surface grids one tensor product:
+
+    from OpenGL.GLU import nurbseval
+
+    # explicit parameters
+    points = nurbseval.evaluateCurve( knots, control, numpy.linspace( 0, 1, 100 ))
+
+    # parameters chosen so the window-space error is at most 0.5 pixels
+    # (the current matrices are used unless model, proj and view are passed)
+    mesh = nurbseval.surfaceMesh( sKnots, tKnots, control, tolerance=0.5 )
+    data, layout = mesh.interleaved()
+    glBufferData( GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW )
+    glBufferData( GL_ELEMENT_ARRAY_BUFFER, mesh.indices.nbytes, mesh.indices, GL_STATIC_DRAW )
+    ...
+    glDrawElements( mesh.mode, mesh.indices.size, GL_UNSIGNED_INT, None )
+
+Knots and control points are given as for gluNurbsCurve/gluNurbsSurface
+(the order is len( knots ) - len( control ) along each direction, and is
+checked with the same checkOrder/checkKnots when ERROR_CHECKING is set).
+With rational=True the last coordinate of each control point is its
+weight and the others are pre-multiplied by it, as for GL_MAP1_VERTEX_4
+and GL_MAP2_VERTEX_4.  Evaluation covers the domain knots[order-1] to
+knots[len( control )], parameters outside it are clamped.
+
+Surface normals are the normalised cross product of the s and t partial
+derivatives (as GL_AUTO_NORMAL computes them), they are 0 where the
+surface is degenerate (e.g. at the poles of a sphere).  Texture
+coordinates are the parameters normalised to 0-1 over the domain.
+"""
+import numpy
+from OpenGL import _configflags
+from OpenGL.raw.GL.VERSION.GL_1_1 import GL_LINE_STRIP, GL_TRIANGLES
+from OpenGL.GLU.glunurbs import checkOrder, checkKnots
+from OpenGL.GLU.projection import gluProjectArray, _matrices
+
+__all__ = (
+    'basis',
+    'evaluateCurve',
+    'evaluateSurface',
+    'sampleCurve',
+    'sampleSurface',
+    'curveMesh',
+    'surfaceMesh',
+    'NurbsMesh',
+)
+
+DEFAULT_TOLERANCE = 0.5
+MAX_SAMPLES = 4096
+
+def _inverse( denominators ):
+    """Reciprocals of denominators with 0 (repeated knots) mapping to 0"""
+    safe = numpy.where( denominators != 0.0, denominators, 1.0 )
+    return numpy.where( denominators != 0.0, 1.0 / safe, 0.0 )
+
+def _order( knots, count, name ):
+    """Convert knots to an array, check them, return (knots, order)"""
+    knots = numpy.asarray( knots, 'd' ).reshape( (-1,) )
+    order = len( knots ) - count
+    if _configflags.ERROR_CHECKING:
+        checkOrder( order, len( knots ), 'order of %s'%( name, ))
+        checkKnots( knots, 'knots of %s'%( name, ))
+    return knots, order
+
+def _domain( knots, order ):
+    """(low, high) parameter range over which the curve is defined"""
+    return knots[order-1], knots[len( knots ) - order]
+
+class _Basis( object ):
+    """B-spline basis of a knot vector with the knot differences precomputed"""
+    def __init__( self, knots, order ):
+        self.knots = knots = numpy.asarray( knots, 'd' )
+        self.order = order
+        self.count = len( knots ) - order
+        self.low, self.high = _domain( knots, order )
+        self.steps = []
+        for k in range( 2, order + 1 ):
+            m = len( knots ) - k
+            self.steps.append( (
+                knots[:m], knots[k:k+m],
+                _inverse( knots[k-1:k-1+m] - knots[:m] ),
+                _inverse( knots[k:k+m] - knots[1:1+m] ),
+            ))
+    def __call__( self, parameters, derivative=False ):
+        knots, order, count = self.knots, self.order, self.count
+        u = numpy.asarray( parameters, 'd' ).reshape( (-1,) )
+        u = numpy.minimum( numpy.maximum( u, self.low ), self.high )
+        span = numpy.searchsorted( knots, u, 'right' ) - 1
+        span = numpy.minimum( numpy.maximum( span, order - 1 ), count - 1 )
+        values = numpy.zeros( (len( u ), len( knots ) - 1), 'd' )
+        values[numpy.arange( len( u )), span] = 1.0
+        u = u[:,None]
+        previous = values
+        for lower, upper, left, right in self.steps:
+            m = len( lower )
+            previous = values
+            values = (
+                (u - lower) * left * previous[:,:m] +
+                (upper - u) * right * previous[:,1:m+1]
+            )
+        if not derivative:
+            return values
+        if order == 1:
+            return values, numpy.zeros( values.shape, 'd' )
+        _, _, left, right = self.steps[-1]
+        derivatives = (order - 1) * (
+            left * previous[:,:count] - right * previous[:,1:count+1]
+        )
+        return values, derivatives
+
+def basis( knots, order, parameters, derivative=False ):
+    """Evaluate the B-spline basis functions at each of parameters
+
+    knots -- non-decreasing knot vector
+    order -- order (degree + 1) of the basis
+    parameters -- parameter values, clamped to the domain
+
+    returns (M, len( knots ) - order) array of basis function values, or
+    with derivative a tuple of that and the array of their derivatives
+    """
+    return _Basis( knots, order )( parameters, derivative )
+
+def _project( homogeneous, rational ):
+    """Divide out the weight of rational points"""
+    if not rational:
+        return homogeneous
+    return homogeneous[...,:-1] / homogeneous[...,-1:]
+
+def _combine( sBasis, control, tBasis ):
+    """Combine (S, T, dimension) control points with the bases of a grid"""
+    # tBasis @ control[i] for each i gives (S, len( tBasis ), dimension)
+    return numpy.tensordot( sBasis, numpy.matmul( tBasis, control ), 1 )
+
+def evaluateCurve( knots, control, parameters, rational=False ):
+    """Evaluate the curve at each of parameters
+
+    knots, control -- as for gluNurbsCurve, control is (N, dimension)
+
+    returns (M, dimension) double array of points (dimension - 1 if rational)
+    """
+    control = numpy.asarray( control, 'd' )
+    if control.ndim != 2:
+        raise ValueError( """Need an (N, dimension) control array, got shape %s"""%( control.shape, ))
+    knots, order = _order( knots, len( control ), 'NURBS curve' )
+    return _project( numpy.dot( basis( knots, order, parameters ), control ), rational )
+
+def evaluateSurface( sKnots, tKnots, control, sParameters, tParameters, rational=False ):
+    """Evaluate the surface over the grid of sParameters x tParameters
+
+    sKnots, tKnots, control -- as for gluNurbsSurface, control is
+        (S, T, dimension), the first axis following sKnots
+
+    returns (points, normals), (len( sParameters ), len( tParameters ),
+    dimension) points (dimension - 1 if rational) and (..., 3) unit
+    normals, or None for normals if the points are not 3D
+    """
+    control = numpy.asarray( control, 'd' )
+    if control.ndim != 3:
+        raise ValueError( """Need an (S, T, dimension) control array, got shape %s"""%( control.shape, ))
+    sKnots, sOrder = _order( sKnots, control.shape[0], 'NURBS surface (s)' )
+    tKnots, tOrder = _order( tKnots, control.shape[1], 'NURBS surface (t)' )
+    sBasis, sDerivative = basis( sKnots, sOrder, sParameters, derivative=True )
+    tBasis, tDerivative = basis( tKnots, tOrder, tParameters, derivative=True )
+    # contract t first, it is shared by the value and the s derivative
+    alongT = numpy.matmul( tBasis, control )
+    homogeneous = numpy.tensordot( sBasis, alongT, 1 )
+    sTangent = numpy.tensordot( sDerivative, alongT, 1 )
+    tTangent = _combine( sBasis, control, tDerivative )
+    points = _project( homogeneous, rational )
+    if rational:
+        weights = homogeneous[...,-1:]
+        sTangent = (sTangent[...,:-1] - points * sTangent[...,-1:]) / weights
+        tTangent = (tTangent[...,:-1] - points * tTangent[...,-1:]) / weights
+    if points.shape[-1] != 3:
+        return points, None
+    normals = numpy.cross( sTangent, tTangent )
+    lengths = numpy.sqrt( (normals * normals).sum( axis=-1 ))[...,None]
+    return points, normals * _inverse( lengths )
+
+def _initial( knots, order, count ):
+    """Distinct knots of the domain with each span split into count intervals"""
+    low, high = _domain( knots, order )
+    breaks = numpy.unique( knots[(knots >= low) & (knots <= high)] )
+    if len( breaks ) < 2:
+        return breaks
+    steps = numpy.linspace( 0.0, 1.0, count + 1 )[:-1]
+    starts = breaks[:-1,None] + (breaks[1:] - breaks[:-1])[:,None] * steps
+    return numpy.append( starts.reshape( (-1,) ), high )
+
+class _Screen( object ):
+    """Map evaluated points to the space in which the tolerance applies"""
+    def __init__( self, model, proj, view, objectSpace ):
+        self.objectSpace = objectSpace
+        if not objectSpace:
+            self.matrices = _matrices( model, proj, view )
+    def __call__( self, points ):
+        shape = points.shape[:-1]
+        points = points.reshape( (-1, points.shape[-1]) )
+        if self.objectSpace:
+            return points.reshape( shape + points.shape[-1:] )
+        if points.shape[1] < 3:
+            points = numpy.column_stack(
+                (points, numpy.zeros( (len( points ), 3 - points.shape[1] )))
+            )
+        window = gluProjectArray( points[:,:3], *self.matrices )[:,:2]
+        return window.reshape( shape + (2,) )
+
+def _chordError( start, end, midpoints ):
+    """Distance of midpoints from the chords from start to end"""
+    chord = end - start
+    offset = midpoints - start
+    length = (chord * chord).sum( axis=-1 )
+    along = numpy.clip( (offset * chord).sum( axis=-1 ) * _inverse( length ), 0.0, 1.0 )
+    delta = offset - along[...,None] * chord
+    return numpy.sqrt( (delta * delta).sum( axis=-1 ))
+
+def sampleCurve(
+    knots, control, tolerance=DEFAULT_TOLERANCE, rational=False,
+    model=None, proj=None, view=None, objectSpace=False,
+):
+    """Choose parameters at which to sample the curve within tolerance
+
+    Starts with order samples per knot span and halves, all at once,
+    every interval whose midpoint is more than tolerance from its chord,
+    until none is or MAX_SAMPLES is reached.
+
+    tolerance -- maximum error in pixels (in object-space units with
+        objectSpace) as for GLU_PARAMETRIC_TOLERANCE
+    model, proj, view -- matrices for gluProjectArray, the current ones
+        are fetched (once) for those not given
+
+    returns the sorted array of parameters
+    """
+    control = numpy.asarray( control, 'd' )
+    knots, order = _order( knots, len( control ), 'NURBS curve' )
+    screen = _Screen( model, proj, view, objectSpace )
+    evaluate = _Basis( knots, order )
+    parameters = _initial( knots, order, max( (order, 2) ))
+    values = screen( _project( numpy.dot( evaluate( parameters ), control ), rational ))
+    active = numpy.ones( len( parameters ) - 1, bool )
+    while active.any() and len( parameters ) < MAX_SAMPLES:
+        indices = numpy.nonzero( active )[0]
+        midpoints = (parameters[indices] + parameters[indices+1]) / 2.0
+        middle = screen( _project( numpy.dot( evaluate( midpoints ), control ), rational ))
+        split = _chordError( values[indices], values[indices+1], middle ) > tolerance
+        if not split.any():
+            break
+        positions = indices[split] + 1
+        parameters = numpy.insert( parameters, positions, midpoints[split] )
+        values = numpy.insert( values, positions, middle[split], axis=0 )
+        # the halves of each split interval are the only ones left to check
+        inserted = positions + numpy.arange( len( positions ))
+        active = numpy.zeros( len( parameters ) - 1, bool )
+        active[inserted - 1] = True
+        active[inserted] = True
+    return parameters
+
+def sampleSurface(
+    sKnots, tKnots, control, tolerance=DEFAULT_TOLERANCE, rational=False,
+    model=None, proj=None, view=None, objectSpace=False,
+):
+    """Choose the s and t parameters of a grid sampling the surface within tolerance
+
+    As sampleCurve, but an interval of s (t) is halved when the error of
+    any of the iso-parameter curves of the grid through it exceeds
+    tolerance, so the result remains a grid.
+
+    returns (sParameters, tParameters)
+    """
+    control = numpy.asarray( control, 'd' )
+    sKnots, sOrder = _order( sKnots, control.shape[0], 'NURBS surface (s)' )
+    tKnots, tOrder = _order( tKnots, control.shape[1], 'NURBS surface (t)' )
+    screen = _Screen( model, proj, view, objectSpace )
+    sEvaluate = _Basis( sKnots, sOrder )
+    tEvaluate = _Basis( tKnots, tOrder )
+    sParameters = _initial( sKnots, sOrder, max( (sOrder, 2) ))
+    tParameters = _initial( tKnots, tOrder, max( (tOrder, 2) ))
+    sBasis = sEvaluate( sParameters )
+    tBasis = tEvaluate( tParameters )
+    def grid( sBasis, tBasis ):
+        return screen( _project( _combine( sBasis, control, tBasis ), rational ))
+    while True:
+        sMidpoints = (sParameters[:-1] + sParameters[1:]) / 2.0
+        tMidpoints = (tParameters[:-1] + tParameters[1:]) / 2.0
+        sMiddleBasis = sEvaluate( sMidpoints )
+        tMiddleBasis = tEvaluate( tMidpoints )
+        values = grid( sBasis, tBasis )
+        sMiddle = grid( sMiddleBasis, tBasis )
+        tMiddle = grid( sBasis, tMiddleBasis )
+        sSplit = _chordError( values[:-1], values[1:], sMiddle ).max( axis=1 ) > tolerance
+        tSplit = _chordError( values[:,:-1], values[:,1:], tMiddle ).max( axis=0 ) > tolerance
+        if len( sParameters ) >= MAX_SAMPLES:
+            sSplit[:] = False
+        if len( tParameters ) >= MAX_SAMPLES:
+            tSplit[:] = False
+        if not (sSplit.any() or tSplit.any()):
+            break
+        # the basis of the refined grid is that of the old one plus midpoints
+        sPositions = numpy.nonzero( sSplit )[0] + 1
+        sParameters = numpy.insert( sParameters, sPositions, sMidpoints[sSplit] )
+        sBasis = numpy.insert( sBasis, sPositions, sMiddleBasis[sSplit], axis=0 )
+        tPositions = numpy.nonzero( tSplit )[0] + 1
+        tParameters = numpy.insert( tParameters, tPositions, tMidpoints[tSplit] )
+        tBasis = numpy.insert( tBasis, tPositions, tMiddleBasis[tSplit], axis=0 )
+    return sParameters, tParameters
+
+def _normalised( knots, order, parameters ):
+    low, high = _domain( knots, order )
+    if high == low:
+        return numpy.zeros( len( parameters ), 'd' )
+    return (numpy.clip( parameters, low, high ) - low) / (high - low)
+
+class NurbsMesh( object ):
+    """Evaluated NURBS geometry as float32/uint32 arrays ready for buffer objects
+
+    vertices -- (N, dimension) positions
+    normals -- (N, 3) unit normals or None (curves)
+    texcoords -- (N, 2) (surfaces) or (N, 1) (curves) normalised parameters
+    indices -- (T, 3) triangle indices, or None to draw the vertices in order
+    mode -- GL_TRIANGLES or GL_LINE_STRIP
+    shape -- (S, T) of a surface grid, (N,) for a curve
+    """
+    def __init__( self, vertices, normals, texcoords, indices, mode, shape ):
+        self.vertices = numpy.ascontiguousarray( vertices, 'f' )
+        self.normals = None if normals is None else numpy.ascontiguousarray( normals, 'f' )
+        self.texcoords = numpy.ascontiguousarray( texcoords, 'f' )
+        self.indices = None if indices is None else numpy.ascontiguousarray( indices, numpy.uint32 )
+        self.mode = mode
+        self.shape = shape
+    def interleaved( self ):
+        """Combine the vertex attributes into a single array
+
+        returns (data, layout): data is an (N, columns) float32 array
+        and layout a list of (name, columns, byte offset) for 'vertex',
+        'normal' (if present) and 'texcoord', the stride is data.strides[0]
+        """
+        arrays = [('vertex', self.vertices), ('normal', self.normals), ('texcoord', self.texcoords)]
+        arrays = [(name, array) for (name, array) in arrays if array is not None]
+        layout = []
+        offset = 0
+        for name, array in arrays:
+            layout.append( (name, array.shape[1], offset) )
+            offset += array.shape[1] * array.itemsize
+        data = numpy.ascontiguousarray( numpy.column_stack( [array for (name, array) in arrays] ), 'f' )
+        return data, layout
+
+def _gridIndices( rows, columns ):
+    """Triangle indices of a rows x columns vertex grid, counter-clockwise
+    seen from the side the s x t normal points to"""
+    index = numpy.arange( rows * columns, dtype=numpy.uint32 ).reshape( (rows, columns) )
+    a = index[:-1,:-1].reshape( (-1,) )
+    b = index[1:,:-1].reshape( (-1,) )
+    c = index[1:,1:].reshape( (-1,) )
+    d = index[:-1,1:].reshape( (-1,) )
+    return numpy.column_stack( (a, b, c, a, c, d) ).reshape( (-1, 3) )
+
+def curveMesh(
+    knots, control, parameters=None, tolerance=DEFAULT_TOLERANCE, rational=False,
+    model=None, proj=None, view=None, objectSpace=False,
+):
+    """Evaluate the curve into a NurbsMesh drawn as a GL_LINE_STRIP
+
+    parameters -- parameters at which to evaluate, if None they are
+        chosen by sampleCurve with the remaining arguments
+    """
+    if parameters is None:
+        parameters = sampleCurve(
+            knots, control, tolerance, rational, model, proj, view, objectSpace,
+        )
+    parameters = numpy.asarray( parameters, 'd' ).reshape( (-1,) )
+    control = numpy.asarray( control, 'd' )
+    vertices = evaluateCurve( knots, control, parameters, rational )
+    knots, order = _order( knots, len( control ), 'NURBS curve' )
+    texcoords = _normalised( knots, order, parameters )[:,None]
+    return NurbsMesh( vertices, None, texcoords, None, GL_LINE_STRIP, (len( parameters ),) )
+
+def surfaceMesh(
+    sKnots, tKnots, control, sParameters=None, tParameters=None,
+    tolerance=DEFAULT_TOLERANCE, rational=False,
+    model=None, proj=None, view=None, objectSpace=False,
+):
+    """Evaluate the surface into an indexed GL_TRIANGLES NurbsMesh
+
+    sParameters, tParameters -- grid at which to evaluate, if either is
+        None both are chosen by sampleSurface with the remaining arguments
+    """
+    if sParameters is None or tParameters is None:
+        sParameters, tParameters = sampleSurface(
+            sKnots, tKnots, control, tolerance, rational, model, proj, view, objectSpace,
+        )
+    sParameters = numpy.asarray( sParameters, 'd' ).reshape( (-1,) )
+    tParameters = numpy.asarray( tParameters, 'd' ).reshape( (-1,) )
+    control = numpy.asarray( control, 'd' )
+    points, normals = evaluateSurface( sKnots, tKnots, control, sParameters, tParameters, rational )
+    sKnots, sOrder = _order( sKnots, control.shape[0], 'NURBS surface (s)' )
+    tKnots, tOrder = _order( tKnots, control.shape[1], 'NURBS surface (t)' )
+    rows, columns = len( sParameters ), len( tParameters )
+    texcoords = numpy.empty( (rows, columns, 2), 'd' )
+    texcoords[...,0] = _normalised( sKnots, sOrder, sParameters )[:,None]
+    texcoords[...,1] = _normalised( tKnots, tOrder, tParameters )[None,:]
+    return NurbsMesh(
+        points.reshape( (rows * columns, -1) ),
+        None if normals is None else normals.reshape( (-1, 3) ),
+        texcoords.reshape( (-1, 2) ),
+        _gridIndices( rows, columns ),
+        GL_TRIANGLES,
+        (rows, columns),
+    )
@@ -1,4 +1,9 @@
-"""glu[Un]Project[4] convenience wrappers"""
+"""glu[Un]Project[4] convenience wrappers
+
+gluProjectArray and gluUnProjectArray transform a whole (N,3) array of
+points with NumPy, fetching the matrices (once) only if they are not
+passed, rather than making a GLU call (and three glGet calls) per point.
+"""
 from OpenGL.raw import GLU as _simple
 from OpenGL import GL
 from OpenGL.lazywrapper import lazy as _lazy
@@ -93,8 +98,85 @@ def gluUnProject4(
         raise ValueError( """Projection failed!""" )
     return objX.value, objY.value, objZ.value, objW.value
 
+def _matrices( model, proj, view ):
+    """Retrieve (model, proj, view) as numpy arrays, fetching those not given"""
+    import numpy
+    if model is None:
+        model = GL.glGetDoublev( GL.GL_MODELVIEW_MATRIX )
+    if proj is None:
+        proj = GL.glGetDoublev( GL.GL_PROJECTION_MATRIX )
+    if view is None:
+        view = GL.glGetIntegerv( GL.GL_VIEWPORT )
+    return (
+        numpy.asarray( model, 'd' ).reshape( (4,4) ),
+        numpy.asarray( proj, 'd' ).reshape( (4,4) ),
+        numpy.asarray( view, 'd' ).reshape( (4,) ),
+    )
+
+def _homogeneous( points ):
+    """Copy (N,3) points into an (N,4) double array with w = 1"""
+    import numpy
+    points = numpy.asarray( points, 'd' )
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError( """Expected an (N,3) array of points, got shape %s"""%( points.shape, ))
+    result = numpy.ones( (points.shape[0], 4), 'd' )
+    result[:,:3] = points
+    return result
+
+def gluProjectArray( points, model=None, proj=None, view=None ):
+    """Project an (N,3) array of object coordinates to window coordinates
+
+    Vectorised equivalent of calling gluProject for each point, the
+    model, projection and viewing matrices are fetched once if not
+    provided (matrices as returned by glGetDoublev, i.e. column-major).
+
+    returns (N,3) double array of (winX,winY,winZ), rows for which the
+    projection fails (clip w of 0) are NaN
+    """
+    import numpy
+    model, proj, view = _matrices( model, proj, view )
+    # matrices are column-major, so row-vectors multiply on the left
+    clip = numpy.dot( _homogeneous( points ), numpy.dot( model, proj ))
+    w = clip[:,3:]
+    with numpy.errstate( divide='ignore', invalid='ignore' ):
+        ndc = numpy.where( w != 0.0, clip[:,:3] / w, numpy.nan )
+    result = numpy.empty( ndc.shape, 'd' )
+    result[:,0] = view[0] + (ndc[:,0] + 1.0) * view[2] / 2.0
+    result[:,1] = view[1] + (ndc[:,1] + 1.0) * view[3] / 2.0
+    result[:,2] = (ndc[:,2] + 1.0) / 2.0
+    return result
+
+def gluUnProjectArray( points, model=None, proj=None, view=None ):
+    """Map an (N,3) array of window coordinates to object coordinates
+
+    Vectorised equivalent of calling gluUnProject for each point, the
+    model, projection and viewing matrices are fetched once if not
+    provided (matrices as returned by glGetDoublev, i.e. column-major).
+
+    raises ValueError if the combined matrix can not be inverted
+
+    returns (N,3) double array of (objX,objY,objZ), rows for which the
+    projection fails (w of 0) are NaN
+    """
+    import numpy
+    model, proj, view = _matrices( model, proj, view )
+    try:
+        inverse = numpy.linalg.inv( numpy.dot( model, proj ))
+    except numpy.linalg.LinAlgError:
+        raise ValueError( """Projection failed!""" )
+    ndc = _homogeneous( points )
+    ndc[:,0] = (ndc[:,0] - view[0]) / view[2] * 2.0 - 1.0
+    ndc[:,1] = (ndc[:,1] - view[1]) / view[3] * 2.0 - 1.0
+    ndc[:,2] = ndc[:,2] * 2.0 - 1.0
+    obj = numpy.dot( ndc, inverse )
+    w = obj[:,3:]
+    with numpy.errstate( divide='ignore', invalid='ignore' ):
+        return numpy.where( w != 0.0, obj[:,:3] / w, numpy.nan )
+
 __all__ = (
     'gluProject',
     'gluUnProject',
     'gluUnProject4',
+    'gluProjectArray',
+    'gluUnProjectArray',
 )
@@ -0,0 +1,506 @@
+"""Indexed quadric meshes as arrays, drawn from buffer objects and instanced
+
+gluSphere/gluCylinder/gluDisk and glutSolidSphere/glutSolidCone/
+glutSolidTorus regenerate and send every vertex through immediate mode
+on each call, so scenes with many small quadrics spend their frame
+there.  The generators here produce the same shapes once as indexed
+float32/uint32 arrays (memoised per parameter set), and MeshBuffer
+uploads a mesh once per context and draws it with a single
+glDrawElements, or all of its instances with one glDrawElementsInstanced:
+
+    from OpenGL.GLU import quadricmesh
+
+    sphere = quadricmesh.sphereMesh( 0.5, 16, 12 )   # cached QuadricMesh
+    buffer = quadricmesh.getBuffer( sphere )         # uploaded once
+    buffer.draw()                                    # like glutSolidSphere
+    # one draw call for every collectible, translations with a scale
+    buffer.drawInstanced( [(x, y, z, scale), ...], colors=[(r, g, b), ...] )
+
+Meshes are memoised (and buffers kept per context) for the MAX_MESHES
+most recently used parameter sets, older ones are discarded and their
+buffer objects deleted.  Sizes which change from frame to frame (e.g.
+glutSolidSphere( radius * fade, 10, 8 )) should use a unit mesh scaled
+at draw time, with glScalef before draw() or the instance scale of
+drawInstanced(), rather than generating and uploading a mesh per size:
+
+    unit = quadricmesh.getBuffer( quadricmesh.sphereMesh( 1.0, 10, 8 ))
+    unit.drawInstanced( [(x, y, z, radius * fade)] )
+
+Shapes follow the GLU/GLUT conventions: spheres are centred on the
+origin with their poles on the z axis, cylinders and cones extend from
+z=0 (base radius) to z=height (top radius), disks lie in the z=0 plane
+facing +z, tori (inner being the tube radius as for glutSolidTorus) lie
+around the z axis.  Triangles are counter-clockwise seen from outside,
+normals point outwards and texture coordinates are those of
+gluQuadricTexture (for tori, ring and side fractions).
+
+draw() uses the fixed-function vertex, normal and texture coordinate
+arrays unless passed generic attribute locations, from a vertex array
+object where available (GL 3.0 or ARB_vertex_array_object), otherwise
+binding the buffers and setting the pointers on each call.  drawInstanced() takes per-instance
+transforms and colours; without a program (locations) it uses a small
+built-in GLSL 1.20 program which transforms with the current
+modelview/projection matrices and lights with the direction of
+GL_LIGHT0.  Without GL 3.3 it falls back to a fixed-function loop of
+glMultMatrixf/glColor4f/draw().
+"""
+import math, collections
+import numpy
+from OpenGL import GL, contextdata, extensions
+
+__all__ = (
+    'QuadricMesh',
+    'sphereMesh',
+    'cylinderMesh',
+    'coneMesh',
+    'diskMesh',
+    'torusMesh',
+    'MeshBuffer',
+    'getBuffer',
+)
+
+MAX_MESHES = 256
+_MESHES = collections.OrderedDict()
+_BUFFERS_KEY = 'OpenGL.GLU.quadricmesh.buffers'
+_PROGRAM_KEY = 'OpenGL.GLU.quadricmesh.program'
+_INSTANCE_FLOATS = 20 # 4x4 matrix, rgba colour
+_CLIENT_STATES = {
+    'vertex': GL.GL_VERTEX_ARRAY,
+    'normal': GL.GL_NORMAL_ARRAY,
+    'texcoord': GL.GL_TEXTURE_COORD_ARRAY,
+}
+
+class QuadricMesh( object ):
+    """Read-only indexed triangle mesh
+
+    vertices, normals -- (N,3) float32 arrays
+    texcoords -- (N,2) float32 array
+    indices -- (T,3) uint32 array of counter-clockwise triangles
+    mode -- GL_TRIANGLES
+    key -- the (generator name, parameters) the mesh is memoised under
+    """
+    mode = GL.GL_TRIANGLES
+    def __init__( self, vertices, normals, texcoords, indices, key=None ):
+        self.vertices = numpy.ascontiguousarray( vertices, 'f' )
+        self.normals = numpy.ascontiguousarray( normals, 'f' )
+        self.texcoords = numpy.ascontiguousarray( texcoords, 'f' )
+        self.indices = numpy.ascontiguousarray( indices, numpy.uint32 )
+        self.key = key
+        for array in (self.vertices, self.normals, self.texcoords, self.indices):
+            array.flags.writeable = False
+    def interleaved( self ):
+        """Combine the vertex attributes into a single array
+
+        returns (data, layout): data is an (N,8) float32 array and layout
+        a list of (name, columns, byte offset) for 'vertex', 'normal' and
+        'texcoord', the stride is data.strides[0]
+        """
+        data = numpy.ascontiguousarray(
+            numpy.column_stack( (self.vertices, self.normals, self.texcoords) ), 'f',
+        )
+        return data, [('vertex', 3, 0), ('normal', 3, 12), ('texcoord', 2, 24)]
+
+def _memoised( function ):
+    """Cache the QuadricMesh produced for each set of (numeric) arguments"""
+    def memoised( *args ):
+        key = (function.__name__,) + tuple([ float( arg ) for arg in args ])
+        mesh = _MESHES.get( key )
+        if mesh is not None:
+            _MESHES.move_to_end( key )
+            return mesh
+        mesh = _MESHES[ key ] = QuadricMesh( *function( *args ), key=key )
+        while len( _MESHES ) > MAX_MESHES:
+            _MESHES.popitem( last=False )
+        return mesh
+    memoised.__name__ = function.__name__
+    memoised.__doc__ = function.__doc__
+    return memoised
+
+def _gridIndices( rows, columns ):
+    """Triangle indices of a rows x columns vertex grid, counter-clockwise
+    seen from the side the row x column normal points to"""
+    index = numpy.arange( rows * columns, dtype=numpy.uint32 ).reshape( (rows, columns) )
+    a = index[:-1,:-1].reshape( (-1,) )
+    b = index[1:,:-1].reshape( (-1,) )
+    c = index[1:,1:].reshape( (-1,) )
+    d = index[:-1,1:].reshape( (-1,) )
+    return numpy.column_stack( (a, b, c, a, c, d) ).reshape( (-1, 3) )
+
+def _triangles( vertices, rows, columns, flip=False ):
+    """Indices of a rows x columns grid, without the degenerate triangles"""
+    indices = _gridIndices( rows, columns )
+    if flip:
+        indices = indices[:,::-1]
+    corners = vertices[indices]
+    keep = ~(
+        numpy.all( corners[:,0] == corners[:,1], axis=1 ) |
+        numpy.all( corners[:,1] == corners[:,2], axis=1 ) |
+        numpy.all( corners[:,2] == corners[:,0], axis=1 )
+    )
+    return indices[keep]
+
+def _fractions( count ):
+    return numpy.linspace( 0.0, 1.0, int( count ) + 1 )
+
+def _sphere( radius, slices, stacks ):
+    rho = (math.pi * _fractions( stacks ))[:,None]
+    theta = (2.0 * math.pi * _fractions( slices ))[None,:]
+    # exactly 0 at the poles, so their triangles are found degenerate
+    sinRho = numpy.sin( rho )
+    sinRho[[0,-1]] = 0.0
+    normals = numpy.empty( (int( stacks ) + 1, int( slices ) + 1, 3), 'd' )
+    normals[...,0] = -numpy.sin( theta ) * sinRho
+    normals[...,1] = numpy.cos( theta ) * sinRho
+    normals[...,2] = numpy.cos( rho )
+    texcoords = numpy.empty( normals.shape[:2] + (2,), 'd' )
+    texcoords[...,0] = _fractions( slices )[None,:]
+    texcoords[...,1] = 1.0 - _fractions( stacks )[:,None]
+    vertices = (normals * radius).reshape( (-1, 3) )
+    return (
+        vertices, normals.reshape( (-1, 3) ), texcoords.reshape( (-1, 2) ),
+        _triangles( vertices, normals.shape[0], normals.shape[1] ),
+    )
+
+def _cylinder( base, top, height, slices, stacks ):
+    z = height * _fractions( stacks )[:,None]
+    radius = base + (top - base) * _fractions( stacks )[:,None]
+    theta = (2.0 * math.pi * _fractions( slices ))[None,:]
+    shape = (int( stacks ) + 1, int( slices ) + 1)
+    vertices = numpy.empty( shape + (3,), 'd' )
+    vertices[...,0] = radius * numpy.sin( theta )
+    vertices[...,1] = radius * numpy.cos( theta )
+    vertices[...,2] = z
+    slope = (base - top) / height if height else 0.0
+    normals = numpy.empty( shape + (3,), 'd' )
+    normals[...,0] = numpy.sin( theta )
+    normals[...,1] = numpy.cos( theta )
+    normals[...,2] = slope
+    normals /= math.sqrt( 1.0 + slope * slope )
+    texcoords = numpy.empty( shape + (2,), 'd' )
+    texcoords[...,0] = _fractions( slices )[None,:]
+    texcoords[...,1] = _fractions( stacks )[:,None]
+    vertices = vertices.reshape( (-1, 3) )
+    return (
+        vertices, normals.reshape( (-1, 3) ), texcoords.reshape( (-1, 2) ),
+        _triangles( vertices, shape[0], shape[1] ),
+    )
+
+def _disk( inner, outer, slices, loops, facing=1.0 ):
+    radius = (inner + (outer - inner) * _fractions( loops ))[:,None]
+    theta = (2.0 * math.pi * _fractions( slices ))[None,:]
+    shape = (int( loops ) + 1, int( slices ) + 1)
+    vertices = numpy.zeros( shape + (3,), 'd' )
+    vertices[...,0] = radius * numpy.sin( theta )
+    vertices[...,1] = radius * numpy.cos( theta )
+    normals = numpy.zeros( shape + (3,), 'd' )
+    normals[...,2] = facing
+    texcoords = vertices[...,:2] / (2.0 * outer) + 0.5
+    vertices = vertices.reshape( (-1, 3) )
+    return (
+        vertices, normals.reshape( (-1, 3) ), texcoords.reshape( (-1, 2) ),
+        _triangles( vertices, shape[0], shape[1], flip=facing > 0 ),
+    )
+
+def _torus( inner, outer, sides, rings ):
+    theta = (2.0 * math.pi * _fractions( rings ))[:,None]
+    phi = (2.0 * math.pi * _fractions( sides ))[None,:]
+    shape = (int( rings ) + 1, int( sides ) + 1)
+    normals = numpy.empty( shape + (3,), 'd' )
+    normals[...,0] = numpy.cos( phi ) * numpy.cos( theta )
+    normals[...,1] = numpy.cos( phi ) * numpy.sin( theta )
+    normals[...,2] = numpy.sin( phi )
+    vertices = normals * inner
+    vertices[...,0] += outer * numpy.cos( theta )
+    vertices[...,1] += outer * numpy.sin( theta )
+    texcoords = numpy.empty( shape + (2,), 'd' )
+    texcoords[...,0] = _fractions( rings )[:,None]
+    texcoords[...,1] = _fractions( sides )[None,:]
+    vertices = vertices.reshape( (-1, 3) )
+    return (
+        vertices, normals.reshape( (-1, 3) ), texcoords.reshape( (-1, 2) ),
+        _triangles( vertices, shape[0], shape[1] ),
+    )
+
+@_memoised
+def sphereMesh( radius, slices, stacks ):
+    """Sphere as drawn by gluSphere/glutSolidSphere"""
+    return _sphere( radius, slices, stacks )
+
+@_memoised
+def cylinderMesh( base, top, height, slices, stacks ):
+    """Open (uncapped) cylinder or cone frustum as drawn by gluCylinder"""
+    return _cylinder( base, top, height, slices, stacks )
+
+@_memoised
+def coneMesh( base, height, slices, stacks ):
+    """Cone closed at its base as drawn by glutSolidCone"""
+    side = _cylinder( base, 0.0, height, slices, stacks )
+    cap = _disk( 0.0, base, slices, 1, facing=-1.0 )
+    return (
+        numpy.concatenate( (side[0], cap[0]) ),
+        numpy.concatenate( (side[1], cap[1]) ),
+        numpy.concatenate( (side[2], cap[2]) ),
+        numpy.concatenate( (side[3], cap[3] + len( side[0] )) ),
+    )
+
+@_memoised
+def diskMesh( inner, outer, slices, loops ):
+    """Disk (annulus if inner > 0) facing +z as drawn by gluDisk"""
+    return _disk( inner, outer, slices, loops )
+
+@_memoised
+def torusMesh( inner, outer, sides, rings ):
+    """Torus as drawn by glutSolidTorus (inner is the tube radius)"""
+    return _torus( inner, outer, sides, rings )
+
+def _instanceData( transforms, colors ):
+    """Pack per-instance matrices and colours into an (N,20) float32 array
+
+    transforms -- (N,3) translations, (N,4) translations with uniform
+        scales, or (N,4,4)/(N,16) matrices laid out as glGetFloatv
+        returns them (translation in the last row)
+    colors -- None (white), or (N,3)/(N,4) colours
+    """
+    transforms = numpy.asarray( transforms, 'f' )
+    count = len( transforms )
+    data = numpy.zeros( (count, _INSTANCE_FLOATS), 'f' )
+    if transforms.ndim == 3 or (transforms.ndim == 2 and transforms.shape[1] == 16):
+        data[:,:16] = transforms.reshape( (count, 16) )
+    elif transforms.ndim == 2 and transforms.shape[1] in (3, 4):
+        scale = transforms[:,3] if transforms.shape[1] == 4 else 1.0
+        data[:,0] = data[:,5] = data[:,10] = scale
+        data[:,12:15] = transforms[:,:3]
+        data[:,15] = 1.0
+    else:
+        raise ValueError( """Need (N,3), (N,4), (N,16) or (N,4,4) transforms, got shape %s"""%( transforms.shape, ))
+    if colors is None:
+        data[:,16:] = 1.0
+    else:
+        colors = numpy.asarray( colors, 'f' ).reshape( (count, -1) )
+        data[:,16:16+colors.shape[1]] = colors
+        if colors.shape[1] == 3:
+            data[:,19] = 1.0
+    return data
+
+_VERTEX_SHADER = """#version 120
+attribute vec3 position;
+attribute vec3 normal;
+attribute vec4 instanceColor;
+attribute mat4 instanceMatrix;
+varying vec4 color;
+varying vec3 eyeNormal;
+void main() {
+    gl_Position = gl_ModelViewProjectionMatrix * (instanceMatrix * vec4( position, 1.0 ));
+    eyeNormal = gl_NormalMatrix * (mat3( instanceMatrix ) * normal);
+    color = instanceColor;
+}
+"""
+_FRAGMENT_SHADER = """#version 120
+varying vec4 color;
+varying vec3 eyeNormal;
+void main() {
+    vec3 light = normalize( gl_LightSource[0].position.xyz );
+    float diffuse = max( dot( normalize( eyeNormal ), light ), 0.0 );
+    gl_FragColor = vec4( color.rgb * (0.3 + 0.7 * diffuse), color.a );
+}
+"""
+
+def _defaultProgram():
+    """Retrieve (compiling if necessary) the built-in program and its locations"""
+    stored = contextdata.getValue( _PROGRAM_KEY )
+    if stored is None:
+        from OpenGL.GL import shaders
+        program = shaders.compileProgram(
+            shaders.compileShader( _VERTEX_SHADER, GL.GL_VERTEX_SHADER ),
+            shaders.compileShader( _FRAGMENT_SHADER, GL.GL_FRAGMENT_SHADER ),
+        )
+        locations = {
+            'vertex': GL.glGetAttribLocation( program, 'position' ),
+            'normal': GL.glGetAttribLocation( program, 'normal' ),
+            'color': GL.glGetAttribLocation( program, 'instanceColor' ),
+            'matrix': GL.glGetAttribLocation( program, 'instanceMatrix' ),
+        }
+        stored = (program, dict([ (k, v) for (k, v) in locations.items() if v >= 0 ]))
+        contextdata.setValue( _PROGRAM_KEY, stored )
+    return stored
+
+class MeshBuffer( object ):
+    """A QuadricMesh uploaded into the buffer objects of the current context
+
+    Create with getBuffer( mesh ) so each mesh is uploaded once per
+    context, all methods require that context to be current.
+    """
+    def __init__( self, mesh ):
+        self.mesh = mesh
+        self.count = mesh.indices.size
+        data, self.layout = mesh.interleaved()
+        self.stride = data.strides[0]
+        self.bytes = data.nbytes + mesh.indices.nbytes
+        self.vertexBuffer, self.elementBuffer, self.instanceBuffer = [
+            int( buffer ) for buffer in GL.glGenBuffers( 3 )
+        ]
+        GL.glBindBuffer( GL.GL_ARRAY_BUFFER, self.vertexBuffer )
+        GL.glBufferData( GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_STATIC_DRAW )
+        GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+        GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, self.elementBuffer )
+        GL.glBufferData( GL.GL_ELEMENT_ARRAY_BUFFER, mesh.indices.nbytes, mesh.indices, GL.GL_STATIC_DRAW )
+        GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, 0 )
+        self.vaos = {}
+        self.vertexArrays = (
+            extensions.hasGLExtension( 'GL_VERSION_GL_3_0' ) or
+            extensions.hasGLExtension( 'GL_ARB_vertex_array_object' )
+        )
+        self.instanced = extensions.hasGLExtension( 'GL_VERSION_GL_3_3' )
+    def _enableArrays( self, locations ):
+        """Enable and point the vertex attributes at the vertex buffer"""
+        GL.glBindBuffer( GL.GL_ARRAY_BUFFER, self.vertexBuffer )
+        for name, width, offset in self.layout:
+            pointer = GL.GLvoidp( offset )
+            if locations is not None:
+                if name in locations:
+                    GL.glEnableVertexAttribArray( locations[name] )
+                    GL.glVertexAttribPointer( locations[name], width, GL.GL_FLOAT, GL.GL_FALSE, self.stride, pointer )
+                continue
+            GL.glEnableClientState( _CLIENT_STATES[name] )
+            if name == 'vertex':
+                GL.glVertexPointer( width, GL.GL_FLOAT, self.stride, pointer )
+            elif name == 'normal':
+                GL.glNormalPointer( GL.GL_FLOAT, self.stride, pointer )
+            else:
+                GL.glTexCoordPointer( width, GL.GL_FLOAT, self.stride, pointer )
+    def _disableArrays( self, locations ):
+        """Disable the vertex attributes enabled by _enableArrays"""
+        for name, width, offset in self.layout:
+            if locations is None:
+                GL.glDisableClientState( _CLIENT_STATES[name] )
+            elif name in locations:
+                GL.glDisableVertexAttribArray( locations[name] )
+    def _bind( self, locations ):
+        """Set up the vertex and element arrays for glDrawElements"""
+        if self.vertexArrays:
+            GL.glBindVertexArray( self._vao( locations ))
+        else:
+            self._enableArrays( locations )
+            GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, self.elementBuffer )
+    def _unbind( self, locations ):
+        """Undo _bind"""
+        if self.vertexArrays:
+            GL.glBindVertexArray( 0 )
+        else:
+            self._disableArrays( locations )
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+            GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, 0 )
+    def _vao( self, locations, instanced=False ):
+        """Retrieve (creating if necessary) the vertex array object for locations"""
+        key = (instanced, None if locations is None else tuple( sorted( locations.items() )))
+        vao = self.vaos.get( key )
+        if vao is not None:
+            return vao
+        vao = self.vaos[ key ] = int( GL.glGenVertexArrays( 1 ))
+        GL.glBindVertexArray( vao )
+        self._enableArrays( locations )
+        if instanced:
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, self.instanceBuffer )
+            stride = _INSTANCE_FLOATS * 4
+            if 'matrix' in locations:
+                for column in range( 4 ):
+                    location = locations['matrix'] + column
+                    GL.glEnableVertexAttribArray( location )
+                    GL.glVertexAttribPointer( location, 4, GL.GL_FLOAT, GL.GL_FALSE, stride, GL.GLvoidp( column * 16 ))
+                    GL.glVertexAttribDivisor( location, 1 )
+            if 'color' in locations:
+                GL.glEnableVertexAttribArray( locations['color'] )
+                GL.glVertexAttribPointer( locations['color'], 4, GL.GL_FLOAT, GL.GL_FALSE, stride, GL.GLvoidp( 64 ))
+                GL.glVertexAttribDivisor( locations['color'], 1 )
+        GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, self.elementBuffer )
+        GL.glBindVertexArray( 0 )
+        GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+        return vao
+    def draw( self, locations=None ):
+        """Draw the mesh once with the current matrices
+
+        locations -- optional mapping from 'vertex', 'normal' and
+            'texcoord' to generic vertex attribute locations, if not
+            provided the fixed-function arrays are used
+        """
+        self._bind( locations )
+        GL.glDrawElements( GL.GL_TRIANGLES, self.count, GL.GL_UNSIGNED_INT, None )
+        self._unbind( locations )
+    def drawInstanced( self, transforms, colors=None, locations=None ):
+        """Draw one instance of the mesh per transform in a single call
+
+        transforms -- (N,3) translations, (N,4) translations with uniform
+            scales, or (N,4,4)/(N,16) model matrices laid out as
+            glGetFloatv returns them, applied before the current matrices
+        colors -- optional (N,3)/(N,4) per-instance colours (default white)
+        locations -- mapping as for draw() plus 'matrix' (the first of
+            the 4 locations of a mat4 attribute) and 'color' for the
+            per-instance attributes of the current program, if None the
+            built-in program is used
+        """
+        data = _instanceData( transforms, colors )
+        if not len( data ):
+            return
+        if not self.instanced:
+            self._drawLoop( data, locations )
+            return
+        previous = None
+        if locations is None:
+            previous = GL.glGetIntegerv( GL.GL_CURRENT_PROGRAM )
+            program, locations = _defaultProgram()
+            GL.glUseProgram( program )
+        try:
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, self.instanceBuffer )
+            GL.glBufferData( GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_STREAM_DRAW )
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+            GL.glBindVertexArray( self._vao( locations, instanced=True ))
+            GL.glDrawElementsInstanced( GL.GL_TRIANGLES, self.count, GL.GL_UNSIGNED_INT, None, len( data ))
+            GL.glBindVertexArray( 0 )
+        finally:
+            if previous is not None:
+                GL.glUseProgram( int( previous ))
+    def _drawLoop( self, data, locations ):
+        """Draw the instances one at a time with the fixed-function matrix stack"""
+        if locations is not None:
+            locations = dict([
+                (k, v) for (k, v) in locations.items() if k not in ('matrix', 'color')
+            ])
+        self._bind( locations )
+        for instance in data:
+            GL.glPushMatrix()
+            GL.glMultMatrixf( instance[:16] )
+            GL.glColor4f( *instance[16:] )
+            GL.glDrawElements( GL.GL_TRIANGLES, self.count, GL.GL_UNSIGNED_INT, None )
+            GL.glPopMatrix()
+        self._unbind( locations )
+    def delete( self ):
+        """Delete the buffer and vertex array objects"""
+        if self.vaos:
+            GL.glDeleteVertexArrays( len( self.vaos ), list( self.vaos.values() ))
+            self.vaos = {}
+        GL.glDeleteBuffers( 3, [self.vertexBuffer, self.elementBuffer, self.instanceBuffer] )
+
+def getBuffer( mesh, context=None ):
+    """Retrieve (uploading if necessary) the MeshBuffer of mesh for the context
+
+    Only the MAX_MESHES most recently retrieved buffers are kept for each
+    context, the buffer objects of older ones are deleted (so the context
+    must be current), retrieve buffers where they are drawn rather than
+    holding on to them while many other meshes are uploaded.
+    """
+    buffers = contextdata.getValue( _BUFFERS_KEY, context=context )
+    if buffers is None:
+        buffers = collections.OrderedDict()
+        contextdata.setValue( _BUFFERS_KEY, buffers, context=context )
+    key = mesh.key if mesh.key is not None else id( mesh )
+    buffer = buffers.get( key )
+    if buffer is None or buffer.mesh is not mesh and mesh.key is None:
+        if buffer is not None:
+            buffer.delete()
+        buffer = buffers[ key ] = MeshBuffer( mesh )
+        while len( buffers ) > MAX_MESHES:
+            _, oldest = buffers.popitem( last=False )
+            oldest.delete()
+    else:
+        buffers.move_to_end( key )
+    return buffer
@@ -1,4 +1,10 @@
-"""Wrapper/Implementation of the GLU tessellator objects for PyOpenGL"""
+"""Wrapper/Implementation of the GLU tessellator objects for PyOpenGL
+
+tessellate( contours, winding_rule ) is a one-shot alternative to
+driving a GLUtesselator through Python callbacks, returning the
+triangles as NumPy vertex and index arrays (it is not exported by
+"from OpenGL.GLU import *", import it from OpenGL.GLU.tess).
+"""
 from OpenGL.raw import GLU as _simple
 from OpenGL.raw.GL.VERSION import GL_1_1
 from OpenGL.platform import createBaseFunction
@@ -9,6 +15,7 @@ from OpenGL.platform import PLATFORM
 GLU = PLATFORM.GLU
 from OpenGL.lazywrapper import lazy as _lazy
 import ctypes
+import threading
 
 
 class GLUtesselator(glustruct.GLUStruct, _simple.GLUtesselator):
@@ -258,6 +265,157 @@ gluTessVertexBase = wrapper.wrapper(_simple.gluTessVertex).setInputArraySize(
     3,
 )
 
+class _Collector(object):
+    """Tessellator and callbacks used by tessellate(), one per thread
+
+    The callbacks only record vertex indices (passed to GLU as the
+    vertex data pointers, offset by one so that index 0 is not NULL)
+    and the positions of combined vertices, no Python objects are
+    registered with noteObject.  The edge-flag callback makes GLU
+    produce only independent triangles, the begin callback records where
+    each boundary loop starts when only boundaries are requested.
+    """
+
+    def __init__(self):
+        types = GLUtesselator.CALLBACK_TYPES
+        self.tess = gluNewTess()
+        self.indices = []
+        self.combined = []
+        self.starts = []
+        self.count = 0
+        self.errors = []
+        self.callbacks = {
+            _simple.GLU_TESS_BEGIN: types[_simple.GLU_TESS_BEGIN](self.begin),
+            _simple.GLU_TESS_EDGE_FLAG: types[_simple.GLU_TESS_EDGE_FLAG](self.edgeFlag),
+            _simple.GLU_TESS_VERTEX: types[_simple.GLU_TESS_VERTEX](self.vertex),
+            _simple.GLU_TESS_COMBINE: types[_simple.GLU_TESS_COMBINE](self.combine),
+            _simple.GLU_TESS_ERROR: types[_simple.GLU_TESS_ERROR](self.error),
+        }
+        registrars = GLUtesselator.CALLBACK_FUNCTION_REGISTRARS
+        for which, callback in self.callbacks.items():
+            registrars[which](self.tess, which, callback)
+        self.tessVertex = GLUtesselator.FUNCTION_TYPE(
+            None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p
+        )(('gluTessVertex', GLU))
+
+    def begin(self, mode):
+        self.starts.append(len(self.indices))
+
+    def edgeFlag(self, flag):
+        pass
+
+    def vertex(self, data):
+        self.indices.append(data - 1)
+
+    def combine(self, coords, vertex_data, weight, outData):
+        self.combined.append((coords[0], coords[1], coords[2]))
+        outData[0] = self.count + len(self.combined)
+
+    def error(self, code):
+        self.errors.append(code)
+
+    def __del__(self):
+        try:
+            _simple.gluDeleteTess(self.tess)
+        except Exception:
+            pass
+
+
+_collectors = threading.local()
+
+
+def tessellate(
+    contours, winding_rule=_simple.GLU_TESS_WINDING_ODD, normal=None, boundary_only=False
+):
+    """Tessellate a polygon into triangles (or its boundary) in one call
+
+    contours -- sequence of contours, each an (N,2) or (N,3) array-like
+        of vertex positions
+    winding_rule -- GLU_TESS_WINDING_* rule deciding which regions are
+        inside the polygon
+    normal -- optional (x,y,z) normal passed to gluTessNormal, by default
+        GLU computes one (which decides the sign of winding numbers)
+    boundary_only -- if true, produce the edges of the boundary loops
+        separating the interior from the exterior (GLU_TESS_BOUNDARY_ONLY)
+        rather than triangles
+
+    GLU does the tessellation (so the results, including the handling of
+    intersecting contours, are those of GLU for the same rule), but with
+    a collector that records vertex indices in place of per-vertex
+    Python callbacks and objects.
+
+    raises GLUError if GLU reports a tessellation error
+
+    returns (vertices, indices): vertices is a float64 array of the input
+    vertices in order followed by any created at intersections, with 2
+    columns if all contours were 2D, otherwise 3; indices is an (T,3)
+    uint32 array of counter-clockwise (as seen from the normal)
+    triangles indexing vertices, or with boundary_only an (E,2) uint32
+    array of the edges of the (counter-clockwise) boundary loops, i.e.
+    GL_LINES indices
+    """
+    import numpy
+    from OpenGL import error
+
+    contours = [numpy.asarray(contour, 'd') for contour in contours]
+    columns = 2
+    for contour in contours:
+        if contour.ndim != 2 or contour.shape[1] not in (2, 3):
+            raise ValueError(
+                """Contours must be (N,2) or (N,3) arrays, got shape %s""" % (contour.shape,)
+            )
+        columns = max((columns, contour.shape[1]))
+    count = sum(len(contour) for contour in contours)
+    vertices = numpy.zeros((count, 3), 'd')
+    start = 0
+    for contour in contours:
+        vertices[start : start + len(contour), : contour.shape[1]] = contour
+        start += len(contour)
+    collector = getattr(_collectors, 'collector', None)
+    if collector is None:
+        collector = _collectors.collector = _Collector()
+    collector.indices, collector.combined, collector.errors = [], [], []
+    collector.starts = []
+    collector.count = count
+    tess = collector.tess
+    tessVertex = collector.tessVertex
+    _simple.gluTessProperty(tess, _simple.GLU_TESS_WINDING_RULE, winding_rule)
+    _simple.gluTessProperty(tess, _simple.GLU_TESS_BOUNDARY_ONLY, bool(boundary_only))
+    if normal is None:
+        _simple.gluTessNormal(tess, 0.0, 0.0, 0.0)
+    else:
+        _simple.gluTessNormal(tess, *normal)
+    address = ctypes.addressof(tess)
+    base = vertices.ctypes.data
+    _simple.gluTessBeginPolygon(tess, None)
+    index = 0
+    for contour in contours:
+        _simple.gluTessBeginContour(tess)
+        for i in range(index, index + len(contour)):
+            tessVertex(address, base + i * 24, i + 1)
+        _simple.gluTessEndContour(tess)
+        index += len(contour)
+    _simple.gluTessEndPolygon(tess)
+    if collector.errors:
+        raise error.GLUError(err=collector.errors[0])
+    if collector.combined:
+        vertices = numpy.concatenate(
+            (vertices, numpy.array(collector.combined, 'd').reshape((-1, 3)))
+        )
+    if boundary_only:
+        loops = numpy.array(collector.indices, numpy.uint32)
+        starts = numpy.array(collector.starts, numpy.intp)
+        # each vertex joins the next one in its loop, the last the first
+        following = numpy.arange(1, len(loops) + 1)
+        if len(starts):
+            following[numpy.append(starts[1:], len(loops)) - 1] = starts
+        indices = numpy.column_stack((loops, loops[following])).reshape((-1, 2))
+    else:
+        indices = numpy.array(collector.indices, numpy.uint32).reshape((-1, 3))
+    collector.indices = collector.combined = collector.starts = []
+    return vertices[:, :columns], indices
+
+
 __all__ = (
     'gluNewTess',
     'gluGetTessProperty',
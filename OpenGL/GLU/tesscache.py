@@ -0,0 +1,262 @@
+"""Cache of GLU tessellation results keyed by the contours' contents
+
+Static outlines (HUD frames, cards, map shapes...) drawn through
+gluTessBeginPolygon/gluTessVertex are re-tessellated, with a Python
+callback per output vertex, every time they are drawn.  A
+TessellationCache hashes the contours together with the winding rule,
+boundary-only flag and normal, tessellates with
+OpenGL.GLU.tess.tessellate only the first time it sees them, and keeps
+the result as indexed NumPy arrays which draw() uploads into buffer
+objects and replays with a single glDrawElements:
+
+    from OpenGL.GLU.tesscache import drawPolygon, getCache
+
+    # each frame
+    drawPolygon( [outline, hole], GLU_TESS_WINDING_ODD )
+    drawPolygon( [outline, hole], boundary_only=True ) # its boundary
+
+    # or, to work with the arrays
+    entry = getCache().get( contours, GLU_TESS_WINDING_NONZERO )
+    entry.vertices, entry.indices, entry.mode
+
+The key is a digest of the contour coordinates (as doubles) and shapes,
+so equal contours hit the cache whatever sequence type they come in.
+Hashing is linear in the number of vertices, but far cheaper than
+tessellating them.  Vertices are stored as float32, indices as uint32.
+
+Each context has its own TessellationCache (stored via
+OpenGL.contextdata), getCache() without a current context returns a
+process-wide cache which only holds arrays.  Caches hold
+least-recently-used entries up to a byte budget (the arrays plus any
+buffer objects), evicting (and deleting the buffers of) the oldest
+entries beyond it.  Buffers are deleted on eviction, so use a cache only
+with its own context current.
+
+draw() leaves GL_ARRAY_BUFFER and GL_ELEMENT_ARRAY_BUFFER bound to 0
+and the vertex array (or the generic attribute at location) enabled.
+On core profiles a vertex array object must be bound and a location
+passed; the element buffer binding is recorded in that vertex array
+object.
+"""
+import ctypes, collections, hashlib
+import numpy
+from OpenGL import GL, contextdata, extensions, platform
+from OpenGL.raw.GLU import GLU_TESS_WINDING_ODD
+from OpenGL.GLU.tess import tessellate
+
+__all__ = (
+    'TessellationCache',
+    'CachedTessellation',
+    'getCache',
+    'drawPolygon',
+)
+
+DEFAULT_BUDGET = 16 * 1024 * 1024
+_CACHE_KEY = 'OpenGL.GLU.tesscache'
+_SHARED = []
+
+def contourKey( contours, winding_rule=GLU_TESS_WINDING_ODD, normal=None, boundary_only=False ):
+    """Calculate the cache key for the arguments of tessellate()
+
+    returns (key, contours) where contours are the contours converted to
+    C-contiguous double arrays (to pass on to tessellate on a miss)
+    """
+    digest = hashlib.blake2b( digest_size=16 )
+    arrays = []
+    for contour in contours:
+        contour = numpy.ascontiguousarray( contour, 'd' )
+        digest.update( repr( contour.shape ).encode( 'ascii' ))
+        digest.update( contour.data )
+        arrays.append( contour )
+    if normal is not None:
+        normal = tuple([ float( x ) for x in normal ])
+    return (digest.digest(), int( winding_rule ), normal, bool( boundary_only )), arrays
+
+class CachedTessellation( object ):
+    """Result of a tessellation held by a TessellationCache
+
+    vertices -- (N,2) or (N,3) float32 array
+    indices -- (T,3) (triangles) or (E,2) (boundary edges) uint32 array
+    mode -- GL_TRIANGLES or GL_LINES, how to draw indices
+    buffers -- (vertex buffer, element buffer) once uploaded, otherwise None
+    bytes -- storage used by the arrays and buffers
+    """
+    def __init__( self, vertices, indices, mode ):
+        self.vertices = numpy.ascontiguousarray( vertices, 'f' )
+        self.indices = numpy.ascontiguousarray( indices, numpy.uint32 )
+        self.mode = mode
+        self.count = self.indices.size
+        self.buffers = None
+        self.bytes = self.vertices.nbytes + self.indices.nbytes
+    def upload( self ):
+        """Copy the arrays into new buffer objects, returns bytes added"""
+        buffers = [ int( buffer ) for buffer in GL.glGenBuffers( 2 ) ]
+        try:
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, buffers[0] )
+            GL.glBufferData( GL.GL_ARRAY_BUFFER, self.vertices.nbytes, self.vertices, GL.GL_STATIC_DRAW )
+            GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, buffers[1] )
+            GL.glBufferData( GL.GL_ELEMENT_ARRAY_BUFFER, self.indices.nbytes, self.indices, GL.GL_STATIC_DRAW )
+        finally:
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+            GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, 0 )
+        self.buffers = tuple( buffers )
+        added = self.vertices.nbytes + self.indices.nbytes
+        self.bytes += added
+        return added
+    def draw( self, location=None ):
+        """Draw the stored primitives from the buffers (if uploaded) or the arrays
+
+        location -- generic vertex attribute location for the positions,
+            if None the fixed-function vertex array is used
+        """
+        if not self.count:
+            return
+        size = self.vertices.shape[1]
+        if self.buffers is not None:
+            GL.glBindBuffer( GL.GL_ARRAY_BUFFER, self.buffers[0] )
+            GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, self.buffers[1] )
+            vertices = indices = ctypes.c_void_p( 0 )
+        else:
+            vertices = ctypes.c_void_p( self.vertices.ctypes.data )
+            indices = ctypes.c_void_p( self.indices.ctypes.data )
+        try:
+            if location is None:
+                GL.glEnableClientState( GL.GL_VERTEX_ARRAY )
+                GL.glVertexPointer( size, GL.GL_FLOAT, 0, vertices )
+            else:
+                GL.glEnableVertexAttribArray( location )
+                GL.glVertexAttribPointer( location, size, GL.GL_FLOAT, GL.GL_FALSE, 0, vertices )
+            GL.glDrawElements( self.mode, self.count, GL.GL_UNSIGNED_INT, indices )
+        finally:
+            if self.buffers is not None:
+                GL.glBindBuffer( GL.GL_ARRAY_BUFFER, 0 )
+                GL.glBindBuffer( GL.GL_ELEMENT_ARRAY_BUFFER, 0 )
+    def delete( self ):
+        """Delete the buffer objects (requires their context to be current)"""
+        if self.buffers is not None:
+            GL.glDeleteBuffers( 2, self.buffers )
+            self.buffers = None
+            self.bytes = self.vertices.nbytes + self.indices.nbytes
+
+class TessellationCache( object ):
+    """Least-recently-used store of tessellation results
+
+    budget -- maximum total bytes (arrays and buffer objects) to hold,
+        least-recently used entries are deleted when it is exceeded
+
+    Counters:
+
+        hits -- lookups answered from the cache
+        misses -- lookups which had to tessellate
+        evictions -- entries deleted to stay within the budget
+        bytes -- current total bytes held
+    """
+    def __init__( self, budget=DEFAULT_BUDGET ):
+        self.budget = budget
+        self.entries = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._buffered = None
+    def __len__( self ):
+        return len( self.entries )
+    @property
+    def buffered( self ):
+        """Whether the current context supports buffer objects"""
+        if self._buffered is None:
+            self._buffered = bool(
+                extensions.hasGLExtension( 'GL_VERSION_GL_1_5' ) or
+                extensions.hasGLExtension( 'GL_ARB_vertex_buffer_object' )
+            )
+        return self._buffered
+    def get( self, contours, winding_rule=GLU_TESS_WINDING_ODD, normal=None, boundary_only=False ):
+        """Retrieve (tessellating on a miss) the CachedTessellation of the polygon
+
+        Arguments are as for OpenGL.GLU.tess.tessellate, which raises
+        GLUError for polygons GLU cannot tessellate (those are not cached).
+        """
+        key, arrays = contourKey( contours, winding_rule, normal, boundary_only )
+        entry = self.entries.get( key )
+        if entry is not None:
+            self.entries.move_to_end( key )
+            self.hits += 1
+            return entry
+        self.misses += 1
+        vertices, indices = tessellate(
+            arrays, winding_rule, normal=normal, boundary_only=boundary_only,
+        )
+        entry = CachedTessellation(
+            vertices, indices, GL.GL_LINES if boundary_only else GL.GL_TRIANGLES,
+        )
+        return self.store( key, entry )
+    def store( self, key, entry ):
+        """Add entry for key, evicting least-recently-used entries over budget"""
+        previous = self.entries.pop( key, None )
+        if previous is not None:
+            self.bytes -= previous.bytes
+            previous.delete()
+        self.entries[ key ] = entry
+        self.bytes += entry.bytes
+        self._evict()
+        return entry
+    def _evict( self ):
+        while self.bytes > self.budget and len( self.entries ) > 1:
+            _, oldest = self.entries.popitem( last=False )
+            self.bytes -= oldest.bytes
+            oldest.delete()
+            self.evictions += 1
+    def draw( self, contours, winding_rule=GLU_TESS_WINDING_ODD, normal=None, boundary_only=False, location=None ):
+        """Draw the polygon (or its boundary), tessellating and uploading only once
+
+        location -- see CachedTessellation.draw
+
+        returns the CachedTessellation drawn
+        """
+        entry = self.get( contours, winding_rule, normal, boundary_only )
+        if entry.buffers is None and entry.count and self.buffered:
+            self.bytes += entry.upload()
+            self._evict()
+        entry.draw( location )
+        return entry
+    def clear( self ):
+        """Delete all entries (requires the context to be current if buffers were created)"""
+        while self.entries:
+            _, entry = self.entries.popitem()
+            entry.delete()
+        self.bytes = 0
+    def stats( self ):
+        """Return a dictionary of the cache counters"""
+        return {
+            'entries': len( self.entries ),
+            'bytes': self.bytes,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+def getCache( context=None ):
+    """Retrieve (creating if necessary) the TessellationCache for the context
+
+    Without a context (and none current) returns the process-wide cache,
+    whose entries are never uploaded.
+    """
+    if context is None and not platform.GetCurrentContext():
+        if not _SHARED:
+            shared = TessellationCache()
+            shared._buffered = False
+            _SHARED.append( shared )
+        return _SHARED[0]
+    cache = contextdata.getValue( _CACHE_KEY, context=context )
+    if cache is None:
+        cache = TessellationCache()
+        contextdata.setValue( _CACHE_KEY, cache, context=context )
+    return cache
+
+def drawPolygon( contours, winding_rule=GLU_TESS_WINDING_ODD, normal=None, boundary_only=False, location=None ):
+    """Draw the polygon through the current context's TessellationCache
+
+    See TessellationCache.draw
+    """
+    return getCache().draw( contours, winding_rule, normal, boundary_only, location )
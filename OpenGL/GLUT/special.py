@@ -350,3 +350,9 @@ def glutDestroyWindow( window ):
         _log.error( """Error attempting to clean up context data for GLUT window %s: %s""", window, result )
     return _base_glutDestroyWindow( window )
 glutDestroyWindow.wrappedOperation = _simple.glutDestroyWindow
+
+def glutSwapBuffers():
+    """Swap buffers, first checking GL errors deferred by error.DEFERRED mode"""
+    error.checkDeferred()
+    return _simple.glutSwapBuffers()
+glutSwapBuffers.wrappedOperation = _simple.glutSwapBuffers
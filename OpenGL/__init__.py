@@ -164,6 +164,40 @@ import occurs the flags should no longer be changed.
         operations.
 
         Default: True
+
+    GENERATED_WRAPPERS -- if True, and OpenGL_accelerate is not in use,
+        finalise each wrapper.Wrapper by generating and compiling a
+        straight-line Python function specialised for that wrapper's
+        converters, rather than selecting one of the generic nested
+        closures.  Use Wrapper.generatedSource() to see the code
+        produced for a given function.
+
+        Default: True
+
+    ARRAY_FAST_PATH -- if True, and OpenGL_accelerate is not in use,
+        array arguments are converted by per-call-site converters which
+        remember the last array already in final form (C-contiguous and
+        of the required type) and pass a cached data-pointer to ctypes
+        when that same array is passed again.
+
+        Default: True
+
+    LAZY_IMPORTS -- if True (and running on Python 3.7 or later),
+        OpenGL.GL only imports the modules which define its functions
+        and constants when one of their names is first accessed, using
+        the generated index in OpenGL.GL._symbols.  Set to False to
+        import everything along with OpenGL.GL, as in earlier releases.
+
+        Default: True
+
+    COMPACT_CONSTANTS -- if True, integer constants in the raw modules
+        (and so OpenGL.GL etc.) are plain ints rather than Constant
+        instances which display their names, which reduces the memory
+        used and time taken by importing them.  The names of plain
+        constants are still available from OpenGL.constant.names() and
+        are used when formatting GLError.
+
+        Default: False
     
     MODULE_ANNOTATIONS -- if True, attempt to annotate alternates() and 
         constants to track in which module they are defined (only useful 
@@ -203,6 +237,10 @@ FORWARD_COMPATIBLE_ONLY = False
 SIZE_1_ARRAY_UNPACK = True
 USE_ACCELERATE = environ_key("USE_ACCELERATE", True)
 CONTEXT_CHECKING = environ_key("CONTEXT_CHECKING", False)
+GENERATED_WRAPPERS = environ_key("GENERATED_WRAPPERS", True)
+ARRAY_FAST_PATH = environ_key("ARRAY_FAST_PATH", True)
+LAZY_IMPORTS = environ_key("LAZY_IMPORTS", True)
+COMPACT_CONSTANTS = environ_key("COMPACT_CONSTANTS", False)
 
 FULL_LOGGING = environ_key("FULL_LOGGING", False)
 ALLOW_NUMPY_SCALARS = environ_key("ALLOW_NUMPY_SCALARS", False)
@@ -10,6 +10,10 @@ from OpenGL import (
     SIZE_1_ARRAY_UNPACK,
     USE_ACCELERATE,
     CONTEXT_CHECKING,
+    GENERATED_WRAPPERS,
+    ARRAY_FAST_PATH,
+    LAZY_IMPORTS,
+    COMPACT_CONSTANTS,
 
     FULL_LOGGING,
     ALLOW_NUMPY_SCALARS,
@@ -0,0 +1,347 @@
+"""Sub-allocation of many small VBO-like slices from a few large buffers
+
+Basic usage:
+
+    meshes = arena.BufferArena()
+    obstacle = meshes.allocate( numpy.array( obstacle_vertices, 'f' ) )
+    coin = meshes.allocate( numpy.array( coin_vertices, 'f' ) )
+    ...
+    with obstacle:
+        glVertexPointer( 3, GL_FLOAT, 0, obstacle )
+        glDrawArrays( GL_TRIANGLES, 0, len(obstacle) )
+
+Slices are VBOOffset instances, so they can be passed wherever a VBO or
+VBOOffset is accepted (slice + 12 produces a VBOOffset as for a VBO).
+Slices allocated from the same page share a single GL buffer, so
+drawing many of them only requires one glBindBuffer.
+
+Each page is managed with an address-ordered free-list, allocations
+are rounded up to the arena's alignment and placed first-fit, freed
+blocks are coalesced with their neighbours.  compact() packs the live
+slices of fragmented pages together (using glCopyBufferSubData where
+available, otherwise re-uploading each slice's data) and releases
+empty pages.  Because compaction moves slices, offsets derived from a
+slice with + must be re-derived after compact().
+"""
+from OpenGL.arrays.arraydatatype import ArrayDatatype
+from OpenGL.arrays.vbo import VBOOffset, get_implementation
+from OpenGL.constant import Constant
+from OpenGL import error
+from OpenGL._bytes import bytes, unicode, long
+import bisect, weakref
+__all__ = ('BufferArena','ArenaSlice')
+
+GL_COPY_READ_BUFFER = Constant( 'GL_COPY_READ_BUFFER', 0x8F36 )
+GL_COPY_WRITE_BUFFER = Constant( 'GL_COPY_WRITE_BUFFER', 0x8F37 )
+
+class ArenaSlice( VBOOffset ):
+    """A sub-allocated region of a BufferArena page
+
+    Attributes:
+
+        vbo -- the _ArenaPage holding the slice (as for VBOOffset)
+        offset -- byte offset of the slice within the page's buffer
+        size -- bytes reserved for the slice (including alignment)
+        data -- the source data, kept (as VBO does) so the slice can
+            be re-uploaded when compacting without glCopyBufferSubData
+        arena -- the owning BufferArena
+    """
+    def __init__( self, arena, page, offset, size, data ):
+        super( ArenaSlice, self ).__init__( page, offset )
+        self.arena = arena
+        self.size = size
+        self.data = data
+    def bind( self ):
+        """Bind the page buffer holding this slice"""
+        self.vbo.bind()
+    def unbind( self ):
+        """Unbind the page buffer (make normal array operations active)"""
+        self.vbo.unbind()
+    __enter__ = bind
+    def __exit__( self, exc_type=None, exc_val=None, exc_tb=None ):
+        """Context manager exit"""
+        self.unbind()
+        return False # do not supress exceptions...
+    def __int__( self ):
+        """Get the id of the GL buffer holding this slice"""
+        return self.vbo.buffer
+    def __len__( self ):
+        """Delegate length checks to our data-array (0 once freed or without data)"""
+        if self.data is None:
+            return 0
+        return len( self.data )
+    def __bool__( self ):
+        return True
+    __nonzero__ = __bool__
+    def set_array( self, data, size=None ):
+        """Replace the slice's data in-place (must fit in self.size)"""
+        if size is None:
+            size = ArrayDatatype.arrayByteCount( data )
+        if size > self.size:
+            raise ValueError( """%s bytes will not fit in %s byte slice"""%( size, self.size ))
+        self.data = data
+        self.vbo.upload( self.offset, size, data )
+    def delete( self ):
+        """Return the slice's storage to the arena"""
+        self.arena.free( self )
+
+class _ArenaPage( object ):
+    """One GL buffer and the free-list of its unallocated blocks"""
+    def __init__( self, arena, size ):
+        self.arena = arena
+        self.size = size
+        self.buffer = None
+        self.slices = []
+        # address-ordered, coalesced free blocks
+        self.free_offsets = [0]
+        self.free_sizes = [size]
+    def create_buffer( self ):
+        """Create and allocate (uninitialised) GL storage for the page"""
+        implementation = self.arena.implementation
+        buffer = long( implementation.glGenBuffers(1) )
+        implementation.glBindBuffer( self.arena.target, buffer )
+        implementation.glBufferData( self.arena.target, self.size, None, self.arena.usage )
+        implementation.glBindBuffer( self.arena.target, 0 )
+        self.arena.buffers.append( buffer )
+        return buffer
+    def bind( self ):
+        self.arena.implementation.glBindBuffer( self.arena.target, self.buffer )
+    def unbind( self ):
+        self.arena.implementation.glBindBuffer( self.arena.target, 0 )
+    def upload( self, offset, size, data ):
+        """Copy size bytes of data into the buffer at offset"""
+        if data is None or not size:
+            return
+        implementation = self.arena.implementation
+        implementation.glBindBuffer( self.arena.target, self.buffer )
+        implementation.glBufferSubData( self.arena.target, offset, size, data )
+        implementation.glBindBuffer( self.arena.target, 0 )
+    def reserve( self, size ):
+        """Take size bytes from the first free block which fits, return offset or None"""
+        for index, free in enumerate( self.free_sizes ):
+            if free >= size:
+                offset = self.free_offsets[index]
+                if free == size:
+                    del self.free_offsets[index]
+                    del self.free_sizes[index]
+                else:
+                    self.free_offsets[index] += size
+                    self.free_sizes[index] -= size
+                return offset
+        return None
+    def release( self, offset, size ):
+        """Return [offset,offset+size) to the free-list, coalescing neighbours"""
+        offsets, sizes = self.free_offsets, self.free_sizes
+        index = bisect.bisect_left( offsets, offset )
+        if index < len(offsets) and offset + size == offsets[index]:
+            size += sizes[index]
+            del offsets[index]
+            del sizes[index]
+        if index and offsets[index-1] + sizes[index-1] == offset:
+            sizes[index-1] += size
+        else:
+            offsets.insert( index, offset )
+            sizes.insert( index, size )
+    def used( self ):
+        return self.size - sum( self.free_sizes )
+    def fragmented( self ):
+        """Whether the free space is not a single block at the end"""
+        return len( self.free_sizes ) > 1 or (
+            self.free_sizes and self.free_offsets[0] + self.free_sizes[0] != self.size
+        )
+
+class BufferArena( object ):
+    """Allocator handing out ArenaSlice regions of shared GL buffers
+
+    page_size -- size in bytes of each GL buffer, larger allocations
+        get a dedicated page of their own size
+    alignment -- every slice starts at a multiple of this many bytes,
+        use (at least) GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT for uniform
+        buffer slices
+    usage -- usage hint for the page buffers
+    target -- VBO target to which pages are bound (array or indices)
+
+    GL operations are performed on the target binding point, which is
+    left unbound (0) by allocate(), free() and compact(), compact()
+    restores the GL_COPY_READ_BUFFER/GL_COPY_WRITE_BUFFER bindings it
+    uses for glCopyBufferSubData.
+    """
+    def __init__(
+        self, page_size=4*1024*1024, alignment=16,
+        usage='GL_STATIC_DRAW', target='GL_ARRAY_BUFFER',
+    ):
+        if alignment < 1 or alignment & (alignment-1):
+            raise ValueError( """Alignment must be a power of two, got %r"""%( alignment, ))
+        self.page_size = page_size
+        self.alignment = alignment
+        self.usage = usage
+        self.target = target
+        self.pages = []
+        self.buffers = []
+        self.allocations = 0
+        self.frees = 0
+        self.compactions = 0
+        self.bytes_moved = 0
+    implementation = property( get_implementation, )
+    def resolve( self, value ):
+        """Resolve string constant to constant"""
+        if isinstance( value, (bytes,unicode)):
+            return getattr( self.implementation, self.implementation.basename( value ) )
+        return value
+    def _register( self ):
+        """Resolve constants and register the buffer deleter on first use"""
+        self.target = self.resolve( self.target )
+        self.usage = self.resolve( self.usage )
+        implementation = self.implementation
+        implementation._DELETERS_[ id(self) ] = weakref.ref(
+            self, implementation.deleter( self.buffers, id(self) )
+        )
+    def aligned( self, size ):
+        """Round size up to our alignment"""
+        return (size + self.alignment - 1) & ~(self.alignment - 1)
+    def allocate( self, data, size=None ):
+        """Allocate a slice holding data (or size uninitialised bytes)
+
+        data -- PyOpenGL-compatible array-data structure or None
+        size -- if not provided, will use arrayByteCount to determine
+            the size of the data-array
+
+        returns ArenaSlice
+        """
+        if size is None:
+            if data is None:
+                raise ValueError( """Need data or size to allocate a slice""" )
+            size = ArrayDatatype.arrayByteCount( data )
+        if not self.buffers and not self.pages:
+            self._register()
+        reserved = self.aligned( max((size,1)) )
+        for page in self.pages:
+            offset = page.reserve( reserved )
+            if offset is not None:
+                break
+        else:
+            page = self._new_page( max((reserved, self.page_size)) )
+            offset = page.reserve( reserved )
+        handle = ArenaSlice( self, page, offset, reserved, data )
+        page.slices.append( handle )
+        page.upload( offset, size, data )
+        self.allocations += 1
+        return handle
+    def _new_page( self, size ):
+        page = _ArenaPage( self, self.aligned( size ) )
+        page.buffer = page.create_buffer()
+        self.pages.append( page )
+        return page
+    def free( self, handle ):
+        """Return handle's storage to its page"""
+        page = handle.vbo
+        try:
+            page.slices.remove( handle )
+        except ValueError:
+            raise ValueError( """Slice %r is not allocated in this arena"""%( handle, ))
+        page.release( handle.offset, handle.size )
+        handle.data = None
+        self.frees += 1
+    def compact( self ):
+        """Pack the live slices of fragmented pages, release empty pages
+
+        Slices keep their page but receive new offsets, returns number
+        of bytes moved.
+        """
+        implementation = self.implementation
+        copy = implementation.optional( 'glCopyBufferSubData' )
+        moved = 0
+        for page in self.pages[:]:
+            if not page.slices and len( self.pages ) > 1:
+                self._delete_page( page )
+                continue
+            if not page.fragmented():
+                continue
+            live = sorted( page.slices, key=lambda handle: handle.offset )
+            if not copy and any( handle.data is None for handle in live ):
+                # without copy support we can only move slices we can re-upload
+                continue
+            old = page.buffer
+            page.buffer = page.create_buffer()
+            if copy:
+                previous = self._copy_bindings()
+                implementation.glBindBuffer( GL_COPY_READ_BUFFER, old )
+                implementation.glBindBuffer( GL_COPY_WRITE_BUFFER, page.buffer )
+            position = 0
+            try:
+                for handle in live:
+                    if copy:
+                        copy(
+                            GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER,
+                            handle.offset, position, handle.size,
+                        )
+                        handle.offset = position
+                    else:
+                        handle.offset = position
+                        page.upload(
+                            position, ArrayDatatype.arrayByteCount( handle.data ),
+                            handle.data,
+                        )
+                    position += handle.size
+                    moved += handle.size
+            finally:
+                if copy:
+                    implementation.glBindBuffer( GL_COPY_READ_BUFFER, previous[0] )
+                    implementation.glBindBuffer( GL_COPY_WRITE_BUFFER, previous[1] )
+            self._delete_buffer( old )
+            page.free_offsets = [position]
+            page.free_sizes = [page.size - position]
+            if position == page.size:
+                page.free_offsets, page.free_sizes = [], []
+        self.compactions += 1
+        self.bytes_moved += moved
+        return moved
+    def _copy_bindings( self ):
+        """Retrieve the current (GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER) bindings"""
+        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetIntegerv
+        from OpenGL.raw.GL._types import GLint
+        bindings = []
+        for target in (GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER):
+            # the *_BINDING queries share the target's value
+            binding = GLint()
+            glGetIntegerv( target, binding )
+            bindings.append( binding.value )
+        return bindings
+    def _delete_page( self, page ):
+        self.pages.remove( page )
+        self._delete_buffer( page.buffer )
+        page.buffer = None
+    def _delete_buffer( self, buffer ):
+        try:
+            self.buffers.remove( buffer )
+        except ValueError:
+            pass
+        try:
+            self.implementation.glDeleteBuffers( 1, buffer )
+        except (AttributeError, error.NullFunctionError):
+            pass
+    def delete( self ):
+        """Delete all page buffers explicitly, invalidating all slices"""
+        while self.pages:
+            self._delete_page( self.pages[-1] )
+    def stats( self ):
+        """Return a dictionary of usage statistics for the arena"""
+        capacity = sum( page.size for page in self.pages )
+        used = sum( page.used() for page in self.pages )
+        largest = max(
+            [size for page in self.pages for size in page.free_sizes] or [0]
+        )
+        free = capacity - used
+        return {
+            'pages': len( self.pages ),
+            'slices': sum( len(page.slices) for page in self.pages ),
+            'capacity': capacity,
+            'used': used,
+            'free': free,
+            'largest_free': largest,
+            'fragmentation': (1.0 - float(largest)/free) if free else 0.0,
+            'allocations': self.allocations,
+            'frees': self.frees,
+            'compactions': self.compactions,
+            'bytes_moved': self.bytes_moved,
+        }
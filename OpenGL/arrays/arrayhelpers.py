@@ -4,7 +4,7 @@ These are functions intended to be used in wrapping
 GL functions that deal with OpenGL array data-types.
 """
 import OpenGL
-import ctypes
+import ctypes, weakref
 from OpenGL import _configflags
 from OpenGL import contextdata, error, converters
 from OpenGL.arrays import arraydatatype
@@ -84,10 +84,137 @@ if AsArrayTypedSizeChecked is None:
 else:
     returnPointer = returnPyArgumentIndex( 0 )
 
+def _noReference( ):
+    """Stands in for a dead weak reference"""
+    return None
+_NO_FINAL = (_noReference, None, None, None, None)
+
+class FastArrayConverter( converters.PyConverter ):
+    """Per-call-site array converter caching final-form arrays
+
+    arrayName -- name of the array argument
+    arrayType -- ArrayDatatype (sub-)class used for conversion, with 
+        ArrayDatatype itself meaning a void pointer of any type
+    typeName -- optional name of an argument holding the GL type 
+        constant of the array (as for the gl*Pointer functions), 
+        overrides arrayType.typeConstant
+    expectedBytes -- optional byte-count the converted array must have
+
+    Remembers the handler for the last Python type seen, and a weak
+    reference to the last array which was already in final form 
+    (see FormatHandler.finalPointer) along with a ctypes pointer to
+    its data and the handler's finalSignature of the array.  Passing 
+    that same array again with an unchanged signature (for numpy the 
+    shape, strides and dtype), the common case for per-frame vertex and 
+    matrix data, then skips conversion and pointer extraction, as 
+    finalise() installs a cResolver which hands the cached pointer 
+    directly to ctypes.  An array which has been re-allocated or 
+    re-typed in-place (ndarray.resize) takes the normal path.
+    """
+    argNames = ( 'arrayName','arrayType','typeName','expectedBytes' )
+    def __init__( self, arrayName=None, arrayType=None, typeName=None, expectedBytes=None ):
+        self.arrayName = arrayName
+        self.arrayType = arrayType
+        self.typeName = typeName
+        self.expectedBytes = expectedBytes
+        self.typeConstant = getattr( arrayType, 'typeConstant', None )
+        self.lastType = self.lastHandler = None
+        self.final = _NO_FINAL
+    def finalise( self, wrapper ):
+        """Look up our indices and install our cResolver"""
+        if self.typeName is not None:
+            self.typeIndex = wrapper.pyArgIndex( self.typeName )
+        if self.arrayName is None:
+            self.arrayName = wrapper.pyConverterNames[ 
+                wrapper.pyConverters.index( self ) 
+            ]
+        resolvers = getattr( wrapper, 'cResolvers', None )
+        try:
+            index = wrapper.cArgIndex( self.arrayName )
+        except KeyError:
+            return
+        if not resolvers or resolvers[index] is None:
+            wrapper.setCResolver( self.arrayName, self.resolve )
+    def __call__( self, incoming, function, args ):
+        """Get incoming as an array of the appropriate type"""
+        if self.typeName is None:
+            typeConstant = self.typeConstant
+        else:
+            typeConstant = arraydatatype.GL_CONSTANT_TO_ARRAY_TYPE[ 
+                args[ self.typeIndex ] 
+            ].typeConstant
+        reference, finalType, pointer, handler, signature = self.final
+        if (
+            incoming is not None and incoming is reference() and 
+            typeConstant == finalType and 
+            handler.finalSignature( incoming ) == signature
+        ):
+            return incoming
+        # resolve() must not hand out the pointer for this call
+        self.final = _NO_FINAL
+        typ = incoming.__class__
+        if typ is self.lastType:
+            handler = self.lastHandler
+        else:
+            handler = self.arrayType.getHandler( incoming )
+            self.lastType, self.lastHandler = typ, handler
+        result = handler.asArray( incoming, typeConstant )
+        if self.expectedBytes is not None:
+            byteSize = handler.arrayByteCount( result )
+            if byteSize != self.expectedBytes:
+                raise ValueError(
+                    """Expected %r byte array, got %r byte array"""%(
+                        self.expectedBytes,
+                        byteSize,
+                    ),
+                    incoming,
+                )
+        if result is incoming and result is not None:
+            pointer = handler.finalPointer( result, typeConstant )
+            signature = pointer is not None and handler.finalSignature( result )
+            if signature:
+                try:
+                    self.final = (
+                        weakref.ref( result ), typeConstant, pointer, 
+                        handler, signature,
+                    )
+                except TypeError:
+                    pass
+        return result
+    def resolve( self, value ):
+        """cResolver returning cached pointer for our last final-form array
+
+        Only called with the result of __call__ for the same call, which
+        has already checked the array's signature (or dropped the cached
+        pointer), so identity is sufficient here.
+        """
+        reference, finalType, pointer, handler, signature = self.final
+        if value is reference():
+            return pointer
+        return value
+
+FAST_PATH = (
+    _configflags.ARRAY_FAST_PATH and 
+    not arraydatatype.ArrayDatatype.isAccelerated
+)
+if FAST_PATH:
+    class AsArrayOfType( FastArrayConverter ):
+        """Given arrayName and typeName coerce arrayName to array of type typeName"""
+        argNames = ( 'arrayName','typeName' )
+        def __init__( self, arrayName='pointer', typeName='type' ):
+            super( AsArrayOfType, self ).__init__(
+                arrayName, arraydatatype.ArrayDatatype, typeName
+            )
+
 if not _configflags.ERROR_ON_COPY:
-    def asArrayType( typ, size=None ):
-        """Create PyConverter to get first argument as array of type"""
-        return converters.CallFuncPyConverter( typ.asArray )
+    if FAST_PATH:
+        def asArrayType( typ, size=None ):
+            """Create PyConverter to get first argument as array of type"""
+            return FastArrayConverter( arrayType=typ )
+    else:
+        def asArrayType( typ, size=None ):
+            """Create PyConverter to get first argument as array of type"""
+            return converters.CallFuncPyConverter( typ.asArray )
 else:
     def asArrayType( typ, size=None ):
         """No converter required"""
@@ -98,6 +225,13 @@ if not _configflags.ARRAY_SIZE_CHECKING:
 else:
     if AsArrayTypedSizeChecked:
         asArrayTypeSize = AsArrayTypedSizeChecked
+    elif FAST_PATH:
+        def asArrayTypeSize( typ, size ):
+            """Create PyConverter to get array as type and check size"""
+            return FastArrayConverter( 
+                arrayType=typ, 
+                expectedBytes=ctypes.sizeof( typ.baseType ) * size,
+            )
     else:
         def asArrayTypeSize( typ, size ):
             """Create PyConverter function to get array as type and check size
@@ -129,6 +263,8 @@ if not _configflags.ERROR_ON_COPY:
     def asVoidArray( ):
         """Create PyConverter returning incoming as an array of any type"""
         from OpenGL.arrays import ArrayDatatype
+        if FAST_PATH:
+            return FastArrayConverter( arrayType=ArrayDatatype )
         return converters.CallFuncPyConverter( ArrayDatatype.asArray )
 else:
     def asVoidArray( ):
@@ -81,6 +81,25 @@ class FormatHandler( object ):
         """return long for pointer value"""
     def asArray( self, value, typeCode=None ):
         """Given a value, convert to array representation"""
+    def finalPointer( self, value, typeCode=None ):
+        """Return a ctypes pointer if value can be passed to GL unchanged
+
+        Handlers which can cheaply tell that value is already in its
+        final form (contiguous, of typeCode) return a ctypes pointer to
+        the data which callers may cache while value is alive, all other
+        cases return None.
+        """
+        return None
+    def finalSignature( self, value ):
+        """Return a comparable description of value's data buffer
+
+        Used to check that a pointer returned by finalPointer is still
+        valid for value (i.e. the array has not been re-allocated or
+        re-typed in-place).  It is computed on every call which reuses
+        the pointer, so should be cheap, e.g. the shape, strides and
+        element type where the data can not move without those changing.
+        """
+        return None
     def arrayToGLType( self, value ):
         """Given a value, guess OpenGL type of the corresponding pointer"""
     def arraySize( self, value, typeCode = None ):
@@ -222,6 +222,31 @@ if NumpyHandler is None:
                         instance.dtype.char, typeCode,
                     )
                 return c_void_p( pointer )
+        @classmethod
+        def finalPointer( cls, instance, typeCode=None ):
+            """Return c_void_p for instance if GL can use it unchanged
+
+            instance must be an ndarray which is C-contiguous and, if
+            typeCode is specified, of the matching dtype, otherwise
+            returns None.
+            """
+            if not isinstance( instance, numpy.ndarray ):
+                return None
+            if not instance.flags.c_contiguous:
+                return None
+            if typeCode is not None and instance.dtype != GL_TYPE_TO_ARRAY_MAPPING[ typeCode ]:
+                return None
+            return c_void_p( instance.ctypes.data )
+        @classmethod
+        def finalSignature( cls, instance ):
+            """Return (shape, strides, dtype) of instance
+
+            An ndarray's data only moves (ndarray.resize) or changes type
+            (assigning dtype) in-place along with its shape or dtype, so
+            these identify the buffer without building the
+            __array_interface__ dictionary.
+            """
+            return ( instance.shape, instance.strides, instance.dtype )
 
 try:
     numpy.array( [1], 's' )
@@ -34,13 +34,14 @@ from OpenGL.arrays.arraydatatype import ArrayDatatype
 from OpenGL.arrays.formathandler import FormatHandler
 from OpenGL.raw.GL import _types 
 from OpenGL import error
+from OpenGL.constant import Constant
 from OpenGL._bytes import bytes,unicode,as_8_bit
 import ctypes,logging
 _log = logging.getLogger( 'OpenGL.arrays.vbo' )
 from OpenGL._bytes import long, integer_types
 
-import weakref
-__all__ = ('VBO','VBOHandler','mapVBO')
+import weakref, bisect
+__all__ = ('VBO','VBOHandler','mapVBO','StreamingVBO')
 
 class Implementation( object ):
     """Abstraction point for the various implementations that can be used
@@ -83,6 +84,20 @@ class Implementation( object ):
     GL_TEXTURE_BUFFER
     GL_TRANSFORM_FEEDBACK_BUFFER'''.split()
     available = False
+    # modules searched by optional() for functions which are not part
+    # of every implementation (mapping ranges, buffer storage, syncs)
+    OPTIONAL_SOURCES = ()
+    def optional( self, name ):
+        """Return the first available function name in OPTIONAL_SOURCES or None
+
+        Availability depends on the current context, so look these up
+        with the context in which they will be used current.
+        """
+        for source in self.OPTIONAL_SOURCES:
+            function = getattr( source, name, None )
+            if function:
+                return function
+        return None
     def _arbname( self, name ):
         return (
             (name.startswith( 'gl' ) and name.endswith( 'ARB' )) or
@@ -127,6 +142,41 @@ class Implementation( object ):
 
 get_implementation = Implementation.get_implementation
 
+class DirtyRanges( object ):
+    """Coalescing set of dirty [start,stop) byte ranges
+
+    Ranges which overlap or touch are merged as they are added, so 
+    iterating produces the minimal sorted set of (start,stop) ranges
+    covering every byte marked dirty.
+    """
+    def __init__( self ):
+        self.starts = []
+        self.stops = []
+    def add( self, start, stop ):
+        """Mark [start,stop) as dirty"""
+        if stop <= start:
+            return
+        starts, stops = self.starts, self.stops
+        # first range whose stop reaches start, last whose start reaches stop
+        first = bisect.bisect_left( stops, start )
+        last = bisect.bisect_right( starts, stop )
+        if first < last:
+            start = min( start, starts[first] )
+            stop = max( stop, stops[last-1] )
+        starts[first:last] = [start]
+        stops[first:last] = [stop]
+    def clear( self ):
+        """Forget all dirty ranges"""
+        del self.starts[:]
+        del self.stops[:]
+    def total( self ):
+        """Total number of dirty bytes"""
+        return sum( self.stops ) - sum( self.starts )
+    def __len__( self ):
+        return len( self.starts )
+    def __iter__( self ):
+        return iter( list( zip( self.starts, self.stops )) )
+
 from OpenGL import acceleratesupport
 VBO = None
 if acceleratesupport.ACCELERATE_AVAILABLE:
@@ -151,6 +201,11 @@ if VBO is None:
         """
         copied = False
         _no_cache_ = True # do not cache in context data arrays
+        # fraction of the buffer which may be dirty before copy_data
+        # re-uploads (orphans) the whole buffer instead of the ranges
+        dirty_threshold = 0.5
+        upload_bytes = 0
+        upload_calls = 0
         def __init__(
             self, data, usage='GL_DYNAMIC_DRAW',
             target='GL_ARRAY_BUFFER', size=None,
@@ -196,7 +251,7 @@ if VBO is None:
             self.set_array( data, size )
             self.target = target
             self.buffers = []
-            self._copy_segments = []
+            self._copy_segments = DirtyRanges()
         _I_ = None
         implementation = property( get_implementation, )
         def resolve( self, value ):
@@ -214,6 +269,8 @@ if VBO is None:
             """
             self.data = data
             self.copied = False
+            if getattr( self, '_copy_segments', None ):
+                self._copy_segments.clear()
             if size is not None:
                 self.size = size
             elif self.data is not None:
@@ -237,37 +294,18 @@ if VBO is None:
                 raise NotImplemented( """Don't know how to map stepped arrays yet""" )
             # TODO: handle e.g. mapping character data into an integer data-set
             data = ArrayDatatype.asArray( array )
-            data_length = ArrayDatatype.arrayByteCount( array )
-            start = (slice.start or 0)
-            stop = (slice.stop or len(self.data))
-            if start < 0:
-                start += len(self.data)
-                start = max((start,0))
-            if stop < 0:
-                stop += len(self.data)
-                stop = max((stop,0))
+            start, stop, step = slice.indices( len(self.data) )
             self.data[ slice ] = data
-            if self.copied and self.buffers:
-                if start-stop == len(self.data):
+            if self.copied and self.buffers and stop > start:
+                if stop-start == len(self.data):
                     # re-copy the whole data-set
                     self.copied = False
-                elif len(data):
-                    # now the fun part, we need to make the array match the
-                    # structure of the array we're going to copy into and make
-                    # the "size" parameter match the value we're going to copy in,
-                    # note that a 2D array (rather than a 1D array) may require
-                    # multiple mappings to copy into the memory area...
-
-                    # find the step size from the dimensions and base size...
+                    self._copy_segments.clear()
+                else:
+                    # find the step size from the dimensions and base size,
+                    # the dirty range is copied from self.data at bind time
                     size = ArrayDatatype.arrayByteCount( self.data[0] )
-                    #baseSize = ArrayDatatype.unitSize( data )
-                    # now create the start and distance values...
-                    start *= size
-                    stop *= size
-                    # wait until the last moment (bind) to copy the data...
-                    self._copy_segments.append(
-                        (start,(stop-start), data)
-                    )
+                    self._copy_segments.add( start*size, stop*size )
         def __len__( self ):
             """Delegate length/truth checks to our data-array"""
             return len( self.data )
@@ -291,16 +329,28 @@ if VBO is None:
             Ensures that the GL's version of the data in the VBO matches our 
             internal view of the data, either by copying the entire data-set 
             over with glBufferData or by updating the already-transferred 
-            data with glBufferSubData.
+            data with one glBufferSubData per merged dirty range, read 
+            directly from self.data.  If more than dirty_threshold of the 
+            buffer is dirty the whole data-set is re-copied instead.
             """
             assert self.buffers, """Should do create_buffers before copy_data"""
-            if self.copied:
-                if self._copy_segments:
-                    while self._copy_segments:
-                        start,size,data  = self._copy_segments.pop(0)
-                        dataptr = ArrayDatatype.voidDataPointer( data )
-                        self.implementation.glBufferSubData(self.target, start, size, dataptr)
-            else:
+            segments = self._copy_segments
+            if self.copied and segments:
+                if self.size and segments.total() > self.size * self.dirty_threshold:
+                    # cheaper to orphan and re-copy everything
+                    self.copied = False
+                else:
+                    source = ArrayDatatype.asArray( self.data )
+                    pointer = ArrayDatatype.dataPointer( source )
+                    for start,stop in segments:
+                        self.implementation.glBufferSubData(
+                            self.target, start, stop-start, 
+                            ctypes.c_void_p( pointer + start ),
+                        )
+                        self.upload_bytes += stop-start
+                        self.upload_calls += 1
+                    segments.clear()
+            if not self.copied:
                 if self.data is not None and self.size is None:
                     self.size = ArrayDatatype.arrayByteCount( self.data )
                 self.implementation.glBufferData(
@@ -309,7 +359,13 @@ if VBO is None:
                     self.data,
                     self.usage,
                 )
+                segments.clear()
+                self.upload_bytes += self.size or 0
+                self.upload_calls += 1
                 self.copied = True
+        def reset_statistics( self ):
+            """Reset the upload_bytes and upload_calls counters"""
+            self.upload_bytes = self.upload_calls = 0
         def delete( self ):
             """Delete this buffer explicitly"""
             if self.buffers:
@@ -463,3 +519,270 @@ def mapVBO( vbo, access=0x88BA ): # GL_READ_WRITE
     array = frombuffer( vp_array, 'B' )
     _cleaners[vbo] = weakref.ref( array, _cleaner( vbo ))
     return array
+
+GL_MAP_WRITE_BIT = Constant( 'GL_MAP_WRITE_BIT', 0x0002 )
+GL_MAP_INVALIDATE_RANGE_BIT = Constant( 'GL_MAP_INVALIDATE_RANGE_BIT', 0x0004 )
+GL_MAP_UNSYNCHRONIZED_BIT = Constant( 'GL_MAP_UNSYNCHRONIZED_BIT', 0x0020 )
+GL_MAP_PERSISTENT_BIT = Constant( 'GL_MAP_PERSISTENT_BIT', 0x0040 )
+GL_MAP_COHERENT_BIT = Constant( 'GL_MAP_COHERENT_BIT', 0x0080 )
+GL_SYNC_FLUSH_COMMANDS_BIT = Constant( 'GL_SYNC_FLUSH_COMMANDS_BIT', 0x0001 )
+GL_SYNC_GPU_COMMANDS_COMPLETE = Constant( 'GL_SYNC_GPU_COMMANDS_COMPLETE', 0x9117 )
+GL_ALREADY_SIGNALED = Constant( 'GL_ALREADY_SIGNALED', 0x911A )
+GL_TIMEOUT_EXPIRED = Constant( 'GL_TIMEOUT_EXPIRED', 0x911B )
+GL_WAIT_FAILED = Constant( 'GL_WAIT_FAILED', 0x911D )
+
+PERSISTENT = 'persistent'
+MAP_RANGE = 'map_range'
+ORPHAN = 'orphan'
+STREAMING_STRATEGIES = ( PERSISTENT, MAP_RANGE, ORPHAN )
+
+def _mappedArray( pointer, size ):
+    """Produce a writable numpy byte-array over size bytes at pointer"""
+    from numpy import frombuffer
+    return frombuffer( (ctypes.c_ubyte*size).from_address( pointer ), 'B' )
+
+class StreamingVBO( object ):
+    """Ring-buffer VBO for data which is re-written every frame
+
+    Basic usage:
+
+        stream = vbo.StreamingVBO( 65536, frames=3 )
+        ...
+        # each frame
+        positions = stream.map( (count,3), 'f' )
+        positions[:] = ... # producer writes directly, no copy
+        offset = stream.commit()
+        with stream:
+            glVertexPointer( 3, GL_FLOAT, 0, offset )
+            glDrawArrays( GL_POINTS, 0, count )
+        stream.fence()
+
+    The buffer holds frames regions of size bytes and each frame uses
+    the next region, so the GL may still be reading the regions of 
+    earlier frames while the current one is written.  fence() places 
+    a sync object after the commands which use the region and map() 
+    waits on it before handing the region out again, which only blocks 
+    when the GL falls more than frames frames behind.
+
+    The strategy is chosen when the buffer is created (i.e. with a 
+    context current) unless one is passed in:
+
+        PERSISTENT -- glBufferStorage with a persistent, coherent write
+            mapping created once, map() returns views of the mapping,
+            requires GL 4.4 or ARB_buffer_storage
+        MAP_RANGE -- glMapBufferRange with the unsynchronised and 
+            invalidate-range flags for the region each frame, commit()
+            unmaps, requires GL 3.0 or ARB_map_buffer_range
+        ORPHAN -- a single region, map() returns a view of a client-side 
+            staging array which commit() uploads with glBufferSubData
+            after orphaning the buffer with glBufferData( NULL )
+
+    Both mapping strategies also require fence syncs (GL 3.2 or ARB_sync)
+    and fall back to ORPHAN without them.
+
+    Views returned by map() are only valid until the region is next 
+    handed out (PERSISTENT) or until commit() (MAP_RANGE, ORPHAN), 
+    do not hold onto them.
+    """
+    _no_cache_ = True # do not cache in context data arrays
+    def __init__( 
+        self, size, frames=3, 
+        usage='GL_STREAM_DRAW', target='GL_ARRAY_BUFFER', 
+        strategy=None, 
+    ):
+        """Initialize the streaming VBO (buffers are created lazily)
+
+        size -- bytes available to each frame
+        frames -- number of regions in the ring
+        usage -- usage hint for the MAP_RANGE and ORPHAN strategies
+        target -- VBO target to which to bind
+        strategy -- one of STREAMING_STRATEGIES or None to choose the
+            best strategy the context supports
+        """
+        if strategy is not None and strategy not in STREAMING_STRATEGIES:
+            raise ValueError( """Unknown streaming strategy %r"""%( strategy, ))
+        self.size = size 
+        self.frames = frames
+        self.usage = usage
+        self.target = target
+        self.strategy = strategy 
+        self.buffers = []
+        self.region = 0
+        self.offset = 0
+        self.stalls = 0
+        self._fences = []
+        self._mapping = None
+        self._pending = None
+    implementation = property( get_implementation, )
+    def resolve( self, value ):
+        """Resolve string constant to constant"""
+        if isinstance( value, (bytes,unicode)):
+            return getattr( self.implementation, self.implementation.basename( value ) )
+        return value
+    def choose_strategy( self ):
+        """Choose the best strategy available in the current context"""
+        optional = self.implementation.optional
+        if optional( 'glMapBufferRange' ) and optional( 'glFenceSync' ):
+            if optional( 'glBufferStorage' ):
+                return PERSISTENT
+            return MAP_RANGE
+        return ORPHAN
+    def create_buffers( self ):
+        """Create and allocate the buffer, leaves the buffer bound"""
+        assert not self.buffers, """Already created the buffer"""
+        implementation = self.implementation
+        self.target = self.resolve( self.target )
+        self.usage = self.resolve( self.usage )
+        if self.strategy is None:
+            self.strategy = self.choose_strategy()
+        if self.strategy == ORPHAN:
+            self.frames = 1
+        self._fences = [None] * self.frames
+        self.buffers = [ long(implementation.glGenBuffers(1)) ]
+        implementation._DELETERS_[ id(self) ] = weakref.ref( self, implementation.deleter( self.buffers, id(self) ))
+        implementation.glBindBuffer( self.target, self.buffers[0] )
+        total = self.size * self.frames
+        if self.strategy == PERSISTENT:
+            flags = GL_MAP_WRITE_BIT|GL_MAP_PERSISTENT_BIT|GL_MAP_COHERENT_BIT
+            implementation.optional( 'glBufferStorage' )( self.target, total, None, flags )
+            pointer = implementation.optional( 'glMapBufferRange' )( self.target, 0, total, flags )
+            if not pointer:
+                raise error.Error( """Unable to map persistent streaming buffer""" )
+            self._mapping = _mappedArray( pointer, total )
+        elif self.strategy == MAP_RANGE:
+            implementation.glBufferData( self.target, total, None, self.usage )
+        else:
+            from numpy import zeros
+            implementation.glBufferData( self.target, total, None, self.usage )
+            self._mapping = zeros( (total,), 'B' )
+        return self.buffers
+    def wait( self, region ):
+        """Block until the GL has finished with region (if fenced)"""
+        fence = self._fences[region]
+        if fence is None:
+            return
+        self._fences[region] = None
+        optional = self.implementation.optional
+        clientWaitSync = optional( 'glClientWaitSync' )
+        try:
+            result = clientWaitSync( fence, GL_SYNC_FLUSH_COMMANDS_BIT, 0 )
+            if result != GL_ALREADY_SIGNALED:
+                self.stalls += 1
+                while result == GL_TIMEOUT_EXPIRED:
+                    result = clientWaitSync( fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000 )
+            if result == GL_WAIT_FAILED:
+                raise error.Error( """Wait on streaming buffer fence failed""" )
+        finally:
+            optional( 'glDeleteSync' )( fence )
+    def map( self, shape, dtype='B' ):
+        """Get a writable numpy view of shape and dtype on the current region
+
+        Waits for the GL to finish with the region (see fence()), the
+        view must be filled in before calling commit()
+        """
+        from numpy import dtype as _dtype
+        if self._pending is not None:
+            raise RuntimeError( """Region already mapped, commit() it first""" )
+        if isinstance( shape, integer_types ):
+            shape = (shape,)
+        dtype = _dtype( dtype )
+        count = 1
+        for dimension in shape:
+            count *= dimension
+        nbytes = count * dtype.itemsize
+        if nbytes > self.size:
+            raise ValueError( """Requested %s bytes, regions are %s bytes"""%( nbytes, self.size ))
+        if not self.buffers:
+            self.create_buffers()
+        self.wait( self.region )
+        self.offset = self.region * self.size
+        if self.strategy == MAP_RANGE:
+            self.implementation.glBindBuffer( self.target, self.buffers[0] )
+            pointer = self.implementation.optional( 'glMapBufferRange' )(
+                self.target, self.offset, max((nbytes,1)),
+                GL_MAP_WRITE_BIT|GL_MAP_UNSYNCHRONIZED_BIT|GL_MAP_INVALIDATE_RANGE_BIT,
+            )
+            if not pointer:
+                raise error.Error( """Unable to map streaming buffer region""" )
+            region = _mappedArray( pointer, nbytes )
+        elif self.strategy == PERSISTENT:
+            region = self._mapping[self.offset:self.offset+nbytes]
+        else:
+            region = self._mapping[:nbytes]
+        self._pending = nbytes
+        return region.view( dtype ).reshape( shape )
+    def commit( self ):
+        """Make the mapped region's data available to the GL
+
+        returns VBOOffset for the start of the region, use while this
+        StreamingVBO is bound
+        """
+        if self._pending is None:
+            raise RuntimeError( """No region mapped, call map() first""" )
+        nbytes, self._pending = self._pending, None
+        implementation = self.implementation
+        if self.strategy == MAP_RANGE:
+            implementation.glBindBuffer( self.target, self.buffers[0] )
+            implementation.glUnmapBuffer( self.target )
+        elif self.strategy == ORPHAN:
+            implementation.glBindBuffer( self.target, self.buffers[0] )
+            implementation.glBufferData( self.target, self.size, None, self.usage )
+            if nbytes:
+                implementation.glBufferSubData( 
+                    self.target, 0, nbytes, self._mapping[:nbytes] 
+                )
+        return VBOOffset( self, self.offset )
+    def fence( self ):
+        """Fence the current region after the commands using it, advance the ring"""
+        if self.strategy != ORPHAN and self.buffers:
+            self._fences[self.region] = self.implementation.optional( 'glFenceSync' )(
+                GL_SYNC_GPU_COMMANDS_COMPLETE, 0
+            )
+        self.region = (self.region + 1) % self.frames
+    def delete( self ):
+        """Delete this buffer (and any fences/mapping) explicitly"""
+        optional = self.implementation.optional
+        while self._fences:
+            fence = self._fences.pop()
+            if fence is not None:
+                optional( 'glDeleteSync' )( fence )
+        if self.buffers:
+            if self.strategy in (PERSISTENT, MAP_RANGE) and (
+                self._mapping is not None or self._pending is not None
+            ):
+                try:
+                    self.implementation.glBindBuffer( self.target, self.buffers[0] )
+                    self.implementation.glUnmapBuffer( self.target )
+                except (AttributeError,error.NullFunctionError,error.GLError) as err:
+                    pass
+            while self.buffers:
+                try:
+                    self.implementation.glDeleteBuffers(1, self.buffers.pop(0))
+                except (AttributeError,error.NullFunctionError) as err:
+                    pass
+        self._mapping = self._pending = None
+    def __int__( self ):
+        """Get our VBO id"""
+        if not self.buffers:
+            self.create_buffers()
+        return self.buffers[0]
+    def bind( self ):
+        """Bind this buffer for use in vertex calls"""
+        if not self.buffers:
+            self.create_buffers()
+        self.implementation.glBindBuffer( self.target, self.buffers[0] )
+    def unbind( self ):
+        """Unbind the buffer (make normal array operations active)"""
+        self.implementation.glBindBuffer( self.target, 0 )
+    def __add__( self, other ):
+        """Add an integer to the current region's offset (create a VBOOffset)"""
+        if hasattr( other, 'offset' ):
+            other = other.offset
+        assert isinstance( other, integer_types ), """Only know how to add integer/long offsets"""
+        return VBOOffset( self, self.offset + other )
+
+    __enter__ = bind
+    def __exit__( self, exc_type=None, exc_val=None, exc_tb=None ):
+        """Context manager exit"""
+        self.unbind()
+        return False # do not supress exceptions...
@@ -1,8 +1,20 @@
-"""Implementation of OpenGL constant objects"""
-import sys
+"""Implementation of OpenGL constant objects
+
+Normally each constant is a Constant instance, an int/float/bytes which
+remembers its name for repr.  With OpenGL.COMPACT_CONSTANTS set,
+Constant( name, value ) returns integer values as plain ints, which
+saves an object with an instance dictionary for each of the many
+thousands of constants in the raw modules.  The names of plain int
+constants can still be recovered with names() and getName(), which
+consult a value -> names table built on first use from the loaded
+OpenGL modules (GLError uses it to describe error codes and arguments).
+"""
+import sys, re
 from OpenGL._bytes import bytes,unicode,as_8_bit, long, integer_types, maxsize
 from OpenGL import _configflags
 
+COMPACT = _configflags.COMPACT_CONSTANTS
+
 class Constant( object ):
     """OpenGL constant that displays itself as a name rather than a value
 
@@ -13,6 +25,10 @@ class Constant( object ):
     """
     def __new__( cls, name, value=None ):
         """Initialise the constant with the given name and value"""
+        if COMPACT and cls is Constant and type( value ) is int:
+            if value > maxsize:
+                value = - (value & maxsize)
+            return value
         if not isinstance( value, Constant ):
             if isinstance( value, float ) and cls is not FloatConstant:
                 return FloatConstant( name, value )
@@ -66,6 +82,62 @@ class StringConstant( Constant, bytes ):
         """Return the value as a human-friendly string"""
         return '%s (%s)'%(self.name,super(Constant,self).__str__())
 
+NAME_PATTERN = re.compile( r'^(?:GL|GLU|GLUT|GLX|WGL|EGL|OSMESA|CGL)_[A-Z0-9_]+$' )
+_names = {}
+_scanned = {}
+
+def _scan():
+    """Add the constants of any newly-loaded OpenGL modules to _names"""
+    for moduleName, module in list( sys.modules.items() ):
+        if module is None or not moduleName.startswith( 'OpenGL.' ):
+            continue
+        namespace = getattr( module, '__dict__', None )
+        if namespace is None or _scanned.get( moduleName ) == len( namespace ):
+            continue
+        _scanned[moduleName] = len( namespace )
+        for name, value in list( namespace.items() ):
+            if (
+                isinstance( value, integer_types ) and
+                not isinstance( value, bool ) and
+                NAME_PATTERN.match( name )
+            ):
+                _names.setdefault( int( value ), set() ).add( name )
+
+def names( value ):
+    """Return the names of the loaded constants with integer value
+
+    Names are sorted shortest first (so unsuffixed names precede their
+    vendor aliases), then alphabetically.
+    """
+    _scan()
+    return tuple( sorted( _names.get( int( value ), () ), key=lambda name: (len(name), name) ))
+
+def getName( value, prefix=None ):
+    """Return the name of constant value (optionally starting with prefix) or None
+
+    Constant instances return their own name, plain integers the first
+    of names( value ).
+    """
+    if isinstance( value, Constant ):
+        return value.name
+    for name in names( value ):
+        if prefix is None or name.startswith( prefix ):
+            return name
+    return None
+
+def describe( value, limit=3 ):
+    """Return a human-readable description of a (possibly plain) integer constant"""
+    if isinstance( value, Constant ):
+        return repr( value )
+    found = names( value )
+    if not found:
+        return repr( value )
+    if len( found ) == 1:
+        return found[0]
+    if len( found ) > limit:
+        found = found[:limit] + ('...',)
+    return '%s (%s)'%( value, ' or '.join( found ))
+
 if __name__ == "__main__":
     x = IntConstant( 'testint', 3 )
     y = FloatConstant( 'testfloat', 3.0 )
@@ -6,6 +6,16 @@ such as TypeError or ValueError when appropriate.
 ErrorChecker is an _ErrorChecker instance that allows you
 to register a new error-checking function for use 
 throughout the system.
+
+error.setErrorCheckingMode( error.DEFERRED ) switches the GL error
+checker (at run-time) to record calls and only check glGetError at
+glFlush, glFinish, glutSwapBuffers, explicit error.checkDeferred()
+calls (e.g. at the end of each frame) or every interval calls.  These
+are not in __all__, so that star-imports of OpenGL.GL do not pick up
+the mode names, use them through the module:
+
+    from OpenGL import error
+    error.setErrorCheckingMode( error.DEFERRED )
 """
 import logging
 _log = logging.getLogger( 'OpenGL.error' )
@@ -16,6 +26,12 @@ __all__ = (
     'GLerror','GLUerror','GLUTerror','ArgumentError',
 )
 
+# error-checking modes for _ErrorChecker.setMode
+IMMEDIATE = 'immediate'
+DEFERRED = 'deferred'
+OFF = 'off'
+
+
 class Error( Exception ):
     """Base class for all PyOpenGL-specific exception classes"""
 class NoContext( Error ):
@@ -57,7 +73,12 @@ class GLError( Error ):
         cArguments -- ctypes-level arguments to the operation,
             often raw integers for pointers and the like
         description -- OpenGL description of the error (textual)
+        history -- for errors detected in DEFERRED mode, the
+            (baseOperation, cArguments) of the calls made since the
+            previous check (at most the checker's history size), oldest
+            first, any of which may have raised the error
     """
+    history = None
     def __init__( 
         self, 
         err=None, 
@@ -86,6 +107,7 @@ class GLError( Error ):
         'cArgs',
         'cArguments',
         'result', 
+        'history',
     )
     def __str__( self ):
         """Create a fully formatted representation of the error"""
@@ -145,12 +167,45 @@ class GLError( Error ):
             return r
         else:
             return r[:117] + '...'
+    def format_err( self, property, value ):
+        """Format the error code along with the name of its constant"""
+        if type( value ) is not int:
+            return '%s = %s'%( property, self.shortRepr( value ))
+        from OpenGL import constant
+        return '%s = %s'%( property, constant.describe( value ))
+    def format_pyArgs( self, property, value ):
+        """Format arguments, naming enumerants passed as plain ints (COMPACT_CONSTANTS)"""
+        if _configflags.COMPACT_CONSTANTS and isinstance( value, (list,tuple) ):
+            value = type( value )([
+                _Described( item ) if type( item ) is int and item >= 0x100 else item
+                for item in value
+            ])
+        return '%s = %s'%( property, self.shortRepr( value ))
+    format_cArgs = format_cArguments = format_pyArgs
     def format_baseOperation( self, property, value ):
         """Format a baseOperation reference for display"""
         if hasattr( value, '__name__' ):
             return '%s = %s'%( property, value.__name__ )
         else:
             return '%s = %r'%( property, value )
+    def format_history( self, property, value ):
+        """Format the deferred-mode window of candidate calls"""
+        calls = []
+        for baseOperation, cArguments in value:
+            calls.append( '%s%s'%(
+                getattr( baseOperation, '__name__', baseOperation ),
+                self.shortRepr( tuple(cArguments or ()), False ),
+            ))
+        return '%s = %s'%( property, self.shortRepr( calls ) )
+
+class _Described( object ):
+    """Argument displayed through OpenGL.constant.describe"""
+    __slots__ = ('value',)
+    def __init__( self, value ):
+        self.value = value
+    def __repr__( self ):
+        from OpenGL import constant
+        return constant.describe( self.value )
 
 class GLUError( Error ):
     """GLU error implementation class"""
@@ -191,7 +246,13 @@ if _configflags.ERROR_CHECKING:
                         self._registeredChecker = self._getErrors
                 else:
                     self._registeredChecker = self.nullGetError
+                self._activeChecker = self._registeredChecker
                 self._currentChecker = self._registeredChecker
+                self._mode = IMMEDIATE
+                self._deferred = False
+                self._operations = self._arguments = ()
+                self._flushes = {}
+                self._index = self._pending = self._interval = self._size = 0
             def __bool__( self ):
                 """We are "true" if we actually do anything"""
                 if self._registeredChecker is self.nullGetError:
@@ -225,6 +286,22 @@ if _configflags.ERROR_CHECKING:
                     sequence.  If you are calling glBegin/glEnd in C you 
                     should call onBegin and onEnd appropriately.
                 """
+                if self._deferred:
+                    index = self._index
+                    self._operations[index] = baseOperation
+                    self._arguments[index] = cArguments
+                    index += 1
+                    self._index = 0 if index == self._size else index
+                    self._pending += 1
+                    # keyed by id as ctypes function pointers are unhashable
+                    flush = self._flushes.get( id(baseOperation) )
+                    if flush is None:
+                        flush = self._flushes[id(baseOperation)] = (
+                            getattr( baseOperation, '__name__', None ) in self.FLUSH_OPERATIONS
+                        )
+                    if flush or (self._interval and self._pending >= self._interval):
+                        self.checkDeferred( result )
+                    return result
                 err = self._currentChecker()
                 if err != self._noErrorResult:
                     raise self._errorClass(
@@ -234,6 +311,94 @@ if _configflags.ERROR_CHECKING:
                         baseOperation = baseOperation,
                     )
                 return result
+            FLUSH_OPERATIONS = frozenset(( 'glFlush', 'glFinish' ))
+            def setMode( self, mode, history=16, interval=0 ):
+                """Choose how (and whether) errors are checked
+                
+                mode -- one of
+                    IMMEDIATE -- glGetError after every call (the default)
+                    DEFERRED -- record the last history calls in a ring
+                        buffer and only call glGetError at glFlush/glFinish,
+                        on checkDeferred() or after interval calls
+                    OFF -- never call glGetError
+                history -- number of calls remembered in DEFERRED mode,
+                    i.e. the largest culprit window reported on error
+                interval -- in DEFERRED mode check after this many calls
+                    if no other check has occurred, 0 to disable
+                
+                Switching mode checks any calls still pending.  This only
+                affects checkers which are not null (i.e. which have a
+                glGetError available).
+                """
+                if mode not in (IMMEDIATE, DEFERRED, OFF):
+                    raise ValueError( """Unknown error-checking mode %r"""%( mode, ))
+                if self._activeChecker is self.nullGetError:
+                    return
+                if self._deferred:
+                    self.checkDeferred()
+                    if self._pending:
+                        raise RuntimeError( """Cannot change error-checking mode within glBegin/glEnd""" )
+                if mode == DEFERRED:
+                    if history < 1:
+                        raise ValueError( """Need a history of at least one call, got %r"""%( history, ))
+                    self._operations = [None]*history
+                    self._arguments = [None]*history
+                    self._flushes = {}
+                else:
+                    self._operations = self._arguments = ()
+                self._size = len( self._operations )
+                self._index = self._pending = 0
+                self._interval = interval
+                self._mode = mode
+                self._deferred = mode == DEFERRED
+                inBegin = self._currentChecker is not self._registeredChecker
+                if mode == OFF:
+                    self._registeredChecker = self.nullGetError
+                else:
+                    self._registeredChecker = self._activeChecker
+                if not inBegin:
+                    self._currentChecker = self._registeredChecker
+            def getMode( self ):
+                """Retrieve the current error-checking mode"""
+                return self._mode
+            def history( self, count=None ):
+                """Retrieve the last count recorded (baseOperation, cArguments), oldest first"""
+                size = len( self._operations )
+                if count is None or count > size:
+                    count = size
+                index = self._index
+                result = []
+                for offset in range( -count, 0 ):
+                    position = (index + offset) % size
+                    if self._operations[position] is not None:
+                        result.append( (self._operations[position], self._arguments[position]) )
+                return result
+            def checkDeferred( self, result=None ):
+                """Check for errors raised by calls recorded in DEFERRED mode
+                
+                Call at frame boundaries (before swapping buffers) when
+                using DEFERRED mode.  Does nothing between glBegin and
+                glEnd or if there are no unchecked calls, otherwise calls
+                glGetError and, on error, raises the errorClass with the
+                most recent call as baseOperation and the window of calls
+                made since the previous check as history.
+                """
+                if not self._pending or self._currentChecker is self.nullGetError:
+                    return result
+                pending, self._pending = self._pending, 0
+                err = self._currentChecker()
+                if err != self._noErrorResult:
+                    history = self.history( pending )
+                    baseOperation, cArguments = history[-1] if history else (None, None)
+                    error = self._errorClass(
+                        err,
+                        result,
+                        cArguments = cArguments,
+                        baseOperation = baseOperation,
+                    )
+                    error.history = history
+                    raise error
+                return result
             def onBegin( self ):
                 """Called by glBegin to record the fact that glGetError won't work"""
                 self._currentChecker = self.nullGetError
@@ -242,6 +407,34 @@ if _configflags.ERROR_CHECKING:
                 self._currentChecker = self._registeredChecker
 else:
     _ErrorChecker = None
+
+def _glChecker():
+    """Retrieve the GL error checker, checking it supports modes"""
+    from OpenGL.raw.GL._errors import _error_checker
+    if not hasattr( _error_checker, 'setMode' ):
+        raise RuntimeError(
+            """Error-checking modes require OpenGL.ERROR_CHECKING (and not OpenGL_accelerate's checker)"""
+        )
+    return _error_checker
+
+def setErrorCheckingMode( mode, history=16, interval=0 ):
+    """Set the GL error-checking mode at run-time
+    
+    See _ErrorChecker.setMode for the parameters.  Error checking must
+    have been enabled (OpenGL.ERROR_CHECKING) when OpenGL.GL was
+    imported, as otherwise there is no checker attached to the calls.
+    """
+    _glChecker().setMode( mode, history=history, interval=interval )
+
+def checkDeferred():
+    """Check for GL errors raised by calls recorded in DEFERRED mode
+    
+    Call at frame boundaries, before swapping buffers with anything other
+    than glutSwapBuffers.  Does nothing when not in DEFERRED mode.
+    """
+    from OpenGL.raw.GL._errors import _error_checker
+    if getattr( _error_checker, '_deferred', False ):
+        _error_checker.checkDeferred()
 # Compatibility with PyOpenGL 2.x series
 GLUerror = GLUError
 GLerror = GLError 
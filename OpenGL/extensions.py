@@ -2,11 +2,18 @@
 
 This module provides the tools required to check whether
 an extension is available
+
+GL_ specifiers are checked against a Capabilities snapshot (extensions,
+version and implementation limits) built once per context, see
+getCapabilities.  setCapabilityCache (or PYOPENGL_CAPABILITY_CACHE)
+sets a directory where snapshots are stored so later processes on the
+same implementation skip the queries.
 """
 from OpenGL.latebind import LateBind
+from OpenGL import platform, contextdata
 from OpenGL._bytes import bytes,unicode,as_8_bit
 import OpenGL as root
-import sys
+import sys, os, re, json, types, hashlib, tempfile
 import logging
 _log = logging.getLogger( 'OpenGL.extensions' )
 VERSION_PREFIX = as_8_bit('GL_VERSION_GL_')
@@ -80,6 +87,18 @@ VERSION_EXTENSIONS = [
     ]),
 ]
 
+def _asBytes( value ):
+    """Convert raw glGetString/glGetStringi result to bytes
+
+    The raw entry points only return bytes once OpenGL.GL.glget and
+    OpenGL.GL.VERSION.GL_3_0 have set their restype, which may not have
+    happened yet when OpenGL.GL is imported lazily.
+    """
+    if value and not isinstance( value, bytes ):
+        import ctypes
+        value = ctypes.cast( value, ctypes.c_char_p ).value
+    return value
+
 class ExtensionQuerier( object ):
     prefix = None
     version_prefix = None
@@ -90,6 +109,7 @@ class ExtensionQuerier( object ):
     
     registered = []
     def __init__( self ):
+        self.parsed = {}
         self.registered.append( self )
     
     @classmethod 
@@ -100,22 +120,41 @@ class ExtensionQuerier( object ):
                 return result 
         return False
     
-    def __call__( self, specifier ):
-        specifier = as_8_bit(specifier).replace(as_8_bit('.'),as_8_bit('_'))
-        if not specifier.startswith( as_8_bit(self.prefix) ):
-            return None 
-        
-        if specifier.startswith( as_8_bit(self.version_prefix) ):
-            specifier = [
+    def parse( self, specifier ):
+        """Parse specifier, returns (name, version tuple or None) or None
+
+        name is the specifier as bytes with '.' replaced by '_', version
+        is the tuple of ints for version specifiers.  Results are cached,
+        as the same few hundred specifiers are checked repeatedly.
+        """
+        try:
+            return self.parsed[specifier]
+        except KeyError:
+            pass
+        name = as_8_bit(specifier).replace(as_8_bit('.'),as_8_bit('_'))
+        if not name.startswith( as_8_bit(self.prefix) ):
+            result = None
+        elif name.startswith( as_8_bit(self.version_prefix) ):
+            result = name, tuple([
                 int(x)
-                for x in specifier[ len(self.version_prefix):].split(as_8_bit('_'))
-            ]
-            if specifier[:2] <= self.assumed_version:
+                for x in name[ len(self.version_prefix):].split(as_8_bit('_'))
+            ])
+        else:
+            result = name, None
+        self.parsed[specifier] = result
+        return result
+    def __call__( self, specifier ):
+        parsed = self.parse( specifier )
+        if parsed is None:
+            return None
+        specifier, required = parsed
+        if required is not None:
+            if list(required[:2]) <= self.assumed_version:
                 return True
             version = self.getVersion()
             if not version:
                 return version
-            return specifier <= version
+            return list(required) <= version
         else:
             extensions = self.getExtensions()
             return extensions and specifier in extensions
@@ -128,71 +167,412 @@ class ExtensionQuerier( object ):
             self.extensions = self.pullExtensions()
         return self.extensions
 
+# Limits recorded in capability snapshots:
+#   (name, enum, count, desktop version or None if only in compatibility
+#    profiles, ES version or None if not in OpenGL ES)
+LIMITS = [
+    ('GL_MAX_TEXTURE_SIZE', 0x0D33, 1, (1,0), (2,0)),
+    ('GL_MAX_VIEWPORT_DIMS', 0x0D3A, 2, (1,0), (2,0)),
+    ('GL_MAX_3D_TEXTURE_SIZE', 0x8073, 1, (1,2), (3,0)),
+    ('GL_MAX_ELEMENTS_VERTICES', 0x80E8, 1, (1,2), (3,0)),
+    ('GL_MAX_ELEMENTS_INDICES', 0x80E9, 1, (1,2), (3,0)),
+    ('GL_MAX_CUBE_MAP_TEXTURE_SIZE', 0x851C, 1, (1,3), (2,0)),
+    ('GL_MAX_TEXTURE_IMAGE_UNITS', 0x8872, 1, (2,0), (2,0)),
+    ('GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS', 0x8B4D, 1, (2,0), (2,0)),
+    ('GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS', 0x8B4C, 1, (2,0), (2,0)),
+    ('GL_MAX_VERTEX_ATTRIBS', 0x8869, 1, (2,0), (2,0)),
+    ('GL_MAX_VERTEX_UNIFORM_COMPONENTS', 0x8B4A, 1, (2,0), (3,0)),
+    ('GL_MAX_FRAGMENT_UNIFORM_COMPONENTS', 0x8B49, 1, (2,0), (3,0)),
+    ('GL_MAX_DRAW_BUFFERS', 0x8824, 1, (2,0), (3,0)),
+    ('GL_MAX_ARRAY_TEXTURE_LAYERS', 0x88FF, 1, (3,0), (3,0)),
+    ('GL_MAX_VARYING_COMPONENTS', 0x8B4B, 1, (3,0), (3,0)),
+    ('GL_MAX_COLOR_ATTACHMENTS', 0x8CDF, 1, (3,0), (3,0)),
+    ('GL_MAX_SAMPLES', 0x8D57, 1, (3,0), (3,0)),
+    ('GL_MAX_RENDERBUFFER_SIZE', 0x84E8, 1, (3,0), (2,0)),
+    ('GL_MAX_UNIFORM_BLOCK_SIZE', 0x8A30, 1, (3,1), (3,0)),
+    ('GL_MAX_UNIFORM_BUFFER_BINDINGS', 0x8A2F, 1, (3,1), (3,0)),
+    ('GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT', 0x8A34, 1, (3,1), (3,0)),
+    ('GL_MAX_TEXTURE_BUFFER_SIZE', 0x8C2B, 1, (3,1), (3,2)),
+    ('GL_MAX_GEOMETRY_OUTPUT_VERTICES', 0x8DE0, 1, (3,2), (3,2)),
+    ('GL_MAX_SAMPLE_MASK_WORDS', 0x8E59, 1, (3,2), (3,1)),
+    ('GL_MAX_TESS_GEN_LEVEL', 0x8E7E, 1, (4,0), (3,2)),
+    ('GL_MAX_VIEWPORTS', 0x825B, 1, (4,1), None),
+    ('GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS', 0x90DD, 1, (4,3), (3,1)),
+    ('GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT', 0x90DF, 1, (4,3), (3,1)),
+    ('GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS', 0x90EB, 1, (4,3), (3,1)),
+    ('GL_MAX_VERTEX_ATTRIB_BINDINGS', 0x82DA, 1, (4,3), (3,1)),
+    ('GL_MAX_LABEL_LENGTH', 0x82E8, 1, (4,3), (3,2)),
+    ('GL_MAX_LIGHTS', 0x0D31, 1, None, None),
+    ('GL_MAX_CLIP_PLANES', 0x0D32, 1, None, None),
+    ('GL_MAX_LIST_NESTING', 0x0B31, 1, None, None),
+    ('GL_MAX_TEXTURE_UNITS', 0x84E2, 1, None, None),
+    ('GL_MAX_TEXTURE_COORDS', 0x8871, 1, None, None),
+]
+# Increment when the snapshot contents change, invalidates stored snapshots
+CAPABILITIES_FORMAT = 2
+CAPABILITIES_KEY = 'OpenGL.extensions.capabilities'
+_capabilityCache = None
+
+def _parseVersion( version_string ):
+    """Parse (major, minor) from a GL_VERSION string, or None
+
+    Desktop strings start with the version ("4.5 (Compatibility Profile)
+    Mesa ..."), ES strings with "OpenGL ES " ("OpenGL ES 3.2 Mesa ...").
+    """
+    if not version_string:
+        return None
+    match = re.search( as_8_bit(r'(\d+)\.(\d+)'), version_string )
+    if match is None:
+        return None
+    return int( match.group(1) ), int( match.group(2) )
+
+def _singleExtensions( ):
+    """Extension names from glGetString( GL_EXTENSIONS )"""
+    from OpenGL.raw.GL.VERSION.GL_1_1 import glGetString, GL_EXTENSIONS
+    extensions = _asBytes( glGetString( GL_EXTENSIONS ) )
+    return extensions.split() if extensions else []
+def _indexedExtensions( ):
+    """Extension names from glGetStringi( GL_EXTENSIONS, i ) (GL 3.0, ES 3.0)"""
+    from OpenGL.raw.GL._types import GLint
+    from OpenGL.raw.GL.VERSION.GL_1_1 import glGetIntegerv, GL_EXTENSIONS
+    from OpenGL.raw.GL.VERSION.GL_3_0 import GL_NUM_EXTENSIONS, glGetStringi
+    count = GLint()
+    glGetIntegerv( GL_NUM_EXTENSIONS, count )
+    return [
+        _asBytes( glGetStringi( GL_EXTENSIONS, i ) )
+        for i in range( count.value )
+    ]
+
+class Capabilities( object ):
+    """Immutable snapshot of the capabilities of a GL context
+
+    vendor, renderer, version_string -- glGetString results (bytes)
+    version -- (major, minor) parsed from version_string
+    es -- whether the context is an OpenGL ES context
+    profile_mask -- GL_CONTEXT_PROFILE_MASK (0 before GL 3.2 and on ES)
+    context_flags -- GL_CONTEXT_FLAGS (0 where it can not be queried)
+    extensions -- frozenset of the extension names (bytes), including
+        those implied by version (VERSION_EXTENSIONS)
+    limits -- read-only mapping from LIMITS names to the queried value
+        (int, or tuple of ints for multi-valued limits), limits which do
+        not apply to the context are absent
+
+    Snapshots are built by Capabilities.query once per context and
+    shared (see getCapabilities), they can be written with save() and
+    read with load() to skip the queries in later processes using the
+    same implementation and context profile/flags (see 
+    setCapabilityCache).
+    """
+    __slots__ = (
+        'vendor', 'renderer', 'version_string', 'version', 'es',
+        'profile_mask', 'context_flags', 'extensions', 'limits',
+    )
+    def __init__( 
+        self, vendor, renderer, version_string, extensions, limits,
+        profile_mask=0, context_flags=0,
+    ):
+        version = _parseVersion( version_string )
+        es = bool( version_string ) and version_string.startswith( as_8_bit('OpenGL ES') )
+        if version and not es:
+            extensions = set( extensions )
+            for (v,v_exts) in VERSION_EXTENSIONS:
+                if v <= version:
+                    extensions.update( v_exts )
+                else:
+                    break
+        for key, value in (
+            ('vendor', vendor),
+            ('renderer', renderer),
+            ('version_string', version_string),
+            ('version', version),
+            ('es', es),
+            ('profile_mask', profile_mask),
+            ('context_flags', context_flags),
+            ('extensions', frozenset( extensions )),
+            ('limits', types.MappingProxyType( dict( limits ) )),
+        ):
+            object.__setattr__( self, key, value )
+    def __setattr__( self, key, value ):
+        raise AttributeError( """Capabilities are immutable""" )
+    def __repr__( self ):
+        return '<%s %r %r, %d extensions>'%(
+            self.__class__.__name__, self.renderer, self.version_string,
+            len( self.extensions ),
+        )
+    @property
+    def signature( self ):
+        """(vendor, renderer, version_string, profile_mask, context_flags)
+
+        Identifies the implementation and the kind of context, a core or
+        debug context of the same driver reports different extensions
+        and limits.
+        """
+        return (
+            self.vendor, self.renderer, self.version_string,
+            self.profile_mask, self.context_flags,
+        )
+    def check( self, name, required=None ):
+        """Check a parsed specifier (see ExtensionQuerier.parse)"""
+        if required is not None:
+            return bool( self.version ) and required <= self.version
+        return name in self.extensions
+    def hasExtension( self, specifier ):
+        """Check whether the GL_ specifier (extension or version) is supported"""
+        parsed = GLQuerier.parse( specifier )
+        if parsed is None:
+            return False
+        return self.check( *parsed )
+
+    @classmethod
+    def query( cls ):
+        """Build a snapshot of the current context, None if it has no GL_VERSION
+
+        If a capability cache is set (setCapabilityCache) a snapshot stored
+        for the same vendor, renderer and version strings, profile mask and
+        context flags is loaded instead of querying the extensions and 
+        limits, new snapshots are stored.
+        """
+        from OpenGL.raw.GL.VERSION.GL_1_1 import (
+            glGetString, GL_VENDOR, GL_RENDERER, GL_VERSION,
+        )
+        strings = tuple([
+            _asBytes( glGetString( constant ) ) or as_8_bit('')
+            for constant in (GL_VENDOR, GL_RENDERER, GL_VERSION)
+        ])
+        version = _parseVersion( strings[2] )
+        if not version:
+            return None # not yet loaded/supported
+        es = strings[2].startswith( as_8_bit('OpenGL ES') )
+        profile_mask, context_flags = cls.pullProfile( version, es )
+        signature = strings + (profile_mask, context_flags)
+        cache = _capabilityCache
+        if cache:
+            filename = cls.filename( cache, signature )
+            capabilities = cls.load( filename )
+            if capabilities is not None and capabilities.signature == signature:
+                return capabilities
+        compatibility = cls.pullCompatibility( version, es, profile_mask, context_flags )
+        capabilities = cls(
+            strings[0], strings[1], strings[2],
+            cls.pullExtensions( version, es, compatibility ),
+            cls.pullLimits( version, es, compatibility ),
+            profile_mask, context_flags,
+        )
+        if cache:
+            capabilities.save( filename )
+        return capabilities
+    @staticmethod
+    def pullProfile( version, es ):
+        """Query (GL_CONTEXT_PROFILE_MASK, GL_CONTEXT_FLAGS) of the current context
+
+        Either is 0 where the context's version does not define it.
+        """
+        from OpenGL.raw.GL._types import GLint
+        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetIntegerv
+        mask, flags = GLint(), GLint()
+        if not es and version >= (3,2):
+            glGetIntegerv( 0x9126, mask ) # GL_CONTEXT_PROFILE_MASK
+        if version >= ((3,2) if es else (3,0)):
+            glGetIntegerv( 0x821E, flags ) # GL_CONTEXT_FLAGS
+        return mask.value, flags.value
+    @staticmethod
+    def pullCompatibility( version, es, profile_mask, context_flags=0 ):
+        """Whether a context with version/profile_mask/context_flags provides deprecated functionality"""
+        if es:
+            return False
+        if version < (3,0):
+            return True
+        if version < (3,2):
+            return not (context_flags & 0x1) # GL_CONTEXT_FLAG_FORWARD_COMPATIBLE_BIT
+        return not (profile_mask & 0x1) # GL_CONTEXT_CORE_PROFILE_BIT
+    @staticmethod
+    def pullExtensions( version, es=False, compatibility=True ):
+        """Retrieve the list of extension names of the current context
+
+        Desktop contexts before 3.0 or with deprecated functionality
+        (compatibility) and ES contexts before 3.0 use glGetString(
+        GL_EXTENSIONS ), others (core and forward-compatible profiles,
+        ES 3.x) retrieve the names one at a time with glGetStringi.  If
+        the chosen query fails the other one is tried.
+        """
+        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetError
+        from OpenGL import error
+        if es:
+            single = version < (3,0)
+        else:
+            single = compatibility
+        queries = (_singleExtensions, _indexedExtensions)
+        if not single:
+            queries = queries[::-1]
+        for query in queries:
+            try:
+                extensions = query()
+                if glGetError():
+                    raise error.GLError()
+            except (AttributeError, error.GLError, error.NullFunctionError):
+                continue
+            if extensions:
+                return extensions
+        return []
+    @staticmethod
+    def pullLimits( version, es=False, compatibility=True ):
+        """Query the LIMITS which apply to the current context"""
+        from OpenGL.raw.GL._types import GLint
+        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetIntegerv
+        from OpenGL import error
+        limits = {}
+        for name, constant, count, desktop, es_version in LIMITS:
+            if es:
+                if es_version is None or es_version > version:
+                    continue
+            elif desktop is None:
+                if not compatibility:
+                    continue
+            elif desktop > version:
+                continue
+            value = (GLint*count)()
+            try:
+                glGetIntegerv( constant, value )
+            except error.GLError:
+                continue
+            limits[name] = value[0] if count == 1 else tuple( value )
+        return limits
+
+    def save( self, filename ):
+        """Atomically write the snapshot to filename (JSON), returns success"""
+        data = {
+            'format': CAPABILITIES_FORMAT,
+            'vendor': self.vendor.decode( 'latin-1' ),
+            'renderer': self.renderer.decode( 'latin-1' ),
+            'version_string': self.version_string.decode( 'latin-1' ),
+            'profile_mask': self.profile_mask,
+            'context_flags': self.context_flags,
+            'extensions': sorted([ name.decode( 'latin-1' ) for name in self.extensions ]),
+            'limits': dict( self.limits ),
+        }
+        directory = os.path.dirname( os.path.abspath( filename ))
+        try:
+            if not os.path.isdir( directory ):
+                os.makedirs( directory )
+            handle, temporary = tempfile.mkstemp(
+                dir=directory, prefix='.', suffix='.tmp',
+            )
+            try:
+                with os.fdopen( handle, 'w' ) as output:
+                    json.dump( data, output, indent=1, sort_keys=True )
+                os.replace( temporary, filename )
+            except Exception:
+                os.remove( temporary )
+                raise
+        except (IOError, OSError) as err:
+            _log.warning( """Unable to store capabilities in %s: %s""", filename, err )
+            return False
+        return True
+    @classmethod
+    def load( cls, filename ):
+        """Read a snapshot written by save(), None if missing or out of date"""
+        try:
+            with open( filename ) as handle:
+                data = json.load( handle )
+            if data.get( 'format' ) != CAPABILITIES_FORMAT:
+                return None
+            return cls(
+                data['vendor'].encode( 'latin-1' ),
+                data['renderer'].encode( 'latin-1' ),
+                data['version_string'].encode( 'latin-1' ),
+                [ name.encode( 'latin-1' ) for name in data['extensions'] ],
+                [
+                    (name, tuple(value) if isinstance( value, list ) else value)
+                    for name, value in data['limits'].items()
+                ],
+                int( data['profile_mask'] ),
+                int( data['context_flags'] ),
+            )
+        except (IOError, OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    @staticmethod
+    def filename( directory, signature ):
+        """File in directory for the snapshot of the implementation signature"""
+        digest = hashlib.sha256( b'\0'.join([
+            item if isinstance( item, bytes ) else as_8_bit( str( item ))
+            for item in signature
+        ])).hexdigest()
+        return os.path.join( directory, 'capabilities-%s.json'%( digest[:32], ))
+
+def getCapabilities( context=None ):
+    """Retrieve the Capabilities snapshot of context (default current)
+
+    The snapshot is built on the first call for a context and stored
+    with the context's data (so released by contextdata.cleanupContext),
+    returns None if there is no valid current context or it can not
+    report its version yet.
+    """
+    if context is None:
+        context = platform.PLATFORM.GetCurrentContext()
+        if not context:
+            return None
+    capabilities = contextdata.storedPointers.get( context, {} ).get( CAPABILITIES_KEY )
+    if capabilities is None:
+        capabilities = Capabilities.query()
+        if capabilities is not None:
+            contextdata.setValue(
+                CAPABILITIES_KEY, capabilities, context=context, weak=False
+            )
+    return capabilities
+
+def setCapabilityCache( directory ):
+    """Set the directory used to store Capabilities snapshots
+
+    directory -- directory name, or None to disable the cache
+
+    Snapshots are stored per vendor, renderer and version string, profile
+    mask and context flags, so a driver update (which normally changes 
+    the version string) rebuilds them.  PYOPENGL_CAPABILITY_CACHE sets the directory on import.
+    """
+    global _capabilityCache
+    if directory:
+        directory = os.path.abspath( os.path.expanduser( directory ))
+    _capabilityCache = directory or None
+    return _capabilityCache
+def getCapabilityCache( ):
+    """Retrieve the capability cache directory (or None)"""
+    return _capabilityCache
+if os.environ.get( 'PYOPENGL_CAPABILITY_CACHE' ):
+    setCapabilityCache( os.environ['PYOPENGL_CAPABILITY_CACHE'] )
+
 class _GLQuerier( ExtensionQuerier ):
+    """Querier for GL_ specifiers, using the current context's Capabilities"""
     prefix = as_8_bit('GL_')
     version_prefix = as_8_bit('GL_VERSION_GL_')
     assumed_version = [1,1]
+    def __call__( self, specifier ):
+        parsed = self.parse( specifier )
+        if parsed is None:
+            return None
+        if parsed[1] is not None and list(parsed[1][:2]) <= self.assumed_version:
+            return True
+        capabilities = getCapabilities()
+        if capabilities is None:
+            return False
+        return capabilities.check( *parsed )
+    def getVersion( self ):
+        capabilities = getCapabilities()
+        if capabilities is None or not capabilities.version:
+            return False
+        return list( capabilities.version )
+    def getExtensions( self ):
+        capabilities = getCapabilities()
+        if capabilities is None:
+            return False
+        return sorted( capabilities.extensions )
     def pullVersion( self ):
         """Retrieve 2-int declaration of major/minor GL version
 
         returns [int(major),int(minor)] or False if not loaded
         """
-        from OpenGL import platform
-        if not platform.PLATFORM.CurrentContextIsValid():
-            return False
-        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetString 
-        from OpenGL.raw.GL.VERSION.GL_1_1 import GL_VERSION
-        new = glGetString( GL_VERSION )
-        
-        self.version_string = new
-        if new:
-            return [
-                int(x) for x in new.split(as_8_bit(' '),1)[0].split( as_8_bit('.') )
-            ]
-        else:
-            return False # not yet loaded/supported
+        return self.getVersion()
     def pullExtensions( self ):
-        from OpenGL import platform
-        if not platform.PLATFORM.CurrentContextIsValid():
-            return False
-        from OpenGL.raw.GL._types import GLint
-        from OpenGL.raw.GL.VERSION.GL_1_1 import glGetString, glGetError
-        from OpenGL.raw.GL.VERSION.GL_1_1 import GL_EXTENSIONS
-        from OpenGL import error
-        try:
-            extensions = glGetString( GL_EXTENSIONS )
-            if glGetError():
-                raise error.GLError()
-            if extensions:
-                extensions = extensions.split()
-            else:
-                return False
-        except (AttributeError, error.GLError):
-            # OpenGL 3.0 deprecates glGetString( GL_EXTENSIONS )
-            from OpenGL.raw.GL.VERSION.GL_3_0 import GL_NUM_EXTENSIONS, glGetStringi
-            from OpenGL.raw.GL.VERSION.GL_1_1 import glGetIntegerv
-            count = GLint()
-            glGetIntegerv( GL_NUM_EXTENSIONS, count )
-            extensions = []
-            for i in range( count.value ):
-                extension = glGetStringi( GL_EXTENSIONS, i )
-                extensions.append(
-                    extension
-                )
-        # Add included-by-reference extensions...
-        version = self.getVersion()
-        if not version:
-            # should not be possible?
-            return version 
-        check = tuple( version[:2] )
-        for (v,v_exts) in VERSION_EXTENSIONS:
-            if v <= check:
-                for v_ext in v_exts:
-                    if v_ext not in extensions:
-                        extensions.append( as_8_bit(v_ext) )
-            else:
-                break
-        return extensions
+        return self.getExtensions()
 GLQuerier = _GLQuerier()
 class _GLUQuerier( ExtensionQuerier ):
     prefix = as_8_bit('GLU_')
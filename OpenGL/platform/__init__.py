@@ -55,8 +55,12 @@ def _load( ):
 
 _load()
 
+# argTypes tuples, interned so that identical signatures share one tuple
+_signatures = {}
+
 def types(resultType,*argTypes):
     """Decorator to add returnType, argTypes and argNames to a function"""
+    argTypes = _signatures.setdefault( argTypes, argTypes )
     def add_types( function ):
         """Adds the given metadata to the function, introspects var names from declaration"""
         function.resultType = resultType
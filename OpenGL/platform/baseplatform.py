@@ -3,7 +3,7 @@
 import ctypes
 from OpenGL.platform import ctypesloader
 from OpenGL._bytes import as_8_bit
-import sys, logging
+import sys, time, logging, threading, weakref
 from OpenGL import _configflags
 from OpenGL import logs, MODULE_ANNOTATIONS
 log = logging.getLogger(__name__)
@@ -73,6 +73,10 @@ class BasePlatform( object ):
         EXTENSIONS_USE_BASE_FUNCTIONS -- if True, uses regular
             dll attribute-based lookup to retrieve extension 
             function pointers.
+
+        BACKGROUND_RESOLUTION -- if True, function pointers can be
+            retrieved without the context being current on the
+            calling thread, so resolveFunctions may use a thread
     """
     
     EXPORTED_NAMES = [
@@ -83,6 +87,7 @@ class BasePlatform( object ):
         'copyBaseFunction',
         'getGLUTFontPointer',
         'nullFunction',
+        'resolveFunctions',
         'GLUT_GUARD_CALLBACKS',
     ]
 
@@ -90,6 +95,7 @@ class BasePlatform( object ):
     DEFAULT_FUNCTION_TYPE = None
     GLUT_GUARD_CALLBACKS = False
     EXTENSIONS_USE_BASE_FUNCTIONS = False
+    BACKGROUND_RESOLUTION = False
     
     def install( self, namespace ):
         """Install this platform instance into the platform module"""
@@ -134,6 +140,22 @@ class BasePlatform( object ):
             return ArrayDatatype
         else:
             return typ
+    def prototypeFor( self, dll, resultType, argTypes ):
+        """Retrieve the ctypes function type for a signature in dll
+
+        Prototypes are interned, so every entry point with the same
+        (function type, resultType, argTypes) shares one prototype
+        regardless of the module which declared it.
+        """
+        functionType = self.functionTypeFor( dll )
+        key = (functionType, resultType, tuple( argTypes ))
+        prototype = _prototypes.get( key )
+        if prototype is None:
+            prototype = _prototypes[key] = functionType(
+                resultType,
+                *[ self.finalArgType( t ) for t in argTypes ]
+            )
+        return prototype
     def constructFunction( 
         self,
         functionName, dll, 
@@ -144,34 +166,30 @@ class BasePlatform( object ):
         module = None,
         force_extension = False,
         error_checker = None,
+        checked = False,
     ):
         """Core operation to create a new base ctypes function
         
+        checked -- if True the caller has verified that extension is
+            supported, so it is not checked against the current context
+        
         raises AttributeError if can't find the procedure...
         """
         is_core = (not extension) or extension.split('_')[1] == 'VERSION'
-        if (not is_core) and not self.checkExtension( extension ):
+        if (not is_core) and not checked and not self.checkExtension( extension ):
             raise AttributeError( """Extension not available""" )
-        argTypes = [ self.finalArgType( t ) for t in argTypes ]
+        prototype = self.prototypeFor( dll, resultType, argTypes )
             
         if force_extension or ((not is_core) and (not self.EXTENSIONS_USE_BASE_FUNCTIONS)):
             # what about the VERSION values???
             pointer = self.getExtensionProcedure( as_8_bit(functionName) )
             if pointer:
-                func = self.functionTypeFor( dll )(
-                    resultType,
-                    *argTypes
-                )(
-                    pointer
-                )
+                func = prototype( pointer )
             else:
                 raise AttributeError( """Extension %r available, but no pointer for function %r"""%(extension,functionName))
         else:
             func = ctypesloader.buildFunction(
-                self.functionTypeFor( dll )(
-                    resultType,
-                    *argTypes
-                ),
+                prototype,
                 functionName,
                 dll,
             )
@@ -260,25 +278,10 @@ class BasePlatform( object ):
 #            return True
         if not name:
             return True
-        context = self.GetCurrentContext()
-        if context:
-            from OpenGL import contextdata
-            set = contextdata.getValue( 'extensions', context=context )
-            if set is None:
-                set = {}
-                contextdata.setValue( 
-                    'extensions', set, context=context, weak=False 
-                )
-            current = set.get( name )
-            if current is None:
-                from OpenGL import extensions
-                result = extensions.ExtensionQuerier.hasExtension( name )
-                set[name] = result 
-                return result
-            return current
-        else:
-            from OpenGL import extensions
-            return extensions.ExtensionQuerier.hasExtension( name )
+        # GL_ specifiers are checked against the context's (cached, immutable)
+        # extensions.Capabilities snapshot
+        from OpenGL import extensions
+        return extensions.ExtensionQuerier.hasExtension( name )
     createExtensionFunction = createBaseFunction
 
     def copyBaseFunction( self, original ):
@@ -322,24 +325,78 @@ class BasePlatform( object ):
         error_checker = None,
         force_extension = False,
     ):
-        """Construct a "null" function pointer"""
+        """Construct a "null" function pointer
+
+        The pointer is an instance of the shared _NullFunctionPointer
+        (or _DeprecatedFunctionPointer) class, the per-function class
+        through which a loaded pointer forwards its calls is only
+        created by load(), so declaring the thousands of entry points
+        of the raw modules is cheap.
+        """
         if deprecated:
-            base = _DeprecatedFunctionPointer
+            cls = _DeprecatedFunctionPointer
         else:
-            base = _NullFunctionPointer
-        cls = type( functionName, (base,), {
-            '__doc__': doc,
-            'deprecated': deprecated,
-        } )
+            cls = _NullFunctionPointer
         if MODULE_ANNOTATIONS:
+            cls = cls.specialise( functionName, doc )
             if not module:
                 module = _find_module( )
             if module:
                 cls.__module__ = module
-        return cls(
+        result = cls(
             functionName, dll, resultType, argTypes, argNames, extension=extension, doc=doc,
             error_checker = error_checker, force_extension=force_extension,
         )
+        if not deprecated:
+            _nullFunctions.add( result )
+        return result
+    def resolveFunctions( self, background=False ):
+        """Resolve the entry points of all supported GL versions and extensions
+
+        Entry points are normally resolved when first called, which puts
+        the symbol lookups of every function a renderer uses into its
+        first frame.  Call this with the context current (e.g. right
+        after creating it) to resolve, in one pass, every unresolved
+        function created so far (i.e. those of the modules imported so
+        far) whose GL version or extension is supported by the current
+        context's extensions.Capabilities.
+
+        background -- if True and the platform allows it
+            (BACKGROUND_RESOLUTION), do the lookups on a daemon thread;
+            the set of functions is chosen on the calling thread
+
+        returns FunctionResolution reporting the counts and time taken,
+        which is already done() unless resolution runs in the background
+        """
+        from OpenGL import extensions
+        report = FunctionResolution()
+        capabilities = extensions.getCapabilities()
+        if capabilities is None:
+            report.finish()
+            return report
+        pending = []
+        for function in list( _nullFunctions ):
+            if function.resolved:
+                continue
+            extension = function.extension
+            if not (extension and extension.startswith( 'GL_' )) or function.force_extension:
+                # window-system and library entry points, or those which
+                # check their extension themselves
+                report.skipped += 1
+            elif capabilities.hasExtension( extension ):
+                pending.append( function )
+            else:
+                report.unsupported += 1
+        if background and self.BACKGROUND_RESOLUTION:
+            thread = threading.Thread(
+                target=report.resolve, args=(pending,),
+                name='PyOpenGL-resolveFunctions',
+            )
+            thread.daemon = True
+            thread.start()
+        else:
+            report.resolve( pending )
+        return report
     def GetCurrentContext( self ):
         """Retrieve opaque pointer for the current context"""
         raise NotImplementedError( 
@@ -357,6 +414,56 @@ class BasePlatform( object ):
     @lazy_property
     def OpenGL(self): return self.GL
 
+class FunctionResolution( object ):
+    """Report from BasePlatform.resolveFunctions
+
+    resolved -- number of entry points resolved
+    missing -- names of entry points whose version/extension is supported
+        but for which the platform returned no pointer
+    unsupported -- number of entry points skipped as their version or
+        extension is not supported by the context
+    skipped -- number of entry points which are not GL version/extension
+        functions (GLU, GLUT, window-system functions, etc.)
+    elapsed -- seconds spent resolving
+    """
+    def __init__( self ):
+        self.resolved = self.unsupported = self.skipped = 0
+        self.missing = []
+        self.elapsed = 0.0
+        self.finished = threading.Event()
+    def resolve( self, functions ):
+        """Resolve functions (already known to be supported), then finish"""
+        start = time.perf_counter()
+        try:
+            for function in functions:
+                if function.resolved or function.load( checked=True ) is not None:
+                    self.resolved += 1
+                else:
+                    self.missing.append( function.__name__ )
+        finally:
+            self.elapsed = time.perf_counter() - start
+            self.finish()
+    def finish( self ):
+        self.finished.set()
+    def done( self ):
+        """Whether resolution has completed"""
+        return self.finished.is_set()
+    def wait( self, timeout=None ):
+        """Wait for resolution to complete, returns done()"""
+        return self.finished.wait( timeout )
+    def __repr__( self ):
+        return '<%s %s resolved=%d missing=%d unsupported=%d skipped=%d %.1fms>'%(
+            self.__class__.__name__,
+            'done' if self.done() else 'pending',
+            self.resolved, len( self.missing ), self.unsupported, self.skipped,
+            self.elapsed * 1000,
+        )
+
+# _NullFunctionPointer instances created by BasePlatform.nullFunction
+_nullFunctions = weakref.WeakSet()
+# (function type, resultType, argTypes): prototype, see BasePlatform.prototypeFor
+_prototypes = {}
+
 class _NullFunctionPointer( object ):
     """Function-pointer-like object for undefined functions"""
     def __init__( 
@@ -364,27 +471,40 @@ class _NullFunctionPointer( object ):
         extension=None, doc=None, deprecated=False,
         error_checker = None, force_extension=None,
     ):
-        from OpenGL import error
-        self.__name__ = name
-        self.DLL = dll
-        self.argNames = argNames
-        self.argtypes = argTypes
-        self.errcheck = None
-        self.restype = resultType
-        self.extension = extension
-        self.doc = doc
-        self.deprecated = deprecated
-        self.error_checker = error_checker
-        self.force_extension = force_extension
+        # bypasses __setattr__, nothing is loaded yet
+        self.__dict__.update(
+            __name__ = name,
+            __doc__ = doc,
+            DLL = dll,
+            argNames = argNames,
+            argtypes = argTypes,
+            errcheck = None,
+            restype = resultType,
+            extension = extension,
+            doc = doc,
+            deprecated = deprecated or self.deprecated,
+            error_checker = error_checker,
+            force_extension = force_extension,
+        )
     resolved = False
+    deprecated = False
+    SHARED = True
+    @classmethod
+    def specialise( cls, name, doc=None ):
+        """Create the class of a single function pointer"""
+        return type( name, (cls,), {'__doc__': doc, 'SHARED': False} )
     def __nonzero__( self ):
         """Make this object appear to be NULL"""
         if (not self.resolved) and (self.extension or self.force_extension):
             self.load()
         return self.resolved
     __bool__ = __nonzero__
-    def load( self ):
-        """Attempt to load the function again, presumably with a context this time"""
+    def load( self, checked=False ):
+        """Attempt to load the function again, presumably with a context this time
+
+        checked -- passed to constructFunction, if True the extension is
+            known to be supported and is not checked again
+        """
         try:
             from OpenGL import platform
         except ImportError:
@@ -401,15 +521,28 @@ class _NullFunctionPointer( object ):
                 extension = self.extension,
                 error_checker = self.error_checker,
                 force_extension = self.force_extension,
+                checked = checked,
             )
         except AttributeError as err:
             return None 
         else:
             # now short-circuit so that we don't need to check again...
-            self.__class__.__call__ = staticmethod( func.__call__ )
+            cls = self.__class__
+            if cls.SHARED:
+                cls = cls.specialise( self.__name__, self.doc )
+            cls.__call__ = staticmethod( func.__call__ )
+            self.__class__ = cls
+            self.function = func
             self.resolved = True
             return func
         return None
+    function = None
+    FORWARDED = ('restype','errcheck')
+    def __setattr__( self, key, value ):
+        """Apply restype/errcheck changes made after loading to the loaded function"""
+        object.__setattr__( self, key, value )
+        if key in self.FORWARDED and self.function is not None:
+            setattr( self.function, key, value )
     def __call__( self, *args, **named ):
         if self.load():
             return self( *args, **named )
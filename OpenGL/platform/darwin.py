@@ -28,6 +28,8 @@ class DarwinPlatform( baseplatform.BasePlatform ):
     """Darwin (OSX) platform implementation"""
     DEFAULT_FUNCTION_TYPE = staticmethod( ctypes.CFUNCTYPE )
     EXTENSIONS_USE_BASE_FUNCTIONS = True
+    # symbols are looked up in the framework with dlsym
+    BACKGROUND_RESOLUTION = True
 
     @baseplatform.lazy_property
     def GL(self):
@@ -101,6 +101,8 @@ class EGLPlatform( baseplatform.BasePlatform ):
             return None
 
     DEFAULT_FUNCTION_TYPE = staticmethod( ctypes.CFUNCTYPE )
+    # eglGetProcAddress results do not depend on the current context
+    BACKGROUND_RESOLUTION = True
     @baseplatform.lazy_property
     def GetCurrentContext( self ):
         return self.EGL.eglGetCurrentContext
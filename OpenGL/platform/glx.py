@@ -92,6 +92,8 @@ class GLXPlatform(baseplatform.BasePlatform):
             return None
 
     DEFAULT_FUNCTION_TYPE = staticmethod(ctypes.CFUNCTYPE)
+    # glXGetProcAddressARB results do not depend on the current context
+    BACKGROUND_RESOLUTION = True
 
     # This loads the GLX functions from the GL .so, not sure if that's
     # really kosher...
@@ -60,6 +60,8 @@ class OSMesaPlatform( baseplatform.BasePlatform ):
     def OSMesa( self ): return self.GL
         
     DEFAULT_FUNCTION_TYPE = staticmethod( ctypes.CFUNCTYPE )
+    # OSMesaGetProcAddress results do not depend on the current context
+    BACKGROUND_RESOLUTION = True
 
     @baseplatform.lazy_property
     def GetCurrentContext( self ):
@@ -117,6 +117,7 @@ class Win32Platform( baseplatform.BasePlatform ):
         module = None,
         force_extension = False,
         error_checker = None,
+        checked = False,
     ):
         """Override construct function to do win32-specific hacks to find entry points"""
         try:
@@ -128,6 +129,7 @@ class Win32Platform( baseplatform.BasePlatform ):
                 deprecated,
                 module,
                 error_checker=error_checker,
+                checked=checked,
             )
         except AttributeError:
             try:
@@ -139,6 +141,7 @@ class Win32Platform( baseplatform.BasePlatform ):
                     deprecated,
                     module,
                     error_checker=error_checker,
+                    checked=checked,
                 )
             except AttributeError:
                 return super( Win32Platform, self ).constructFunction(
@@ -150,5 +153,6 @@ class Win32Platform( baseplatform.BasePlatform ):
                     module,
                     force_extension = True,
                     error_checker=error_checker,
+                    checked=checked,
                 )
             
@@ -7,66 +7,23 @@ except ImportError:
 _glget_size_mapping = _m = {}
 # _m[0x8892] = TODO # GL_ARRAY_BUFFER
 # _m[0x92C0] = TODO # GL_ATOMIC_COUNTER_BUFFER
-# _m[0x8777] = TODO # GL_BUMP_NUM_TEX_UNITS_ATI
-# _m[0x8775] = TODO # GL_BUMP_ROT_MATRIX_ATI
-# _m[0x8776] = TODO # GL_BUMP_ROT_MATRIX_SIZE_ATI
-# _m[0x8778] = TODO # GL_BUMP_TEX_UNITS_ATI
 # _m[0x0A00] = TODO # GL_COEFF
 # _m[0x8576] = TODO # GL_CONSTANT
 # _m[0x8095] = TODO # GL_DETAIL_TEXTURE_2D_SGIS
-# _m[0x809C] = TODO # GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS
-# _m[0x809A] = TODO # GL_DETAIL_TEXTURE_LEVEL_SGIS
-# _m[0x809B] = TODO # GL_DETAIL_TEXTURE_MODE_SGIS
 # _m[0x9599] = TODO # GL_DEVICE_LUID_EXT
-# _m[0x959A] = TODO # GL_DEVICE_NODE_MASK_EXT
 # _m[0x9597] = TODO # GL_DEVICE_UUID_EXT
 # _m[0x90EE] = TODO # GL_DISPATCH_INDIRECT_BUFFER
 # _m[0x0A02] = TODO # GL_DOMAIN
 # _m[0x8F3F] = TODO # GL_DRAW_INDIRECT_BUFFER
 # _m[0x9598] = TODO # GL_DRIVER_UUID_EXT
-# _m[0x8124] = TODO # GL_DUAL_TEXTURE_SELECT_SGIS
 # _m[0x8893] = TODO # GL_ELEMENT_ARRAY_BUFFER
 # _m[0x86C0] = TODO # GL_EVAL_2D_NV
 # _m[0x86C1] = TODO # GL_EVAL_TRIANGULAR_2D_NV
 # _m[0x2400] = TODO # GL_EYE_LINEAR
-# _m[0x8210] = TODO # GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING_EXT
-# _m[0x8211] = TODO # GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE_EXT
-# _m[0x8DA7] = TODO # GL_FRAMEBUFFER_ATTACHMENT_LAYERED_ARB
-# _m[0x8DA7] = TODO # GL_FRAMEBUFFER_ATTACHMENT_LAYERED_EXT
-# _m[0x8DA7] = TODO # GL_FRAMEBUFFER_ATTACHMENT_LAYERED_OES
-# _m[0x8CD1] = TODO # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME_EXT
-# _m[0x8CD1] = TODO # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME_OES
-# _m[0x8CD0] = TODO # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE_EXT
-# _m[0x8CD0] = TODO # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE_OES
-# _m[0x8CD4] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_EXT
-# _m[0x8CD4] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_OES
-# _m[0x8CD3] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE_EXT
-# _m[0x8CD3] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE_OES
-# _m[0x8CD4] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER_EXT
-# _m[0x8CD2] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL_EXT
-# _m[0x8CD2] = TODO # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL_OES
-# _m[0x8191] = TODO # GL_GENERATE_MIPMAP_SGIS
-# _m[0x8917] = TODO # GL_GEOMETRY_INPUT_TYPE
-# _m[0x8918] = TODO # GL_GEOMETRY_OUTPUT_TYPE
-# _m[0x8916] = TODO # GL_GEOMETRY_VERTICES_OUT
-# _m[0x815E] = TODO # GL_IMAGE_CUBIC_WEIGHT_HP
-# _m[0x815C] = TODO # GL_IMAGE_MAG_FILTER_HP
-# _m[0x815D] = TODO # GL_IMAGE_MIN_FILTER_HP
-# _m[0x8159] = TODO # GL_IMAGE_ROTATE_ANGLE_HP
-# _m[0x815A] = TODO # GL_IMAGE_ROTATE_ORIGIN_X_HP
-# _m[0x815B] = TODO # GL_IMAGE_ROTATE_ORIGIN_Y_HP
-# _m[0x8155] = TODO # GL_IMAGE_SCALE_X_HP
-# _m[0x8156] = TODO # GL_IMAGE_SCALE_Y_HP
-# _m[0x8157] = TODO # GL_IMAGE_TRANSLATE_X_HP
-# _m[0x8158] = TODO # GL_IMAGE_TRANSLATE_Y_HP
-# _m[0x8182] = TODO # GL_LIST_PRIORITY_SGIX
 # _m[0] = TODO # GL_NONE
-# _m[0x9596] = TODO # GL_NUM_DEVICE_UUIDS_EXT
 # _m[0x2401] = TODO # GL_OBJECT_LINEAR
 # _m[0x0A01] = TODO # GL_ORDER
-# _m[0x85A0] = TODO # GL_PACK_SUBSAMPLE_RATE_SGIX
 # _m[0x80EE] = TODO # GL_PARAMETER_BUFFER
-# _m[0x908A] = TODO # GL_PATH_OBJECT_BOUNDING_BOX_NV
 # _m[0x88EB] = TODO # GL_PIXEL_PACK_BUFFER
 # _m[0x88EC] = TODO # GL_PIXEL_UNPACK_BUFFER
 # _m[0x8063] = TODO # GL_PROXY_TEXTURE_1D
@@ -90,38 +47,9 @@ _glget_size_mapping = _m = {}
 # _m[0x84F7] = TODO # GL_PROXY_TEXTURE_RECTANGLE
 # _m[0x84F7] = TODO # GL_PROXY_TEXTURE_RECTANGLE_ARB
 # _m[0x84F7] = TODO # GL_PROXY_TEXTURE_RECTANGLE_NV
-# _m[0x8125] = TODO # GL_QUAD_TEXTURE_SELECT_SGIS
 # _m[0x9192] = TODO # GL_QUERY_BUFFER
-# _m[0x8D53] = TODO # GL_RENDERBUFFER_ALPHA_SIZE_EXT
-# _m[0x8D53] = TODO # GL_RENDERBUFFER_ALPHA_SIZE_OES
-# _m[0x8D52] = TODO # GL_RENDERBUFFER_BLUE_SIZE_EXT
-# _m[0x8D52] = TODO # GL_RENDERBUFFER_BLUE_SIZE_OES
-# _m[0x8D54] = TODO # GL_RENDERBUFFER_DEPTH_SIZE_EXT
-# _m[0x8D54] = TODO # GL_RENDERBUFFER_DEPTH_SIZE_OES
-# _m[0x8D51] = TODO # GL_RENDERBUFFER_GREEN_SIZE_EXT
-# _m[0x8D51] = TODO # GL_RENDERBUFFER_GREEN_SIZE_OES
-# _m[0x8D43] = TODO # GL_RENDERBUFFER_HEIGHT_EXT
-# _m[0x8D43] = TODO # GL_RENDERBUFFER_HEIGHT_OES
-# _m[0x8D44] = TODO # GL_RENDERBUFFER_INTERNAL_FORMAT_EXT
-# _m[0x8D44] = TODO # GL_RENDERBUFFER_INTERNAL_FORMAT_OES
-# _m[0x8D50] = TODO # GL_RENDERBUFFER_RED_SIZE_EXT
-# _m[0x8D50] = TODO # GL_RENDERBUFFER_RED_SIZE_OES
-# _m[0x8CAB] = TODO # GL_RENDERBUFFER_SAMPLES_ANGLE
-# _m[0x8CAB] = TODO # GL_RENDERBUFFER_SAMPLES_APPLE
-# _m[0x8CAB] = TODO # GL_RENDERBUFFER_SAMPLES_EXT
-# _m[0x8CAB] = TODO # GL_RENDERBUFFER_SAMPLES_NV
-# _m[0x8D55] = TODO # GL_RENDERBUFFER_STENCIL_SIZE_EXT
-# _m[0x8D55] = TODO # GL_RENDERBUFFER_STENCIL_SIZE_OES
-# _m[0x8D42] = TODO # GL_RENDERBUFFER_WIDTH_EXT
-# _m[0x8D42] = TODO # GL_RENDERBUFFER_WIDTH_OES
-# _m[0x80BF] = TODO # GL_SHADOW_AMBIENT_SGIX
-# _m[0x81FB] = TODO # GL_SHARED_TEXTURE_PALETTE_EXT
-# _m[0x80B0] = TODO # GL_SHARPEN_TEXTURE_FUNC_POINTS_SGIS
 # _m[0x9100] = TODO # GL_TEXTURE_2D_MULTISAMPLE
 # _m[0x9102] = TODO # GL_TEXTURE_2D_MULTISAMPLE_ARRAY
-# _m[0x8136] = TODO # GL_TEXTURE_4DSIZE_SGIS
-# _m[0x8175] = TODO # GL_TEXTURE_CLIPMAP_LOD_OFFSET_SGIX
-# _m[0x1003] = TODO # GL_TEXTURE_COMPONENTS
 # _m[0x9009] = TODO # GL_TEXTURE_CUBE_MAP_ARRAY_ARB
 # _m[0x9009] = TODO # GL_TEXTURE_CUBE_MAP_ARRAY_EXT
 # _m[0x9009] = TODO # GL_TEXTURE_CUBE_MAP_ARRAY_OES
@@ -131,13 +59,8 @@ _glget_size_mapping = _m = {}
 # _m[0x8515] = TODO # GL_TEXTURE_CUBE_MAP_POSITIVE_X
 # _m[0x8517] = TODO # GL_TEXTURE_CUBE_MAP_POSITIVE_Y
 # _m[0x8519] = TODO # GL_TEXTURE_CUBE_MAP_POSITIVE_Z
-# _m[0x8147] = TODO # GL_TEXTURE_FILTER4_SIZE_SGIS
-# _m[0x819D] = TODO # GL_TEXTURE_GEQUAL_R_SGIX
-# _m[0x819C] = TODO # GL_TEXTURE_LEQUAL_R_SGIX
-# _m[0x84FE] = TODO # GL_TEXTURE_MAX_ANISOTROPY
 # _m[0x8C8E] = TODO # GL_TRANSFORM_FEEDBACK_BUFFER
 # _m[0x8A11] = TODO # GL_UNIFORM_BUFFER
-# _m[0x85A1] = TODO # GL_UNPACK_SUBSAMPLE_RATE_SGIX
 _m[0x0D5B] = (1,) # GL_ACCUM_ALPHA_BITS
 _m[0x0D5A] = (1,) # GL_ACCUM_BLUE_BITS
 _m[0x0B80] = (4,) # GL_ACCUM_CLEAR_VALUE
@@ -267,7 +190,11 @@ _m[0x8764] = (1,) # GL_BUFFER_SIZE_ARB
 _m[0x8220] = (1,) # GL_BUFFER_STORAGE_FLAGS
 _m[0x8765] = (1,) # GL_BUFFER_USAGE
 _m[0x8765] = (1,) # GL_BUFFER_USAGE_ARB
+_m[0x8777] = (1,) # GL_BUMP_NUM_TEX_UNITS_ATI
+_m[0x8775] = (4,) # GL_BUMP_ROT_MATRIX_ATI
+_m[0x8776] = (1,) # GL_BUMP_ROT_MATRIX_SIZE_ATI
 _m[0x877C] = (1,) # GL_BUMP_TARGET_ATI
+_m[0x8778] = (_L(0x8777),) # GL_BUMP_TEX_UNITS_ATI
 _m[0x8183] = (1,) # GL_CALLIGRAPHIC_FRAGMENT_SGIX
 _m[0x891B] = (1,) # GL_CLAMP_FRAGMENT_COLOR
 _m[0x891B] = (1,) # GL_CLAMP_FRAGMENT_COLOR_ARB
@@ -369,6 +296,8 @@ _m[0x8572] = (1,) # GL_COMBINE_ALPHA
 _m[0x8571] = (1,) # GL_COMBINE_RGB
 _m[0x8E4B] = (1,) # GL_COMPATIBLE_SUBROUTINES
 _m[0x8B81] = (1,) # GL_COMPILE_STATUS
+_m[0x91B1] = (1,) # GL_COMPLETION_STATUS_ARB
+_m[0x91B1] = (1,) # GL_COMPLETION_STATUS_KHR
 _m[0x86A3] = (_L(0x86A2),) # GL_COMPRESSED_TEXTURE_FORMATS
 _m[0x86A3] = (_L(0x86A2),) # GL_COMPRESSED_TEXTURE_FORMATS_ARB
 _m[0x90FB] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/compute_program5.txt # GL_COMPUTE_PROGRAM_NV
@@ -488,6 +417,10 @@ _m[0x95AB] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/
 _m[0x95A9] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NV/NV_memory_attachment.txt # GL_DETACHED_MEMORY_INCARNATION_NV
 _m[0x95AA] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NV/NV_memory_attachment.txt # GL_DETACHED_TEXTURES_NV
 _m[0x8096] = (1,) # GL_DETAIL_TEXTURE_2D_BINDING_SGIS
+_m[0x809C] = (1,) # GL_DETAIL_TEXTURE_FUNC_POINTS_SGIS
+_m[0x809A] = (1,) # GL_DETAIL_TEXTURE_LEVEL_SGIS
+_m[0x809B] = (1,) # GL_DETAIL_TEXTURE_MODE_SGIS
+_m[0x959A] = (1,) # GL_DEVICE_NODE_MASK_EXT
 _m[0x1201] = (4,) # GL_DIFFUSE
 _m[0x90EF] = (1,) # GL_DISPATCH_INDIRECT_BUFFER_BINDING
 _m[0x8129] = (3,) # GL_DISTANCE_ATTENUATION_SGIS
@@ -551,6 +484,7 @@ _m[0x8716] = (1,) # GL_DS_BIAS_NV
 _m[0x8710] = (1,) # GL_DS_SCALE_NV
 _m[0x8717] = (1,) # GL_DT_BIAS_NV
 _m[0x8711] = (1,) # GL_DT_SCALE_NV
+_m[0x8124] = (1,) # GL_DUAL_TEXTURE_SELECT_SGIS
 _m[0x0B43] = (1,) # GL_EDGE_FLAG
 _m[0x8079] = (1,) # GL_EDGE_FLAG_ARRAY
 _m[0x889B] = (1,) # GL_EDGE_FLAG_ARRAY_BUFFER_BINDING
@@ -648,18 +582,34 @@ _m[0x829F] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internal
 _m[0x8215] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE
 _m[0x8214] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE
 _m[0x8210] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING
+_m[0x8210] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING_EXT
 _m[0x8211] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE
+_m[0x8211] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE_EXT
 _m[0x8216] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE
 _m[0x8213] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE
 _m[0x8DA7] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_LAYERED
+_m[0x8DA7] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_LAYERED_ARB
+_m[0x8DA7] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_LAYERED_EXT
+_m[0x8DA7] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_LAYERED_OES
 _m[0x8CD1] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME
+_m[0x8CD1] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME_EXT
+_m[0x8CD1] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME_OES
 _m[0x8CD0] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE
+_m[0x8CD0] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE_EXT
+_m[0x8CD0] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE_OES
 _m[0x8212] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE
 _m[0x8217] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE
+_m[0x8CD4] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_EXT
+_m[0x8CD4] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_OES
 _m[0x9632] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/OVR/OVR_multiview.txt # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_BASE_VIEW_INDEX_OVR
 _m[0x8CD3] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE
+_m[0x8CD3] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE_EXT
+_m[0x8CD3] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE_OES
 _m[0x8CD4] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER
+_m[0x8CD4] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER_EXT
 _m[0x8CD2] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL
+_m[0x8CD2] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL_EXT
+_m[0x8CD2] = (1,) # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL_OES
 _m[0x9630] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/OVR/OVR_multiview.txt # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_NUM_VIEWS_OVR
 _m[0x8D6C] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/EXT/EXT_multisampled_render_to_texture.txt # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT
 _m[0x913F] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/IMG/IMG_framebuffer_downsample.txt # GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SCALE_IMG
@@ -683,6 +633,8 @@ _m[0x0B46] = (1,) # GL_FRONT_FACE
 _m[0x8191] = (1,) # GL_GENERATE_MIPMAP
 _m[0x8192] = (1,) # GL_GENERATE_MIPMAP_HINT
 _m[0x8192] = (1,) # GL_GENERATE_MIPMAP_HINT_SGIS
+_m[0x8191] = (1,) # GL_GENERATE_MIPMAP_SGIS
+_m[0x8917] = (1,) # GL_GEOMETRY_INPUT_TYPE
 _m[0x8DDB] = (1,) # GL_GEOMETRY_INPUT_TYPE_ARB
 _m[0x8DDB] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/geometry_program4.txt # GL_GEOMETRY_INPUT_TYPE_EXT
 _m[0x8917] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/EXT/EXT_geometry_shader.txt # GL_GEOMETRY_LINKED_INPUT_TYPE_EXT
@@ -691,6 +643,7 @@ _m[0x8918] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/
 _m[0x8918] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/OES/OES_geometry_shader.txt # GL_GEOMETRY_LINKED_OUTPUT_TYPE_OES
 _m[0x8916] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/EXT/EXT_geometry_shader.txt # GL_GEOMETRY_LINKED_VERTICES_OUT_EXT
 _m[0x8916] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/OES/OES_geometry_shader.txt # GL_GEOMETRY_LINKED_VERTICES_OUT_OES
+_m[0x8918] = (1,) # GL_GEOMETRY_OUTPUT_TYPE
 _m[0x8DDC] = (1,) # GL_GEOMETRY_OUTPUT_TYPE_ARB
 _m[0x8DDC] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/geometry_program4.txt # GL_GEOMETRY_OUTPUT_TYPE_EXT
 _m[0x8C26] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/geometry_program4.txt # GL_GEOMETRY_PROGRAM_NV
@@ -698,6 +651,7 @@ _m[0x8DA3] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/parameter
 _m[0x8DD9] = (1,) # GL_GEOMETRY_SHADER
 _m[0x887F] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/gpu_shader5.txt # GL_GEOMETRY_SHADER_INVOCATIONS
 _m[0x829E] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_GEOMETRY_TEXTURE
+_m[0x8916] = (1,) # GL_GEOMETRY_VERTICES_OUT
 _m[0x8DDA] = (1,) # GL_GEOMETRY_VERTICES_OUT_ARB
 _m[0x8DDA] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/geometry_program4.txt # GL_GEOMETRY_VERTICES_OUT_EXT
 _m[0x8291] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_GET_TEXTURE_IMAGE_FORMAT
@@ -735,10 +689,20 @@ _m[0x8026] = (1,) # GL_HISTOGRAM_WIDTH_EXT
 _m[0x8714] = (1,) # GL_HI_BIAS_NV
 _m[0x870E] = (1,) # GL_HI_SCALE_NV
 _m[0x82A8] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_IMAGE_COMPATIBILITY_CLASS
+_m[0x815E] = (1,) # GL_IMAGE_CUBIC_WEIGHT_HP
 _m[0x90C7] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_IMAGE_FORMAT_COMPATIBILITY_TYPE
+_m[0x815C] = (1,) # GL_IMAGE_MAG_FILTER_HP
+_m[0x815D] = (1,) # GL_IMAGE_MIN_FILTER_HP
 _m[0x82A9] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_IMAGE_PIXEL_FORMAT
 _m[0x82AA] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_IMAGE_PIXEL_TYPE
+_m[0x8159] = (1,) # GL_IMAGE_ROTATE_ANGLE_HP
+_m[0x815A] = (1,) # GL_IMAGE_ROTATE_ORIGIN_X_HP
+_m[0x815B] = (1,) # GL_IMAGE_ROTATE_ORIGIN_Y_HP
+_m[0x8155] = (1,) # GL_IMAGE_SCALE_X_HP
+_m[0x8156] = (1,) # GL_IMAGE_SCALE_Y_HP
 _m[0x82A7] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_IMAGE_TEXEL_SIZE
+_m[0x8157] = (1,) # GL_IMAGE_TRANSLATE_X_HP
+_m[0x8158] = (1,) # GL_IMAGE_TRANSLATE_Y_HP
 _m[0x8B9B] = (1,) # GL_IMPLEMENTATION_COLOR_READ_FORMAT
 _m[0x8B9A] = (1,) # GL_IMPLEMENTATION_COLOR_READ_TYPE
 _m[0x8077] = (1,) # GL_INDEX_ARRAY
@@ -813,6 +777,7 @@ _m[0x8B82] = (1,) # GL_LINK_STATUS
 _m[0x0B32] = (1,) # GL_LIST_BASE
 _m[0x0B33] = (1,) # GL_LIST_INDEX
 _m[0x0B30] = (1,) # GL_LIST_MODE
+_m[0x8182] = (1,) # GL_LIST_PRIORITY_SGIX
 _m[0x930E] = (1,) # GL_LOCATION
 _m[0x930F] = (1,) # GL_LOCATION_INDEX
 _m[0x0BF1] = (1,) # GL_LOGIC_OP
@@ -1211,6 +1176,7 @@ _m[0x8869] = (1,) # GL_MAX_VERTEX_ATTRIBS
 _m[0x8869] = (1,) # GL_MAX_VERTEX_ATTRIBS_ARB
 _m[0x82DA] = (1,) # GL_MAX_VERTEX_ATTRIB_BINDINGS
 _m[0x82D9] = (1,) # GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET
+_m[0x82E5] = (1,) # GL_MAX_VERTEX_ATTRIB_STRIDE
 _m[0x8DE2] = (1,) # GL_MAX_VERTEX_BINDABLE_UNIFORMS_EXT
 _m[0x90CA] = (1,) # GL_MAX_VERTEX_IMAGE_UNIFORMS
 _m[0x9122] = (1,) # GL_MAX_VERTEX_OUTPUT_COMPONENTS
@@ -1337,6 +1303,7 @@ _m[0x9304] = (1,) # GL_NUM_ACTIVE_VARIABLES
 _m[0x8E4A] = (1,) # GL_NUM_COMPATIBLE_SUBROUTINES
 _m[0x86A2] = (1,) # GL_NUM_COMPRESSED_TEXTURE_FORMATS
 _m[0x86A2] = (1,) # GL_NUM_COMPRESSED_TEXTURE_FORMATS_ARB
+_m[0x9596] = (1,) # GL_NUM_DEVICE_UUIDS_EXT
 _m[0x913D] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/IMG/IMG_framebuffer_downsample.txt # GL_NUM_DOWNSAMPLE_SCALES_IMG
 _m[0x821D] = (1,) # GL_NUM_EXTENSIONS
 _m[0x8E29] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/present_video.txt # GL_NUM_FILL_STREAMS_NV
@@ -1351,6 +1318,7 @@ _m[0x8970] = (1,) # GL_NUM_PASSES_ATI
 _m[0x87FE] = (1,) # GL_NUM_PROGRAM_BINARY_FORMATS
 _m[0x9380] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query.txt # GL_NUM_SAMPLE_COUNTS
 _m[0x8DF9] = (1,) # GL_NUM_SHADER_BINARY_FORMATS
+_m[0x82E9] = (1,) # GL_NUM_SHADING_LANGUAGE_VERSIONS
 _m[0x91AA] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/sparse_texture.txt # GL_NUM_SPARSE_LEVELS_ARB
 _m[0x91AA] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/EXT/EXT_sparse_texture.txt # GL_NUM_SPARSE_LEVELS_EXT
 _m[0x9554] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/ARB/ARB_spirv_extensions.txt # GL_NUM_SPIR_V_EXTENSIONS
@@ -1409,6 +1377,7 @@ _m[0x806B] = (1,) # GL_PACK_SKIP_IMAGES_EXT
 _m[0x0D04] = (1,) # GL_PACK_SKIP_PIXELS
 _m[0x0D03] = (1,) # GL_PACK_SKIP_ROWS
 _m[0x8130] = (1,) # GL_PACK_SKIP_VOLUMES_SGIS
+_m[0x85A0] = (1,) # GL_PACK_SUBSAMPLE_RATE_SGIX
 _m[0x0D00] = (1,) # GL_PACK_SWAP_BYTES
 _m[0x83F4] = (1,) # GL_PARALLEL_ARRAYS_INTEL
 _m[0x80EF] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/indirect_parameters.txt # GL_PARAMETER_BUFFER_BINDING_ARB
@@ -1427,6 +1396,7 @@ _m[0x90B1] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/path_rend
 _m[0x90B2] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/path_rendering.txt # GL_PATH_GEN_COLOR_FORMAT_NV
 _m[0x90B3] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/path_rendering.txt # GL_PATH_GEN_COMPONENTS_NV
 _m[0x90B0] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/path_rendering.txt # GL_PATH_GEN_MODE_NV
+_m[0x908A] = (4,) # GL_PATH_OBJECT_BOUNDING_BOX_NV
 _m[0x90BD] = (1,) # GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV
 _m[0x90BE] = (1,) # GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV
 _m[0x90B7] = (1,) # GL_PATH_STENCIL_FUNC_NV
@@ -1591,7 +1561,7 @@ _m[0x88B0] = (1,) # GL_PROGRAM_ADDRESS_REGISTERS_ARB
 _m[0x8805] = (1,) # GL_PROGRAM_ALU_INSTRUCTIONS_ARB
 _m[0x88AC] = (1,) # GL_PROGRAM_ATTRIBS_ARB
 _m[0x8906] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/gpu_program4.txt # GL_PROGRAM_ATTRIB_COMPONENTS_NV
-_m[0x87FF] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/get_program_binary.txt # GL_PROGRAM_BINARY_FORMATS
+_m[0x87FF] = (_L(0x87FE),) # GL_PROGRAM_BINARY_FORMATS
 _m[0x8741] = (1,) # GL_PROGRAM_BINARY_LENGTH
 _m[0x8677] = (1,) # GL_PROGRAM_BINDING_ARB
 _m[0x864B] = (1,) # GL_PROGRAM_ERROR_POSITION_ARB
@@ -1635,6 +1605,7 @@ _m[0x8E4F] = (1,) # GL_PROVOKING_VERTEX_EXT
 _m[0x1209] = (1,) # GL_QUADRATIC_ATTENUATION
 _m[0x8E4C] = (1,) # GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION
 _m[0x8E4C] = (1,) # GL_QUADS_FOLLOW_PROVOKING_VERTEX_CONVENTION_EXT
+_m[0x8125] = (1,) # GL_QUAD_TEXTURE_SELECT_SGIS
 _m[0x9193] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/query_buffer_object.txt # GL_QUERY_BUFFER_BINDING
 _m[0x9193] = (1,) # GL_QUERY_BUFFER_BINDING_AMD
 _m[0x8864] = (1,) # GL_QUERY_COUNTER_BITS
@@ -1672,22 +1643,44 @@ _m[0x817E] = (4,) # GL_REFERENCE_PLANE_EQUATION_SGIX
 _m[0x817D] = (1,) # GL_REFERENCE_PLANE_SGIX
 _m[0x8522] = (1,) # GL_REGISTER_COMBINERS_NV
 _m[0x8D53] = (1,) # GL_RENDERBUFFER_ALPHA_SIZE
+_m[0x8D53] = (1,) # GL_RENDERBUFFER_ALPHA_SIZE_EXT
+_m[0x8D53] = (1,) # GL_RENDERBUFFER_ALPHA_SIZE_OES
 _m[0x8CA7] = (1,) # GL_RENDERBUFFER_BINDING
 _m[0x8CA7] = (1,) # GL_RENDERBUFFER_BINDING_EXT
 _m[0x8D52] = (1,) # GL_RENDERBUFFER_BLUE_SIZE
+_m[0x8D52] = (1,) # GL_RENDERBUFFER_BLUE_SIZE_EXT
+_m[0x8D52] = (1,) # GL_RENDERBUFFER_BLUE_SIZE_OES
 _m[0x8E10] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/framebuffer_multisample_coverage.txt # GL_RENDERBUFFER_COLOR_SAMPLES_NV
 _m[0x8CAB] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/framebuffer_multisample_coverage.txt # GL_RENDERBUFFER_COVERAGE_SAMPLES_NV
 _m[0x8D54] = (1,) # GL_RENDERBUFFER_DEPTH_SIZE
+_m[0x8D54] = (1,) # GL_RENDERBUFFER_DEPTH_SIZE_EXT
+_m[0x8D54] = (1,) # GL_RENDERBUFFER_DEPTH_SIZE_OES
 _m[0x87FD] = (1,) # GL_RENDERBUFFER_FREE_MEMORY_ATI
 _m[0x8D51] = (1,) # GL_RENDERBUFFER_GREEN_SIZE
+_m[0x8D51] = (1,) # GL_RENDERBUFFER_GREEN_SIZE_EXT
+_m[0x8D51] = (1,) # GL_RENDERBUFFER_GREEN_SIZE_OES
 _m[0x8D43] = (1,) # GL_RENDERBUFFER_HEIGHT
+_m[0x8D43] = (1,) # GL_RENDERBUFFER_HEIGHT_EXT
+_m[0x8D43] = (1,) # GL_RENDERBUFFER_HEIGHT_OES
 _m[0x8D44] = (1,) # GL_RENDERBUFFER_INTERNAL_FORMAT
+_m[0x8D44] = (1,) # GL_RENDERBUFFER_INTERNAL_FORMAT_EXT
+_m[0x8D44] = (1,) # GL_RENDERBUFFER_INTERNAL_FORMAT_OES
 _m[0x8D50] = (1,) # GL_RENDERBUFFER_RED_SIZE
+_m[0x8D50] = (1,) # GL_RENDERBUFFER_RED_SIZE_EXT
+_m[0x8D50] = (1,) # GL_RENDERBUFFER_RED_SIZE_OES
 _m[0x8CAB] = (1,) # GL_RENDERBUFFER_SAMPLES
+_m[0x8CAB] = (1,) # GL_RENDERBUFFER_SAMPLES_ANGLE
+_m[0x8CAB] = (1,) # GL_RENDERBUFFER_SAMPLES_APPLE
+_m[0x8CAB] = (1,) # GL_RENDERBUFFER_SAMPLES_EXT
 _m[0x9133] = (1,) # GL_RENDERBUFFER_SAMPLES_IMG
+_m[0x8CAB] = (1,) # GL_RENDERBUFFER_SAMPLES_NV
 _m[0x8D55] = (1,) # GL_RENDERBUFFER_STENCIL_SIZE
+_m[0x8D55] = (1,) # GL_RENDERBUFFER_STENCIL_SIZE_EXT
+_m[0x8D55] = (1,) # GL_RENDERBUFFER_STENCIL_SIZE_OES
 _m[0x91B2] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/AMD/AMD_framebuffer_multisample_advanced.txt # GL_RENDERBUFFER_STORAGE_SAMPLES_AMD
 _m[0x8D42] = (1,) # GL_RENDERBUFFER_WIDTH
+_m[0x8D42] = (1,) # GL_RENDERBUFFER_WIDTH_EXT
+_m[0x8D42] = (1,) # GL_RENDERBUFFER_WIDTH_OES
 _m[0x1F01] = (1,) # GL_RENDERER
 _m[0x9558] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NV/NV_gpu_multicast.txt # GL_RENDER_GPU_MASK_NV
 _m[0x0C40] = (1,) # GL_RENDER_MODE
@@ -1768,7 +1761,7 @@ _m[0x0DF3] = (1,) # GL_SELECTION_BUFFER_POINTER
 _m[0x0DF4] = (1,) # GL_SELECTION_BUFFER_SIZE
 _m[0x8012] = (1,) # GL_SEPARABLE_2D
 _m[0x8012] = (1,) # GL_SEPARABLE_2D_EXT
-_m[0x8DF8] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/ES2_compatibility.txt # GL_SHADER_BINARY_FORMATS
+_m[0x8DF8] = (_L(0x8DF9),) # GL_SHADER_BINARY_FORMATS
 _m[0x8DFA] = (1,) # GL_SHADER_COMPILER
 _m[0x82A6] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_SHADER_IMAGE_ATOMIC
 _m[0x82A4] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_SHADER_IMAGE_LOAD
@@ -1789,6 +1782,9 @@ _m[0x9563] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/
 _m[0x955E] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NV/NV_shading_rate_image.txt # GL_SHADING_RATE_IMAGE_PALETTE_SIZE_NV
 _m[0x955D] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NV/NV_shading_rate_image.txt # GL_SHADING_RATE_IMAGE_TEXEL_HEIGHT_NV
 _m[0x955C] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NV/NV_shading_rate_image.txt # GL_SHADING_RATE_IMAGE_TEXEL_WIDTH_NV
+_m[0x80BF] = (1,) # GL_SHADOW_AMBIENT_SGIX
+_m[0x81FB] = (1,) # GL_SHARED_TEXTURE_PALETTE_EXT
+_m[0x80B0] = (1,) # GL_SHARPEN_TEXTURE_FUNC_POINTS_SGIS
 _m[0x1601] = (1,) # GL_SHININESS
 _m[0x82AC] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_TEST
 _m[0x82AE] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_SIMULTANEOUS_TEXTURE_AND_DEPTH_WRITE
@@ -1906,6 +1902,7 @@ _m[0x806F] = (1,) # GL_TEXTURE_3D
 _m[0x806A] = (1,) # GL_TEXTURE_3D_BINDING_EXT
 _m[0x806F] = (1,) # GL_TEXTURE_3D_EXT
 _m[0x806F] = (1,) # GL_TEXTURE_3D_OES
+_m[0x8136] = (1,) # GL_TEXTURE_4DSIZE_SGIS
 _m[0x814F] = (1,) # GL_TEXTURE_4D_BINDING_SGIS
 _m[0x8134] = (1,) # GL_TEXTURE_4D_SGIS
 _m[0x805F] = (1,) # GL_TEXTURE_ALPHA_SIZE
@@ -1955,6 +1952,7 @@ _m[0x919E] = (1,) # GL_TEXTURE_BUFFER_SIZE
 _m[0x8171] = (2,) # GL_TEXTURE_CLIPMAP_CENTER_SGIX
 _m[0x8176] = (1,) # GL_TEXTURE_CLIPMAP_DEPTH_SGIX
 _m[0x8172] = (1,) # GL_TEXTURE_CLIPMAP_FRAME_SGIX
+_m[0x8175] = (1,) # GL_TEXTURE_CLIPMAP_LOD_OFFSET_SGIX
 _m[0x8173] = (2,) # GL_TEXTURE_CLIPMAP_OFFSET_SGIX
 _m[0x8174] = (3,) # GL_TEXTURE_CLIPMAP_VIRTUAL_DEPTH_SGIX
 _m[0x9046] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/texture_multisample.txt # GL_TEXTURE_COLOR_SAMPLES_NV
@@ -1965,6 +1963,7 @@ _m[0x884D] = (1,) # GL_TEXTURE_COMPARE_FUNC
 _m[0x884C] = (1,) # GL_TEXTURE_COMPARE_MODE
 _m[0x819B] = (1,) # GL_TEXTURE_COMPARE_OPERATOR_SGIX
 _m[0x819A] = (1,) # GL_TEXTURE_COMPARE_SGIX
+_m[0x1003] = (1,) # GL_TEXTURE_COMPONENTS
 _m[0x86A1] = (1,) # GL_TEXTURE_COMPRESSED
 _m[0x82B2] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_TEXTURE_COMPRESSED_BLOCK_HEIGHT
 _m[0x82B3] = (1,)#TODO Review http://www.opengl.org/registry/specs//ARB/internalformat_query2.txt # GL_TEXTURE_COMPRESSED_BLOCK_SIZE
@@ -1999,6 +1998,7 @@ _m[0x871D] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/texture_s
 _m[0x871E] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/texture_shader.txt # GL_TEXTURE_DT_SIZE_NV
 _m[0x2201] = (4,) # GL_TEXTURE_ENV_COLOR
 _m[0x2200] = (1,) # GL_TEXTURE_ENV_MODE
+_m[0x8147] = (1,) # GL_TEXTURE_FILTER4_SIZE_SGIS
 _m[0x9107] = (1,) # GL_TEXTURE_FIXED_SAMPLE_LOCATIONS
 _m[0x888C] = (1,)#TODO Review http://www.opengl.org/registry/specs//NV/float_buffer.txt # GL_TEXTURE_FLOAT_COMPONENTS_NV
 _m[0x8BFD] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/QCOM/QCOM_texture_foveated.txt # GL_TEXTURE_FOVEATED_FEATURE_QUERY_QCOM
@@ -2012,6 +2012,7 @@ _m[0x0C62] = (1,) # GL_TEXTURE_GEN_R
 _m[0x0C60] = (1,) # GL_TEXTURE_GEN_S
 _m[0x8D60] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/OES/OES_texture_cube_map.txt # GL_TEXTURE_GEN_STR_OES
 _m[0x0C61] = (1,) # GL_TEXTURE_GEN_T
+_m[0x819D] = (1,) # GL_TEXTURE_GEQUAL_R_SGIX
 _m[0x805D] = (1,) # GL_TEXTURE_GREEN_SIZE
 _m[0x8C11] = (1,) # GL_TEXTURE_GREEN_TYPE
 _m[0x1001] = (1,) # GL_TEXTURE_HEIGHT
@@ -2024,6 +2025,7 @@ _m[0x80ED] = (1,) # GL_TEXTURE_INDEX_SIZE_EXT
 _m[0x8061] = (1,) # GL_TEXTURE_INTENSITY_SIZE
 _m[0x8C15] = (1,) # GL_TEXTURE_INTENSITY_TYPE
 _m[0x1003] = (1,) # GL_TEXTURE_INTERNAL_FORMAT
+_m[0x819C] = (1,) # GL_TEXTURE_LEQUAL_R_SGIX
 _m[0x8350] = (1,) # GL_TEXTURE_LIGHT_EXT
 _m[0x8501] = (1,) # GL_TEXTURE_LOD_BIAS
 _m[0x8190] = (1,) # GL_TEXTURE_LOD_BIAS_R_SGIX
@@ -2038,6 +2040,7 @@ _m[0x8351] = (1,) # GL_TEXTURE_MATERIAL_FACE_EXT
 _m[0x8352] = (1,) # GL_TEXTURE_MATERIAL_PARAMETER_EXT
 _m[0x0BA8] = (4, 4) # GL_TEXTURE_MATRIX
 _m[0x898F] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/OES/OES_matrix_get.txt # GL_TEXTURE_MATRIX_FLOAT_AS_INT_BITS_OES
+_m[0x84FE] = (1,) # GL_TEXTURE_MAX_ANISOTROPY
 _m[0x84FE] = (1,) # GL_TEXTURE_MAX_ANISOTROPY_EXT
 _m[0x836B] = (1,) # GL_TEXTURE_MAX_CLAMP_R_SGIX
 _m[0x8369] = (1,) # GL_TEXTURE_MAX_CLAMP_S_SGIX
@@ -2165,6 +2168,7 @@ _m[0x806D] = (1,) # GL_UNPACK_SKIP_IMAGES_EXT
 _m[0x0CF4] = (1,) # GL_UNPACK_SKIP_PIXELS
 _m[0x0CF3] = (1,) # GL_UNPACK_SKIP_ROWS
 _m[0x8132] = (1,) # GL_UNPACK_SKIP_VOLUMES_SGIS
+_m[0x85A1] = (1,) # GL_UNPACK_SUBSAMPLE_RATE_SGIX
 _m[0x0CF0] = (1,) # GL_UNPACK_SWAP_BYTES
 _m[0x954A] = (1,)#TODO Review /home/mcfletch/OpenGL-dev/pyopengl/src/khronosapi/extensions/NVX/NVX_gpu_multicast2.txt # GL_UPLOAD_GPU_MASK_NVX
 _m[0x8B83] = (1,) # GL_VALIDATE_STATUS
@@ -1,8 +1,9 @@
 """The wrapping code for providing natural ctypes-based OpenGL interface"""
-import ctypes, logging
+import ctypes, logging, linecache, re
 from OpenGL import platform, error
 assert platform
 from OpenGL._configflags import STORE_POINTERS, ERROR_ON_COPY, SIZE_1_ARRAY_UNPACK
+from OpenGL._configflags import GENERATED_WRAPPERS
 from OpenGL import converters
 from OpenGL.converters import DefaultCConverter
 from OpenGL.converters import returnCArgument,returnPyArgument
@@ -215,10 +216,7 @@ class Wrapper( LateBind ):
             if not hasattr( arrayType, 'asArray' ):
                 if arrayType == ctypes.c_void_p:
                     # special case, we will convert to a void * array...
-                    self.setPyConverter( 
-                        argName,
-                        converters.CallFuncPyConverter( arraydatatype.ArrayDatatype.asArray )
-                    )
+                    self.setPyConverter( argName, arrayhelpers.asVoidArray() )
                     self.setCConverter( argName, converters.getPyArgsName( argName ) )
                     return self
                 elif hasattr( arrayType, '_type_' ) and hasattr(arrayType._type_, '_type_' ):
@@ -392,7 +390,10 @@ class Wrapper( LateBind ):
             item = getattr( self, attribute, None )
             if hasattr( item, 'finalise' ):
                 item.finalise( self )
-        callFunction = self.finaliseCall()
+        if GENERATED_WRAPPERS and not cWrapper:
+            callFunction = self.finaliseGeneratedCall()
+        else:
+            callFunction = self.finaliseCall()
         if not callFunction:
             raise RuntimeError( """Missing finalised call type for %s"""%( self, ))
         else:
@@ -1392,6 +1393,190 @@ class Wrapper( LateBind ):
                                     raise err
                                 return result
                             return wrapperCall
+    def generatedSource( self ):
+        """Produce Python source for a straight-line version of our call
+
+        This is the source used by finaliseGeneratedCall, it is intended
+        to be printed when debugging a wrapper's behaviour, e.g.:
+
+            print( glGetIntegerv.generatedSource() )
+
+        returns source-code string
+        """
+        return self._generateCall()[0]
+    def finaliseGeneratedCall( self ):
+        """Produce specialised call by generating and compiling Python source
+
+        Rather than selecting from the closures in finaliseCall, we write
+        out a single function which does only the work this wrapper needs,
+        with each converter unrolled by index, constant C arguments bound
+        in the function's namespace and the intermediate pyArgs/cArgs
+        tuples only created where a converter, storeValues or
+        returnValues needs to see them.
+
+        The source is registered with linecache, so tracebacks and
+        inspect.getsource work on the result, see generatedSource()
+        """
+        source, namespace = self._generateCall()
+        name = namespace['__name__']
+        filename = '<OpenGL.wrapper %s>'%( name, )
+        exec( compile( source, filename, 'exec' ), namespace )
+        linecache.cache[ filename ] = (
+            len(source), None, source.splitlines( True ), filename
+        )
+        return namespace[ name ]
+    def _generateCall( self ):
+        """Generate (source, namespace) for finaliseGeneratedCall"""
+        pyConverters = getattr( self, 'pyConverters', None )
+        cConverters = getattr( self, 'cConverters', None )
+        cResolvers = getattr( self, 'cResolvers', None )
+        storeValues = getattr( self, 'storeValues', None )
+        returnValues = getattr( self, 'returnValues', None )
+        name = re.sub( r'\W', '_', self.wrappedOperation.__name__ )
+        namespace = {
+            '__name__': name,
+            'wrapper': self,
+            'wrappedOperation': self.wrappedOperation,
+            'storeValues': storeValues,
+            'returnValues': returnValues,
+            'NULL': NULL,
+            'ArgumentError': ctypes.ArgumentError,
+            'GLError': error.GLError,
+        }
+        body = []
+        if pyConverters:
+            required = len([
+                p for p in pyConverters if not getattr( p, 'optional', False )
+            ])
+            namespace['argumentNames'] = ", ".join( self.pyConverterNames )
+            body.extend([
+                'if len( args ) < %d:'%( required, ),
+                '    raise ValueError(',
+                '        """%s requires %r arguments (%s), received %s: %r"""%(',
+                '            wrappedOperation.__name__, %d, argumentNames, len(args), args'%( required, ),
+                '        )',
+                '    )',
+            ])
+            pyNames = []
+            for index,converter in enumerate( pyConverters ):
+                local = 'py%d'%( index, )
+                pyNames.append( local )
+                if converter is None:
+                    body.append( '%s = args[%d]'%( local, index ))
+                    continue
+                namespace[ 'pyConverter%d'%( index, ) ] = converter
+                body.extend([
+                    'try:',
+                    '    %s = pyConverter%d( args[%d], wrapper, args )'%( local, index, index ),
+                    'except IndexError:',
+                    '    %s = NULL'%( local, ),
+                    'except Exception as err:',
+                    "    if hasattr( err, 'args' ):",
+                    '        err.args += ( pyConverter%d, )'%( index, ),
+                    '    raise',
+                ])
+            pyArgs = '( %s, )'%( ', '.join( pyNames ), )
+        else:
+            pyNames = None
+            pyArgs = 'args'
+        needPyArgs = bool( storeValues or returnValues )
+        needCArgs = needPyArgs
+        if cConverters:
+            cNames = []
+            generated = []
+            for index,converter in enumerate( cConverters ):
+                if (
+                    pyNames and
+                    type( converter ) in (converters.DefaultCConverter,converters.getPyArgsName) and
+                    0 <= getattr( converter, 'index', -1 ) < len( pyNames )
+                ):
+                    cNames.append( pyNames[ converter.index ] )
+                elif hasattr( converter, '__call__' ):
+                    needPyArgs = True
+                    local = 'c%d'%( index, )
+                    cNames.append( local )
+                    namespace[ 'cConverter%d'%( index, ) ] = converter
+                    generated.extend([
+                        'try:',
+                        '    %s = cConverter%d( pyArgs, %d, wrapper )'%( local, index, index ),
+                        'except Exception as err:',
+                        "    if hasattr( err, 'args' ):",
+                        '        err.args += (',
+                        '            """Failure in cConverter %%r"""%%( cConverter%d, ),'%( index, ),
+                        '            pyArgs, %d, wrapper,'%( index, ),
+                        '        )',
+                        '    raise',
+                    ])
+                else:
+                    # bound by name, repr() of e.g. float('inf') is not source
+                    local = 'cConstant%d'%( index, )
+                    namespace[ local ] = converter
+                    cNames.append( local )
+            if needPyArgs and pyNames:
+                body.append( 'pyArgs = %s'%( pyArgs, ))
+                pyArgs = 'pyArgs'
+            elif needPyArgs:
+                body.append( 'pyArgs = args' )
+                pyArgs = 'pyArgs'
+            body.extend( generated )
+            cArgs = '( %s, )'%( ', '.join( cNames ), )
+        else:
+            cNames = pyNames
+            if needPyArgs and pyNames:
+                body.append( 'pyArgs = %s'%( pyArgs, ))
+                pyArgs = 'pyArgs'
+            cArgs = pyArgs
+        if needCArgs and cArgs not in ('args','pyArgs'):
+            body.append( 'cArgs = %s'%( cArgs, ))
+            cArgs = 'cArgs'
+        if cResolvers:
+            if cNames is None:
+                # unknown argument count, index dynamically
+                cNames = [ 'args[%d]'%( i, ) for i in range( len( cResolvers )) ]
+            argNames = []
+            for index,converter in enumerate( cResolvers ):
+                if converter is None:
+                    argNames.append( cNames[index] )
+                    continue
+                local = 'r%d'%( index, )
+                argNames.append( local )
+                namespace[ 'cResolver%d'%( index, ) ] = converter
+                body.extend([
+                    'try:',
+                    '    %s = cResolver%d( %s )'%( local, index, cNames[index] ),
+                    'except Exception as err:',
+                    '    err.args += ( cResolver%d, )'%( index, ),
+                    '    raise',
+                ])
+            cArguments = '( %s, )'%( ', '.join( argNames ), )
+            callArgs = ', '.join( argNames )
+        elif cNames is None:
+            cArguments = 'args'
+            callArgs = '*args'
+        else:
+            cArguments = '( %s, )'%( ', '.join( cNames ), )
+            callArgs = ', '.join( cNames )
+        body.extend([
+            'try:',
+            '    result = wrappedOperation( %s )'%( callArgs, ),
+            'except ArgumentError as err:',
+            '    err.args = err.args + ( %s, )'%( cArguments, ),
+            '    raise err',
+            'except GLError as err:',
+            '    err.cArgs = %s'%( cArgs, ),
+            '    err.pyArgs = %s'%( pyArgs, ),
+            '    raise err',
+        ])
+        if storeValues:
+            body.append( 'storeValues( result, wrapper, %s, %s )'%( pyArgs, cArgs ))
+        if returnValues:
+            body.append( 'return returnValues( result, wrapper, %s, %s )'%( pyArgs, cArgs ))
+        else:
+            body.append( 'return result' )
+        source = '\n'.join(
+            [ 'def %s( *args ):'%( name, ) ] + [ '    '+line for line in body ]
+        ) + '\n'
+        return source, namespace
 #    def __call__( self, *args, **named ):
 #        """Finalise the wrapper before calling it"""
 #        try:
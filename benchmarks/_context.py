@@ -0,0 +1,48 @@
+"""Context creation shared by the benchmark scripts
+
+By default a (hidden) GLUT window is used, as in the scripts at the top
+of the repository.  Set PYOPENGL_PLATFORM=egl to use an EGL pbuffer
+instead, which together with EGL_PLATFORM=surfaceless on Mesa allows
+running the benchmarks without a display.
+"""
+import os, ctypes
+
+
+def createContext( width=256, height=256 ):
+    """Create and make current an OpenGL context, return an opaque handle"""
+    if os.environ.get( 'PYOPENGL_PLATFORM' ) == 'egl':
+        return _eglContext( width, height )
+    return _glutContext( width, height )
+
+
+def _glutContext( width, height ):
+    from OpenGL import GLUT
+    GLUT.glutInit()
+    GLUT.glutInitDisplayMode( GLUT.GLUT_DOUBLE | GLUT.GLUT_RGB | GLUT.GLUT_DEPTH )
+    GLUT.glutInitWindowSize( width, height )
+    window = GLUT.glutCreateWindow( b"PyOpenGL benchmark" )
+    GLUT.glutHideWindow()
+    return window
+
+
+def _eglContext( width, height ):
+    from OpenGL import EGL
+    display = EGL.eglGetDisplay( EGL.EGL_DEFAULT_DISPLAY )
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    EGL.eglInitialize( display, ctypes.pointer( major ), ctypes.pointer( minor ) )
+    attributes = (EGL.EGLint * 5)(
+        EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        EGL.EGL_NONE,
+    )
+    config = EGL.EGLConfig()
+    count = EGL.EGLint()
+    EGL.eglChooseConfig( display, attributes, ctypes.pointer( config ), 1, ctypes.pointer( count ) )
+    surface = EGL.eglCreatePbufferSurface(
+        display, config,
+        (EGL.EGLint * 5)( EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE ),
+    )
+    EGL.eglBindAPI( EGL.EGL_OPENGL_API )
+    context = EGL.eglCreateContext( display, config, EGL.EGL_NO_CONTEXT, None )
+    EGL.eglMakeCurrent( display, surface, surface, context )
+    return context
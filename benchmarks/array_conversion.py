@@ -0,0 +1,113 @@
+"""Measure allocations made converting NumPy arrays for GL calls
+
+Run from the top of the repository:
+
+    python -m benchmarks.array_conversion [iterations]
+
+Each function is called iterations times (default 10**5) with the same
+C-contiguous array of the required dtype, once with the per-call-site
+array fast path disabled (PYOPENGL_ARRAY_FAST_PATH=0) and once with it
+enabled, each in a separate interpreter as the flag is read at import.
+
+tracemalloc only tracks live blocks, so two figures are reported:
+
+    peak -- mean over all calls of the peak traced bytes above the
+        starting point during a single call, i.e. the temporaries
+        (dictionaries, tuples, ctypes pointers...) built per call
+    retained -- blocks and bytes still allocated after all calls
+"""
+import os, sys, subprocess, time, tracemalloc
+
+
+def _cases():
+    import numpy
+    from OpenGL.GL import (
+        GL_FLOAT, GL_FALSE, GL_ARRAY_BUFFER, GL_STREAM_DRAW, GL_VERTEX_SHADER,
+        glVertexPointer, glBufferData, glGenBuffers, glBindBuffer,
+        glUniformMatrix4fv, glCreateProgram, glCreateShader, glShaderSource,
+        glCompileShader, glAttachShader, glLinkProgram, glUseProgram,
+        glGetUniformLocation,
+    )
+    vertices = numpy.zeros( (64,3), 'f' )
+    buffer = glGenBuffers( 1 )
+    glBindBuffer( GL_ARRAY_BUFFER, buffer )
+    shader = glCreateShader( GL_VERTEX_SHADER )
+    glShaderSource( shader, """#version 120
+    uniform mat4 mvp;
+    void main() { gl_Position = mvp * gl_Vertex; }
+    """ )
+    glCompileShader( shader )
+    program = glCreateProgram()
+    glAttachShader( program, shader )
+    glLinkProgram( program )
+    glUseProgram( program )
+    location = glGetUniformLocation( program, 'mvp' )
+    matrix = numpy.identity( 4, 'f' )
+    return [
+        ( 'glVertexPointer', glVertexPointer, (3, GL_FLOAT, 0, vertices) ),
+        ( 'glBufferData', glBufferData, (GL_ARRAY_BUFFER, vertices, GL_STREAM_DRAW) ),
+        ( 'glUniformMatrix4fv', glUniformMatrix4fv, (location, 1, GL_FALSE, matrix) ),
+    ]
+
+
+def measure( iterations ):
+    """Run the cases in this interpreter, print one line per case"""
+    from benchmarks._context import createContext
+    createContext()
+    for name, function, args in _cases():
+        function( *args )
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        peaks = 0
+        start = time.perf_counter()
+        for i in range( iterations ):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function( *args )
+            peaks += tracemalloc.get_traced_memory()[1] - current
+        elapsed = time.perf_counter() - start
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        retained = [
+            stat for stat in after.compare_to( before, 'filename' )
+            if stat.count_diff > 0
+        ]
+        print( '%s %f %d %d %f'%(
+            name,
+            peaks / float( iterations ),
+            sum( stat.count_diff for stat in retained ),
+            sum( stat.size_diff for stat in retained ),
+            elapsed / iterations * 1e6,
+        ))
+
+
+def main( iterations=100000 ):
+    results = {}
+    for flag in ('0','1'):
+        environ = dict( os.environ, PYOPENGL_ARRAY_FAST_PATH=flag )
+        output = subprocess.check_output(
+            [sys.executable, '-m', 'benchmarks.array_conversion', '--measure', str(iterations)],
+            env=environ,
+        )
+        for line in output.decode( 'ascii' ).splitlines():
+            name, peak, blocks, size, micros = line.split()
+            results.setdefault( name, [] ).append(
+                (float(peak), int(blocks), int(size), float(micros))
+            )
+    print( '%d calls each, fast path off -> on'%( iterations, ))
+    print( '%-20s %20s %24s %20s'%(
+        'function', 'peak bytes/call', 'retained blocks (bytes)', 'us/call',
+    ))
+    for name, (off, on) in results.items():
+        print( '%-20s %9.1f -> %7.1f %11s -> %10s %8.2f -> %7.2f'%(
+            name, off[0], on[0],
+            '%d (%d)'%(off[1], off[2]), '%d (%d)'%(on[1], on[2]),
+            off[3], on[3],
+        ))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--measure']:
+        measure( int( sys.argv[2] ))
+    else:
+        main( *[int(arg) for arg in sys.argv[1:2]] )
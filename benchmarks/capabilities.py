@@ -0,0 +1,79 @@
+"""Compare building the capability snapshot with and without the cache
+
+Run from the top of the repository:
+
+    python -m benchmarks.capabilities [runs]
+
+Creates a context in fresh interpreters and times the first
+extensions.getCapabilities() call:
+
+    uncached -- no capability cache set, extensions and limits queried
+    cold -- with an empty cache directory, queried then stored
+    warm -- with the directory filled by the cold run, loaded from disk
+
+followed by the time for 1000 platform.checkExtension calls on a mix of
+extension and version specifiers, reporting medians (default 10 runs).
+"""
+import os, sys, shutil, subprocess, tempfile
+
+SPECIFIERS = [
+    'GL_ARB_sync', 'GL_ARB_vertex_array_object', 'GL_VERSION_GL_3_3',
+    'GL_NV_not_an_extension', 'GL_KHR_debug', 'GL_VERSION_GL_4_6',
+]
+
+def build():
+    """Time the snapshot in this interpreter, print the elapsed times"""
+    import time
+    from benchmarks._context import createContext
+    createContext()
+    from OpenGL import extensions, platform
+    start = time.perf_counter()
+    capabilities = extensions.getCapabilities()
+    snapshot = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range( 1000//len(SPECIFIERS) ):
+        for specifier in SPECIFIERS:
+            platform.PLATFORM.checkExtension( specifier )
+    checks = time.perf_counter() - start
+    print( '%f %f %d'%( snapshot, checks, len( capabilities.extensions )))
+
+def run( directory=None ):
+    environ = dict( os.environ )
+    environ.pop( 'PYOPENGL_CAPABILITY_CACHE', None )
+    if directory:
+        environ['PYOPENGL_CAPABILITY_CACHE'] = directory
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.capabilities', '--build'],
+        env=environ,
+    )
+    snapshot, checks, count = output.decode( 'ascii' ).split()
+    return float( snapshot ), float( checks ), int( count )
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( runs=10 ):
+    directory = tempfile.mkdtemp( prefix='pyopengl-capabilities-' )
+    try:
+        uncached, cold, warm = [], [], []
+        for i in range( runs ):
+            uncached.append( run() )
+            shutil.rmtree( directory )
+            cold.append( run( directory ) )
+            warm.append( run( directory ) )
+        print( '%d extensions, median of %d runs'%( uncached[-1][2], runs ))
+        for name, results in (('uncached', uncached), ('cold', cold), ('warm', warm)):
+            print( '%-10s snapshot %8.2fms  1000 checks %8.2fms'%(
+                name,
+                median([ r[0] for r in results ])*1000,
+                median([ r[1] for r in results ])*1000,
+            ))
+    finally:
+        shutil.rmtree( directory, ignore_errors=True )
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--build']:
+        build()
+    else:
+        main( *[int(arg) for arg in sys.argv[1:2]] )
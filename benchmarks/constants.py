@@ -0,0 +1,89 @@
+"""Compare import time and memory of Constant objects and compact constants
+
+Run from the top of the repository:
+
+    python -m benchmarks.constants [runs]
+
+Times, in fresh interpreters with PYOPENGL_COMPACT_CONSTANTS set to 0
+and to 1, the import of
+
+    star -- from OpenGL.GL import *
+    raw GL -- every module in the OpenGL.raw.GL package (all of the
+        extensions, as a large application or a documentation tool
+        might load)
+
+and reports the median (default 10 runs, after one warm-up run so that
+byte-code caches are written) of the import time, the growth of the
+resident set size over the import, and the number of constants loaded.
+"""
+import os, sys, subprocess
+
+SCOPES = ('star', 'raw GL')
+
+def rss():
+    """Current resident set size in bytes"""
+    try:
+        with open( '/proc/self/statm' ) as handle:
+            return int( handle.read().split()[1] ) * os.sysconf( 'SC_PAGE_SIZE' )
+    except (IOError, OSError):
+        import resource
+        return resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss * 1024
+
+def importRaw():
+    import pkgutil, importlib
+    import OpenGL.raw.GL as package
+    for info in pkgutil.walk_packages( package.__path__, package.__name__ + '.' ):
+        try:
+            importlib.import_module( info.name )
+        except Exception:
+            pass
+
+def build( scope ):
+    """Import scope in this interpreter, print time, RSS growth and count"""
+    import time
+    import ctypes
+    before = rss()
+    start = time.perf_counter()
+    if scope == 'star':
+        exec( 'from OpenGL.GL import *', {} )
+    else:
+        importRaw()
+    elapsed = time.perf_counter() - start
+    after = rss()
+    from OpenGL import constant
+    constant._scan()
+    count = sum( len( names ) for names in constant._names.values() )
+    print( '%f %d %d'%( elapsed, after - before, count ))
+
+def run( scope, compact ):
+    environ = dict( os.environ, PYOPENGL_COMPACT_CONSTANTS=compact )
+    environ.pop( 'PYTHONDONTWRITEBYTECODE', None )
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.constants', '--build', scope],
+        env=environ,
+    )
+    elapsed, memory, count = output.decode( 'ascii' ).split()
+    return float( elapsed ), int( memory ), int( count )
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( runs=10 ):
+    print( 'median of %d interpreters, objects -> compact'%( runs, ))
+    for scope in SCOPES:
+        results = []
+        for compact in ('0', '1'):
+            run( scope, compact )
+            results.append( [run( scope, compact ) for i in range( runs )] )
+        times = [median([ r[0] for r in result ])*1000 for result in results]
+        memory = [median([ r[1] for r in result ])/1024./1024. for result in results]
+        print( '%-7s %5d constants  import %7.1f -> %7.1fms  RSS +%6.1f -> +%6.1fMB'%(
+            scope, results[0][-1][2], times[0], times[1], memory[0], memory[1],
+        ))
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--build']:
+        build( sys.argv[2] )
+    else:
+        main( *[int(arg) for arg in sys.argv[1:2]] )
@@ -0,0 +1,91 @@
+"""Compare OpenGL.GL import time with and without lazy imports
+
+Run from the top of the repository:
+
+    python -m benchmarks.gl_import [runs]
+    python -m benchmarks.gl_import --importtime [count]
+
+The first form times, in fresh interpreters with PYOPENGL_LAZY_IMPORTS
+set to 0 and to 1, three statements typical of small tools:
+
+    import -- import OpenGL.GL
+    glut tool -- import the names used by a simple GLUT immediate-mode
+        script (as the scripts at the top of the repository do)
+    star -- from OpenGL.GL import *
+
+and reports the median of runs (default 10) interpreters each, after one
+warm-up run so that byte-code caches are written (PYTHONDONTWRITEBYTECODE
+is removed from the environment of the child interpreters).
+
+The second form runs "python -X importtime -c 'import OpenGL.GL'" in both
+modes and lists the count (default 15) modules with the largest
+cumulative import time, followed by the total.
+"""
+import os, sys, subprocess
+
+STATEMENTS = [
+    ( 'import', 'import OpenGL.GL' ),
+    ( 'glut tool', 'from OpenGL.GL import ('
+        'glClear, glClearColor, glBegin, glEnd, glVertex3f, glColor3f, '
+        'glMatrixMode, glLoadIdentity, glViewport, glRotatef, glTranslatef, '
+        'GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_TRIANGLES, '
+        'GL_PROJECTION, GL_MODELVIEW)' ),
+    ( 'star', 'from OpenGL.GL import *' ),
+]
+TIMER = '''import time
+start = time.perf_counter()
+%s
+print( time.perf_counter() - start )
+'''
+
+def environment( lazy ):
+    environ = dict( os.environ, PYOPENGL_LAZY_IMPORTS=lazy )
+    environ.pop( 'PYTHONDONTWRITEBYTECODE', None )
+    return environ
+
+def run( statement, lazy ):
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER%( statement, )],
+        env=environment( lazy ),
+    )
+    return float( output.decode( 'ascii' ).strip() )
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( runs=10 ):
+    print( 'median of %d interpreters, ms, eager -> lazy'%( runs, ))
+    for name, statement in STATEMENTS:
+        results = []
+        for lazy in ('0','1'):
+            run( statement, lazy )
+            results.append( median([ run( statement, lazy ) for i in range( runs )]) )
+        print( '%-10s %8.1f -> %8.1f'%( name, results[0]*1000, results[1]*1000 ))
+
+def importtime( count=15 ):
+    for lazy in ('0','1'):
+        environ = environment( lazy )
+        command = [sys.executable, '-X', 'importtime', '-c', 'import OpenGL.GL']
+        subprocess.check_call( command, env=environ, stderr=subprocess.DEVNULL )
+        output = subprocess.run(
+            command, env=environ, stderr=subprocess.PIPE, check=True,
+        ).stderr.decode( 'ascii' )
+        rows = []
+        for line in output.splitlines():
+            if not line.startswith( 'import time:' ) or 'cumulative' in line:
+                continue
+            own, cumulative, module = line[len('import time:'):].split( '|' )
+            rows.append( (int(cumulative), int(own), module.rstrip()) )
+        print( 'PYOPENGL_LAZY_IMPORTS=%s, %d modules imported'%( lazy, len(rows) ))
+        print( '%12s %12s  %s'%( 'cumulative', 'self', 'module (us)' ))
+        for cumulative, own, module in sorted( rows, reverse=True )[:count]:
+            print( '%12d %12d  %s'%( cumulative, own, module ))
+        print( 'total self time %d us'%( sum( row[1] for row in rows ), ))
+        print()
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--importtime']:
+        importtime( *[int(arg) for arg in sys.argv[2:3]] )
+    else:
+        main( *[int(arg) for arg in sys.argv[1:2]] )
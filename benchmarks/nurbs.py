@@ -0,0 +1,162 @@
+"""Compare OpenGL.GLU.nurbseval with GLU's NURBS renderer
+
+Run from the top of the repository:
+
+    python -m benchmarks.nurbs [runs]
+
+For reference curves (a non-uniform cubic B-spline and a rational
+circle) and surfaces (a bicubic patch and a rational half cylinder seen
+in perspective) renders with gluNurbsCurve/gluNurbsSurface into a
+feedback buffer (GLU_PARAMETRIC_ERROR sampling, GLU_PARAMETRIC_TOLERANCE
+0.5 pixels), and with nurbseval.curveMesh/surfaceMesh (tolerance 0.5).
+
+Reports the window-space distance (in pixels) of GLU's vertices from
+the nurbseval curve (evaluated densely) or surface (evaluated on the
+grid GLU samples with GLU_DOMAIN_DISTANCE steps of 1/20), which should
+be within float rounding, the number of vertices each produced and the
+best of runs (default 5) times of each.  GLU times include the feedback
+round trip, nurbseval times produce the float32 arrays only.
+"""
+import sys, time, math
+
+SIZE = 256
+
+def curves():
+    import numpy
+    cubic = (
+        [0, 0, 0, 0, .3, .5, .5, .8, 1, 1, 1, 1],
+        numpy.random.RandomState( 0 ).uniform( -1, 1, (8, 3) ) * (1, 1, 0),
+        False,
+    )
+    w = math.sqrt( .5 )
+    points = [(1,0),(1,1),(0,1),(-1,1),(-1,0),(-1,-1),(0,-1),(1,-1),(1,0)]
+    weights = [1, w, 1, w, 1, w, 1, w, 1]
+    circle = (
+        [0, 0, 0, .25, .25, .5, .5, .75, .75, 1, 1, 1],
+        numpy.array([ (x*weight, y*weight, 0, weight) for ((x, y), weight) in zip( points, weights ) ]),
+        True,
+    )
+    return [('cubic', cubic), ('circle', circle)]
+
+def surfaces():
+    import numpy
+    patch = numpy.zeros( (4, 4, 3) )
+    for i in range( 4 ):
+        for j in range( 4 ):
+            patch[i, j] = (i/1.5 - 1, j/1.5 - 1, math.sin( i + j ) * .5)
+    w = math.sqrt( .5 )
+    cylinder = numpy.zeros( (5, 2, 4) )
+    rim = [(1,0,1),(1,1,w),(0,1,1),(-1,1,w),(-1,0,1)]
+    for i, (x, y, weight) in enumerate( rim ):
+        for j, z in enumerate( (-1, 1) ):
+            cylinder[i, j] = (x*weight, y*weight, z*weight, weight)
+    return [
+        ('patch', ([0,0,0,0,1,1,1,1], [0,0,0,0,1,1,1,1], patch, False)),
+        ('cylinder', ([0,0,0,.5,.5,1,1,1], [0,0,1,1], cylinder, True)),
+    ]
+
+def setupMatrices( perspective ):
+    from OpenGL import GL, GLU
+    GL.glViewport( 0, 0, SIZE, SIZE )
+    GL.glMatrixMode( GL.GL_PROJECTION )
+    GL.glLoadIdentity()
+    GL.glMatrixMode( GL.GL_MODELVIEW )
+    GL.glLoadIdentity()
+    if perspective:
+        GL.glMatrixMode( GL.GL_PROJECTION )
+        GLU.gluPerspective( 60, 1, .1, 10 )
+        GL.glMatrixMode( GL.GL_MODELVIEW )
+        GLU.gluLookAt( 1, 2, 3, 0, 0, 0, 0, 1, 0 )
+    else:
+        GL.glMatrixMode( GL.GL_PROJECTION )
+        GL.glOrtho( -1.2, 1.2, -1.2, 1.2, -2, 2 )
+        GL.glMatrixMode( GL.GL_MODELVIEW )
+
+STEPS = 20
+
+def gluFeedback( draw, domain=False ):
+    """Run draw( nurb ) in feedback mode, return the (N,2) window coordinates
+
+    domain -- sample STEPS times per unit of parameter rather than by
+        parametric error
+    """
+    import numpy
+    from OpenGL import GL, GLU
+    nurb = GLU.gluNewNurbsRenderer()
+    if domain:
+        GLU.gluNurbsProperty( nurb, GLU.GLU_SAMPLING_METHOD, GLU.GLU_DOMAIN_DISTANCE )
+        GLU.gluNurbsProperty( nurb, GLU.GLU_U_STEP, STEPS )
+        GLU.gluNurbsProperty( nurb, GLU.GLU_V_STEP, STEPS )
+    else:
+        GLU.gluNurbsProperty( nurb, GLU.GLU_SAMPLING_METHOD, GLU.GLU_PARAMETRIC_ERROR )
+        GLU.gluNurbsProperty( nurb, GLU.GLU_PARAMETRIC_TOLERANCE, 0.5 )
+    GL.glFeedbackBuffer( 1 << 20, GL.GL_3D )
+    GL.glRenderMode( GL.GL_FEEDBACK )
+    draw( nurb )
+    tokens = GL.glRenderMode( GL.GL_RENDER )
+    GLU.gluDeleteNurbsRenderer( nurb )
+    return numpy.array([
+        vertex.vertex[:2] for token in tokens for vertex in token[1:]
+    ], 'd' )
+
+def distance( reference, points, chunk=256 ):
+    """Largest distance from each of points to its nearest reference point"""
+    import numpy
+    worst = 0.0
+    for start in range( 0, len( points ), chunk ):
+        block = points[start:start+chunk]
+        delta = block[:,None,:] - reference[None,:,:]
+        worst = max( (worst, numpy.sqrt( (delta*delta).sum( -1 ).min( axis=1 ).max() )))
+    return worst
+
+def best( function, runs ):
+    timings = []
+    for i in range( runs ):
+        start = time.perf_counter()
+        result = function()
+        timings.append( time.perf_counter() - start )
+    return min( timings ), result
+
+def main( runs=5 ):
+    import numpy
+    from benchmarks._context import createContext
+    createContext( SIZE, SIZE )
+    from OpenGL import GL, GLU
+    from OpenGL.GLU import nurbseval
+    from OpenGL.GLU.projection import gluProjectArray
+    print( 'best of %d runs, distances in pixels'%( runs, ))
+    print( '%-9s %8s %9s %9s %8s %13s'%( 'shape', 'distance', 'GLU verts', 'eval verts', 'GLU ms', 'nurbseval ms' ))
+    for name, (knots, control, rational) in curves():
+        setupMatrices( False )
+        vertexType = GL.GL_MAP1_VERTEX_4 if rational else GL.GL_MAP1_VERTEX_3
+        def draw( nurb ):
+            GLU.gluBeginCurve( nurb )
+            GLU.gluNurbsCurve( nurb, knots, control.astype( 'f' ), vertexType )
+            GLU.gluEndCurve( nurb )
+        slow, reference = best( lambda: gluFeedback( draw ), runs )
+        fast, mesh = best( lambda: nurbseval.curveMesh( knots, control, rational=rational ), runs )
+        dense = nurbseval.evaluateCurve( knots, control, numpy.linspace( 0, 1, 20001 ), rational )
+        dense = gluProjectArray( dense[:,:3] )[:,:2]
+        print( '%-9s %8.4f %9d %9d %8.2f %13.2f'%(
+            name, distance( dense, reference ), len( reference ), len( mesh.vertices ), slow*1000, fast*1000,
+        ))
+    for name, (sKnots, tKnots, control, rational) in surfaces():
+        setupMatrices( True )
+        vertexType = GL.GL_MAP2_VERTEX_4 if rational else GL.GL_MAP2_VERTEX_3
+        def draw( nurb ):
+            GLU.gluBeginSurface( nurb )
+            GLU.gluNurbsSurface( nurb, sKnots, tKnots, control.astype( 'f' ), vertexType )
+            GLU.gluEndSurface( nurb )
+        slow, reference = best( lambda: gluFeedback( draw ), runs )
+        fast, mesh = best( lambda: nurbseval.surfaceMesh( sKnots, tKnots, control, rational=rational ), runs )
+        grid = numpy.linspace( 0, 1, STEPS + 1 )
+        points, normals = nurbseval.evaluateSurface( sKnots, tKnots, control, grid, grid, rational )
+        points = gluProjectArray( points.reshape( (-1, 3) ))[:,:2]
+        sampled = numpy.unique( gluFeedback( draw, domain=True ), axis=0 )
+        print( '%-9s %8.4f %9d %9d %8.2f %13.2f'%(
+            name, distance( points, sampled ),
+            len( reference ), len( mesh.vertices ), slow*1000, fast*1000,
+        ))
+
+if __name__ == "__main__":
+    main( *[int(arg) for arg in sys.argv[1:2]] )
@@ -0,0 +1,116 @@
+"""Compare cold and warm start-up of a suite of programs with the program cache
+
+Run from the top of the repository:
+
+    python -m benchmarks.program_cache [programs] [runs]
+
+Compiles a suite of programs (default 20, each a distinct vertex and
+fragment shader pair) in fresh interpreters:
+
+    uncached -- no program cache set
+    cold -- with an empty cache directory, all programs are compiled
+        and linked from source, then their binaries stored
+    warm -- with the directory filled by the cold run, all programs are
+        loaded from their binaries
+
+and reports the median time (default of 5 runs) to build the suite.
+"""
+import os, sys, shutil, subprocess, tempfile
+
+VERTEX = '''#version 330
+#define VARIANT %(variant)d
+in vec3 position;
+in vec3 normal;
+uniform mat4 mvp;
+uniform mat3 normalMatrix;
+out vec3 eyeNormal;
+out float fog;
+void main() {
+    vec3 offset = position;
+    for (int i = 0; i < VARIANT %% 4 + 2; i++) {
+        offset += 0.01 * sin( offset.yzx * float(i + VARIANT) );
+    }
+    eyeNormal = normalize( normalMatrix * normal );
+    gl_Position = mvp * vec4( offset, 1.0 );
+    fog = clamp( gl_Position.z / 100.0, 0.0, 1.0 );
+}
+'''
+FRAGMENT = '''#version 330
+#define VARIANT %(variant)d
+in vec3 eyeNormal;
+in float fog;
+uniform vec3 lights[4];
+uniform vec4 colour;
+out vec4 result;
+void main() {
+    vec3 n = normalize( eyeNormal );
+    vec3 total = vec3( 0.05 * float(VARIANT %% 3) );
+    for (int i = 0; i < 4; i++) {
+        float diffuse = max( dot( n, normalize( lights[i] )), 0.0 );
+        float specular = pow( max( dot( reflect( -normalize( lights[i] ), n ), vec3(0,0,1)), 0.0 ), 16.0 + float(VARIANT) );
+        total += colour.rgb * diffuse + vec3( specular );
+    }
+    result = vec4( mix( total, vec3( 0.5 ), fog ), colour.a );
+}
+'''
+
+def build( count ):
+    """Build the suite in this interpreter, print the elapsed time"""
+    import time
+    from benchmarks._context import createContext
+    createContext()
+    from OpenGL.GL import GL_VERTEX_SHADER, GL_FRAGMENT_SHADER, glFinish
+    from OpenGL.GL import shaders
+    start = time.perf_counter()
+    for variant in range( count ):
+        values = {'variant': variant}
+        shaders.compileProgram(
+            shaders.deferredShader( VERTEX%values, GL_VERTEX_SHADER ),
+            shaders.deferredShader( FRAGMENT%values, GL_FRAGMENT_SHADER ),
+            validate=False,
+        )
+    glFinish()
+    elapsed = time.perf_counter() - start
+    cache = shaders.getProgramCache()
+    stats = cache.stats() if cache is not None else {}
+    print( '%f %d %d'%( elapsed, stats.get( 'hits', 0 ), stats.get( 'stores', 0 )))
+
+def run( count, directory=None ):
+    environ = dict( os.environ )
+    environ.pop( 'PYOPENGL_PROGRAM_CACHE', None )
+    if directory:
+        environ['PYOPENGL_PROGRAM_CACHE'] = directory
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.program_cache', '--build', str(count)],
+        env=environ,
+    )
+    elapsed, hits, stores = output.decode( 'ascii' ).split()
+    return float( elapsed ), int( hits ), int( stores )
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( count=20, runs=5 ):
+    directory = tempfile.mkdtemp( prefix='pyopengl-program-cache-' )
+    try:
+        uncached, cold, warm = [], [], []
+        for i in range( runs ):
+            uncached.append( run( count ) )
+            shutil.rmtree( directory )
+            cold.append( run( count, directory ) )
+            warm.append( run( count, directory ) )
+        print( '%d programs, median of %d runs'%( count, runs ))
+        for name, results in (('uncached', uncached), ('cold', cold), ('warm', warm)):
+            print( '%-10s %8.1fms  hits %3d  stores %3d'%(
+                name, median([ r[0] for r in results ])*1000,
+                results[-1][1], results[-1][2],
+            ))
+    finally:
+        shutil.rmtree( directory, ignore_errors=True )
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--build']:
+        build( int( sys.argv[2] ))
+    else:
+        main( *[int(arg) for arg in sys.argv[1:3]] )
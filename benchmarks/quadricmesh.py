@@ -0,0 +1,82 @@
+"""Compare drawing many small quadrics with GLU and with quadricmesh
+
+Run from the top of the repository:
+
+    python -m benchmarks.quadricmesh [count] [frames]
+
+Draws count (default 500) spheres (12 slices, 10 stacks, as the game's
+collectibles) and as many cones (16 slices, 8 stacks) at random
+positions with depth testing and culling, for frames (default 20)
+frames:
+
+    glu -- glTranslatef/gluSphere and gluCylinder+gluDisk per object
+    buffer -- glTranslatef/MeshBuffer.draw() per object
+    instanced -- one MeshBuffer.drawInstanced() per shape
+
+and reports the best frame time of each and the best time spent issuing
+the calls (before the glFinish ending the frame).
+"""
+import sys, time
+
+def main( count=500, frames=20 ):
+    import numpy
+    from benchmarks._context import createContext
+    createContext( 512, 512 )
+    from OpenGL import GL, GLU
+    from OpenGL.GLU import quadricmesh
+    GL.glMatrixMode( GL.GL_PROJECTION )
+    GLU.gluPerspective( 60, 1, .1, 50 )
+    GL.glMatrixMode( GL.GL_MODELVIEW )
+    GLU.gluLookAt( 0, 0, 12, 0, 0, 0, 0, 1, 0 )
+    GL.glEnable( GL.GL_DEPTH_TEST )
+    GL.glEnable( GL.GL_CULL_FACE )
+    GL.glEnable( GL.GL_LIGHTING )
+    GL.glEnable( GL.GL_LIGHT0 )
+    GL.glEnable( GL.GL_COLOR_MATERIAL )
+    random = numpy.random.RandomState( 1 )
+    spheres = numpy.column_stack( (random.uniform( -5, 5, (count, 3) ), numpy.full( count, .2 )))
+    cones = numpy.column_stack( (random.uniform( -5, 5, (count, 3) ), numpy.full( count, .3 )))
+    quadric = GLU.gluNewQuadric()
+    sphere = quadricmesh.getBuffer( quadricmesh.sphereMesh( 1.0, 12, 10 ))
+    cone = quadricmesh.getBuffer( quadricmesh.coneMesh( 1.0, 2.0, 16, 8 ))
+    def glu():
+        for x, y, z, scale in spheres:
+            GL.glPushMatrix()
+            GL.glTranslatef( x, y, z )
+            GLU.gluSphere( quadric, scale, 12, 10 )
+            GL.glPopMatrix()
+        for x, y, z, scale in cones:
+            GL.glPushMatrix()
+            GL.glTranslatef( x, y, z )
+            GLU.gluCylinder( quadric, scale, 0, 2*scale, 16, 8 )
+            GL.glRotatef( 180, 1, 0, 0 )
+            GLU.gluDisk( quadric, 0, scale, 16, 1 )
+            GL.glPopMatrix()
+    def buffer():
+        for shape, positions in ((sphere, spheres), (cone, cones)):
+            for x, y, z, scale in positions:
+                GL.glPushMatrix()
+                GL.glTranslatef( x, y, z )
+                GL.glScalef( scale, scale, scale )
+                shape.draw()
+                GL.glPopMatrix()
+    def instanced():
+        sphere.drawInstanced( spheres )
+        cone.drawInstanced( cones )
+    print( '%d spheres and %d cones, best of %d frames'%( count, count, frames ))
+    for draw in (glu, buffer, instanced):
+        timings = []
+        issued = []
+        for frame in range( frames ):
+            start = time.perf_counter()
+            GL.glClear( GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT )
+            draw()
+            issued.append( time.perf_counter() - start )
+            GL.glFinish()
+            timings.append( time.perf_counter() - start )
+        print( '%-10s %8.2fms/frame  calls %8.2fms'%(
+            draw.__name__, min( timings )*1000, min( issued )*1000,
+        ))
+
+if __name__ == "__main__":
+    main( *[int(arg) for arg in sys.argv[1:3]] )
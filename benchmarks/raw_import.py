@@ -0,0 +1,102 @@
+"""Measure the cost of declaring the entry points of the raw GL modules
+
+Run from the top of the repository:
+
+    python -m benchmarks.raw_import [runs]
+
+In fresh interpreters (after one warm-up run so that byte-code caches
+are written) imports every module in the OpenGL.raw.GL package and
+reports the medians (default 10 runs) of
+
+    import -- time to import the modules
+    RSS -- growth of the resident set size over the import
+    objects -- growth of the number of objects tracked by the garbage
+        collector, and of the number of classes among them
+    entry points -- functions declared by the modules
+
+then, with a context current, calls OpenGL.platform.resolveFunctions()
+and reports the time it took, the functions resolved and the number of
+distinct ctypes prototypes (function types) they use.
+"""
+import os, sys, subprocess
+
+def rss():
+    """Current resident set size in bytes"""
+    try:
+        with open( '/proc/self/statm' ) as handle:
+            return int( handle.read().split()[1] ) * os.sysconf( 'SC_PAGE_SIZE' )
+    except (IOError, OSError):
+        import resource
+        return resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss * 1024
+
+def census():
+    import gc
+    objects = gc.get_objects()
+    return len( objects ), sum( 1 for o in objects if isinstance( o, type ))
+
+def build():
+    """Import and resolve in this interpreter, print the measurements"""
+    import time, pkgutil, importlib
+    import ctypes
+    from benchmarks._context import createContext
+    createContext()
+    from OpenGL import platform
+    from OpenGL.platform import baseplatform
+    import OpenGL.raw.GL as package
+    names = [
+        info.name for info in
+        pkgutil.walk_packages( package.__path__, package.__name__ + '.' )
+    ]
+    objects, classes = census()
+    before = rss()
+    start = time.perf_counter()
+    for name in names:
+        try:
+            importlib.import_module( name )
+        except Exception:
+            pass
+    elapsed = time.perf_counter() - start
+    memory = rss() - before
+    after = census()
+    functions = len( baseplatform._nullFunctions )
+    report = platform.resolveFunctions()
+    prototypes = set()
+    for function in list( baseplatform._nullFunctions ):
+        if function.resolved:
+            prototypes.add( type( function.function ))
+    print( '%f %d %d %d %d %f %d %d'%(
+        elapsed, memory, after[0] - objects, after[1] - classes,
+        functions, report.elapsed, report.resolved, len( prototypes ),
+    ))
+
+def run():
+    environ = dict( os.environ )
+    environ.pop( 'PYTHONDONTWRITEBYTECODE', None )
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.raw_import', '--build'],
+        env=environ,
+    )
+    values = output.decode( 'ascii' ).split()
+    return [float( value ) if '.' in value else int( value ) for value in values]
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( runs=10 ):
+    run()
+    results = [run() for i in range( runs )]
+    column = lambda index: median([ result[index] for result in results ])
+    print( 'median of %d interpreters'%( runs, ))
+    print( 'import %8.1fms  RSS +%6.1fMB  objects +%d (%d classes)  entry points %d'%(
+        column( 0 )*1000, column( 1 )/1024./1024., column( 2 ), column( 3 ), column( 4 ),
+    ))
+    print( 'resolveFunctions %8.1fms  resolved %d  prototypes %d'%(
+        column( 5 )*1000, column( 6 ), column( 7 ),
+    ))
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--build']:
+        build()
+    else:
+        main( *[int(arg) for arg in sys.argv[1:2]] )
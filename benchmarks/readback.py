@@ -0,0 +1,94 @@
+"""Compare synchronous glReadPixels with PixelReader for continuous capture
+
+Run from the top of the repository:
+
+    python -m benchmarks.readback [frames] [runs]
+
+In fresh interpreters renders frames (default 120) 1280x720 frames,
+each drawing a few thousand triangles, and captures every frame as RGBA
+bytes:
+
+    sync -- glReadPixels into a new array after each frame
+    reuse -- glReadPixels into the same array after each frame
+    async -- PixelReader( slots=3 ), reading each frame and poll()ing
+        for the completed reads (finish() after the last frame)
+
+and reports the medians (default 5 runs) of the time per frame, of the
+time spent in the capture calls per frame and the number of stalls.
+"""
+import os, sys, subprocess
+
+WIDTH, HEIGHT = 1280, 720
+
+def build( mode, frames ):
+    """Render and capture in this interpreter, print the timings"""
+    import time
+    import numpy
+    from benchmarks._context import createContext
+    createContext( WIDTH, HEIGHT )
+    from OpenGL.GL import (
+        glClearColor, glClear, glFinish, glReadPixels, glViewport,
+        glEnableClientState, glVertexPointer, glDrawArrays,
+        GL_COLOR_BUFFER_BIT, GL_VERTEX_ARRAY, GL_FLOAT, GL_TRIANGLES,
+        GL_RGBA, GL_UNSIGNED_BYTE,
+    )
+    from OpenGL.GL.readback import PixelReader
+    glViewport( 0, 0, WIDTH, HEIGHT )
+    vertices = numpy.random.RandomState( 1 ).uniform( -1, 1, (3*4000, 2) ).astype( 'f' )
+    glEnableClientState( GL_VERTEX_ARRAY )
+    glVertexPointer( 2, GL_FLOAT, 0, vertices )
+    reader = PixelReader( slots=3 )
+    target = numpy.empty( (WIDTH, HEIGHT, 4), 'B' )
+    captured = []
+    glFinish()
+    capture = 0.0
+    start = time.perf_counter()
+    for frame in range( frames ):
+        glClearColor( (frame % 10)/10., 0.2, 0.3, 1.0 )
+        glClear( GL_COLOR_BUFFER_BIT )
+        glDrawArrays( GL_TRIANGLES, 0, len( vertices ))
+        begin = time.perf_counter()
+        if mode == 'sync':
+            captured.append( glReadPixels( 0, 0, WIDTH, HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE, outputType=None ))
+        elif mode == 'reuse':
+            glReadPixels( 0, 0, WIDTH, HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE, array=target )
+            captured.append( target )
+        else:
+            reader.read( 0, 0, WIDTH, HEIGHT, GL_RGBA, GL_UNSIGNED_BYTE )
+            captured.extend( reader.poll() )
+        capture += time.perf_counter() - begin
+    begin = time.perf_counter()
+    captured.extend( reader.finish() )
+    glFinish()
+    end = time.perf_counter()
+    capture += end - begin
+    assert len( captured ) == frames, len( captured )
+    print( '%f %f %d'%( (end - start)/frames, capture/frames, reader.stalls ))
+
+def run( mode, frames ):
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.readback', '--build', mode, str( frames )],
+    )
+    frame, capture, stalls = output.decode( 'ascii' ).split()
+    return float( frame ), float( capture ), int( stalls )
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( frames=120, runs=5 ):
+    print( '%d %dx%d frames, median of %d runs'%( frames, WIDTH, HEIGHT, runs ))
+    for mode in ('sync', 'reuse', 'async'):
+        results = [run( mode, frames ) for i in range( runs )]
+        print( '%-6s frame %7.2fms  capture %7.2fms  stalls %d'%(
+            mode,
+            median([ r[0] for r in results ])*1000,
+            median([ r[1] for r in results ])*1000,
+            results[-1][2],
+        ))
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--build']:
+        build( sys.argv[2], int( sys.argv[3] ))
+    else:
+        main( *[int(arg) for arg in sys.argv[1:3]] )
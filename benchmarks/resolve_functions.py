@@ -0,0 +1,84 @@
+"""Measure first-frame entry point resolution with and without resolveFunctions
+
+Run from the top of the repository:
+
+    python -m benchmarks.resolve_functions [runs]
+
+In fresh interpreters which create a context and import the raw
+VERSION modules a simple frame uses, times the first call of the
+frame's functions:
+
+    lazy -- each entry point is resolved on its first call
+    resolved -- OpenGL.platform.resolveFunctions() is called first
+    background -- resolveFunctions( background=True ) is called first
+        and the frame starts once it reports done
+
+and reports the medians (default 10 runs) of the first frame time and
+of the time resolveFunctions took, with its counts.
+"""
+import os, sys, subprocess
+
+def frame():
+    """Return [(function, args)] for the calls of a simple frame"""
+    from OpenGL.raw.GL.VERSION import GL_1_1, GL_1_5, GL_2_0, GL_3_0
+    return [
+        (GL_1_1.glViewport, (0, 0, 16, 16)),
+        (GL_1_1.glClearColor, (0., 0., 0., 1.)),
+        (GL_1_1.glClear, (0x4000,)),
+        (GL_1_1.glEnable, (0x0B71,)),
+        (GL_2_0.glUseProgram, (0,)),
+        (GL_3_0.glBindVertexArray, (0,)),
+        (GL_1_5.glBindBuffer, (0x8892, 0)),
+        (GL_1_1.glDisable, (0x0B71,)),
+        (GL_1_1.glFlush, ()),
+    ]
+
+def build( mode ):
+    """Run one first frame in this interpreter, print the timings"""
+    import time
+    from benchmarks._context import createContext
+    createContext()
+    from OpenGL.GL import glFinish
+    from OpenGL import platform
+    calls = frame()
+    report = None
+    if mode != 'lazy':
+        report = platform.resolveFunctions( background=(mode == 'background') )
+        report.wait()
+    start = time.perf_counter()
+    for function, args in calls:
+        function( *args )
+    elapsed = time.perf_counter() - start
+    glFinish()
+    if report is None:
+        print( '%f 0 0 0'%( elapsed, ))
+    else:
+        print( '%f %f %d %d'%( elapsed, report.elapsed, report.resolved, len( report.missing )))
+
+def run( mode ):
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'benchmarks.resolve_functions', '--build', mode],
+    )
+    elapsed, resolution, resolved, missing = output.decode( 'ascii' ).split()
+    return float( elapsed ), float( resolution ), int( resolved ), int( missing )
+
+def median( values ):
+    values = sorted( values )
+    return values[len(values)//2]
+
+def main( runs=10 ):
+    print( 'median of %d runs'%( runs, ))
+    for mode in ('lazy', 'resolved', 'background'):
+        results = [run( mode ) for i in range( runs )]
+        print( '%-11s first frame %7.3fms  resolveFunctions %7.1fms  resolved %4d  missing %d'%(
+            mode,
+            median([ r[0] for r in results ])*1000,
+            median([ r[1] for r in results ])*1000,
+            results[-1][2], results[-1][3],
+        ))
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--build']:
+        build( sys.argv[2] )
+    else:
+        main( *[int(arg) for arg in sys.argv[1:2]] )
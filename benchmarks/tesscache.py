@@ -0,0 +1,77 @@
+"""Compare re-tessellating static polygons every frame with TessellationCache
+
+Run from the top of the repository:
+
+    python -m benchmarks.tesscache [frames] [runs]
+
+Draws the polygons of benchmarks.tessellate's corpus (odd winding rule)
+for frames (default 60) frames:
+
+    callbacks -- GLUtesselator with Python callbacks feeding
+        glBegin/glVertex/glEnd, as static outlines are usually drawn
+    tessellate -- OpenGL.GLU.tess.tessellate then glDrawElements from
+        client arrays every frame
+    cached -- OpenGL.GLU.tesscache.drawPolygon, tessellating and
+        uploading on the first frame only
+
+and reports the best of runs (default 3) of the time per frame (with a
+glFinish at the end of each frame) and the cache statistics.
+"""
+import sys, time
+
+def callbacks( contours, rule ):
+    from OpenGL import GL, GLU
+    tess = GLU.gluNewTess()
+    GLU.gluTessProperty( tess, GLU.GLU_TESS_WINDING_RULE, rule )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_BEGIN, GL.glBegin )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_VERTEX, GL.glVertex3dv )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_END, GL.glEnd )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_COMBINE, lambda coords, data, weight: coords )
+    GLU.gluTessBeginPolygon( tess, None )
+    for contour in contours:
+        GLU.gluTessBeginContour( tess )
+        for point in contour:
+            point = (point[0], point[1], 0.0)
+            GLU.gluTessVertex( tess, point, point )
+        GLU.gluTessEndContour( tess )
+    GLU.gluTessEndPolygon( tess )
+    GLU.gluDeleteTess( tess )
+
+def uncached( contours, rule ):
+    from OpenGL import GL
+    from OpenGL.GLU.tess import tessellate
+    vertices, indices = tessellate( contours, rule )
+    GL.glEnableClientState( GL.GL_VERTEX_ARRAY )
+    GL.glVertexPointer( vertices.shape[1], GL.GL_DOUBLE, 0, vertices )
+    GL.glDrawElements( GL.GL_TRIANGLES, indices.size, GL.GL_UNSIGNED_INT, indices )
+
+def cached( contours, rule ):
+    from OpenGL.GLU.tesscache import drawPolygon
+    drawPolygon( contours, rule )
+
+def frames( draw, corpus, rule, count ):
+    from OpenGL import GL
+    start = time.perf_counter()
+    for frame in range( count ):
+        GL.glClear( GL.GL_COLOR_BUFFER_BIT )
+        for name, contours in corpus:
+            draw( contours, rule )
+        GL.glFinish()
+    return (time.perf_counter() - start) / count
+
+def main( count=60, runs=3 ):
+    from benchmarks._context import createContext
+    createContext( 256, 256 )
+    from OpenGL import GLU
+    from OpenGL.GLU import tesscache
+    from benchmarks.tessellate import CORPUS
+    rule = GLU.GLU_TESS_WINDING_ODD
+    print( '%d frames of %d polygons, best of %d runs'%( count, len( CORPUS ), runs ))
+    for name, draw in (('callbacks', callbacks), ('tessellate', uncached), ('cached', cached)):
+        tesscache.getCache().clear()
+        best = min( frames( draw, CORPUS, rule, count ) for i in range( runs ))
+        print( '%-10s %8.2fms/frame'%( name, best*1000 ))
+    print( tesscache.getCache().stats() )
+
+if __name__ == "__main__":
+    main( *[int(arg) for arg in sys.argv[1:3]] )
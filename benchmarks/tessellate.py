@@ -0,0 +1,112 @@
+"""Compare OpenGL.GLU.tess.tessellate with callback-driven GLU tessellation
+
+Run from the top of the repository:
+
+    python -m benchmarks.tessellate [runs]
+
+For a corpus of polygons (simple, many-vertex, with holes, overlapping
+and self-intersecting contours, nested contours) and each GLU winding
+rule, tessellates with a GLUtesselator driven through Python callbacks
+(gluTessVertex with the position as vertex data, vertex/combine/edge
+flag callbacks collecting the triangles) and with tessellate(), checks
+both produce the same set of triangles and reports the best of runs
+(default 5) times of each.  No context is needed.
+"""
+import sys, time, math
+
+def star( count, outer=1.0, inner=0.4 ):
+    return [
+        (
+            math.cos( 2*math.pi*i/count ) * (outer if i % 2 else inner),
+            math.sin( 2*math.pi*i/count ) * (outer if i % 2 else inner),
+        )
+        for i in range( count )
+    ]
+
+def circle( count, radius, x=0.0, y=0.0, reverse=False ):
+    points = [
+        (x + radius*math.cos( 2*math.pi*i/count ), y + radius*math.sin( 2*math.pi*i/count ))
+        for i in range( count )
+    ]
+    return points[::-1] if reverse else points
+
+CORPUS = [
+    ('square', [[(0,0),(1,0),(1,1),(0,1)]]),
+    ('star 2000', [star( 2000 )]),
+    ('holes', [circle( 400, 1.0 ), circle( 100, .3, -.4, 0, True ), circle( 100, .3, .4, 0, True )]),
+    ('overlapping', [circle( 64, 1.0 ), circle( 64, 1.0, .5, 0 )]),
+    ('pentagram', [[
+        (math.cos( math.pi/2 + 4*math.pi*i/5 ), math.sin( math.pi/2 + 4*math.pi*i/5 ))
+        for i in range( 5 )
+    ]]),
+    ('nested', [circle( 50, 1.0 ), circle( 50, .6 ), circle( 50, .3 )]),
+]
+
+def callbacks( contours, rule ):
+    """Tessellate through the GLUtesselator callback API, return triangle vertices"""
+    from OpenGL import GLU
+    tess = GLU.gluNewTess()
+    GLU.gluTessProperty( tess, GLU.GLU_TESS_WINDING_RULE, rule )
+    output = []
+    def combine( coords, vertex_data, weight ):
+        return tuple( coords )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_EDGE_FLAG_DATA, lambda flag, data: None )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_VERTEX, output.append )
+    GLU.gluTessCallback( tess, GLU.GLU_TESS_COMBINE, combine )
+    GLU.gluTessBeginPolygon( tess, None )
+    for contour in contours:
+        GLU.gluTessBeginContour( tess )
+        for point in contour:
+            point = (point[0], point[1], 0.0)
+            GLU.gluTessVertex( tess, point, point )
+        GLU.gluTessEndContour( tess )
+    GLU.gluTessEndPolygon( tess )
+    GLU.gluDeleteTess( tess )
+    return output
+
+def triangles( points ):
+    """Canonical set of triangles from a flat sequence of vertices"""
+    points = [tuple( round( x, 9 ) for x in point[:2] ) for point in points]
+    return sorted(
+        tuple( sorted( points[i:i+3] ))
+        for i in range( 0, len( points ), 3 )
+    )
+
+def best( function, runs ):
+    timings = []
+    for i in range( runs ):
+        start = time.perf_counter()
+        result = function()
+        timings.append( time.perf_counter() - start )
+    return min( timings ), result
+
+def main( runs=5 ):
+    from OpenGL import GLU
+    from OpenGL.GLU.tess import tessellate
+    rules = [
+        ('odd', GLU.GLU_TESS_WINDING_ODD),
+        ('nonzero', GLU.GLU_TESS_WINDING_NONZERO),
+        ('positive', GLU.GLU_TESS_WINDING_POSITIVE),
+        ('negative', GLU.GLU_TESS_WINDING_NEGATIVE),
+        ('abs>=2', GLU.GLU_TESS_WINDING_ABS_GEQ_TWO),
+    ]
+    print( 'best of %d runs'%( runs, ))
+    print( '%-12s %-9s %9s %6s %13s %13s'%(
+        'polygon', 'rule', 'triangles', 'same', 'callbacks ms', 'tessellate ms',
+    ))
+    mismatches = 0
+    for name, contours in CORPUS:
+        for ruleName, rule in rules:
+            slow, output = best( lambda: callbacks( contours, rule ), runs )
+            fast, (vertices, indices) = best( lambda: tessellate( contours, rule ), runs )
+            same = triangles( output ) == triangles( vertices[indices.ravel()] )
+            mismatches += not same
+            print( '%-12s %-9s %9d %6s %13.2f %13.2f'%(
+                name, ruleName, len( indices ), same, slow*1000, fast*1000,
+            ))
+    if mismatches:
+        print( '%d mismatches'%( mismatches, ))
+        sys.exit( 1 )
+
+if __name__ == "__main__":
+    main( *[int(arg) for arg in sys.argv[1:2]] )
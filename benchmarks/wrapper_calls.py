@@ -0,0 +1,57 @@
+"""Compare generated wrapper calls against the nested-closure calls
+
+Run from the top of the repository:
+
+    python -m benchmarks.wrapper_calls [iterations]
+
+For each function both call paths are produced from the same finalised
+wrapper.Wrapper (finaliseCall for the closures, finaliseGeneratedCall
+for the generated source), so only the Python-side dispatch differs.
+The two are timed alternately and the best of 7 repeats of each is
+reported, as the GL work (e.g. glTexImage2D's upload) varies more than
+the dispatch does.
+"""
+import sys, timeit
+from benchmarks._context import createContext
+
+
+def main( iterations=100000 ):
+    createContext()
+    import numpy
+    from OpenGL import wrapper
+    from OpenGL.GL import (
+        GL_TEXTURE_2D, GL_RGBA, GL_UNSIGNED_BYTE, GL_VIEWPORT,
+        glGenTextures, glBindTexture, glGetIntegerv, glTexImage2D,
+    )
+    from OpenGL.raw.GL.VERSION import GL_1_0
+    glVertex3f = wrapper.wrapper( GL_1_0.glVertex3f )
+    texture = glGenTextures( 1 )
+    glBindTexture( GL_TEXTURE_2D, texture )
+    pixels = numpy.zeros( (4,4,4), 'B' )
+    viewport = numpy.zeros( (4,), 'i' )
+    cases = [
+        ( glVertex3f, (0.0, 1.0, 2.0) ),
+        ( glGetIntegerv, (GL_VIEWPORT,) ),
+        ( glGetIntegerv, (GL_VIEWPORT, viewport) ),
+        ( glTexImage2D, (GL_TEXTURE_2D, 0, GL_RGBA, 4, 4, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixels) ),
+    ]
+    print( '%-16s %-10s %12s %12s %8s'%( 'function', 'args', 'closure us', 'generated us', 'speedup' ))
+    for function, args in cases:
+        function.finalise()
+        closure = function.finaliseCall()
+        generated = function.finaliseGeneratedCall()
+        calls = (closure, generated)
+        repeats = [[], []]
+        for call in calls:
+            call( *args )
+        for repeat in range( 7 ):
+            for call, results in zip( calls, repeats ):
+                results.append( timeit.timeit( lambda: call( *args ), number=iterations ))
+        timings = [ min( results ) / iterations * 1e6 for results in repeats ]
+        print( '%-16s %-10s %12.3f %12.3f %7.2fx'%(
+            function.__name__, len(args), timings[0], timings[1], timings[0]/timings[1],
+        ))
+
+
+if __name__ == "__main__":
+    main( *[int(arg) for arg in sys.argv[1:2]] )
@@ -1293,9 +1293,7 @@ def draw_text(x, y, text, font=None, color=(1.0, 1.0, 1.0)):
 	if font is None:
 		font = GLUT.GLUT_BITMAP_HELVETICA_18
 	# Use current window viewport size for orthographic text placement
-	vp = glGetIntegerv(GL_VIEWPORT)
-	vp_w = vp[2] if isinstance(vp, (list, tuple)) else width
-	vp_h = vp[3] if isinstance(vp, (list, tuple)) else height
+	_, _, vp_w, vp_h = glGetIntegerValue(GL_VIEWPORT)
 	glMatrixMode(GL_PROJECTION)
 	glPushMatrix()
 	glLoadIdentity()